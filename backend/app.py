@@ -38,6 +38,11 @@ init_app_config(app)
 # (e.g. Cloudflare), bump this to 2.
 app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1)
 
+# Per-request DB accounting and Server-Timing headers. Registered before the
+# rate limiter and the other request hooks so their queries are counted too.
+from core.db_profiler import init_db_profiler
+init_db_profiler(app)
+
 # Initialize the rate limiter against the Flask app. MUST come after
 # ProxyFix is installed, so the key function sees the real client IP
 # from the very first request.
@@ -174,7 +179,7 @@ if __name__ == '__main__':
     
     # Start research worker thread (only when running directly)
     if not research_queue._worker_running:
-        research_queue.start_worker(song_research.research_song)
+        research_queue.start_worker(song_research.research_song, job_handlers=song_research.JOB_HANDLERS)
         logger.info("Research worker thread initialized")
         
     try:
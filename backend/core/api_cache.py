@@ -0,0 +1,423 @@
+"""
+API Cache Module
+Single SQLite-backed store for external API responses
+
+MusicBrainz, Spotify, Apple Music, the Cover Art Archive and Wikipedia used
+to write one JSON file per request under get_cache_dir(<service>) and check
+freshness by file mtime. On the persistent disk that grew to millions of
+small files, and both lookups and directory listings became slow. All of
+those clients now read and write through this module instead:
+
+    from core import api_cache
+
+    key = api_cache.CacheKey('musicbrainz', f'recordings/recording_{mb_id}')
+    cached = api_cache.get(key, max_age_days=30)
+    if cached is None:
+        ...
+        api_cache.set(key, {'data': data, 'cached_at': ...})
+
+Design notes:
+
+- One table keyed by a digest of (namespace, key). The key strings are the
+  old cache file paths relative to the service directory, without the
+  extension, so migrate_file_caches.py maps every existing file onto its
+  entry one-to-one (and keeps its mtime as stored_at).
+
+- Values are JSON, zlib-compressed above a small size. get() returns
+  ``default`` on a miss so callers that cache ``None`` (negative lookups)
+  can pass their own sentinel.
+
+- Freshness: callers pass max_age_days (their cache_days setting);
+  otherwise the namespace default from NAMESPACE_TTL_DAYS applies.
+
+- Size bound: a trigger-maintained byte total is checked every
+  EVICT_CHECK_INTERVAL writes. Over the bound, expired entries are purged
+  first, then least recently read entries until the store is back under
+  90% of API_CACHE_MAX_MB. Reads only touch accessed_at once an hour per
+  entry so hits stay read-only.
+
+- One connection per thread in WAL mode, so research worker threads, the
+  web process and CLI scripts can share the file concurrently.
+
+Configuration (environment):
+    API_CACHE_PATH      database file (default: <cache root>/api_cache.sqlite3)
+    API_CACHE_MAX_MB    size bound for stored values (default: 4096)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Iterable, Iterator, NamedTuple, Optional
+
+from core.cache_utils import get_cache_root
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = int(os.environ.get('API_CACHE_MAX_MB', 4096)) * 1024 * 1024
+
+# Default freshness per namespace, used when the caller gives no max_age
+NAMESPACE_TTL_DAYS = {
+    'musicbrainz': 30,
+    'spotify': 30,
+    'apple_music': 30,
+    'coverart': 30,
+    'wikipedia': 7,
+}
+DEFAULT_TTL_DAYS = 30
+
+COMPRESS_MIN_BYTES = 256
+EVICT_CHECK_INTERVAL = 500
+TOUCH_INTERVAL_SECONDS = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    digest BLOB PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    compressed INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    value BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at);
+CREATE INDEX IF NOT EXISTS idx_entries_namespace_stored ON entries(namespace, stored_at);
+
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (name, value) VALUES ('total_bytes', 0);
+
+CREATE TRIGGER IF NOT EXISTS entries_size_insert AFTER INSERT ON entries BEGIN
+    UPDATE meta SET value = value + NEW.size WHERE name = 'total_bytes';
+END;
+CREATE TRIGGER IF NOT EXISTS entries_size_delete AFTER DELETE ON entries BEGIN
+    UPDATE meta SET value = value - OLD.size WHERE name = 'total_bytes';
+END;
+CREATE TRIGGER IF NOT EXISTS entries_size_update AFTER UPDATE OF size ON entries BEGIN
+    UPDATE meta SET value = value + NEW.size - OLD.size WHERE name = 'total_bytes';
+END;
+"""
+
+
+_UPSERT_SQL = """
+INSERT INTO entries (digest, namespace, key, stored_at, accessed_at, compressed, size, value)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (digest) DO UPDATE SET
+    stored_at = excluded.stored_at,
+    accessed_at = excluded.accessed_at,
+    compressed = excluded.compressed,
+    size = excluded.size,
+    value = excluded.value
+"""
+
+_UPSERT_IF_NEWER_SQL = _UPSERT_SQL + "WHERE excluded.stored_at > entries.stored_at\n"
+
+
+class CacheKey(NamedTuple):
+    """Identifies one cached response: service namespace plus key path"""
+    namespace: str
+    key: str
+
+    @property
+    def name(self) -> str:
+        """Last path segment, for log messages"""
+        return self.key.rsplit('/', 1)[-1]
+
+    @property
+    def digest(self) -> bytes:
+        return hashlib.blake2b(f"{self.namespace}\0{self.key}".encode(), digest_size=16).digest()
+
+
+class ApiCache:
+    """SQLite-backed key/value store with per-namespace TTLs and a size bound"""
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes_since_check = 0
+        self._stats = defaultdict(lambda: {'hits': 0, 'misses': 0, 'expired': 0, 'writes': 0})
+        self._evictions = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _count(self, namespace: str, counter: str, n: int = 1) -> None:
+        with self._lock:
+            self._stats[namespace][counter] += n
+
+    def get(self, cache_key: CacheKey, max_age_days: Optional[float] = None,
+            default: Any = None) -> Any:
+        """
+        Return the cached value for ``cache_key``, or ``default`` when it is
+        missing, older than max_age_days (namespace TTL if omitted) or unreadable
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT stored_at, accessed_at, compressed, value FROM entries WHERE digest = ?",
+                (cache_key.digest,),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"API cache read failed for {cache_key.namespace}/{cache_key.key}: {e}")
+            self._count(cache_key.namespace, 'misses')
+            return default
+
+        if row is None:
+            self._count(cache_key.namespace, 'misses')
+            return default
+
+        stored_at, accessed_at, compressed, blob = row
+        now = time.time()
+        if max_age_days is None:
+            max_age_days = NAMESPACE_TTL_DAYS.get(cache_key.namespace, DEFAULT_TTL_DAYS)
+        if now - stored_at >= max_age_days * 86400:
+            self._count(cache_key.namespace, 'expired')
+            return default
+
+        try:
+            value = json.loads(zlib.decompress(blob) if compressed else blob)
+        except (zlib.error, ValueError) as e:
+            logger.warning(f"Corrupt API cache entry {cache_key.namespace}/{cache_key.key}: {e}")
+            self.delete(cache_key)
+            self._count(cache_key.namespace, 'misses')
+            return default
+
+        if now - accessed_at > TOUCH_INTERVAL_SECONDS:
+            try:
+                self._connect().execute(
+                    "UPDATE entries SET accessed_at = ? WHERE digest = ?",
+                    (now, cache_key.digest),
+                )
+            except sqlite3.Error:
+                pass  # Recency is best-effort; a locked database must not fail a hit
+
+        self._count(cache_key.namespace, 'hits')
+        return value
+
+    @staticmethod
+    def _encode(value: Any) -> tuple:
+        """JSON-encode and (above COMPRESS_MIN_BYTES) compress. Returns (compressed, blob)."""
+        blob = json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        if len(blob) >= COMPRESS_MIN_BYTES:
+            return True, zlib.compress(blob, 6)
+        return False, blob
+
+    def set(self, cache_key: CacheKey, value: Any, stored_at: Optional[float] = None) -> bool:
+        """Store ``value`` (JSON serializable). Returns False if it could not be saved."""
+        try:
+            compressed, blob = self._encode(value)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Cannot cache {cache_key.namespace}/{cache_key.key}: {e}")
+            return False
+
+        now = time.time()
+        try:
+            self._connect().execute(
+                _UPSERT_SQL,
+                (cache_key.digest, cache_key.namespace, cache_key.key, stored_at or now, now,
+                 int(compressed), len(blob), blob),
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"API cache write failed for {cache_key.namespace}/{cache_key.key}: {e}")
+            return False
+
+        self._count(cache_key.namespace, 'writes')
+        self._maybe_evict()
+        return True
+
+    def set_many(self, items: Iterable[tuple]) -> int:
+        """
+        Store (cache_key, value, stored_at) tuples in one transaction.
+
+        An existing entry is only replaced by an item with a newer stored_at,
+        so re-running a bulk load never clobbers fresher data. Returns the
+        number of items written.
+        """
+        now = time.time()
+        rows = []
+        for cache_key, value, stored_at in items:
+            compressed, blob = self._encode(value)
+            rows.append((cache_key.digest, cache_key.namespace, cache_key.key, stored_at or now,
+                         now, int(compressed), len(blob), blob))
+        if not rows:
+            return 0
+
+        conn = self._connect()
+        conn.execute('BEGIN')
+        try:
+            conn.executemany(_UPSERT_IF_NEWER_SQL, rows)
+            conn.execute('COMMIT')
+        except sqlite3.Error:
+            conn.execute('ROLLBACK')
+            raise
+        return len(rows)
+
+    def _maybe_evict(self) -> None:
+        with self._lock:
+            self._writes_since_check += 1
+            if self._writes_since_check < EVICT_CHECK_INTERVAL:
+                return
+            self._writes_since_check = 0
+        self.evict()
+
+    def delete(self, cache_key: CacheKey) -> None:
+        try:
+            self._connect().execute("DELETE FROM entries WHERE digest = ?", (cache_key.digest,))
+        except sqlite3.Error as e:
+            logger.warning(f"API cache delete failed for {cache_key.namespace}/{cache_key.key}: {e}")
+
+    @staticmethod
+    def _prefix_pattern(key_prefix: str) -> str:
+        """LIKE pattern (ESCAPE '\\') matching keys that start with key_prefix"""
+        return key_prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+    def clear(self, namespace: str, key_prefix: Optional[str] = None) -> int:
+        """Delete a namespace, or the keys in it starting with key_prefix. Returns rows deleted."""
+        if key_prefix:
+            cur = self._connect().execute(
+                "DELETE FROM entries WHERE namespace = ? AND key LIKE ? ESCAPE '\\'",
+                (namespace, self._prefix_pattern(key_prefix)),
+            )
+        else:
+            cur = self._connect().execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+        return cur.rowcount
+
+    def keys(self, namespace: str, key_prefix: Optional[str] = None) -> Iterator[CacheKey]:
+        """
+        Keys stored in a namespace (optionally only those starting with
+        key_prefix), expired or not, in key order. For maintenance scripts
+        that used to walk a cache directory; read values with get().
+        """
+        if key_prefix:
+            rows = self._connect().execute(
+                "SELECT key FROM entries WHERE namespace = ? AND key LIKE ? ESCAPE '\\' ORDER BY key",
+                (namespace, self._prefix_pattern(key_prefix)),
+            ).fetchall()
+        else:
+            rows = self._connect().execute(
+                "SELECT key FROM entries WHERE namespace = ? ORDER BY key", (namespace,),
+            ).fetchall()
+        return (CacheKey(namespace, key) for (key,) in rows)
+
+    def total_bytes(self) -> int:
+        row = self._connect().execute(
+            "SELECT value FROM meta WHERE name = 'total_bytes'"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def evict(self) -> int:
+        """Bring the store under its size bound. Returns entries removed."""
+        if self.total_bytes() <= self.max_bytes:
+            return 0
+
+        conn = self._connect()
+        now = time.time()
+        removed = 0
+        for namespace, ttl_days in NAMESPACE_TTL_DAYS.items():
+            removed += conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND stored_at < ?",
+                (namespace, now - ttl_days * 86400),
+            ).rowcount
+
+        target = int(self.max_bytes * 0.9)
+        while True:
+            excess = self.total_bytes() - target
+            if excess <= 0:
+                break
+            victims = []
+            for digest, size in conn.execute(
+                "SELECT digest, size FROM entries ORDER BY accessed_at LIMIT 1000"
+            ):
+                victims.append((digest,))
+                excess -= size
+                if excess <= 0:
+                    break
+            if not victims:
+                break
+            conn.execute('BEGIN')
+            conn.executemany("DELETE FROM entries WHERE digest = ?", victims)
+            conn.execute('COMMIT')
+            removed += len(victims)
+
+        with self._lock:
+            self._evictions += removed
+        logger.info(f"API cache eviction removed {removed} entries")
+        return removed
+
+    def get_stats(self, include_storage: bool = False) -> dict:
+        """
+        Hit/miss/write counters for this process, by namespace. With
+        include_storage, also entry counts and bytes per namespace (scans
+        the table; meant for scripts, not request paths).
+        """
+        with self._lock:
+            stats = {
+                'namespaces': {ns: dict(counters) for ns, counters in self._stats.items()},
+                'evictions': self._evictions,
+            }
+        stats['total_bytes'] = self.total_bytes()
+        stats['max_bytes'] = self.max_bytes
+        if include_storage:
+            rows = self._connect().execute(
+                "SELECT namespace, COUNT(*), SUM(size) FROM entries GROUP BY namespace"
+            ).fetchall()
+            stats['storage'] = {ns: {'entries': n, 'bytes': b} for ns, n, b in rows}
+        return stats
+
+
+_cache: Optional[ApiCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ApiCache:
+    """Process-wide ApiCache, opened on first use"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                path = os.environ.get('API_CACHE_PATH') or get_cache_root() / 'api_cache.sqlite3'
+                _cache = ApiCache(path)
+    return _cache
+
+
+def get(cache_key: CacheKey, max_age_days: Optional[float] = None, default: Any = None) -> Any:
+    return get_cache().get(cache_key, max_age_days=max_age_days, default=default)
+
+
+def set(cache_key: CacheKey, value: Any, stored_at: Optional[float] = None) -> bool:
+    return get_cache().set(cache_key, value, stored_at=stored_at)
+
+
+def delete(cache_key: CacheKey) -> None:
+    get_cache().delete(cache_key)
+
+
+def clear(namespace: str, key_prefix: Optional[str] = None) -> int:
+    return get_cache().clear(namespace, key_prefix)
+
+
+def keys(namespace: str, key_prefix: Optional[str] = None) -> Iterator[CacheKey]:
+    return get_cache().keys(namespace, key_prefix)
+
+
+def get_stats(include_storage: bool = False) -> dict:
+    return get_cache().get_stats(include_storage)
@@ -0,0 +1,1039 @@
+"""
+Authority Recommendation Matcher
+Matches song_authority_recommendations rows to recordings of the same song
+
+Each recommendation (artist, album title, year, optionally an iTunes album
+id) is compared against the song's recordings by artist name, album title
+and year; a confident match sets song_authority_recommendations.recording_id.
+
+Match Criteria:
+- Song ID must match (required)
+- Artist name fuzzy match (≥85% similarity)
+- Album title fuzzy match (≥85% similarity)
+- Recording year exact or ±1 year tolerance
+
+Confidence Levels:
+- High: Artist ≥90% + album ≥90% + year match
+- Medium: Artist ≥90% + album ≥85%, OR artist ≥80% + album ≥85% + year match
+- Low: Artist ≥80% but weak album/year
+
+PERFORMANCE:
+- Recommendations are matched a song at a time. SongCandidateIndex loads the
+  song's recordings, their performers (leader and all names), default
+  release and every linked release in two queries. Candidate selection - the
+  performer / artist_credit / album title substring filters that used to be
+  LIKE queries over the whole performers table per recommendation - runs
+  against that index in memory, with no LIMIT truncating the candidates.
+- _SongScorer scores every recommendation of the song against every artist
+  and album string in the index with rapidfuzz.process.cdist (one matrix per
+  scorer) instead of one fuzz call per pair.
+- Matches for a song are written with one UPDATE ... FROM unnest().
+
+Used by scripts/jazzs_match_authorityrecs.py (CLI), the per-song admin
+route, and the research worker (KIND_AUTHORITY_MATCH jobs queued by
+/admin/recommendations/run-matcher-all).
+"""
+
+import logging
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import requests
+from rapidfuzz import fuzz, process
+
+from db_utils import get_db_connection
+from core import response_cache
+
+logger = logging.getLogger(__name__)
+
+_ARTIST_SCORERS = (fuzz.ratio, fuzz.token_sort_ratio, fuzz.partial_ratio)
+# token_set_ratio handles word reordering well, e.g.:
+# "The (Be)Witching Hour: Midnight Blue" vs "Midnight Blue, the (Be)witching Hour"
+_ALBUM_SCORERS = _ARTIST_SCORERS + (fuzz.token_set_ratio,)
+
+_CONFIDENCE_ORDER = {'high': 3, 'medium': 2, 'low': 1, 'none': 0}
+
+
+def strip_accents(text: str) -> str:
+    """Remove accents from text for fuzzy matching (e.g., 'Antônio' -> 'Antonio')"""
+    if not text:
+        return text
+    # Normalize to NFD (decomposed form), then remove combining characters
+    normalized = unicodedata.normalize('NFD', text)
+    return ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
+
+
+def _search_key(text: Optional[str]) -> Optional[str]:
+    """In-memory equivalent of SQL unaccent(LOWER(text))"""
+    return strip_accents(text).lower() if text is not None else None
+
+
+# ============================================================================
+# PER-SONG CANDIDATE INDEX
+# ============================================================================
+
+class SongCandidateIndex:
+    """
+    One song's recordings with everything the matcher compares against.
+
+    Each recording dict carries id, recording_year, label, album_title and
+    artist_credit (default release), artist_names (all performers,
+    ' / '-joined), primary_artist (leader) and releases (every linked
+    release's title, artist_credit and release_year).
+    """
+
+    def __init__(self, song_id: str, recordings: List[Dict]):
+        self.song_id = song_id
+        self.recordings = recordings
+        for rec in recordings:
+            rec['_performer_keys'] = [_search_key(n) for n in rec['performer_names'] or []]
+            rec['_credit_key'] = _search_key(rec['artist_credit'])
+            rec['_title_key'] = _search_key(rec['album_title'])
+            for rel in rec['releases']:
+                rel['_title_key'] = _search_key(rel['title'])
+
+    @classmethod
+    def load(cls, song_id: str) -> 'SongCandidateIndex':
+        """Load a song's recordings and linked releases (two queries)"""
+        with get_db_connection() as db:
+            with db.cursor() as cur:
+                cur.execute("""
+                    SELECT
+                        r.id,
+                        r.recording_year,
+                        r.label,
+                        def_rel.title as album_title,
+                        def_rel.artist_credit,
+                        STRING_AGG(DISTINCT p.name, ' / ' ORDER BY p.name) as artist_names,
+                        (ARRAY_AGG(p.name ORDER BY rp.role NULLS LAST, p.name)
+                            FILTER (WHERE p.id IS NOT NULL
+                                    AND (rp.role = 'leader' OR rp.role IS NULL)))[1] as primary_artist,
+                        ARRAY_AGG(DISTINCT p.name) FILTER (WHERE p.id IS NOT NULL) as performer_names
+                    FROM recordings r
+                    LEFT JOIN releases def_rel ON r.default_release_id = def_rel.id
+                    LEFT JOIN recording_performers rp ON rp.recording_id = r.id
+                    LEFT JOIN performers p ON rp.performer_id = p.id
+                    WHERE r.song_id = %s
+                    GROUP BY r.id, def_rel.id
+                    ORDER BY r.recording_year NULLS LAST, r.id
+                """, (song_id,))
+                recordings = [dict(row, releases=[]) for row in cur.fetchall()]
+
+                cur.execute("""
+                    SELECT rr.recording_id, rel.title, rel.artist_credit, rel.release_year
+                    FROM recording_releases rr
+                    JOIN releases rel ON rr.release_id = rel.id
+                    JOIN recordings r ON rr.recording_id = r.id
+                    WHERE r.song_id = %s
+                """, (song_id,))
+                by_id = {rec['id']: rec for rec in recordings}
+                for row in cur.fetchall():
+                    by_id[row['recording_id']]['releases'].append({
+                        'title': row['title'],
+                        'artist_credit': row['artist_credit'],
+                        'release_year': row['release_year'],
+                    })
+
+        return cls(song_id, recordings)
+
+    def artist_strings(self) -> set:
+        """Every artist string a recommendation may be scored against"""
+        strings = set()
+        for rec in self.recordings:
+            strings.update((rec['artist_names'], rec['primary_artist'], rec['artist_credit']))
+            strings.update(rel['artist_credit'] for rel in rec['releases'])
+        strings.discard(None)
+        strings.discard('')
+        return strings
+
+    def album_strings(self) -> set:
+        """Every album title a recommendation may be scored against"""
+        strings = set()
+        for rec in self.recordings:
+            strings.add(rec['album_title'])
+            strings.update(rel['title'] for rel in rec['releases'])
+        strings.discard(None)
+        strings.discard('')
+        return strings
+
+    def by_performer(self, artist_name: str) -> List[Dict]:
+        """
+        Recordings with a performer whose name resembles artist_name: full
+        name, accent-stripped name, last name, or any part of a combined
+        credit ("A & B") contained in the performer name, or the performer
+        name contained in artist_name
+        """
+        normalized_artist = artist_name.lower()
+        # Also create accent-stripped version for matching (e.g., "Antônio" -> "Antonio")
+        stripped_artist = strip_accents(artist_name).lower()
+        # Last word (usually surname) for broader matching
+        name_parts = artist_name.split()
+        last_name = name_parts[-1].lower() if name_parts else normalized_artist
+
+        needles = {normalized_artist, stripped_artist, last_name}
+        # Split combined artist names (e.g., "Warren Vache & Brian Lemon" -> ["Warren Vache", "Brian Lemon"])
+        for part in (p.strip() for p in re.split(r'\s*[&/,]\s*', artist_name)):
+            if len(part) > 3:  # Skip very short parts
+                needles.add(strip_accents(part).lower())
+                part_last_name = part.split()[-1].lower()
+                if len(part_last_name) > 3:
+                    needles.add(part_last_name)
+
+        return [
+            rec for rec in self.recordings
+            if any(key in normalized_artist or any(n in key for n in needles)
+                   for key in rec['_performer_keys'])
+        ]
+
+    def by_artist_credit(self, artist_name: str) -> List[Dict]:
+        """Recordings whose default release's artist_credit resembles artist_name"""
+        normalized_artist = artist_name.lower()
+        stripped_artist = strip_accents(artist_name).lower()
+        return [
+            rec for rec in self.recordings
+            if rec['_credit_key'] is not None and (
+                normalized_artist in rec['_credit_key']
+                or stripped_artist in rec['_credit_key']
+                or rec['_credit_key'] in normalized_artist
+            )
+        ]
+
+    def by_album_title(self, album_title: str) -> List[Dict]:
+        """Recordings whose default or any linked release title contains album_title"""
+        needle = strip_accents(album_title).lower()
+        return [
+            rec for rec in self.recordings
+            if (rec['_title_key'] is not None and needle in rec['_title_key'])
+            or any(rel['_title_key'] is not None and needle in rel['_title_key']
+                   for rel in rec['releases'])
+        ]
+
+    def by_release_title(self, album_title: str) -> List[Tuple[Dict, Dict]]:
+        """(recording, linked release) pairs whose release title contains album_title"""
+        needles = (album_title.lower(), strip_accents(album_title).lower())
+        return [
+            (rec, rel)
+            for rec in self.recordings
+            for rel in rec['releases']
+            if rel['_title_key'] is not None and any(n in rel['_title_key'] for n in needles)
+        ]
+
+
+class _SongScorer:
+    """
+    Artist and album similarity of one song's recommendations against its
+    index, computed a matrix at a time.
+
+    Scores equal AuthorityRecommendationMatcher.compare_artists() /
+    compare_albums() exactly: the max over the same rapidfuzz scorers of the
+    same normalized strings (plus the album year-pattern boost).
+    """
+
+    def __init__(self, matcher: 'AuthorityRecommendationMatcher',
+                 index: SongCandidateIndex, recommendations: List[Dict]):
+        self.matcher = matcher
+        self._artists = self._Table(matcher, index.artist_strings(), _ARTIST_SCORERS)
+        self._albums = self._Table(matcher, index.album_strings(), _ALBUM_SCORERS)
+        self._artists.prime(r.get('artist_name') for r in recommendations)
+        self._albums.prime(r.get('album_title') for r in recommendations)
+
+    class _Table:
+        def __init__(self, matcher, choices: set, scorers):
+            self.matcher = matcher
+            self.scorers = scorers
+            self.choices = sorted(choices)
+            self.columns = {c: i for i, c in enumerate(self.choices)}
+            self.normalized = [matcher.normalize_string(c) for c in self.choices]
+            self.rows: Dict[str, np.ndarray] = {}
+
+        def prime(self, queries) -> None:
+            new = sorted({q for q in queries if q and q not in self.rows})
+            if not new or not self.choices:
+                return
+            normalized = [self.matcher.normalize_string(q) for q in new]
+            scores = np.maximum.reduce([
+                process.cdist(normalized, self.normalized, scorer=scorer, dtype=np.float64)
+                for scorer in self.scorers
+            ])
+            for query, row in zip(new, scores):
+                self.rows[query] = row
+
+        def score(self, query: Optional[str], choice: Optional[str]) -> Optional[float]:
+            if not query or not choice:
+                return 0.0
+            column = self.columns.get(choice)
+            if column is None:
+                return None
+            if query not in self.rows:
+                self.prime([query])
+            return float(self.rows[query][column])
+
+    def artist(self, query: Optional[str], choice: Optional[str]) -> float:
+        score = self._artists.score(query, choice)
+        return self.matcher.compare_artists(query, choice) if score is None else score
+
+    def album(self, query: Optional[str], choice: Optional[str]) -> float:
+        score = self._albums.score(query, choice)
+        if score is None:
+            return self.matcher.compare_albums(query, choice)
+        if not query or not choice:
+            return score
+        return self.matcher.apply_year_boost(query, choice, score)
+
+
+# ============================================================================
+# MATCHER
+# ============================================================================
+
+class AuthorityRecommendationMatcher:
+    """Matches authority recommendations to recordings in the database"""
+
+    def __init__(self, dry_run: bool = False, min_confidence: str = 'medium',
+                 song_name: Optional[str] = None, strategy: str = 'performer',
+                 song_id: Optional[str] = None):
+        self.dry_run = dry_run
+        self.min_confidence = min_confidence
+        self.song_name = song_name
+        self.song_id = song_id
+        self.strategy = strategy  # 'performer' or 'release'
+        self.stats = {
+            'recommendations_processed': 0,
+            'high_confidence_matches': 0,
+            'medium_confidence_matches': 0,
+            'low_confidence_matches': 0,
+            'no_matches': 0,
+            'multiple_matches': 0,
+            'updated': 0,
+            'errors': 0,
+            'itunes_lookups': 0,
+            'itunes_enriched_matches': 0
+        }
+
+        # Setup HTTP session for iTunes API calls
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'ApproachNote/1.0 (+support@approachnote.com)'
+        })
+
+        # Matching thresholds
+        self.thresholds = {
+            'artist_high': 85,
+            'artist_medium': 90,
+            'artist_low': 80,
+            'album_high': 85,
+            'album_medium': 90,
+            'year_tolerance': 1
+        }
+
+        self._normalized: Dict[str, str] = {}
+
+    def normalize_string(self, s: Optional[str]) -> str:
+        """Normalize string for comparison"""
+        if not s:
+            return ""
+        cached = self._normalized.get(s)
+        if cached is not None:
+            return cached
+        original = s
+        # Strip accents (e.g., "Antônio" -> "Antonio")
+        s = strip_accents(s)
+        # Remove common variations
+        s = s.lower().strip()
+        # Remove "the" prefix
+        if s.startswith("the "):
+            s = s[4:]
+        # Remove punctuation (helps token_set_ratio: "Band," vs "Band")
+        s = re.sub(r'[^\w\s]', ' ', s)
+        # Collapse multiple spaces
+        s = re.sub(r'\s+', ' ', s).strip()
+        self._normalized[original] = s
+        return s
+
+    def fetch_itunes_metadata(self, itunes_album_id: int) -> Optional[Dict]:
+        """
+        Fetch album metadata from iTunes API.
+
+        Args:
+            itunes_album_id: The iTunes collection/album ID
+
+        Returns:
+            Dict with artistName, collectionName, releaseDate, etc. or None if lookup fails
+        """
+        try:
+            url = f"https://itunes.apple.com/lookup?id={itunes_album_id}&country=US"
+            logger.debug(f"  Fetching iTunes metadata for album ID: {itunes_album_id}")
+
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+
+            self.stats['itunes_lookups'] += 1
+
+            if data.get('resultCount', 0) > 0:
+                metadata = data['results'][0]
+                logger.debug(f"    iTunes: {metadata.get('artistName')} - {metadata.get('collectionName')}")
+                return metadata
+            else:
+                logger.debug(f"    iTunes API returned no results for album ID: {itunes_album_id}")
+                return None
+
+        except Exception as e:
+            logger.warning(f"Error fetching iTunes metadata: {e}")
+            return None
+
+    def enrich_recommendation_from_itunes(self, recommendation: Dict) -> Optional[Dict]:
+        """
+        Create an enriched copy of a recommendation using iTunes metadata.
+
+        If the recommendation has an itunes_album_id, fetch metadata from iTunes
+        and return a new dict with the iTunes artist/album names.
+
+        Returns:
+            Enriched recommendation dict, or None if no iTunes data available
+        """
+        itunes_album_id = recommendation.get('itunes_album_id')
+        if not itunes_album_id:
+            return None
+
+        itunes_data = self.fetch_itunes_metadata(itunes_album_id)
+        if not itunes_data:
+            return None
+
+        # Create enriched copy with iTunes metadata
+        enriched = dict(recommendation)
+        enriched['artist_name'] = itunes_data.get('artistName', recommendation.get('artist_name'))
+        enriched['album_title'] = itunes_data.get('collectionName', recommendation.get('album_title'))
+
+        # Extract year from releaseDate if available
+        release_date = itunes_data.get('releaseDate', '')
+        if release_date:
+            year_match = re.search(r'(\d{4})', release_date)
+            if year_match:
+                enriched['recording_year'] = int(year_match.group(1))
+
+        logger.info(f"  iTunes enrichment: {enriched['artist_name']} - {enriched['album_title']}")
+
+        return enriched
+
+    def compare_artists(self, artist1: Optional[str], artist2: Optional[str]) -> float:
+        """Compare artist names with fuzzy matching"""
+        if not artist1 or not artist2:
+            return 0.0
+
+        norm1 = self.normalize_string(artist1)
+        norm2 = self.normalize_string(artist2)
+
+        # Best of several approaches; partial_ratio helps match
+        # "J.J. Johnson" against "Kai Winding / J.J. Johnson"
+        return max(scorer(norm1, norm2) for scorer in _ARTIST_SCORERS)
+
+    def extract_year_patterns(self, text: str) -> set:
+        """
+        Extract year patterns from album titles.
+        Handles formats like: '47, '48, 47-48, 1947, 1947-48, etc.
+        Returns a set of normalized 2-digit year strings.
+        """
+        if not text:
+            return set()
+
+        years = set()
+
+        # Match 4-digit years (1947, 1948, etc.)
+        for match in re.finditer(r'\b(19\d{2}|20\d{2})\b', text):
+            years.add(match.group(1)[-2:])  # Keep last 2 digits
+
+        # Match 2-digit years with apostrophe ('47, '48, etc.)
+        for match in re.finditer(r"'(\d{2})\b", text):
+            years.add(match.group(1))
+
+        # Match year ranges (47-48, 1947-48, etc.)
+        for match in re.finditer(r"(\d{2,4})[-–](\d{2})\b", text):
+            first = match.group(1)
+            second = match.group(2)
+            years.add(first[-2:])  # Last 2 digits of first year
+            years.add(second)       # Second year is already 2 digits
+
+        return years
+
+    def apply_year_boost(self, album1: str, album2: str, base_score: float) -> float:
+        """
+        Boost an album score if both titles contain matching year patterns,
+        e.g. "Buddy Rich '47 '48" vs "The Legendary '47-'48 Orchestra"
+        """
+        if base_score >= 85:
+            return base_score
+
+        years1 = self.extract_year_patterns(album1)
+        years2 = self.extract_year_patterns(album2)
+
+        if years1 and years2:
+            # Check if years match (at least 2 matching years, or all years from smaller set match)
+            matching_years = years1 & years2
+            min_years = min(len(years1), len(years2))
+
+            if len(matching_years) >= 2 or (min_years > 0 and len(matching_years) == min_years):
+                # Significant year overlap - boost score to meet medium confidence threshold (85%)
+                boosted = 86.0  # Just above the 85% threshold for album_high
+                logger.debug(f"    Year pattern boost: {base_score:.1f}% -> {boosted:.1f}% (matching years: {matching_years})")
+                return boosted
+
+        return base_score
+
+    def compare_albums(self, album1: Optional[str], album2: Optional[str]) -> float:
+        """Compare album titles with fuzzy matching"""
+        if not album1 or not album2:
+            return 0.0
+
+        norm1 = self.normalize_string(album1)
+        norm2 = self.normalize_string(album2)
+
+        base_score = max(scorer(norm1, norm2) for scorer in _ALBUM_SCORERS)
+        return self.apply_year_boost(album1, album2, base_score)
+
+    def compare_years(self, year1: Optional[int], year2: Optional[int]) -> bool:
+        """Check if years match within tolerance"""
+        if not year1 or not year2:
+            return False
+
+        return abs(year1 - year2) <= self.thresholds['year_tolerance']
+
+    def calculate_match_confidence(
+        self,
+        recommendation: Dict,
+        recording: Dict,
+        scorer: Optional[_SongScorer] = None
+    ) -> Tuple[str, float, Dict]:
+        """
+        Calculate match confidence level and detailed scores.
+
+        Args:
+            recommendation: Recommendation dict (artist_name, album_title, recording_year)
+            recording: Candidate dict (artist_name, album_title, recording_year,
+                       linked_release_years)
+            scorer: Precomputed scores for the song, if matching a whole song
+
+        Returns:
+            (confidence_level, overall_score, details_dict)
+            confidence_level: 'high', 'medium', 'low', or 'none'
+        """
+        compare_artists = scorer.artist if scorer else self.compare_artists
+        compare_albums = scorer.album if scorer else self.compare_albums
+
+        details = {
+            'artist_score': compare_artists(
+                recommendation.get('artist_name'),
+                recording.get('artist_name')
+            ),
+            'album_score': compare_albums(
+                recommendation.get('album_title'),
+                recording.get('album_title')
+            ),
+            # Compare years - check both recording year and linked release years
+            'year_match': self.compare_years(
+                recommendation.get('recording_year'),
+                recording.get('recording_year')
+            ),
+            'release_year_match': False,  # Matches a linked release year
+            'itunes_match': False  # Keep for future but always False for now
+        }
+
+        # Also check if recommendation year matches any linked release year
+        rec_year = recommendation.get('recording_year')
+        linked_years = recording.get('linked_release_years', [])
+        if rec_year and linked_years:
+            details['release_year_match'] = any(
+                self.compare_years(rec_year, release_year) for release_year in linked_years
+            )
+
+        # Determine confidence level
+        # Note: iTunes matching not currently available (recordings don't store iTunes IDs)
+        year_matches = details['year_match'] or details['release_year_match']
+
+        # Check if album lengths are similar (to avoid substring false positives from partial_ratio)
+        # e.g., "Louis Armstrong" would give 100% match for "The Essential Louis Armstrong"
+        rec_album = self.normalize_string(recommendation.get('album_title', ''))
+        db_album = self.normalize_string(recording.get('album_title', ''))
+        albums_similar_length = (
+            min(len(rec_album), len(db_album)) >= 0.7 * max(len(rec_album), len(db_album))
+            if rec_album and db_album else False
+        )
+
+        if (details['artist_score'] >= self.thresholds['artist_medium'] and
+              details['album_score'] >= self.thresholds['album_medium'] and
+              year_matches):
+            confidence = 'high'
+            overall_score = 90.0
+        elif (details['artist_score'] >= self.thresholds['artist_medium'] and
+              details['album_score'] >= self.thresholds['album_high']):
+            confidence = 'medium'
+            overall_score = 85.0
+        elif (details['artist_score'] >= self.thresholds['artist_low'] and
+              details['album_score'] >= self.thresholds['album_high'] and
+              year_matches):
+            confidence = 'medium'
+            overall_score = 80.0
+        # Very high album match (>=95%) + release year match = medium confidence
+        # This handles cases where album is unmistakably correct but artist format differs
+        elif (details['album_score'] >= 95 and year_matches):
+            confidence = 'medium'
+            overall_score = 75.0
+        # Exact album match (100%) with artist >= 60% = medium confidence
+        # This handles cases like "Louis Armstrong & His Orchestra" vs "Louis Armstrong"
+        # where the album title is unmistakably correct despite artist name variations
+        elif (details['album_score'] >= 100 and details['artist_score'] >= 60 and albums_similar_length):
+            confidence = 'medium'
+            # Weight album heavily since exact match is strong signal
+            overall_score = 0.7 * details['album_score'] + 0.3 * details['artist_score']
+        elif details['artist_score'] >= self.thresholds['artist_low']:
+            confidence = 'low'
+            overall_score = details['artist_score']
+        else:
+            confidence = 'none'
+            overall_score = details['artist_score']
+
+        return confidence, overall_score, details
+
+    def _log_comparison(self, recommendation: Dict, rec_dict: Dict, confidence: str,
+                        score: float, details: Dict) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug(f"\nComparing with recording: {rec_dict['artist_name']} - {rec_dict.get('album_title', 'No album')}")
+        logger.debug(f"  Artist: {details['artist_score']:.1f}% similarity")
+        logger.debug(f"    Recommend: '{recommendation.get('artist_name')}'")
+        logger.debug(f"    Recording: '{rec_dict['artist_name']}'")
+        logger.debug(f"  Album: {details['album_score']:.1f}% similarity")
+        logger.debug(f"    Recommend: '{recommendation.get('album_title')}'")
+        logger.debug(f"    Recording: '{rec_dict.get('album_title')}'")
+        year_status = 'MATCH ✓' if details['year_match'] else ('RELEASE MATCH ✓' if details.get('release_year_match') else 'NO MATCH ✗')
+        logger.debug(f"  Year: {year_status}")
+        logger.debug(f"    Recommend: {recommendation.get('recording_year')}")
+        logger.debug(f"    Recording: {rec_dict.get('recording_year')}")
+        if rec_dict.get('linked_release_years'):
+            logger.debug(f"    Linked releases: {rec_dict.get('linked_release_years')}")
+        logger.debug(f"  → RESULT: {confidence.upper()} confidence ({score:.1f}%)")
+
+    def find_matching_recordings(self, recommendation: Dict, index: SongCandidateIndex,
+                                 scorer: _SongScorer) -> List[Tuple[Dict, str, float, Dict]]:
+        """
+        Find all potential recording matches for a recommendation.
+
+        Candidates are recordings with a performer resembling the
+        recommendation's artist (falling back to the default release's
+        artist_credit), plus recordings whose release titles contain the
+        recommended album.
+
+        Returns:
+            List of (recording, confidence_level, overall_score, details)
+        """
+        artist_name = recommendation.get('artist_name', '')
+
+        # If no artist name, can't filter effectively
+        if not artist_name:
+            logger.debug("No artist name in recommendation, skipping")
+            return []
+
+        # (recording, all artists, primary artist)
+        candidates = [(rec, rec['artist_names'], rec['primary_artist'])
+                      for rec in index.by_performer(artist_name)]
+        if candidates:
+            logger.debug(f"Found {len(candidates)} recordings via performer match")
+        else:
+            # Fallback: release.artist_credit, for recordings whose main
+            # artist isn't in recording_performers
+            candidates = [(rec, rec['artist_credit'], rec['artist_credit'])
+                          for rec in index.by_artist_credit(artist_name)]
+            logger.debug(f"Found {len(candidates)} recordings via release.artist_credit fallback")
+
+        # Recordings whose default or a linked release title contains the album
+        album_title = recommendation.get('album_title', '')
+        if album_title and len(album_title) > 5:
+            existing_ids = {rec['id'] for rec, _, _ in candidates}
+            new_matches = [(rec, rec['artist_credit'], rec['artist_credit'])
+                           for rec in index.by_album_title(album_title)
+                           if rec['id'] not in existing_ids]
+            if new_matches:
+                logger.debug(f"Found {len(new_matches)} additional recordings via album title match")
+                candidates += new_matches
+
+        matches = []
+        for recording, all_artists, primary_artist in candidates:
+            rec_dict = {
+                'id': recording['id'],
+                'album_title': recording['album_title'],
+                'recording_year': recording['recording_year'],
+                'label': recording['label'],
+            }
+
+            # Compare against both primary artist and combined artist names,
+            # use whichever gives the better match. This handles cases like
+            # "Warren Vache & Brian Lemon" matching "Brian Lemon / Warren Vaché"
+            primary_score = scorer.artist(artist_name, primary_artist) if primary_artist else 0
+            all_artists_score = scorer.artist(artist_name, all_artists) if all_artists else 0
+
+            if all_artists_score > primary_score:
+                rec_dict['artist_name'] = all_artists
+            else:
+                rec_dict['artist_name'] = primary_artist or all_artists
+
+            # Find the best matching album title from all linked releases
+            # (a recording can appear on many releases)
+            best_album_title = rec_dict.get('album_title', '')
+            best_album_score = scorer.album(album_title, best_album_title)
+            for linked_rel in recording['releases']:
+                linked_album_score = scorer.album(album_title, linked_rel['title'])
+                if linked_album_score > best_album_score:
+                    best_album_score = linked_album_score
+                    best_album_title = linked_rel['title']
+                    # Also use artist_credit from matching release if better
+                    if (scorer.artist(artist_name, linked_rel['artist_credit']) >
+                            scorer.artist(artist_name, rec_dict['artist_name'])):
+                        rec_dict['artist_name'] = linked_rel['artist_credit']
+
+            rec_dict['album_title'] = best_album_title
+            rec_dict['linked_release_years'] = [
+                rel['release_year'] for rel in recording['releases'] if rel['release_year']
+            ]
+
+            confidence, score, details = self.calculate_match_confidence(
+                recommendation, rec_dict, scorer
+            )
+            self._log_comparison(recommendation, rec_dict, confidence, score, details)
+
+            if confidence != 'none':
+                matches.append((rec_dict, confidence, score, details))
+
+        # Sort by confidence level first (high > medium > low), then by score
+        matches.sort(key=lambda x: (_CONFIDENCE_ORDER.get(x[1], 0), x[2]), reverse=True)
+        return matches
+
+    def find_matching_recordings_via_release(self, recommendation: Dict, index: SongCandidateIndex,
+                                             scorer: _SongScorer) -> List[Tuple[Dict, str, float, Dict]]:
+        """
+        Find matching recordings by first matching to releases, then finding recordings.
+
+        This is a release-first approach:
+        1. Find linked releases whose title contains the album title
+        2. Compare against that release's artist_credit and title
+        3. Return matches with confidence scores
+
+        Returns:
+            List of (recording, confidence_level, overall_score, details)
+        """
+        album_title = recommendation.get('album_title', '')
+        if not album_title:
+            logger.debug("No album title in recommendation, skipping release-based matching")
+            return []
+
+        pairs = index.by_release_title(album_title)
+        if not pairs:
+            logger.debug(f"No recordings found via release match for album: {album_title}")
+            return []
+        logger.debug(f"Found {len(pairs)} recordings via release match")
+
+        matches = []
+        for recording, release in pairs:
+            rec_dict = {
+                'id': recording['id'],
+                'album_title': release['title'],  # Use release title
+                'recording_year': recording['recording_year'],
+                'artist_name': release['artist_credit'],  # Use release artist credit
+                'linked_release_years': [
+                    rel['release_year'] for rel in recording['releases'] if rel['release_year']
+                ],
+            }
+
+            confidence, score, details = self.calculate_match_confidence(
+                recommendation, rec_dict, scorer
+            )
+            self._log_comparison(recommendation, rec_dict, confidence, score, details)
+
+            if confidence != 'none':
+                matches.append((rec_dict, confidence, score, details))
+
+        matches.sort(key=lambda x: (_CONFIDENCE_ORDER.get(x[1], 0), x[2]), reverse=True)
+        return matches
+
+    def _find_matches(self, recommendation: Dict, index: SongCandidateIndex,
+                      scorer: _SongScorer) -> List[Tuple[Dict, str, float, Dict]]:
+        if self.strategy == 'release':
+            return self.find_matching_recordings_via_release(recommendation, index, scorer)
+        return self.find_matching_recordings(recommendation, index, scorer)
+
+    def process_recommendation(self, recommendation: Dict, index: SongCandidateIndex,
+                               scorer: _SongScorer) -> Optional[str]:
+        """
+        Try to match a single recommendation against its song's index.
+
+        Returns:
+            The matched recording id if the best match meets min_confidence,
+            None otherwise
+        """
+        self.stats['recommendations_processed'] += 1
+
+        song_title = recommendation['song_title']
+        artist_name = recommendation.get('artist_name', 'Unknown')
+        album_title = recommendation.get('album_title', '')
+
+        logger.info(f"Song: {song_title}")
+        logger.info(f"Recommendation: {artist_name}" +
+                    (f" - {album_title}" if album_title else ""))
+        logger.debug(f"  Details: artist='{artist_name}', album='{album_title}', year={recommendation.get('recording_year')}")
+
+        matches = self._find_matches(recommendation, index, scorer)
+
+        # Track if we used iTunes enrichment for the match
+        used_itunes_enrichment = False
+
+        # If no matches found, try iTunes enrichment as fallback
+        if not matches and recommendation.get('itunes_album_id'):
+            logger.info("  No matches with parsed data, trying iTunes metadata...")
+            enriched = self.enrich_recommendation_from_itunes(recommendation)
+
+            if enriched:
+                # Retry matching with iTunes-enriched data
+                matches = self._find_matches(enriched, index, scorer)
+                if matches:
+                    used_itunes_enrichment = True
+                    logger.info(f"  ✓ iTunes enrichment found {len(matches)} potential match(es)")
+
+        if not matches:
+            logger.info("  No matches found with sufficient confidence")
+            self.stats['no_matches'] += 1
+            return None
+
+        if len(matches) > 1:
+            self.stats['multiple_matches'] += 1
+            # Count by confidence level
+            confidence_counts = {}
+            for _, conf, _, _ in matches:
+                confidence_counts[conf] = confidence_counts.get(conf, 0) + 1
+
+            summary = ", ".join([f"{count} {conf}" for conf, count in sorted(confidence_counts.items(), reverse=True)])
+            logger.info(f"  Found {len(matches)} potential matches: {summary}")
+
+        # Get best match
+        best_recording, confidence, score, details = matches[0]
+
+        # Track by confidence level
+        if confidence == 'high':
+            self.stats['high_confidence_matches'] += 1
+        elif confidence == 'medium':
+            self.stats['medium_confidence_matches'] += 1
+        elif confidence == 'low':
+            self.stats['low_confidence_matches'] += 1
+
+        # Check if confidence meets minimum threshold
+        confidence_levels = {'high': 2, 'medium': 1, 'low': 0}
+        min_level = confidence_levels.get(self.min_confidence, 1)
+        current_level = confidence_levels.get(confidence, 0)
+
+        if current_level < min_level:
+            logger.info(f"  ⚠ Best match is '{confidence}' confidence but minimum is '{self.min_confidence}'")
+            logger.info(f"    Recording: {best_recording.get('artist_name', 'Unknown')} - {best_recording.get('album_title', 'No album')} ({best_recording.get('recording_year', 'No year')})")
+            logger.debug(f"    Scores: Artist {details['artist_score']:.1f}%, Album {details['album_score']:.1f}%, Year {'✓' if details['year_match'] else '✗'}")
+            return None
+
+        # Log match details
+        mode = "[DRY RUN] " if self.dry_run else ""
+        itunes_note = " via iTunes" if used_itunes_enrichment else ""
+        logger.info(f"  ✓ {mode}MATCHED ({confidence.upper()}, {score:.1f}%){itunes_note}")
+        logger.info(f"    Recording: {best_recording.get('artist_name', 'Unknown')} - {best_recording.get('album_title', 'No album')} ({best_recording.get('recording_year', 'No year')})")
+        logger.debug(f"    Scores: Artist {details['artist_score']:.1f}%, Album {details['album_score']:.1f}%, Year {'✓' if details['year_match'] else '✗'}")
+
+        # Track iTunes-enriched matches
+        if used_itunes_enrichment:
+            self.stats['itunes_enriched_matches'] += 1
+
+        return best_recording['id']
+
+    def write_matches(self, matches: List[Tuple[str, str]]) -> None:
+        """
+        Set recording_id for (recommendation_id, recording_id) pairs in one
+        statement. Rows matched meanwhile by someone else are left alone.
+        """
+        if not matches:
+            return
+        if self.dry_run:
+            self.stats['updated'] += len(matches)
+            return
+
+        try:
+            with get_db_connection() as db:
+                with db.cursor() as cur:
+                    cur.execute("""
+                        UPDATE song_authority_recommendations sar
+                        SET recording_id = m.recording_id,
+                            updated_at = CURRENT_TIMESTAMP
+                        FROM unnest(%s::uuid[], %s::uuid[]) AS m(id, recording_id)
+                        WHERE sar.id = m.id
+                          AND sar.recording_id IS NULL
+                    """, ([str(rec_id) for rec_id, _ in matches],
+                          [str(recording_id) for _, recording_id in matches]))
+                    self.stats['updated'] += cur.rowcount
+        except Exception as e:
+            logger.error(f"Error updating recommendations: {e}", exc_info=True)
+            self.stats['errors'] += len(matches)
+
+    def match_song(self, song_id: str, recommendations: List[Dict]) -> None:
+        """Match one song's recommendations against a single index and write the results"""
+        index = SongCandidateIndex.load(song_id)
+        scorer = _SongScorer(self, index, recommendations)
+
+        matches = []
+        for rec in recommendations:
+            self._position += 1
+            logger.info(f"\n[{self._position}/{self._total}] ============================================")
+            try:
+                recording_id = self.process_recommendation(rec, index, scorer)
+                if recording_id:
+                    matches.append((rec['id'], recording_id))
+            except Exception as e:
+                logger.error(f"Error processing recommendation: {e}", exc_info=True)
+                self.stats['errors'] += 1
+
+        self.write_matches(matches)
+
+    def get_unmatched_recommendations(self, limit: Optional[int] = None) -> List[Dict]:
+        """Fetch recommendations that don't have recording_id set"""
+        if self.song_id:
+            logger.info(f"Fetching unmatched recommendations for song: {self.song_id}...")
+        elif self.song_name:
+            logger.info(f"Fetching unmatched recommendations for song: '{self.song_name}'...")
+        else:
+            logger.info("Fetching unmatched recommendations...")
+
+        try:
+            with get_db_connection() as db:
+                with db.cursor() as cur:
+                    query = """
+                        SELECT
+                            sar.id,
+                            sar.song_id,
+                            sar.artist_name,
+                            sar.album_title,
+                            sar.recording_year,
+                            sar.itunes_album_id,
+                            sar.itunes_track_id,
+                            sar.source,
+                            s.title as song_title
+                        FROM song_authority_recommendations sar
+                        JOIN songs s ON sar.song_id = s.id
+                        WHERE sar.recording_id IS NULL
+                    """
+                    params = []
+
+                    if self.song_id:
+                        query += " AND s.id = %s"
+                        params.append(self.song_id)
+                    elif self.song_name:
+                        query += " AND LOWER(s.title) = LOWER(%s)"
+                        params.append(self.song_name)
+
+                    query += " ORDER BY s.title, s.id, sar.artist_name"
+
+                    if limit:
+                        query += f" LIMIT {limit}"
+
+                    cur.execute(query, params)
+                    recommendations = cur.fetchall()
+
+                    if self.song_name and not recommendations:
+                        # Check if song exists at all
+                        cur.execute("""
+                            SELECT s.title, COUNT(sar.id) as total_recs
+                            FROM songs s
+                            LEFT JOIN song_authority_recommendations sar ON s.id = sar.song_id
+                            WHERE LOWER(s.title) = LOWER(%s)
+                            GROUP BY s.id
+                        """, (self.song_name,))
+                        song_info = cur.fetchone()
+
+                        if song_info:
+                            logger.info(f"✓ Song '{song_info['title']}' exists with {song_info['total_recs']} total recommendations (all may be matched)")
+                        else:
+                            logger.warning(f"⚠ No song found with title: '{self.song_name}'")
+
+                    logger.info(f"✓ Found {len(recommendations)} unmatched recommendations")
+                    return recommendations
+
+        except Exception as e:
+            logger.error(f"Database error: {e}", exc_info=True)
+            return []
+
+    def run(self, limit: Optional[int] = None) -> bool:
+        """Main execution method"""
+        logger.info("="*80)
+        logger.info("MATCH AUTHORITY RECOMMENDATIONS TO RECORDINGS")
+        logger.info("="*80)
+        logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE'}")
+        logger.info(f"Strategy: {self.strategy}")
+        logger.info(f"Minimum confidence: {self.min_confidence}")
+        if self.song_name:
+            logger.info(f"Song filter: '{self.song_name}'")
+        logger.info("")
+
+        # Get unmatched recommendations
+        recommendations = self.get_unmatched_recommendations(limit)
+        if not recommendations:
+            logger.info("No unmatched recommendations found")
+            return True
+
+        # Group by song (the query orders by song) so each song's index is
+        # loaded once
+        by_song: Dict[str, List[Dict]] = {}
+        for rec in recommendations:
+            by_song.setdefault(rec['song_id'], []).append(rec)
+
+        self._position, self._total = 0, len(recommendations)
+        for song_id, song_recs in by_song.items():
+            try:
+                self.match_song(song_id, song_recs)
+            except Exception as e:
+                logger.error(f"Error matching recommendations for song {song_id}: {e}", exc_info=True)
+                self.stats['errors'] += len(song_recs)
+
+        # Print summary
+        self.print_summary()
+
+        return True
+
+    def print_summary(self):
+        """Print statistics summary"""
+        logger.info("\n" + "="*80)
+        logger.info("MATCHING SUMMARY")
+        logger.info("="*80)
+        logger.info(f"Recommendations processed:   {self.stats['recommendations_processed']}")
+        logger.info(f"High confidence matches:     {self.stats['high_confidence_matches']}")
+        logger.info(f"Medium confidence matches:   {self.stats['medium_confidence_matches']}")
+        logger.info(f"Low confidence matches:      {self.stats['low_confidence_matches']}")
+        logger.info(f"No matches found:            {self.stats['no_matches']}")
+        logger.info(f"Multiple matches found:      {self.stats['multiple_matches']}")
+        logger.info(f"Recommendations updated:     {self.stats['updated']}")
+        if self.stats['itunes_lookups'] > 0:
+            logger.info(f"iTunes API lookups:          {self.stats['itunes_lookups']}")
+            logger.info(f"iTunes-enriched matches:     {self.stats['itunes_enriched_matches']}")
+        logger.info(f"Errors:                      {self.stats['errors']}")
+        logger.info("="*80)
+
+
+def match_song_job(song_id: str, song_name: str) -> Dict:
+    """
+    Research queue handler for KIND_AUTHORITY_MATCH jobs: match one song's
+    unmatched recommendations (medium confidence, performer strategy, the
+    same settings as the admin buttons)
+    """
+    matcher = AuthorityRecommendationMatcher(song_id=song_id)
+    matcher.run()
+    if matcher.stats['updated']:
+        # Matched recommendations feed authority_count on the song's
+        # recordings list
+        response_cache.invalidate_song(song_id)
+    if matcher.stats['errors']:
+        return {
+            'success': False,
+            'error': f"{matcher.stats['errors']} recommendation(s) failed for {song_name}",
+            'stats': matcher.stats,
+        }
+    return {'success': True, 'stats': matcher.stats}
@@ -0,0 +1,165 @@
+"""
+Bulk Writer
+Set-based inserts for import paths that used to write one row at a time
+
+The MusicBrainz importer wrote each release, recording_releases link,
+performer link and cover art row with its own INSERT, so a recording that
+appears on thirty releases cost well over a hundred round trips inside the
+import transaction. A BulkWriter stages rows in memory and writes them in
+three statements however many there are:
+
+    1. a temp staging table shaped like the target's columns
+    2. COPY of the staged rows into it
+    3. one INSERT ... SELECT ... ON CONFLICT merge into the target,
+       optionally RETURNING the generated IDs
+
+    writer = BulkWriter('recording_releases',
+                        ('recording_id', 'release_id', 'track_number', 'disc_number'),
+                        conflict=('recording_id', 'release_id'))
+    for link in links:
+        writer.add(link)
+    writer.flush(conn)
+
+The staging table is created from the target (CREATE TABLE AS ... WITH NO
+DATA), so columns keep their types - uuid, enums - and COPY's text input is
+cast exactly as a VALUES insert would be. It is dropped on commit and
+recreated by the next flush, so writers can be flushed any number of times
+in one transaction. The caller owns the transaction; flush() never commits.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+from psycopg import sql
+
+logger = logging.getLogger(__name__)
+
+
+class BulkWriter:
+    """Stage rows for one table and merge them with COPY + INSERT ... SELECT"""
+
+    def __init__(self, table: str, columns: Sequence[str],
+                 conflict: Optional[Sequence[str]] = None,
+                 update: Optional[Sequence[str]] = None,
+                 skip_existing: Optional[Sequence[str]] = None,
+                 returning: Optional[Sequence[str]] = None,
+                 touch: Optional[str] = None,
+                 report_inserted: bool = False):
+        """
+        Args:
+            table: Target table
+            columns: Columns of each staged row, in order
+            conflict: ON CONFLICT target columns (None: any constraint)
+            update: Columns set from EXCLUDED on conflict; DO NOTHING if None.
+                    Staged duplicates on ``conflict`` are collapsed, since one
+                    statement may not update the same row twice
+            skip_existing: Skip rows matching an existing row on these columns.
+                           For unique keys with a nullable column (NULLs never
+                           conflict), e.g. release_performers without an
+                           instrument. Staged duplicates are collapsed too
+            returning: Columns returned for every inserted (or updated) row
+            touch: Timestamp column set to CURRENT_TIMESTAMP on update
+            report_inserted: Also return an ``inserted`` flag per row
+                             (false for rows updated on conflict)
+        """
+        if update and not conflict:
+            raise ValueError("update requires conflict columns")
+        self.table = table
+        self.columns = tuple(columns)
+        self.conflict = tuple(conflict) if conflict else None
+        self.update = tuple(update) if update else None
+        self.skip_existing = tuple(skip_existing) if skip_existing else None
+        self.returning = tuple(returning) if returning else ()
+        self.touch = touch
+        self.report_inserted = report_inserted
+        self._rows: List[tuple] = []
+
+    def add(self, row: Sequence[Any]) -> None:
+        """Stage one row (values in ``columns`` order)"""
+        if len(row) != len(self.columns):
+            raise ValueError(
+                f"{self.table}: expected {len(self.columns)} values, got {len(row)}"
+            )
+        self._rows.append(tuple(row))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def flush(self, conn) -> List[Dict[str, Any]]:
+        """
+        Write the staged rows and clear them
+
+        Returns:
+            The RETURNING rows (empty without ``returning``). With DO NOTHING,
+            rows skipped as conflicts are not returned.
+        """
+        if not self._rows:
+            return []
+
+        rows, self._rows = self._rows, []
+        stage = sql.Identifier(f"_bulk_{self.table}")
+        table = sql.Identifier(self.table)
+        columns = sql.SQL(', ').join(map(sql.Identifier, self.columns))
+
+        with conn.cursor() as cur:
+            cur.execute(sql.SQL("""
+                DROP TABLE IF EXISTS {stage};
+                CREATE TEMP TABLE {stage} ON COMMIT DROP AS
+                    SELECT {columns} FROM {table} WITH NO DATA
+            """).format(stage=stage, columns=columns, table=table))
+
+            with cur.copy(sql.SQL("COPY {stage} ({columns}) FROM STDIN").format(
+                    stage=stage, columns=columns)) as copy:
+                for row in rows:
+                    copy.write_row(row)
+
+            cur.execute(self._merge_query(stage, table, columns))
+            result = cur.fetchall() if self.returning or self.report_inserted else []
+
+        logger.debug(f"Bulk write {self.table}: {len(rows)} staged, "
+                     f"{cur.rowcount} written")
+        return result
+
+    def _merge_query(self, stage, table, columns) -> sql.Composed:
+        distinct_on = self.conflict if self.update else self.skip_existing
+        parts = [sql.SQL("INSERT INTO {table} ({columns}) SELECT").format(
+            table=table, columns=columns)]
+        if distinct_on:
+            parts.append(sql.SQL("DISTINCT ON ({})").format(
+                sql.SQL(', ').join(sql.Identifier('s', c) for c in distinct_on)))
+        parts.append(sql.SQL("{} FROM {} s").format(
+            sql.SQL(', ').join(sql.Identifier('s', c) for c in self.columns), stage))
+
+        if self.skip_existing:
+            match = sql.SQL(' AND ').join(
+                sql.SQL("t.{col} = s.{col}").format(col=sql.Identifier(c))
+                for c in self.skip_existing
+            )
+            parts.append(sql.SQL("WHERE NOT EXISTS (SELECT 1 FROM {} t WHERE {})").format(
+                table, match))
+
+        if self.conflict:
+            parts.append(sql.SQL("ON CONFLICT ({})").format(
+                sql.SQL(', ').join(map(sql.Identifier, self.conflict))))
+        else:
+            parts.append(sql.SQL("ON CONFLICT"))
+
+        if self.update:
+            assignments = [
+                sql.SQL("{col} = EXCLUDED.{col}").format(col=sql.Identifier(c))
+                for c in self.update
+            ]
+            if self.touch:
+                assignments.append(sql.SQL("{} = CURRENT_TIMESTAMP").format(
+                    sql.Identifier(self.touch)))
+            parts.append(sql.SQL("DO UPDATE SET {}").format(sql.SQL(', ').join(assignments)))
+        else:
+            parts.append(sql.SQL("DO NOTHING"))
+
+        returning = [sql.Identifier(c) for c in self.returning]
+        if self.report_inserted:
+            returning.append(sql.SQL("(xmax = 0) AS inserted"))
+        if returning:
+            parts.append(sql.SQL("RETURNING {}").format(sql.SQL(', ').join(returning)))
+
+        return sql.SQL(' ').join(parts)
@@ -0,0 +1,207 @@
+"""
+Cache Bus Module
+Cross-process cache invalidation through the cache_invalidations table
+
+core.response_cache and core.principal_cache live in process memory. That was
+enough while the backend was a single gunicorn worker with research running
+inside it; now the web tier runs several workers and research runs in its own
+process (research_worker.py), so an invalidation made in one process has to
+reach the others. Each invalidation is appended to cache_invalidations
+(sql/migrations/019_shared_runtime_state.sql) and every web worker tails the
+table from a background thread:
+
+    cache_bus.register('response', apply_fn)   # at import, per cache
+    cache_bus.publish('response', ['song:<id>', 'index'])
+    cache_bus.start()                          # per web worker (gunicorn.conf.py)
+
+Design notes:
+
+- The publishing process has already invalidated its own copy; rows it
+  wrote are skipped when it reads the log back (matched on ``origin``).
+
+- A table rather than LISTEN/NOTIFY because the pool goes through Supabase's
+  transaction pooler, where LISTEN doesn't survive between transactions.
+  Remote invalidations therefore land within POLL_SECONDS, not instantly;
+  the caches' own TTLs remain the backstop (including for the rare row whose
+  id commits after a larger one has already been read).
+
+- Publishing is best effort: a failed INSERT is logged, never raised, so a
+  write endpoint doesn't fail over cache bookkeeping.
+
+- The poller starts from the newest row at startup. A fresh process has empty
+  caches, so there is nothing older to apply.
+
+Configuration (environment):
+    CACHE_BUS_POLL_SECONDS        how often web workers read the log (default: 2)
+    CACHE_BUS_RETENTION_SECONDS   how long log rows are kept (default: 3600)
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+POLL_SECONDS = float(os.environ.get('CACHE_BUS_POLL_SECONDS', 2))
+RETENTION_SECONDS = int(os.environ.get('CACHE_BUS_RETENTION_SECONDS', 3600))
+
+# Rows applied per poll; a backlog drains over consecutive polls
+POLL_BATCH_SIZE = 500
+
+# How often a poller prunes rows older than RETENTION_SECONDS
+PRUNE_INTERVAL_SECONDS = 600.0
+
+# Wildcard key: drop everything in the named cache
+ALL_KEYS = '*'
+
+_handlers: dict[str, Callable[[list], None]] = {}
+
+_poller_thread: Optional[threading.Thread] = None
+_stop_event = threading.Event()
+_last_id: Optional[int] = None
+_last_prune = 0.0
+_stats_lock = threading.Lock()
+_stats = {'published': 0, 'publish_errors': 0, 'applied': 0, 'poll_errors': 0}
+
+
+def _origin() -> str:
+    # Evaluated per call: gunicorn forks workers after import
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _bump(stat: str, n: int = 1) -> None:
+    with _stats_lock:
+        _stats[stat] += n
+
+
+def register(cache: str, handler: Callable[[list], None]) -> None:
+    """
+    Route invalidations for ``cache`` to ``handler``, which is called with the
+    published keys (``[ALL_KEYS]`` for a full clear) and must only touch this
+    process's copy
+    """
+    _handlers[cache] = handler
+
+
+def publish(cache: str, keys: Iterable) -> None:
+    """Tell the other processes to invalidate ``keys`` in ``cache``"""
+    import db_utils as db_tools
+
+    keys = [str(k) for k in keys]
+    try:
+        db_tools.execute_update(
+            "INSERT INTO cache_invalidations (cache, keys, origin) VALUES (%s, %s, %s)",
+            (cache, keys, _origin())
+        )
+        _bump('published')
+    except Exception as e:
+        _bump('publish_errors')
+        logger.warning(f"Cache bus: could not publish {cache} invalidation {keys}: {e}")
+
+
+def _apply(rows: list) -> None:
+    origin = _origin()
+    applied = 0
+    for row in rows:
+        if row['origin'] == origin:
+            continue
+        handler = _handlers.get(row['cache'])
+        if handler is None:
+            continue
+        try:
+            handler(list(row['keys']))
+            applied += 1
+        except Exception as e:
+            logger.error(f"Cache bus: handler for {row['cache']} failed: {e}", exc_info=True)
+    if applied:
+        _bump('applied', applied)
+
+
+def poll_once() -> int:
+    """Apply invalidations published since the last poll. Returns rows read."""
+    global _last_id
+    import db_utils as db_tools
+
+    if _last_id is None:
+        row = db_tools.execute_query(
+            "SELECT COALESCE(MAX(id), 0) AS id FROM cache_invalidations",
+            fetch_one=True
+        )
+        _last_id = row['id'] if row else 0
+        return 0
+
+    rows = db_tools.execute_query("""
+        SELECT id, cache, keys, origin
+        FROM cache_invalidations
+        WHERE id > %s
+        ORDER BY id
+        LIMIT %s
+    """, (_last_id, POLL_BATCH_SIZE)) or []
+    if rows:
+        _apply(rows)
+        _last_id = rows[-1]['id']
+    return len(rows)
+
+
+def _prune() -> None:
+    global _last_prune
+    now = time.monotonic()
+    if now - _last_prune < PRUNE_INTERVAL_SECONDS:
+        return
+    _last_prune = now
+
+    import db_utils as db_tools
+    pruned = db_tools.execute_update("""
+        DELETE FROM cache_invalidations
+        WHERE created_at < CURRENT_TIMESTAMP - make_interval(secs => %s)
+    """, (RETENTION_SECONDS,))
+    if pruned:
+        logger.info(f"Cache bus: pruned {pruned} old invalidations")
+
+
+def _poll_loop() -> None:
+    logger.info(f"Cache bus poller started in PID {os.getpid()} (every {POLL_SECONDS}s)")
+    while not _stop_event.is_set():
+        try:
+            # Drain a backlog without waiting out the interval between batches
+            while poll_once() == POLL_BATCH_SIZE and not _stop_event.is_set():
+                pass
+            _prune()
+        except Exception as e:
+            _bump('poll_errors')
+            logger.warning(f"Cache bus: poll failed: {e}")
+        _stop_event.wait(POLL_SECONDS)
+    logger.info(f"Cache bus poller stopped in PID {os.getpid()}")
+
+
+def start() -> None:
+    """Start tailing the invalidation log in this process (idempotent)"""
+    global _poller_thread
+    if _poller_thread is not None and _poller_thread.is_alive():
+        return
+    _stop_event.clear()
+    _poller_thread = threading.Thread(target=_poll_loop, daemon=True, name="CacheBusPoller")
+    _poller_thread.start()
+
+
+def stop() -> None:
+    """Stop the poller thread"""
+    global _poller_thread
+    if _poller_thread is None:
+        return
+    _stop_event.set()
+    _poller_thread.join(timeout=5.0)
+    _poller_thread = None
+
+
+def get_stats() -> dict:
+    """Publish/apply counters and poller state, for diagnostics"""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats['polling'] = _poller_thread is not None and _poller_thread.is_alive()
+    stats['last_id'] = _last_id
+    stats['poll_seconds'] = POLL_SECONDS
+    return stats
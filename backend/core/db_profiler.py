@@ -0,0 +1,518 @@
+"""
+Database Profiler Module
+Per-request query accounting, Server-Timing headers and a slow-statement report
+
+execute_query() used to log its checkout/exec/fetch timings and nothing else,
+and routes that run SQL on get_db_connection() cursors directly (most of
+routes/admin.py) weren't measured at all. This module measures at the cursor:
+db_utils opens every connection with ``cursor_factory=ProfilingCursor``, so
+every statement is counted no matter which helper issued it.
+
+Per request (installed with init_db_profiler(app)):
+
+    Server-Timing: db;dur=41.2;desc="23 queries", db-pool;dur=0.3,
+                   db-exec;dur=37.5, db-fetch;dur=3.4, app;dur=58.0
+
+Per process, over a rolling window:
+
+- statements, aggregated by normalized SQL (literals replaced with ``?``):
+  calls, total and max time, and the endpoint that last ran them;
+- endpoints: requests, queries per request and the most-repeated statement
+  in a single request. A statement repeated REPEAT_THRESHOLD or more times
+  in one request is the usual N+1 signature and is flagged.
+
+Both are shown on /admin/performance. Numbers are per gunicorn worker: the
+page reports the worker that served it.
+
+With DB_PROFILER_EXPLAIN_MS set, a read statement slower than that gets an
+``EXPLAIN (ANALYZE, BUFFERS)`` captured on the same connection, inside a
+savepoint, at most once per PLAN_REFRESH_SECONDS per statement. ANALYZE runs
+the query a second time, so leave it off unless you're hunting a plan. The
+savepoint is always rolled back, and only statements whose function calls
+are all known read-only builtins qualify: a ``SELECT
+refresh_song_streaming_stats(...)`` is a write that happens to start with
+SELECT.
+
+Configuration (environment):
+    DB_PROFILER_ENABLED         'false' disables all accounting (default: true)
+    DB_PROFILER_SERVER_TIMING   'false' omits the Server-Timing header (default: true)
+    DB_PROFILER_WINDOW_SECONDS  length of one rolling window (default: 3600);
+                                the report covers the current and previous one
+    DB_PROFILER_TOP_N           rows per report table (default: 25)
+    DB_PROFILER_EXPLAIN_MS      EXPLAIN threshold in ms (default: 0, off)
+"""
+
+import contextvars
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+import psycopg
+from psycopg import sql as pgsql
+from psycopg.pq import TransactionStatus
+from psycopg.rows import tuple_row
+
+logger = logging.getLogger(__name__)
+
+PROFILER_ENABLED = os.environ.get('DB_PROFILER_ENABLED', 'true').lower() != 'false'
+SERVER_TIMING_ENABLED = os.environ.get('DB_PROFILER_SERVER_TIMING', 'true').lower() != 'false'
+WINDOW_SECONDS = int(os.environ.get('DB_PROFILER_WINDOW_SECONDS', 3600))
+TOP_N = int(os.environ.get('DB_PROFILER_TOP_N', 25))
+EXPLAIN_THRESHOLD_MS = float(os.environ.get('DB_PROFILER_EXPLAIN_MS', 0))
+
+# Same statement this many times in one request is reported as a likely N+1
+REPEAT_THRESHOLD = 10
+
+# Bound on distinct statements tracked per window; the cheapest are dropped
+MAX_TRACKED_STATEMENTS = 500
+
+# Minimum age of a captured plan before the statement is EXPLAINed again
+PLAN_REFRESH_SECONDS = 600
+
+# Longest normalized SQL kept (the report truncates for display anyway)
+MAX_SQL_LENGTH = 4000
+
+BACKGROUND_ENDPOINT = '(background)'
+
+
+# ============================================================================
+# SQL NORMALIZATION
+# ============================================================================
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_READ_STATEMENT = re.compile(r"^\s*(?:SELECT|WITH)\b", re.IGNORECASE)
+_WRITE_KEYWORD = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+_FUNCTION_CALL = re.compile(r"\b([A-Za-z_][\w.]*)\s*\(")
+
+# Names that may precede "(" in a statement EXPLAIN ANALYZE is allowed to
+# re-run: SQL keywords, and builtins (plus the app's IMMUTABLE search
+# helpers) with no side effects. Any other call -- the refresh_* functions,
+# nextval(), pg_advisory_lock() -- may write, so the statement is skipped.
+_EXPLAIN_SAFE_CALLS = frozenset({
+    'select', 'from', 'where', 'and', 'or', 'not', 'in', 'exists', 'any',
+    'all', 'some', 'as', 'on', 'join', 'lateral', 'using', 'values', 'over',
+    'filter', 'within', 'cast', 'array', 'row', 'partition',
+    'count', 'sum', 'min', 'max', 'avg', 'bool_or', 'bool_and',
+    'array_agg', 'string_agg', 'json_agg', 'jsonb_agg', 'row_number', 'rank',
+    'dense_rank', 'coalesce', 'nullif', 'greatest', 'least', 'lower',
+    'upper', 'length', 'abs', 'round', 'power', 'extract', 'date_trunc',
+    'to_char', 'make_interval', 'now', 'unnest', 'cardinality',
+    'array_length', 'concat', 'substring', 'trim', 'replace', 'split_part',
+    'json_build_object', 'jsonb_build_object', 'json_build_array',
+    'jsonb_build_array', 'row_to_json', 'to_json', 'to_jsonb', 'unaccent',
+    'similarity', 'word_similarity', 'search_normalize',
+    'search_normalize_array',
+})
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Collapse a statement to its shape: literals become ``?``, IN lists of
+    literals become ``(?)`` and whitespace is squeezed, so the same query
+    with different values aggregates under one key
+    """
+    sql = _STRING_LITERAL.sub('?', sql)
+    sql = _NUMBER_LITERAL.sub('?', sql)
+    sql = _WHITESPACE.sub(' ', sql).strip()
+    sql = _IN_LIST.sub('(?)', sql)
+    return sql[:MAX_SQL_LENGTH]
+
+
+def _query_text(query, cursor) -> str:
+    if isinstance(query, str):
+        return query
+    if isinstance(query, bytes):
+        return query.decode('utf-8', 'replace')
+    try:
+        return query.as_string(cursor)
+    except Exception:
+        return str(query)
+
+
+# ============================================================================
+# PER-REQUEST PROFILE
+# ============================================================================
+
+@dataclass
+class RequestProfile:
+    """Database time spent by one request"""
+    endpoint: str
+    started: float = field(default_factory=time.perf_counter)
+    queries: int = 0
+    pool_wait_ms: float = 0.0
+    exec_ms: float = 0.0
+    fetch_ms: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    @property
+    def db_ms(self) -> float:
+        return self.pool_wait_ms + self.exec_ms + self.fetch_ms
+
+    def server_timing(self) -> str:
+        app_ms = (time.perf_counter() - self.started) * 1000
+        return (
+            f'db;dur={self.db_ms:.1f};desc="{self.queries} queries", '
+            f'db-pool;dur={self.pool_wait_ms:.1f}, '
+            f'db-exec;dur={self.exec_ms:.1f}, '
+            f'db-fetch;dur={self.fetch_ms:.1f}, '
+            f'app;dur={app_ms:.1f}'
+        )
+
+
+_current: contextvars.ContextVar[Optional[RequestProfile]] = contextvars.ContextVar(
+    'db_profile', default=None
+)
+
+# Set while the profiler runs its own EXPLAIN, so that isn't counted
+_in_explain = threading.local()
+
+
+def current_profile() -> Optional[RequestProfile]:
+    """The profile of the request running on this thread, if any"""
+    return _current.get()
+
+
+# ============================================================================
+# PROCESS-WIDE AGGREGATES
+# ============================================================================
+
+@dataclass
+class StatementStats:
+    sql: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_endpoint: Optional[str] = None
+
+
+@dataclass
+class EndpointStats:
+    endpoint: str
+    requests: int = 0
+    queries: int = 0
+    max_queries: int = 0
+    db_ms: float = 0.0
+    max_db_ms: float = 0.0
+    max_repeats: int = 0
+    repeated_sql: Optional[str] = None
+
+
+class _Window:
+    def __init__(self, started: float):
+        self.started = started
+        self.statements: dict[str, StatementStats] = {}
+        self.endpoints: dict[str, EndpointStats] = {}
+
+
+_lock = threading.Lock()
+_window = _Window(time.time())
+_previous: Optional[_Window] = None
+
+# Plans outlive window rotation so a rarely-slow statement keeps its plan
+_plans: dict[str, tuple] = {}
+
+
+def _rotate_if_due(now: float) -> None:
+    global _window, _previous
+    if now - _window.started >= WINDOW_SECONDS:
+        _previous = _window
+        _window = _Window(now)
+
+
+def _record_statement(sql: str, elapsed_ms: float, endpoint: str) -> None:
+    with _lock:
+        _rotate_if_due(time.time())
+        stats = _window.statements.get(sql)
+        if stats is None:
+            if len(_window.statements) >= MAX_TRACKED_STATEMENTS:
+                cheapest = min(_window.statements.values(), key=lambda s: s.total_ms)
+                del _window.statements[cheapest.sql]
+            stats = _window.statements[sql] = StatementStats(sql)
+        stats.calls += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+        stats.last_endpoint = endpoint
+
+
+def _record_request(profile: RequestProfile) -> None:
+    repeated_sql, repeats = (profile.statements.most_common(1) or [(None, 0)])[0]
+    with _lock:
+        _rotate_if_due(time.time())
+        stats = _window.endpoints.get(profile.endpoint)
+        if stats is None:
+            stats = _window.endpoints[profile.endpoint] = EndpointStats(profile.endpoint)
+        stats.requests += 1
+        stats.queries += profile.queries
+        stats.max_queries = max(stats.max_queries, profile.queries)
+        stats.db_ms += profile.db_ms
+        stats.max_db_ms = max(stats.max_db_ms, profile.db_ms)
+        if repeats > stats.max_repeats:
+            stats.max_repeats = repeats
+            stats.repeated_sql = repeated_sql
+    if repeats >= REPEAT_THRESHOLD:
+        logger.info(
+            f"Possible N+1 in {profile.endpoint}: same statement {repeats}x "
+            f"({profile.queries} queries, {profile.db_ms:.0f}ms db): {repeated_sql[:200]}"
+        )
+
+
+# ============================================================================
+# HOOKS CALLED BY db_utils
+# ============================================================================
+
+def record_pool_wait(seconds: float) -> None:
+    """Add a pool checkout wait to the current request"""
+    profile = _current.get()
+    if profile is not None:
+        profile.pool_wait_ms += seconds * 1000
+
+
+def _is_explainable(sql: str) -> bool:
+    """True when EXPLAIN ANALYZE can re-run ``sql`` without side effects"""
+    if not _READ_STATEMENT.match(sql) or _WRITE_KEYWORD.search(sql):
+        return False
+    return all(name.lower() in _EXPLAIN_SAFE_CALLS for name in _FUNCTION_CALL.findall(sql))
+
+
+def _maybe_explain(cursor, sql: str, query, params, elapsed_ms: float) -> None:
+    if not EXPLAIN_THRESHOLD_MS or elapsed_ms < EXPLAIN_THRESHOLD_MS:
+        return
+    if not _is_explainable(sql):
+        return
+    captured = _plans.get(sql)
+    if captured and time.time() - captured[2] < PLAN_REFRESH_SECONDS:
+        return
+
+    conn = cursor.connection
+    if conn.info.transaction_status == TransactionStatus.INERROR:
+        return
+    if isinstance(query, pgsql.Composable):
+        explain = pgsql.Composed([pgsql.SQL('EXPLAIN (ANALYZE, BUFFERS) '), query])
+    else:
+        explain = 'EXPLAIN (ANALYZE, BUFFERS) ' + _query_text(query, cursor)
+
+    _in_explain.active = True
+    try:
+        # Savepoint when the caller is mid-transaction, so a failed EXPLAIN
+        # can't poison the caller's transaction. Always rolled back: whatever
+        # the re-run did must not be committed with the caller's work.
+        with conn.transaction():
+            with conn.cursor(row_factory=tuple_row) as cur:
+                cur.execute(explain, params)
+                plan = '\n'.join(row[0] for row in cur.fetchall())
+            raise psycopg.Rollback()
+        with _lock:
+            _plans.pop(sql, None)
+            if len(_plans) >= MAX_TRACKED_STATEMENTS:
+                del _plans[next(iter(_plans))]
+            # (plan text, duration of the slow run, captured at)
+            _plans[sql] = (plan, elapsed_ms, time.time())
+        logger.info(f"Captured plan for slow statement ({elapsed_ms:.0f}ms): {sql[:200]}")
+    except Exception as e:
+        logger.warning(f"Could not EXPLAIN slow statement: {e}")
+    finally:
+        _in_explain.active = False
+
+
+class ProfilingCursor(psycopg.Cursor):
+    """
+    psycopg cursor that reports execute/fetch time to the profiler.
+
+    Installed by db_utils as the connection cursor_factory.
+    """
+
+    def execute(self, query, params=None, **kwargs):
+        if not PROFILER_ENABLED or getattr(_in_explain, 'active', False):
+            return super().execute(query, params, **kwargs)
+        start = time.perf_counter()
+        try:
+            return super().execute(query, params, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._record(query, params, elapsed_ms, calls=1)
+
+    def executemany(self, query, params_seq, **kwargs):
+        if not PROFILER_ENABLED or getattr(_in_explain, 'active', False):
+            return super().executemany(query, params_seq, **kwargs)
+        start = time.perf_counter()
+        try:
+            return super().executemany(query, params_seq, **kwargs)
+        finally:
+            self._record(query, None, (time.perf_counter() - start) * 1000, calls=0)
+
+    def _record(self, query, params, elapsed_ms: float, calls: int) -> None:
+        try:
+            sql = normalize_sql(_query_text(query, self))
+            profile = _current.get()
+            if profile is not None:
+                profile.queries += 1
+                profile.exec_ms += elapsed_ms
+                profile.statements[sql] += 1
+            _record_statement(sql, elapsed_ms, profile.endpoint if profile else BACKGROUND_ENDPOINT)
+            if calls and self.pgresult is not None:
+                _maybe_explain(self, sql, query, params, elapsed_ms)
+        except Exception as e:
+            # Accounting must never break a query
+            logger.debug(f"DB profiler: could not record statement: {e}")
+
+    def _timed_fetch(self, fetch, *args):
+        profile = _current.get() if PROFILER_ENABLED else None
+        if profile is None:
+            return fetch(*args)
+        start = time.perf_counter()
+        try:
+            return fetch(*args)
+        finally:
+            profile.fetch_ms += (time.perf_counter() - start) * 1000
+
+    def fetchone(self):
+        return self._timed_fetch(super().fetchone)
+
+    def fetchmany(self, size=0):
+        return self._timed_fetch(super().fetchmany, size)
+
+    def fetchall(self):
+        return self._timed_fetch(super().fetchall)
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def _merged(attr: str, merge) -> list:
+    merged: dict = {}
+    for window in (_previous, _window):
+        if window is None:
+            continue
+        for key, stats in getattr(window, attr).items():
+            merged[key] = merge(merged.get(key), stats)
+    return list(merged.values())
+
+
+def _merge_statement(a: Optional[StatementStats], b: StatementStats) -> StatementStats:
+    if a is None:
+        return StatementStats(b.sql, b.calls, b.total_ms, b.max_ms, b.last_endpoint)
+    a.calls += b.calls
+    a.total_ms += b.total_ms
+    a.max_ms = max(a.max_ms, b.max_ms)
+    a.last_endpoint = b.last_endpoint
+    return a
+
+
+def _merge_endpoint(a: Optional[EndpointStats], b: EndpointStats) -> EndpointStats:
+    if a is None:
+        return EndpointStats(**vars(b))
+    a.requests += b.requests
+    a.queries += b.queries
+    a.max_queries = max(a.max_queries, b.max_queries)
+    a.db_ms += b.db_ms
+    a.max_db_ms = max(a.max_db_ms, b.max_db_ms)
+    if b.max_repeats > a.max_repeats:
+        a.max_repeats, a.repeated_sql = b.max_repeats, b.repeated_sql
+    return a
+
+
+def get_report(top_n: int = TOP_N) -> dict:
+    """
+    Slow statements and per-endpoint query counts for the current and
+    previous window, heaviest first
+    """
+    with _lock:
+        _rotate_if_due(time.time())
+        statements = _merged('statements', _merge_statement)
+        endpoints = _merged('endpoints', _merge_endpoint)
+        since = (_previous or _window).started
+        plans = dict(_plans)
+
+    def statement_row(s: StatementStats) -> dict:
+        plan = plans.get(s.sql)
+        return {
+            'sql': s.sql,
+            'calls': s.calls,
+            'total_ms': round(s.total_ms, 1),
+            'avg_ms': round(s.total_ms / s.calls, 2) if s.calls else 0.0,
+            'max_ms': round(s.max_ms, 1),
+            'last_endpoint': s.last_endpoint,
+            'plan': plan[0] if plan else None,
+            'plan_ms': round(plan[1], 1) if plan else None,
+        }
+
+    def endpoint_row(e: EndpointStats) -> dict:
+        return {
+            'endpoint': e.endpoint,
+            'requests': e.requests,
+            'avg_queries': round(e.queries / e.requests, 1) if e.requests else 0.0,
+            'max_queries': e.max_queries,
+            'avg_db_ms': round(e.db_ms / e.requests, 1) if e.requests else 0.0,
+            'max_db_ms': round(e.max_db_ms, 1),
+            'max_repeats': e.max_repeats,
+            'repeated_sql': e.repeated_sql,
+            'suspect_n_plus_one': e.max_repeats >= REPEAT_THRESHOLD,
+        }
+
+    by_total = sorted(statements, key=lambda s: s.total_ms, reverse=True)[:top_n]
+    by_max = sorted(statements, key=lambda s: s.max_ms, reverse=True)[:top_n]
+    by_queries = sorted(endpoints, key=lambda e: (e.max_repeats, e.queries / max(e.requests, 1)),
+                        reverse=True)[:top_n]
+    return {
+        'pid': os.getpid(),
+        'enabled': PROFILER_ENABLED,
+        'since': since,
+        'window_seconds': WINDOW_SECONDS,
+        'explain_threshold_ms': EXPLAIN_THRESHOLD_MS,
+        'repeat_threshold': REPEAT_THRESHOLD,
+        'statements_by_total': [statement_row(s) for s in by_total],
+        'statements_by_max': [statement_row(s) for s in by_max],
+        'endpoints': [endpoint_row(e) for e in by_queries],
+    }
+
+
+def reset() -> None:
+    """Forget all aggregates and captured plans in this process"""
+    global _window, _previous
+    with _lock:
+        _window = _Window(time.time())
+        _previous = None
+        _plans.clear()
+
+
+# ============================================================================
+# FLASK INTEGRATION
+# ============================================================================
+
+def init_db_profiler(app) -> None:
+    """Start a profile per request and emit Server-Timing on the response"""
+    if not PROFILER_ENABLED:
+        logger.info("DB profiler is disabled (DB_PROFILER_ENABLED=false)")
+        return
+
+    from flask import g, request
+
+    @app.before_request
+    def _start_db_profile():
+        profile = RequestProfile(endpoint=request.endpoint or request.path)
+        g._db_profile_token = _current.set(profile)
+
+    @app.after_request
+    def _finish_db_profile(response):
+        profile = _current.get()
+        if profile is None:
+            return response
+        if SERVER_TIMING_ENABLED:
+            response.headers.add('Server-Timing', profile.server_timing())
+        _record_request(profile)
+        return response
+
+    @app.teardown_request
+    def _clear_db_profile(exc):
+        token = g.pop('_db_profile_token', None)
+        if token is not None:
+            _current.reset(token)
@@ -0,0 +1,312 @@
+"""
+JSON Stream Module
+Streamed, fast-encoded JSON for full-catalog list endpoints
+
+/songs, /songs/index, /performers and /performers/index return the whole
+catalog. They used to fetchall() every row into dicts and hand the list to
+jsonify(), so peak memory and time-to-first-byte both grew with the catalog.
+This module runs the query on a server-side cursor and encodes rows a chunk
+at a time as the response is sent:
+
+    return json_stream.stream_query(
+        "SELECT id, title FROM songs ORDER BY title",
+        columnar=json_stream.wants_columns(),
+    )
+
+Design notes:
+
+- The first chunk is fetched before the response is returned, so a failing
+  query still becomes the route's normal 500. An error after that can only
+  truncate the body (the status line is already sent); it is logged.
+
+- The pooled connection is held until the last chunk is written (or the
+  client disconnects and the WSGI server closes the iterator).
+
+- Rows are encoded with orjson when it is installed and the stdlib json
+  module otherwise. Output matches utils/json_provider.CustomJSONProvider:
+  sorted keys, dates and datetimes as YYYY-MM-DD, UUIDs and Decimals as
+  strings.
+
+- ``?format=columns`` returns parallel arrays instead of an array of
+  objects: ``{"count": N, "columns": {"id": [...], "title": [...]}}``. Keys
+  are sent once rather than once per row. Arrays can't be written before
+  every row has been read, so this form holds the column values (not
+  per-row dicts) until the end and sends nothing before that.
+
+- Compression is a separate decorator, compressed_response, placed outside
+  cached_response so the response cache keeps the identity body and both
+  hits and misses are compressed. Streamed bodies are compressed chunk by
+  chunk (gzip, or br when the brotli package is installed).
+"""
+
+import contextlib
+import decimal
+import gzip
+import json
+import logging
+import threading
+import uuid
+import zlib
+from collections import OrderedDict
+from datetime import date
+from functools import wraps
+from typing import Any, Iterable, Iterator, Optional
+
+from flask import Response, make_response, request
+from psycopg.rows import tuple_row
+
+import db_utils as db_tools
+
+# Optional fast encoder and br compression - plain json / gzip without them
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched from the server-side cursor (and encoded) per chunk
+STREAM_CHUNK_ROWS = 2000
+
+# Bodies smaller than this aren't worth compressing
+MIN_COMPRESS_BYTES = 1024
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Compressed copies of cached (ETagged) bodies, so a cache hit isn't
+# recompressed on every request
+COMPRESSED_CACHE_ENTRIES = 32
+
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+def _default(obj: Any) -> Any:
+    # Same output as utils/json_provider.CustomJSONProvider
+    if isinstance(obj, date):
+        return obj.strftime('%Y-%m-%d')
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(obj: Any) -> bytes:
+        """Encode ``obj`` as compact JSON bytes"""
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+else:
+    def dumps(obj: Any) -> bytes:
+        """Encode ``obj`` as compact JSON bytes"""
+        return json.dumps(obj, default=_default, sort_keys=True,
+                          separators=(',', ':')).encode()
+
+
+def wants_columns() -> bool:
+    """True when the client asked for parallel arrays (?format=columns)"""
+    return request.args.get('format') == 'columns'
+
+
+def _encode_rows(columns: list, chunks: Iterable[list]) -> Iterator[bytes]:
+    yield b'['
+    first = True
+    for rows in chunks:
+        if not rows:
+            continue
+        body = dumps([dict(zip(columns, row)) for row in rows])
+        yield (body[1:-1] if first else b',' + body[1:-1])
+        first = False
+    yield b']'
+
+
+def _encode_columns(columns: list, chunks: Iterable[list]) -> Iterator[bytes]:
+    values = [[] for _ in columns]
+    count = 0
+    for rows in chunks:
+        for row in rows:
+            for i, value in enumerate(row):
+                values[i].append(value)
+        count += len(rows)
+    yield b'{"count":' + str(count).encode() + b',"columns":{'
+    for i, name in enumerate(columns):
+        yield (b',' if i else b'') + dumps(name) + b':' + dumps(values[i])
+        values[i] = None
+    yield b'}}'
+
+
+def rows_response(rows: list, columnar: bool = False) -> Response:
+    """
+    Response for rows already in memory (e.g. a search result), in the same
+    encodings as stream_query()
+    """
+    columns = list(rows[0].keys()) if rows else []
+    tuples = [tuple(row[c] for c in columns) for row in rows]
+    encode = _encode_columns if columnar else _encode_rows
+    return Response(b''.join(encode(columns, [tuples])), mimetype='application/json')
+
+
+# ============================================================================
+# STREAMING
+# ============================================================================
+
+def stream_query(query: str, params: Any = None, columnar: bool = False,
+                 chunk_rows: int = STREAM_CHUNK_ROWS) -> Response:
+    """
+    Stream a query's rows as a JSON array (or columns, see module docstring)
+
+    Args:
+        query: SELECT to run on a server-side cursor
+        params: Query parameters
+        columnar: Emit parallel arrays instead of an array of objects
+        chunk_rows: Rows fetched and encoded per chunk
+
+    Returns:
+        A streamed 200 response. Raises if the query fails before the first
+        chunk is read.
+    """
+    stack = contextlib.ExitStack()
+    try:
+        conn = stack.enter_context(db_tools.get_db_connection())
+        cur = stack.enter_context(
+            conn.cursor(name=f"json_stream_{uuid.uuid4().hex}", row_factory=tuple_row)
+        )
+        cur.execute(query, params)
+        columns = [col.name for col in cur.description]
+        first = cur.fetchmany(chunk_rows)
+    except BaseException:
+        stack.close()
+        raise
+
+    def chunks() -> Iterator[list]:
+        rows = first
+        while rows:
+            yield rows
+            if len(rows) < chunk_rows:
+                return
+            rows = cur.fetchmany(chunk_rows)
+
+    def generate() -> Iterator[bytes]:
+        try:
+            encode = _encode_columns if columnar else _encode_rows
+            yield from encode(columns, chunks())
+        except Exception as e:
+            logger.error(f"JSON stream failed mid-response: {e}", exc_info=True)
+            raise
+        finally:
+            stack.close()
+
+    response = Response(generate(), mimetype='application/json')
+    # Covers a body that is never iterated (e.g. HEAD), whose generator
+    # cleanup would not run
+    response.call_on_close(stack.close)
+    return response
+
+
+# ============================================================================
+# COMPRESSION
+# ============================================================================
+
+_compressed_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_compressed_lock = threading.Lock()
+
+
+def _negotiate() -> Optional[str]:
+    offered = ['br', 'gzip'] if BROTLI_AVAILABLE else ['gzip']
+    return request.accept_encodings.best_match(offered)
+
+
+def _compress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def _compress_stream(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        compress, flush, finish = compressor.process, compressor.flush, compressor.finish
+    else:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        compress = compressor.compress
+        flush = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)
+        finish = compressor.flush
+    try:
+        for chunk in chunks:
+            # Flush per chunk so the client can start parsing immediately
+            data = compress(chunk) + flush()
+            if data:
+                yield data
+        yield finish()
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close:
+            close()
+
+
+def compress(response: Response) -> Response:
+    """gzip/br-encode a 200 response if the client accepts it"""
+    if response.status_code != 200 or 'Content-Encoding' in response.headers:
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = _negotiate()
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = _compress_stream(response.response, encoding)
+        response.headers.pop('Content-Length', None)
+    else:
+        body = response.get_data()
+        if len(body) < MIN_COMPRESS_BYTES:
+            return response
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            key = (etag, encoding)
+            with _compressed_lock:
+                data = _compressed_cache.get(key)
+                if data is not None:
+                    _compressed_cache.move_to_end(key)
+            if data is None:
+                data = _compress_body(body, encoding)
+                with _compressed_lock:
+                    _compressed_cache[key] = data
+                    while len(_compressed_cache) > COMPRESSED_CACHE_ENTRIES:
+                        _compressed_cache.popitem(last=False)
+            # Same content, different bytes: only a weak validator holds
+            response.set_etag(etag, weak=True)
+        else:
+            data = _compress_body(body, encoding)
+        response.set_data(data)
+
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def compressed_response(f):
+    """
+    Route decorator: compress the response per Accept-Encoding.
+
+    Place it above cached_response so cached bodies stay uncompressed:
+
+        @songs_bp.route('/songs/index', methods=['GET'])
+        @compressed_response
+        @cached_response(lambda: [TAG_INDEX])
+        def get_songs_index():
+            ...
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        return compress(make_response(f(*args, **kwargs)))
+    return decorated_function
@@ -0,0 +1,100 @@
+"""
+Pagination Module
+Opaque keyset cursors for list endpoints
+
+Keyset ("seek") pagination resumes after the last row of the previous
+page with a WHERE on the ORDER BY key, so page N costs the same as page 1
+and rows inserted meanwhile don't shift later pages the way OFFSET does.
+
+The cursor handed to clients is the sort name plus the last row's key
+values, JSON encoded and base64url'd. Clients pass it back verbatim as
+?after=; they should never build or parse one:
+
+    after = pagination.decode_cursor(request.args.get('after'), sort_by, (int, str, UUID))
+    rows = ...  WHERE (k1, k2, id) > (%s, %s, %s) ... LIMIT limit + 1
+    page, next_cursor = pagination.paginate(rows, limit, sort_by, key)
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def parse_page_limit(value: Optional[str], default: int = DEFAULT_PAGE_SIZE) -> int:
+    """Parse a ?limit= argument, clamped to 1..MAX_PAGE_SIZE"""
+    try:
+        limit = int(value) if value else default
+    except (TypeError, ValueError):
+        limit = default
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def encode_cursor(sort: str, key: Sequence[Any]) -> str:
+    """Cursor for resuming after a row whose sort key is ``key``"""
+    raw = json.dumps([sort, *key], default=str, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def _valid_key_value(value: Any, key_type: type) -> bool:
+    if key_type is int:
+        # NULL sort keys (e.g. an undated recording) come back as None
+        return value is None or (isinstance(value, int) and not isinstance(value, bool))
+    if key_type is UUID:
+        if not isinstance(value, str):
+            return False
+        try:
+            UUID(value)
+        except ValueError:
+            return False
+        return True
+    return isinstance(value, key_type)
+
+
+def decode_cursor(token: Optional[str], sort: str,
+                  key_types: Optional[Sequence[type]] = None) -> Optional[List[Any]]:
+    """
+    Key values from a cursor, or None when no cursor was given.
+
+    Args:
+        token: The ?after= value
+        sort: Sort order the page is being read in
+        key_types: Expected type of each key value (int, which may also be
+                   None, str or UUID, which must be a UUID string), so a
+                   tampered cursor is rejected here rather than in SQL
+
+    Raises ValueError for a malformed cursor, one issued for a different
+    sort order (its key would mean something else), or one whose key
+    values don't match key_types.
+    """
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError('Invalid cursor') from e
+    if not isinstance(values, list) or len(values) < 2 or values[0] != sort:
+        raise ValueError('Invalid cursor')
+    key = values[1:]
+    if key_types is not None and (
+            len(key) != len(key_types)
+            or not all(_valid_key_value(v, t) for v, t in zip(key, key_types))):
+        raise ValueError('Invalid cursor')
+    return key
+
+
+def paginate(rows: List[dict], limit: int, sort: str,
+             key: Callable[[dict], Sequence[Any]]) -> Tuple[List[dict], Optional[str]]:
+    """
+    Split rows fetched with LIMIT limit + 1 into the page and the cursor
+    for the next one (None on the last page)
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(sort, key(page[-1]))
@@ -0,0 +1,214 @@
+"""
+Principal Cache Module
+In-process TTL cache of the users rows the auth middleware checks
+
+require_auth and optional_auth used to check out a pooled connection and
+run SELECT ... FROM users WHERE id = %s on every authenticated request,
+after the JWT had already been verified. With the pool capped at a handful
+of connections, favorites/repertoire/contribution traffic then queued
+behind catalog reads for a lookup whose answer almost never changes. This
+module keeps the row (the "principal") in memory for a short TTL:
+
+    user = principal_cache.get_principal(user_id)   # None if no such user
+    if not user['is_active'] or user['account_locked']: ...
+
+Design notes:
+
+- Keyed by user_id. Values are the id/email/display_name/is_active/
+  account_locked/is_admin columns; callers get a copy, so a handler that
+  edits g.current_user can't change what the next request sees.
+
+- Missing users are not cached (a lookup for a deleted user costs a query,
+  as before).
+
+- Writers that change is_active, account_locked or is_admin call
+  invalidate_user(): the login handlers when a failed attempt (un)locks
+  the account, the password routes, and the admin gate, which always reads
+  the row fresh and stores what it saw. invalidate_user() also publishes
+  through core.cache_bus so the other web workers drop their copy within a
+  poll interval. Changes made without it (scripts/grant_admin.py, SQL
+  consoles) are picked up when the TTL expires, so the TTL bounds how long
+  a lock or deactivation can lag.
+
+- A generation counter guards the fill race as in core.response_cache: a
+  lookup that started before an invalidation does not store its (possibly
+  stale) row afterwards.
+
+Configuration (environment):
+    AUTH_PRINCIPAL_CACHE_TTL          entry lifetime in seconds (default: 60, 0 disables)
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES  LRU bound (default: 10000)
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from core import cache_bus
+from db_utils import get_db_connection
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = float(os.environ.get('AUTH_PRINCIPAL_CACHE_TTL', 60))
+DEFAULT_MAX_ENTRIES = int(os.environ.get('AUTH_PRINCIPAL_CACHE_MAX_ENTRIES', 10000))
+
+PRINCIPAL_COLUMNS = ('id', 'email', 'display_name', 'is_active', 'account_locked', 'is_admin')
+
+# Name this cache's invalidations are published under (core.cache_bus)
+BUS_NAME = 'principal'
+
+
+class PrincipalCache:
+    """Thread-safe bounded LRU of user principals with a per-entry TTL"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0,
+                       'evictions': 0, 'invalidations': 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, user_id) -> Optional[dict]:
+        key = str(user_id)
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self._stats['misses'] += 1
+                return None
+            principal, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return dict(principal)
+
+    def set(self, user_id, principal: dict, generation: Optional[int] = None) -> bool:
+        """
+        Store a principal unless an invalidation happened since
+        ``generation`` was read (None stores unconditionally). Returns True
+        if stored.
+        """
+        if not self.enabled:
+            return False
+        key = str(user_id)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._entries[key] = (dict(principal), time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            self._stats['stores'] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+            return True
+
+    def invalidate(self, user_id) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(str(user_id), None)
+            self._stats['invalidations'] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._stats['invalidations'] += 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else None
+        stats['max_entries'] = self.max_entries
+        stats['ttl_seconds'] = self.ttl_seconds
+        stats['enabled'] = self.enabled
+        return stats
+
+
+# Process-wide cache instance
+_cache = PrincipalCache()
+
+
+def get_cache() -> PrincipalCache:
+    """Get the process-wide principal cache"""
+    return _cache
+
+
+def load_principal(user_id) -> Optional[dict]:
+    """Read a principal from the users table, bypassing the cache"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(f"""
+                SELECT {', '.join(PRINCIPAL_COLUMNS)}
+                FROM users
+                WHERE id = %s
+            """, (user_id,))
+            row = cur.fetchone()
+    return dict(row) if row else None
+
+
+def get_principal(user_id) -> Optional[dict]:
+    """A user's principal, from the cache when fresh, else from the database"""
+    if _cache.enabled:
+        principal = _cache.get(user_id)
+        if principal is not None:
+            return principal
+
+    generation = _cache.generation
+    principal = load_principal(user_id)
+    if principal is not None:
+        _cache.set(user_id, principal, generation)
+    return principal
+
+
+def refresh_principal(user_id) -> Optional[dict]:
+    """Read a principal fresh from the database and replace the cached copy"""
+    principal = load_principal(user_id)
+    if principal is None:
+        _cache.invalidate(user_id)
+    else:
+        _cache.set(user_id, principal)
+    return principal
+
+
+def invalidate_user(user_id) -> None:
+    """Drop a user's cached principal; call after changing its users row"""
+    if user_id is None:
+        return
+    _cache.invalidate(user_id)
+    cache_bus.publish(BUS_NAME, [user_id])
+    logger.debug(f"Principal cache: invalidated user {user_id}")
+
+
+def _apply_remote_invalidation(keys: list) -> None:
+    """cache_bus handler: drop this process's copies for another's write"""
+    if cache_bus.ALL_KEYS in keys:
+        _cache.clear()
+        return
+    for user_id in keys:
+        _cache.invalidate(user_id)
+
+
+cache_bus.register(BUS_NAME, _apply_remote_invalidation)
+
+
+def get_cache_stats() -> dict:
+    """Hit/miss/eviction counters plus current size, for diagnostics"""
+    return _cache.get_stats()
@@ -0,0 +1,109 @@
+"""
+Rate Limit Storage Module
+Flask-Limiter storage backed by the rate_limit_counters table
+
+Flask-Limiter's default memory:// storage keeps one set of counters per
+process. With several gunicorn workers that multiplies every limit by the
+worker count (a "10 per minute" login limit becomes 10 per worker), so the
+counters live in Postgres instead, next to everything else the workers share
+(sql/migrations/019_shared_runtime_state.sql). Importing this module registers
+the ``app-postgres://`` scheme with the ``limits`` package:
+
+    Limiter(storage_uri='app-postgres://', ...)
+
+Only the fixed-window strategy is supported, which is the one rate_limit.py
+uses. Each counter row holds the window's count and when the window ends; a
+hit on an expired row starts a new window in the same upsert, so there is
+never a separate read-then-write race between workers. Expired rows are
+removed by an occasional sweep from whichever worker happens to be counting.
+"""
+
+import logging
+import time
+
+from limits.storage import Storage
+
+import db_utils as db_tools
+
+logger = logging.getLogger(__name__)
+
+STORAGE_SCHEME = 'app-postgres'
+
+# Minimum gap between expired-row sweeps in one process
+SWEEP_INTERVAL_SECONDS = 300.0
+
+
+class PostgresRateLimitStorage(Storage):
+    """Fixed-window counters in rate_limit_counters, shared by all workers"""
+
+    STORAGE_SCHEME = [STORAGE_SCHEME]
+
+    def __init__(self, uri: str = None, wrap_exceptions: bool = False, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self._last_sweep = 0.0
+
+    @property
+    def base_exceptions(self):
+        return Exception
+
+    def incr(self, key: str, expiry: float, amount: int = 1, elastic_expiry: bool = False) -> int:
+        # elastic_expiry is only passed by older limits releases; the
+        # fixed-window strategy never sets it
+        self._maybe_sweep()
+        row = db_tools.execute_query("""
+            INSERT INTO rate_limit_counters (key, count, expires_at)
+            VALUES (%(key)s, %(amount)s, CURRENT_TIMESTAMP + make_interval(secs => %(expiry)s))
+            ON CONFLICT (key) DO UPDATE SET
+                count = CASE
+                    WHEN rate_limit_counters.expires_at <= CURRENT_TIMESTAMP THEN EXCLUDED.count
+                    ELSE rate_limit_counters.count + EXCLUDED.count
+                END,
+                expires_at = CASE
+                    WHEN rate_limit_counters.expires_at <= CURRENT_TIMESTAMP THEN EXCLUDED.expires_at
+                    ELSE rate_limit_counters.expires_at
+                END
+            RETURNING count
+        """, {'key': key, 'amount': amount, 'expiry': expiry}, fetch_one=True)
+        return row['count']
+
+    def get(self, key: str) -> int:
+        row = db_tools.execute_query("""
+            SELECT count FROM rate_limit_counters
+            WHERE key = %s AND expires_at > CURRENT_TIMESTAMP
+        """, (key,), fetch_one=True)
+        return row['count'] if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        row = db_tools.execute_query("""
+            SELECT EXTRACT(EPOCH FROM expires_at)::float AS expires_at
+            FROM rate_limit_counters
+            WHERE key = %s AND expires_at > CURRENT_TIMESTAMP
+        """, (key,), fetch_one=True)
+        return row['expires_at'] if row else time.time()
+
+    def check(self) -> bool:
+        try:
+            db_tools.execute_query("SELECT 1 AS ok", fetch_one=True)
+            return True
+        except Exception:
+            return False
+
+    def reset(self) -> int:
+        return db_tools.execute_update("DELETE FROM rate_limit_counters")
+
+    def clear(self, key: str) -> None:
+        db_tools.execute_update("DELETE FROM rate_limit_counters WHERE key = %s", (key,))
+
+    def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep < SWEEP_INTERVAL_SECONDS:
+            return
+        self._last_sweep = now
+        try:
+            swept = db_tools.execute_update(
+                "DELETE FROM rate_limit_counters WHERE expires_at <= CURRENT_TIMESTAMP"
+            )
+            if swept:
+                logger.debug(f"Rate limit storage: swept {swept} expired counters")
+        except Exception as e:
+            logger.warning(f"Rate limit storage: sweep failed: {e}")
@@ -1,258 +1,701 @@
 """
 Research Queue Module
 Manages background processing queue for song research tasks
+
+Jobs live in the research_jobs table (sql/migrations/016_research_jobs.sql)
+rather than in process memory, so:
+
+- A deploy or crash doesn't lose queued songs. A job whose worker died
+  mid-run stops heartbeating and is put back on the queue.
+- Any number of workers can drain the queue at once. Each worker claims the
+  oldest eligible job with SELECT ... FOR UPDATE SKIP LOCKED, so workers in
+  other threads or other processes never block on or double-claim a job.
+- Queueing a song that is already waiting is a no-op (per-song dedup), and
+  a song is never researched by two workers at the same time.
+- Failed jobs are retried with exponential backoff up to max_attempts.
+
+Most jobs research a song (KIND_RESEARCH, run by the function passed to
+start_worker). Other per-song background work is queued with its own kind
+and run by the matching entry of start_worker's job_handlers (e.g.
+KIND_AUTHORITY_MATCH, the authority recommendation matcher). Dedup is per
+song and kind; a song still only ever has one job running.
+
+Queue size, queued songs and progress are read from the table, so they
+report across every worker, not just the ones in this process. Worker
+processes (normally research_worker.py, separate from the web tier) also
+heartbeat a row in research_workers, so the web tier can tell whether
+anything is draining the queue.
+
+Configuration (environment):
+    RESEARCH_WORKER_THREADS       worker threads per process (default: 1)
+    RESEARCH_MAX_ATTEMPTS         attempts before a job is marked failed (default: 3)
+    RESEARCH_RETRY_BASE_SECONDS   first retry delay, doubled per attempt (default: 60)
+    RESEARCH_JOB_STALE_SECONDS    heartbeat age after which a running job is
+                                  presumed dead and re-queued (default: 900)
+    RESEARCH_JOB_RETENTION_DAYS   how long finished jobs are kept (default: 7)
 """
 
-import queue
+import json
+import os
+import socket
 import threading
 import logging
+import time
 from typing import Optional
 
+import psycopg
+
+import db_utils as db_tools
+from core import streaming_stats
+
 logger = logging.getLogger(__name__)
 
-# Global task queue - thread-safe
-research_queue = queue.Queue()
+WORKER_THREADS = int(os.environ.get('RESEARCH_WORKER_THREADS', 1))
+MAX_ATTEMPTS = int(os.environ.get('RESEARCH_MAX_ATTEMPTS', 3))
+RETRY_BASE_SECONDS = int(os.environ.get('RESEARCH_RETRY_BASE_SECONDS', 60))
+STALE_JOB_SECONDS = int(os.environ.get('RESEARCH_JOB_STALE_SECONDS', 900))
+RETENTION_DAYS = int(os.environ.get('RESEARCH_JOB_RETENTION_DAYS', 7))
+
+# How long an idle worker sleeps between claim attempts
+POLL_INTERVAL_SECONDS = 2.0
 
-# Flag to control worker thread
+# Minimum gap between progress writes for a job, except for a phase's first
+# and last update (progress doubles as the job heartbeat, so this also
+# bounds heartbeat write traffic)
+PROGRESS_FLUSH_SECONDS = 2.0
+
+# How often a worker runs stale-job recovery and the retention sweep (and
+# refreshes its process heartbeat)
+MAINTENANCE_INTERVAL_SECONDS = 60.0
+
+# Heartbeat age after which a worker process is reported as gone
+WORKER_STALE_SECONDS = 3 * MAINTENANCE_INTERVAL_SECONDS
+
+# Flag to control worker threads
 _worker_running = False
-_worker_thread: Optional[threading.Thread] = None
+_worker_threads: list[threading.Thread] = []
+
+# Set by add_song_to_queue (and stop_worker) so idle workers in this
+# process wake up immediately instead of waiting out the poll interval
+_wakeup_event = threading.Event()
 
-# Currently processing song
-_current_song: Optional[dict] = None
-_current_song_lock = threading.Lock()
+_last_maintenance = 0.0
+_maintenance_lock = threading.Lock()
+
+# kind -> handler(song_id, song_name) for kinds other than KIND_RESEARCH,
+# set by start_worker
+_job_handlers: dict = {}
+
+# The job each worker thread is currently running, for update_progress()
+_thread_state = threading.local()
 
 # Progress tracking for current research operation
 # Phase names for research stages
 PHASE_IDLE = 'idle'
 PHASE_MB_FETCH = 'musicbrainz_fetch'  # Fetching recording details from MusicBrainz
+PHASE_MB_RELEASE_PREFETCH = 'musicbrainz_release_prefetch'  # Fetching release details ahead of import
 PHASE_MB_RECORDING_IMPORT = 'musicbrainz_recording_import'  # Processing/importing recordings
 PHASE_SPOTIFY_TRACK_MATCH = 'spotify_track_match'
+PHASE_APPLE_MUSIC_MATCH = 'apple_music_match'
+PHASE_CAA_IMPORT = 'caa_import'
 
-_current_progress: Optional[dict] = None
-_progress_lock = threading.Lock()
+# Job statuses (research_jobs.status)
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
 
+# Job kinds (research_jobs.kind)
+KIND_RESEARCH = 'research'
+KIND_AUTHORITY_MATCH = 'authority_match'
 
-def add_song_to_queue(song_id: str, song_name: str, force_refresh: bool = True) -> bool:
+
+def add_song_to_queue(song_id: str, song_name: str, force_refresh: bool = True,
+                      kind: str = KIND_RESEARCH) -> bool:
     """
     Add a song to the research queue
 
+    If the song is already waiting in the queue this is a no-op, except that
+    a deep refresh request upgrades a waiting simple refresh.
+
     Args:
         song_id: UUID of the song
         song_name: Name of the song
         force_refresh: If True, bypass cache and re-fetch all data (default).
                       If False, use cached data where available ("simple refresh").
+        kind: Job kind (default: research)
 
     Returns:
-        True if successfully queued, False otherwise
+        True if successfully queued (or already queued), False otherwise
     """
-    import os
     try:
-        research_queue.put({
-            'song_id': song_id,
-            'song_name': song_name,
-            'force_refresh': force_refresh
-        })
+        row = db_tools.execute_query("""
+            INSERT INTO research_jobs (song_id, song_name, force_refresh, max_attempts, kind)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (song_id, kind) WHERE status = 'queued'
+            DO UPDATE SET force_refresh = research_jobs.force_refresh OR EXCLUDED.force_refresh
+            RETURNING id, (xmax = 0) AS inserted
+        """, (song_id, song_name, force_refresh, MAX_ATTEMPTS, kind), fetch_one=True)
+
         refresh_mode = "deep" if force_refresh else "simple"
-        logger.info(f"Queued song for research ({refresh_mode} refresh): {song_id} / {song_name}")
-        logger.info(f"  Queue size after add: {research_queue.qsize()}")
-        logger.info(f"  Process ID: {os.getpid()}")
-        logger.info(f"  Worker running flag: {_worker_running}")
-        logger.info(f"  Worker thread: {_worker_thread}")
+        if row['inserted']:
+            logger.info(f"Queued song for {kind} ({refresh_mode} refresh): {song_id} / {song_name} (job {row['id']})")
+        else:
+            logger.info(f"Song already queued for {kind}: {song_id} / {song_name} (job {row['id']})")
+        _wakeup_event.set()
         return True
     except Exception as e:
         logger.error(f"Error queuing song {song_id}: {e}")
         return False
 
 
-def get_queue_size() -> int:
-    """Get the current size of the research queue"""
-    return research_queue.qsize()
+def add_songs_to_queue(songs: list[dict], force_refresh: bool = True,
+                       kind: str = KIND_RESEARCH) -> int:
+    """
+    Queue many songs in one statement (e.g. a full-catalog refresh)
+
+    Same dedup rules as add_song_to_queue().
+
+    Args:
+        songs: Dicts with 'id' and 'title'
+        force_refresh: See add_song_to_queue()
+        kind: Job kind (default: research)
+
+    Returns:
+        Number of songs now waiting in the queue from this batch
+    """
+    if not songs:
+        return 0
+    rows = db_tools.execute_query("""
+        INSERT INTO research_jobs (song_id, song_name, force_refresh, max_attempts, kind)
+        SELECT t.song_id, t.song_name, %s, %s, %s
+        FROM unnest(%s::uuid[], %s::text[]) AS t(song_id, song_name)
+        ON CONFLICT (song_id, kind) WHERE status = 'queued'
+        DO UPDATE SET force_refresh = research_jobs.force_refresh OR EXCLUDED.force_refresh
+        RETURNING id
+    """, (
+        force_refresh, MAX_ATTEMPTS, kind,
+        [str(s['id']) for s in songs], [s['title'] for s in songs]
+    )) or []
+    logger.info(f"Queued {len(rows)} songs for {kind} ({'deep' if force_refresh else 'simple'} refresh)")
+    _wakeup_event.set()
+    return len(rows)
+
+
+def get_queue_size(kind: str = KIND_RESEARCH) -> int:
+    """Get the number of jobs of one kind waiting to run (across all workers)"""
+    row = db_tools.execute_query(
+        "SELECT COUNT(*) AS n FROM research_jobs WHERE status = 'queued' AND kind = %s",
+        (kind,), fetch_one=True
+    )
+    return row['n'] if row else 0
+
+
+def get_failed_count(kind: str = KIND_RESEARCH) -> int:
+    """
+    Get the number of jobs of one kind that ran out of attempts
+
+    Failed jobs are pruned with the other finished jobs after
+    RESEARCH_JOB_RETENTION_DAYS, so this counts recent failures only.
+    """
+    row = db_tools.execute_query(
+        "SELECT COUNT(*) AS n FROM research_jobs WHERE status = 'failed' AND kind = %s",
+        (kind,), fetch_one=True
+    )
+    return row['n'] if row else 0
+
+
+def get_active_jobs() -> list[dict]:
+    """
+    Get every job currently running, across all workers and processes
+
+    Returns:
+        List of dicts with song_id, song_name, kind, force_refresh, worker_id,
+        attempts, started_at and progress, oldest first
+    """
+    return db_tools.execute_query("""
+        SELECT song_id::text AS song_id, song_name, kind, force_refresh, worker_id,
+               attempts, started_at, progress
+        FROM research_jobs
+        WHERE status = 'running'
+        ORDER BY started_at, id
+    """) or []
 
 
 def get_current_song() -> Optional[dict]:
     """
     Get the currently processing song
-    
+
+    With several workers this is the longest-running job; see
+    get_active_jobs() for all of them.
+
     Returns:
         Dict with song_id and song_name if a song is being processed, None otherwise
     """
-    with _current_song_lock:
-        return _current_song.copy() if _current_song else None
+    jobs = get_active_jobs()
+    if not jobs:
+        return None
+    job = jobs[0]
+    return {
+        'song_id': job['song_id'],
+        'song_name': job['song_name'],
+        'force_refresh': job['force_refresh']
+    }
+
+
+def get_queued_songs(kind: str = KIND_RESEARCH) -> list[dict]:
+    """
+    Get all songs currently in the queue for one kind of job
 
+    Returns:
+        List of dicts with song_id and song_name, in the order they will be
+        claimed. Retries waiting out their backoff are included, with
+        attempts > 0.
+    """
+    return db_tools.execute_query("""
+        SELECT song_id::text AS song_id, song_name, kind, force_refresh, attempts, run_after
+        FROM research_jobs
+        WHERE status = 'queued' AND kind = %s
+        ORDER BY run_after, id
+    """, (kind,)) or []
 
-def get_queued_songs() -> list[dict]:
+
+class _JobProgress:
     """
-    Get all songs currently in the queue
-    
-    Returns:
-        List of dicts with song_id and song_name, in queue order
+    Progress for one running job
+
+    Research runs several phases concurrently (see core/song_research.py),
+    each reporting from its own thread, so the latest counts for every phase
+    are kept and written together. 'phase'/'current'/'total' mirror the most
+    recent update for clients that only show one progress bar.
+    """
+
+    def __init__(self, job_id: int):
+        self.job_id = job_id
+        self._phases: dict[str, dict] = {}
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, phase: str, current: int = 0, total: int = 0) -> None:
+        now = time.monotonic()
+        with self._lock:
+            is_new_phase = phase not in self._phases
+            self._phases[phase] = {'current': current, 'total': total}
+            if not is_new_phase and current != total and now - self._last_flush < PROGRESS_FLUSH_SECONDS:
+                return
+            self._last_flush = now
+            progress = {
+                'phase': phase,
+                'current': current,
+                'total': total,
+                'phases': dict(self._phases)
+            }
+        try:
+            db_tools.execute_update(
+                "UPDATE research_jobs SET progress = %s, heartbeat_at = CURRENT_TIMESTAMP WHERE id = %s",
+                (json.dumps(progress), self.job_id)
+            )
+        except Exception as e:
+            # Progress is advisory; never fail research over it
+            logger.warning(f"Could not record progress for job {self.job_id}: {e}")
+
+
+def _noop_progress(phase: str, current: int = 0, total: int = 0) -> None:
+    pass
+
+
+def progress_reporter():
+    """
+    Get a progress callback for the job run by the calling worker thread
+
+    The returned callable (phase, current, total) can be handed to threads
+    the job spawns; update_progress() only works on the worker thread itself.
+    Outside a worker thread this returns a no-op.
     """
-    # Access the underlying deque from queue.Queue
-    # Note: This is not thread-safe for modification, but safe for reading
-    with research_queue.mutex:
-        return list(research_queue.queue)
+    job = getattr(_thread_state, 'job', None)
+    return job.update if job else _noop_progress
 
 
 def update_progress(phase: str, current: int = 0, total: int = 0) -> None:
     """
     Update the current research progress
-    
+
+    Records progress on the job being run by the calling worker thread.
+    Writes are throttled; a call from outside a worker thread is ignored.
+
     Args:
         phase: Current phase (use PHASE_* constants)
         current: Current item number in the loop (1-indexed)
         total: Total items in the loop
     """
-    global _current_progress
-    with _progress_lock:
-        _current_progress = {
-            'phase': phase,
-            'current': current,
-            'total': total
-        }
+    progress_reporter()(phase, current, total)
 
 
 def clear_progress() -> None:
-    """Clear the current progress (called when research completes)"""
-    global _current_progress
-    with _progress_lock:
-        _current_progress = None
+    """Forget the calling worker thread's job (called when research completes)"""
+    _thread_state.job = None
 
 
 def get_current_progress() -> Optional[dict]:
     """
     Get the current research progress
-    
+
+    With several workers this is the progress of the longest-running job;
+    see get_active_jobs() for all of them.
+
     Returns:
-        Dict with 'phase', 'current', 'total' if research is active, None otherwise
+        Dict with 'phase', 'current', 'total' (and per-phase counts under
+        'phases') if research is active, None otherwise
     """
-    with _progress_lock:
-        return _current_progress.copy() if _current_progress else None
+    for job in get_active_jobs():
+        if job['progress']:
+            return dict(job['progress'])
+    return None
 
 
-def start_worker(research_function):
+def start_worker(research_function, num_threads: int = WORKER_THREADS,
+                 job_handlers: Optional[dict] = None):
     """
-    Start the background worker thread
-    
+    Start the background worker threads
+
     Args:
         research_function: Function to call for each song (takes song_id, song_name)
+        num_threads: Number of worker threads in this process
+        job_handlers: kind -> function(song_id, song_name) for the other job
+                      kinds this process runs. A dict result with
+                      success=False fails the attempt, as does raising.
     """
-    global _worker_running, _worker_thread
-    
+    global _worker_running
+
     if _worker_running:
-        logger.warning("Worker thread already running")
+        logger.warning("Worker threads already running")
         return
-    
+
+    _job_handlers.clear()
+    _job_handlers.update(job_handlers or {})
     _worker_running = True
-    _worker_thread = threading.Thread(
-        target=_worker_loop,
-        args=(research_function,),
-        daemon=True,
-        name="ResearchWorker"
-    )
-    _worker_thread.start()
-    logger.info("Research worker thread started")
+    _worker_threads.clear()
+    for i in range(max(1, num_threads)):
+        thread = threading.Thread(
+            target=_worker_loop,
+            args=(research_function,),
+            daemon=True,
+            name=f"ResearchWorker-{i + 1}"
+        )
+        thread.start()
+        _worker_threads.append(thread)
+    _heartbeat_process()
+    logger.info(f"Started {len(_worker_threads)} research worker thread(s)")
 
 
 def stop_worker():
-    """Stop the background worker thread"""
+    """Stop the background worker threads"""
     global _worker_running
-    
+
     if not _worker_running:
         return
-    
-    logger.info("Stopping research worker thread...")
+
+    logger.info("Stopping research worker threads...")
     _worker_running = False
-    
-    # Add poison pill to unblock queue.get()
-    research_queue.put(None)
-    
-    if _worker_thread:
-        _worker_thread.join(timeout=5.0)
-    
-    logger.info("Research worker thread stopped")
+    _wakeup_event.set()
 
+    for thread in _worker_threads:
+        thread.join(timeout=5.0)
 
-def _worker_loop(research_function):
+    try:
+        db_tools.execute_update(
+            "DELETE FROM research_workers WHERE worker_id = %s", (_process_id(),)
+        )
+    except Exception as e:
+        logger.warning(f"Could not deregister research worker process: {e}")
+
+    logger.info("Research worker threads stopped")
+
+
+def get_worker_processes() -> list[dict]:
     """
-    Main worker loop - processes songs from the queue
-    
-    Args:
-        research_function: Function to call for each song
+    Get the research worker processes that have heartbeated recently
+
+    Returns:
+        List of dicts with worker_id, hostname, pid, threads, started_at and
+        heartbeat_at, oldest first. Empty when nothing is draining the queue.
     """
-    import os
+    return db_tools.execute_query("""
+        SELECT worker_id, hostname, pid, threads, started_at, heartbeat_at
+        FROM research_workers
+        WHERE heartbeat_at > CURRENT_TIMESTAMP - make_interval(secs => %s)
+        ORDER BY started_at, worker_id
+    """, (WORKER_STALE_SECONDS,)) or []
+
+
+# ============================================================================
+# JOB TABLE OPERATIONS
+# ============================================================================
+
+def _process_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _worker_id() -> str:
+    return f"{_process_id()}:{threading.current_thread().name}"
+
+
+def _heartbeat_process() -> None:
+    """Record that this process is running worker threads"""
     try:
-        logger.info("=== Worker loop starting ===")
-        logger.info(f"Process ID: {os.getpid()}")
-        logger.info(f"Thread ID: {threading.current_thread().ident}")
-        logger.info(f"Thread name: {threading.current_thread().name}")
-        logger.info(f"_worker_running at start: {_worker_running}")
-        logger.info(f"research_function: {research_function}")
-        
-        iteration = 0
-        while _worker_running:
-            iteration += 1
-            
-            # Log heartbeat every 30 seconds (30 iterations of 1 second timeout)
-            if iteration % 30 == 1:
-                logger.info(f"Worker heartbeat - iteration {iteration}, still running")
-            
-            try:
-                # Get next song from queue (blocks until available)
-                song_data = research_queue.get(timeout=1.0)
-                
-                logger.info(f"!!! Got item from queue: {song_data}")
-                
-                # Check for poison pill
-                if song_data is None:
-                    logger.info("Received poison pill - exiting")
-                    break
-                
-                song_id = song_data['song_id']
-                song_name = song_data['song_name']
-                force_refresh = song_data.get('force_refresh', True)  # Default to deep refresh
-
-                # Set current song
-                with _current_song_lock:
-                    global _current_song
-                    _current_song = {
-                        'song_id': song_id,
-                        'song_name': song_name,
-                        'force_refresh': force_refresh
-                    }
-
-                refresh_mode = "deep" if force_refresh else "simple"
-                logger.info(f"Processing queued song ({refresh_mode} refresh): {song_id} / {song_name}")
-
-                # Call the research function
+        db_tools.execute_update("""
+            INSERT INTO research_workers (worker_id, hostname, pid, threads)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (worker_id) DO UPDATE
+            SET threads = EXCLUDED.threads, heartbeat_at = CURRENT_TIMESTAMP
+        """, (_process_id(), socket.gethostname(), os.getpid(), len(_worker_threads)))
+    except Exception as e:
+        logger.warning(f"Could not record research worker heartbeat: {e}")
+
+
+# A claim that loses the race for a song to a concurrent claimer fails on
+# the one-running-job-per-song index; it is retried this many times (each
+# retry sees the winner's running job and passes over that song)
+CLAIM_RETRIES = 3
+
+_CLAIM_SQL = """
+    UPDATE research_jobs
+    SET status = 'running',
+        attempts = attempts + 1,
+        worker_id = %s,
+        progress = NULL,
+        started_at = CURRENT_TIMESTAMP,
+        heartbeat_at = CURRENT_TIMESTAMP
+    WHERE id = (
+        SELECT j.id
+        FROM research_jobs j
+        WHERE j.status = 'queued'
+          AND j.run_after <= CURRENT_TIMESTAMP
+          AND NOT EXISTS (
+              SELECT 1 FROM research_jobs r
+              WHERE r.song_id = j.song_id AND r.status = 'running'
+          )
+        ORDER BY (j.kind <> 'research'), j.run_after, j.id
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING id, song_id::text AS song_id, song_name, kind, force_refresh,
+              attempts, max_attempts, worker_id
+"""
+
+
+def _claim_job(worker_id: str) -> Optional[dict]:
+    """
+    Claim the oldest runnable job, or return None if there is none.
+
+    Research jobs go first: a bulk run of background kinds (e.g. authority
+    matching for the whole catalog) must not hold up songs users asked for.
+    SKIP LOCKED lets concurrent claimers pass over a row another worker is
+    in the middle of claiming instead of waiting on it. Songs that already
+    have a running job are skipped so a re-queued song waits its turn.
+
+    The NOT EXISTS check cannot see a concurrent claimer's uncommitted
+    running job, so two claims can pick the same song at once. The unique
+    index on running jobs (025_research_jobs_one_running.sql) fails the
+    later one, which is retried.
+    """
+    with db_tools.get_db_connection() as conn:
+        with conn.cursor() as cur:
+            for attempt in range(CLAIM_RETRIES + 1):
                 try:
-                    logger.info(f"Calling research_function({song_id}, {song_name}, force_refresh={force_refresh})")
-                    research_function(song_id, song_name, force_refresh=force_refresh)
-                    logger.info(f"Successfully completed research for {song_id}")
-                except Exception as e:
-                    logger.error(f"Error researching song {song_id}: {e}", exc_info=True)
-                finally:
-                    # Clear current song and progress
-                    with _current_song_lock:
-                        _current_song = None
-                    clear_progress()
-                
-                # Mark task as done
-                research_queue.task_done()
-                logger.info(f"Marked task as done for {song_id}")
-                
-            except queue.Empty:
-                # No items in queue, continue waiting
-                continue
-            except Exception as e:
-                logger.error(f"Error in worker loop iteration {iteration}: {e}", exc_info=True)
-                # Continue running even if one iteration fails
-                continue
-        
-        logger.info(f"=== Worker loop exited normally after {iteration} iterations ===")
-        logger.info(f"_worker_running at exit: {_worker_running}")
-        
+                    cur.execute(_CLAIM_SQL, (worker_id,))
+                    job = cur.fetchone()
+                    conn.commit()
+                    return job
+                except psycopg.errors.UniqueViolation:
+                    conn.rollback()
+                    logger.debug(f"Lost a claim race for a song (attempt {attempt + 1}); retrying")
+    return None
+
+
+def _complete_job(job_id: int, worker_id: str) -> None:
+    """
+    Mark a job done, if this worker still owns it.
+
+    Stale-job recovery may have re-queued the job (and another worker
+    claimed it) while this one was still running; that run now belongs to
+    the other worker, so the update is a no-op.
+    """
+    updated = db_tools.execute_update("""
+        UPDATE research_jobs
+        SET status = 'done', finished_at = CURRENT_TIMESTAMP, last_error = NULL
+        WHERE id = %s AND status = 'running' AND worker_id = %s
+    """, (job_id, worker_id))
+    if not updated:
+        logger.warning(f"Research job {job_id} was recovered from {worker_id}; not marking it done")
+
+
+# Shared by retry and stale-job recovery. A job goes back on the queue with
+# a doubled backoff unless it is out of attempts or the song has been
+# re-queued meanwhile (the partial unique index allows one queued job per
+# song and kind), in which case it is marked failed.
+_REQUEUE_OR_FAIL_SQL = """
+    UPDATE research_jobs j
+    SET status = CASE
+            WHEN j.attempts < j.max_attempts AND NOT EXISTS (
+                SELECT 1 FROM research_jobs q
+                WHERE q.song_id = j.song_id AND q.kind = j.kind AND q.status = 'queued'
+            ) THEN 'queued'
+            ELSE 'failed'
+        END,
+        run_after = CURRENT_TIMESTAMP
+            + make_interval(secs => %s * power(2, GREATEST(j.attempts - 1, 0))),
+        finished_at = CURRENT_TIMESTAMP,
+        last_error = %s
+    WHERE {where}
+    RETURNING j.id, j.song_name, j.status, j.attempts, j.run_after
+"""
+
+
+def _fail_job(job_id: int, worker_id: str, error: str) -> None:
+    """
+    Record a failed attempt and schedule a retry if attempts remain.
+
+    Guarded like _complete_job: a job recovered from this worker is left to
+    whoever holds it now.
+    """
+    try:
+        row = db_tools.execute_query(
+            _REQUEUE_OR_FAIL_SQL.format(
+                where="j.id = %s AND j.status = 'running' AND j.worker_id = %s"
+            ),
+            (RETRY_BASE_SECONDS, error[:2000], job_id, worker_id),
+            fetch_one=True
+        )
     except Exception as e:
-        logger.error(f"!!! FATAL ERROR in worker loop: {e}", exc_info=True)
-        logger.error("Worker thread is terminating due to unhandled exception")
+        # Lost a race with a concurrent add_song_to_queue for the same song
+        logger.warning(f"Could not re-queue job {job_id} ({e}); marking failed")
+        db_tools.execute_update("""
+            UPDATE research_jobs
+            SET status = 'failed', finished_at = CURRENT_TIMESTAMP, last_error = %s
+            WHERE id = %s AND status = 'running' AND worker_id = %s
+        """, (error[:2000], job_id, worker_id))
+        return
+
+    if row and row['status'] == STATUS_QUEUED:
+        logger.warning(f"Research attempt {row['attempts']} failed for {row['song_name']}; retrying after {row['run_after']}")
+    elif row:
+        logger.error(f"Research failed for {row['song_name']} after {row['attempts']} attempt(s)")
+    else:
+        logger.warning(f"Research job {job_id} was recovered from {worker_id}; not recording its failure")
+
+
+def _run_maintenance() -> None:
+    """
+    Refresh this process's heartbeat, re-queue jobs whose worker stopped
+    heartbeating, prune old finished jobs (and departed worker rows) and,
+    when due, reconcile the song_streaming_stats rollup.
+    Runs at most once per MAINTENANCE_INTERVAL_SECONDS per process.
+    """
+    global _last_maintenance
+    with _maintenance_lock:
+        now = time.monotonic()
+        if now - _last_maintenance < MAINTENANCE_INTERVAL_SECONDS:
+            return
+        _last_maintenance = now
+
+    _heartbeat_process()
+
+    try:
+        recovered = db_tools.execute_query(
+            _REQUEUE_OR_FAIL_SQL.format(
+                where="j.status = 'running' AND j.heartbeat_at < CURRENT_TIMESTAMP - make_interval(secs => %s)"
+            ),
+            (RETRY_BASE_SECONDS, 'Worker stopped heartbeating', STALE_JOB_SECONDS)
+        ) or []
+        for row in recovered:
+            logger.warning(f"Recovered stale research job {row['id']} ({row['song_name']}) -> {row['status']}")
+
+        pruned = db_tools.execute_update("""
+            DELETE FROM research_jobs
+            WHERE status IN ('done', 'failed')
+              AND finished_at < CURRENT_TIMESTAMP - make_interval(days => %s)
+        """, (RETENTION_DAYS,))
+        if pruned:
+            logger.info(f"Pruned {pruned} finished research jobs")
+
+        db_tools.execute_update("""
+            DELETE FROM research_workers
+            WHERE heartbeat_at < CURRENT_TIMESTAMP - make_interval(days => 1)
+        """)
+    except Exception as e:
+        logger.error(f"Research queue maintenance failed: {e}")
+
+    streaming_stats.maybe_reconcile()
+
+
+# ============================================================================
+# WORKER LOOP
+# ============================================================================
+
+def _run_job(job: dict, research_function) -> None:
+    """Run one claimed job and record its outcome"""
+    song_id = job['song_id']
+    song_name = job['song_name']
+    force_refresh = job['force_refresh']
+    kind = job['kind']
+
+    _thread_state.job = _JobProgress(job['id'])
+    if kind == KIND_RESEARCH:
+        refresh_mode = "deep" if force_refresh else "simple"
+        logger.info(f"Processing queued song ({refresh_mode} refresh, attempt {job['attempts']}/{job['max_attempts']}): {song_id} / {song_name}")
+    else:
+        logger.info(f"Processing queued {kind} job (attempt {job['attempts']}/{job['max_attempts']}): {song_id} / {song_name}")
+
+    try:
+        if kind == KIND_RESEARCH:
+            result = research_function(song_id, song_name, force_refresh=force_refresh)
+        elif kind in _job_handlers:
+            result = _job_handlers[kind](song_id, song_name)
+        else:
+            raise RuntimeError(f"No handler registered for {kind} jobs in this worker")
+        # research_song reports failure in its result rather than raising
+        if isinstance(result, dict) and result.get('success') is False:
+            _fail_job(job['id'], job['worker_id'], result.get('error') or f'{kind} failed')
+        else:
+            _complete_job(job['id'], job['worker_id'])
+            logger.info(f"Successfully completed {kind} for {song_id}")
+    except Exception as e:
+        logger.error(f"Error running {kind} for song {song_id}: {e}", exc_info=True)
+        _fail_job(job['id'], job['worker_id'], str(e))
     finally:
-        logger.info("Worker thread finally block executed")
\ No newline at end of file
+        clear_progress()
+
+
+def _worker_loop(research_function):
+    """
+    Main worker loop - claims and processes jobs until stop_worker()
+
+    Args:
+        research_function: Function to call for each song
+    """
+    worker_id = _worker_id()
+    logger.info(f"=== Research worker {worker_id} starting ===")
+
+    while _worker_running:
+        try:
+            _run_maintenance()
+            job = _claim_job(worker_id)
+        except Exception as e:
+            logger.error(f"Error claiming research job: {e}", exc_info=True)
+            job = None
+
+        if job is None:
+            # Idle: sleep until a local enqueue, stop, or the poll interval
+            _wakeup_event.wait(timeout=POLL_INTERVAL_SECONDS)
+            _wakeup_event.clear()
+            continue
+
+        try:
+            _run_job(job, research_function)
+        except Exception as e:
+            # Recording the outcome failed (DB down?); the job will be
+            # recovered as stale once its heartbeat ages out
+            logger.error(f"Error finishing research job {job['id']}: {e}", exc_info=True)
+
+    logger.info(f"=== Research worker {worker_id} exited ===")
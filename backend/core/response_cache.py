@@ -0,0 +1,379 @@
+"""
+Response Cache Module
+In-process LRU+TTL cache for read-heavy catalog endpoints, with ETag/304
+
+The catalog only changes when research or admin actions write to it, but the
+iOS app reloads /songs/index, /performers/index, /songs/<id>/summary and
+/songs/<id>/recordings/shell constantly. Each of those used to cost a
+cross-region round-trip from Render to Supabase. This module keeps the
+serialized response body in memory and answers repeat requests without
+touching Postgres.
+
+Design notes:
+
+- Keyed by request path plus the sorted query args, so ?sort=name and
+  ?search=... variants are cached independently.
+
+- Every entry carries a set of tags. Song-scoped endpoints are tagged
+  ``song:<id>``; the list endpoints are tagged ``index``. Writers call
+  ``invalidate_song()`` (drops the song's entries and every index entry,
+  since titles/composers/counts there may have changed) or
+  ``invalidate_all()`` when the affected song isn't known.
+
+- ETags are strong (sha256 of the body), so a client that revalidates with
+  If-None-Match gets a bodyless 304 whether the entry was a cache hit or
+  freshly rebuilt with identical content. Responses are sent with
+  ``Cache-Control: no-cache`` so clients always revalidate rather than
+  trusting a local copy.
+
+- The cache lives in process memory, one copy per gunicorn worker.
+  Invalidations are applied locally at once and published through
+  core.cache_bus, so the other web workers drop their copies within a poll
+  interval; that includes research_song's invalidations, which run in the
+  research worker process. Writes from processes that don't publish are
+  only picked up when the TTL expires.
+
+- A global generation counter guards against the classic fill race: a
+  request that started before an invalidation does not store its (possibly
+  stale) body afterwards.
+
+Configuration (environment):
+    RESPONSE_CACHE_ENABLED      'false' disables caching (default: true)
+    RESPONSE_CACHE_TTL          entry lifetime in seconds (default: 300)
+    RESPONSE_CACHE_MAX_ENTRIES  LRU bound (default: 512)
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Callable, Iterable, Optional
+
+from flask import make_response, request
+
+from core import cache_bus
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENABLED = os.environ.get('RESPONSE_CACHE_ENABLED', 'true').lower() != 'false'
+DEFAULT_TTL_SECONDS = int(os.environ.get('RESPONSE_CACHE_TTL', 300))
+DEFAULT_MAX_ENTRIES = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', 512))
+
+TAG_INDEX = 'index'
+
+# Name this cache's invalidations are published under (core.cache_bus)
+BUS_NAME = 'response'
+
+
+def song_tag(song_id) -> str:
+    """Tag for entries that depend on a single song's data"""
+    return f"song:{song_id}"
+
+
+@dataclass
+class CacheEntry:
+    """A cached, fully-serialized response"""
+    body: bytes
+    mimetype: str
+    headers: tuple
+    etag: str
+    tags: frozenset
+    expires_at: float
+
+
+class ResponseCache:
+    """Thread-safe bounded LRU of serialized responses with a per-entry TTL"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0,
+                       'evictions': 0, 'invalidations': 0}
+
+    @property
+    def generation(self) -> int:
+        """Incremented on every invalidation; see module docstring"""
+        with self._lock:
+            return self._generation
+
+    def get(self, key: tuple) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry
+
+    def set(self, key: tuple, entry: CacheEntry, generation: int) -> bool:
+        """
+        Store an entry unless an invalidation happened since ``generation``
+        was read. Returns True if stored.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._stats['stores'] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+            return True
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Drop every entry carrying any of ``tags``. Returns count dropped."""
+        tags = set(tags)
+        with self._lock:
+            self._generation += 1
+            doomed = [k for k, e in self._entries.items() if e.tags & tags]
+            for key in doomed:
+                del self._entries[key]
+            self._stats['invalidations'] += 1
+            return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._stats['invalidations'] += 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['max_entries'] = self.max_entries
+            stats['ttl_seconds'] = self.ttl_seconds
+            return stats
+
+
+# Process-wide cache instance
+_cache = ResponseCache()
+
+
+def get_cache() -> ResponseCache:
+    """Get the process-wide response cache"""
+    return _cache
+
+
+def get_cache_stats() -> dict:
+    """Hit/miss/eviction counters plus current size, for diagnostics"""
+    stats = _cache.get_stats()
+    stats['enabled'] = CACHE_ENABLED
+    return stats
+
+
+# ============================================================================
+# INVALIDATION
+# ============================================================================
+
+def invalidate_song(song_id) -> None:
+    """
+    Drop cached responses affected by a write to one song.
+
+    Index entries are dropped too: the songs index carries title/composer
+    and research can create performers that belong in the performers index.
+    """
+    if song_id is None:
+        return
+    tags = (song_tag(song_id), TAG_INDEX)
+    dropped = _cache.invalidate_tags(tags)
+    cache_bus.publish(BUS_NAME, tags)
+    logger.debug(f"Response cache: invalidated song {song_id} ({dropped} entries)")
+
+
+def invalidate_recording(recording_id) -> None:
+    """Drop cached responses for the song that owns ``recording_id``"""
+    import db_utils as db_tools
+    try:
+        row = db_tools.execute_query(
+            "SELECT song_id FROM recordings WHERE id = %s",
+            (recording_id,),
+            fetch_one=True
+        )
+    except Exception as e:
+        # Can't resolve the song; fall back to dropping everything rather
+        # than risk serving a stale shell row.
+        logger.warning(f"Response cache: could not resolve song for recording {recording_id}: {e}")
+        invalidate_all()
+        return
+    if row:
+        invalidate_song(row['song_id'])
+
+
+def invalidate_all() -> None:
+    """Drop every cached response"""
+    _cache.clear()
+    cache_bus.publish(BUS_NAME, [cache_bus.ALL_KEYS])
+    logger.debug("Response cache: cleared")
+
+
+def _apply_remote_invalidation(keys: list) -> None:
+    """cache_bus handler: drop this process's copies for another's write"""
+    if cache_bus.ALL_KEYS in keys:
+        _cache.clear()
+    else:
+        _cache.invalidate_tags(keys)
+
+
+cache_bus.register(BUS_NAME, _apply_remote_invalidation)
+
+
+_WRITE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+
+def invalidate_on_write(response):
+    """
+    after_request hook for blueprints that write catalog data.
+
+    Runs after the view has returned, i.e. after its transaction committed,
+    so a concurrent reader can't refill the cache with pre-commit data.
+    Scopes the invalidation from the URL when it can (``song_id`` or
+    ``recording_id`` view args) and clears everything otherwise.
+
+    Usage:
+        songs_bp.after_request(invalidate_on_write)
+    """
+    if request.method not in _WRITE_METHODS or response.status_code >= 400:
+        return response
+
+    view_args = request.view_args or {}
+    if 'song_id' in view_args:
+        invalidate_song(view_args['song_id'])
+    elif 'recording_id' in view_args:
+        invalidate_recording(view_args['recording_id'])
+    else:
+        invalidate_all()
+    return response
+
+
+# ============================================================================
+# ROUTE DECORATOR
+# ============================================================================
+
+# Headers recomputed per response rather than replayed from the entry
+_BODY_HEADERS = {'content-type', 'content-length', 'etag', 'cache-control', 'x-cache'}
+
+
+def _request_key() -> tuple:
+    args = tuple(sorted(request.args.items(multi=True)))
+    return (request.path, args)
+
+
+def _make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _respond(entry: CacheEntry, cache_status: str):
+    """Build a 200 (or 304 if the client already has this ETag) response"""
+    # Weak comparison: compressed_response re-labels the ETag as weak
+    if request.if_none_match.contains_weak(entry.etag.strip('"')):
+        response = make_response('', 304)
+    else:
+        response = make_response(entry.body, 200)
+        response.mimetype = entry.mimetype
+        for name, value in entry.headers:
+            response.headers[name] = value
+    response.headers['ETag'] = entry.etag
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Cache'] = cache_status
+    return response
+
+
+def _store_when_complete(chunks: Iterable[bytes], store: Callable[[bytes], CacheEntry]):
+    """
+    Yield a streamed body through, then hand the whole body to ``store``.
+    Nothing is stored if the stream fails or the client disconnects.
+    """
+    parts = []
+    try:
+        for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close:
+            close()
+    store(b''.join(parts))
+
+
+def cached_response(tags: Callable[..., Iterable[str]]):
+    """
+    Cache a GET route's successful response and serve ETag/304 revalidation.
+
+    Args:
+        tags: Called with the view's keyword arguments; returns the tags to
+              attach to the entry (e.g. ``lambda song_id: [song_tag(song_id)]``).
+
+    Usage:
+        @songs_bp.route('/songs/<song_id>/summary', methods=['GET'])
+        @cached_response(lambda song_id: [song_tag(song_id)])
+        def get_song_summary(song_id):
+            ...
+
+    Only 200 responses are cached; errors and 404s always go to the handler.
+    A streamed 200 is stored once it has been sent in full; it carries no
+    ETag itself, but the hits that follow do.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if not CACHE_ENABLED:
+                return f(*args, **kwargs)
+
+            key = _request_key()
+            entry = _cache.get(key)
+            if entry is not None:
+                return _respond(entry, 'HIT')
+
+            generation = _cache.generation
+            response = make_response(f(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+
+            # Route-set headers such as X-Total-Count must survive a hit.
+            # Taken now: a streamed body is stored after outer decorators
+            # (compressed_response) have added their own headers.
+            mimetype = response.mimetype
+            headers = tuple(
+                (name, value) for name, value in response.headers.items()
+                if name.lower() not in _BODY_HEADERS
+            )
+
+            def store(body: bytes) -> CacheEntry:
+                entry = CacheEntry(
+                    body=body,
+                    mimetype=mimetype,
+                    headers=headers,
+                    etag=_make_etag(body),
+                    tags=frozenset(tags(**kwargs)),
+                    expires_at=time.monotonic() + _cache.ttl_seconds,
+                )
+                _cache.set(key, entry, generation)
+                return entry
+
+            if response.is_streamed:
+                # Pass the stream through untouched and store the body once
+                # it has been sent in full (core.json_stream endpoints)
+                response.response = _store_when_complete(response.response, store)
+                response.headers['Cache-Control'] = 'no-cache'
+                response.headers['X-Cache'] = 'MISS'
+                return response
+
+            return _respond(store(response.get_data()), 'MISS')
+
+        return decorated_function
+    return decorator
@@ -0,0 +1,163 @@
+"""
+Search Module
+Ranked, typo-tolerant search over songs and performers
+
+Backed by the normalized *_search columns and pg_trgm indexes from
+sql/migrations/017_search_trigram_index.sql. Every filter below is one the
+GIN (or text_pattern_ops) indexes can answer, so search cost tracks the
+number of matches rather than the size of the catalog.
+
+Two modes:
+
+- fuzzy (default): rows whose text contains the query, or has a word
+  similar to it (pg_trgm word similarity, so "colrane" still finds
+  "Coltrane"), ranked by similarity with exact and prefix hits first.
+- prefix: typeahead. Rows whose title/name, or any word of it, starts with
+  the query, ranked start-of-title first.
+
+Endpoints build a SearchClause and compose it into their own SELECT, so
+each keeps its column list, ordering tie-breaks and pagination:
+
+    clause = search.song_clause(q, prefix=True)
+    rows = search.execute(f'''
+        SELECT id, title, {clause.score} AS score
+        FROM songs WHERE {clause.where}
+        ORDER BY score DESC, title LIMIT 20
+    ''', clause.params)
+
+Queries are normalized in SQL with the same search_normalize() that
+builds the columns, so both sides agree on accents, apostrophes, case and
+whitespace - and on non-Latin text, which unaccent keeps in its script.
+LIKE wildcards typed by the user are escaped after normalizing.
+"""
+
+import logging
+import os
+from typing import Any, Dict, NamedTuple, Optional
+
+import db_utils as db_tools
+
+logger = logging.getLogger(__name__)
+
+# pg_trgm word_similarity threshold for the fuzzy filter (pg_trgm default: 0.6).
+# Lower tolerates more typos at the cost of noisier results.
+WORD_SIMILARITY_THRESHOLD = float(os.environ.get('SEARCH_WORD_SIMILARITY', 0.5))
+
+# Upper bound for the limit a client may ask for
+MAX_LIMIT = 100
+
+MODE_FUZZY = 'fuzzy'
+MODE_PREFIX = 'prefix'
+
+
+class SearchClause(NamedTuple):
+    """SQL fragments for one search: WHERE condition, score expression, params"""
+    where: str
+    score: str
+    params: Dict[str, Any]
+
+
+# The query as the *_search columns store their text, and the same with
+# LIKE wildcards escaped (SQL fragments, composed into each clause)
+_NORMALIZED_Q = "search_normalize(%(search_q)s)"
+_ESCAPED_Q = (
+    "replace(replace(replace(" + _NORMALIZED_Q + ", '\\', '\\\\'), "
+    "'%%', '\\%%'), '_', '\\_')"
+)
+
+
+def is_prefix_mode(mode: Optional[str]) -> bool:
+    """Parse a ?mode= argument (anything but 'prefix' means fuzzy)"""
+    return (mode or '').strip().lower() == MODE_PREFIX
+
+
+def _clause(q: str, prefix: bool, primary: str, secondary: Dict[str, float]) -> SearchClause:
+    """
+    Build the clause for a primary column (title/name) and weighted
+    secondary columns (alt titles, composer)
+    """
+    norm = _NORMALIZED_Q
+    starts = f"({_ESCAPED_Q} || '%%')"
+    word_starts = f"('%% ' || {_ESCAPED_Q} || '%%')"
+    contains = f"('%%' || {_ESCAPED_Q} || '%%')"
+    params = {'search_q': (q or '').strip()}
+    columns = [primary, *secondary]
+
+    if prefix:
+        where = ' OR '.join(
+            f"{col} LIKE {starts} OR {col} LIKE {word_starts}"
+            for col in columns
+        )
+        # Start of title > start of an alt title/composer > start of any word;
+        # similarity orders within a tier (shorter, closer titles first)
+        secondary_starts = ' OR '.join(
+            f"{col} LIKE {starts}" for col in secondary
+        ) or 'FALSE'
+        score = f"""(
+            CASE
+                WHEN {primary} LIKE {starts} THEN 2
+                WHEN {secondary_starts} THEN 1.5
+                ELSE 1
+            END + similarity({primary}, {norm})
+        )"""
+    else:
+        where = ' OR '.join(
+            f"{norm} <%% {col} OR {col} LIKE {contains}"
+            for col in columns
+        )
+        weighted = ', '.join(
+            [f"word_similarity({norm}, {primary})"]
+            + [f"COALESCE(word_similarity({norm}, {col}), 0) * {weight}"
+               for col, weight in secondary.items()]
+        )
+        score = f"""(
+            GREATEST({weighted})
+            + CASE
+                WHEN {primary} = {norm} THEN 1
+                WHEN {primary} LIKE {starts} THEN 0.5
+                ELSE 0
+              END
+            + similarity({primary}, {norm}) * 0.25
+        )"""
+
+    return SearchClause(where=f"({where})", score=score, params=params)
+
+
+def song_clause(query: str, prefix: bool = False) -> SearchClause:
+    """Search clause over songs.title, alt_titles and composer"""
+    return _clause(
+        query, prefix, 'title_search',
+        {'alt_titles_search': 0.95, 'composer_search': 0.8},
+    )
+
+
+def performer_clause(query: str, prefix: bool = False) -> SearchClause:
+    """Search clause over performers.name"""
+    return _clause(query, prefix, 'name_search', {})
+
+
+def parse_limit(value: Optional[str], default: int) -> int:
+    """Parse a ?limit= argument, clamped to 1..MAX_LIMIT"""
+    try:
+        limit = int(value) if value else default
+    except (TypeError, ValueError):
+        limit = default
+    return max(1, min(limit, MAX_LIMIT))
+
+
+def execute(query: str, params: Dict[str, Any], fetch_one: bool = False):
+    """
+    Run a search query with the module's similarity threshold
+
+    The threshold is set with set_config(..., is_local => true), so it only
+    applies to this transaction and never leaks to other users of a pooled
+    connection.
+    """
+    with db_tools.get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                (str(WORD_SIMILARITY_THRESHOLD),)
+            )
+            cur.execute(query, params)
+            return cur.fetchone() if fetch_one else cur.fetchall()
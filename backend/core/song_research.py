@@ -6,18 +6,27 @@ It uses:
 - MBReleaseImporter for MusicBrainz releases and performer data
 - SpotifyMatcher for Spotify release and track matching (with caching)
 - AppleMusicMatcher for Apple Music release and track matching (with caching)
+- CoverArtArchiveClient (via MBReleaseImporter) for cover art
+
+Spotify, Apple Music and Cover Art Archive each run in their own
+ReleaseStage thread fed by the MusicBrainz import; see research_song().
 """
 
 import logging
 import os
-from typing import Dict, Any
+import queue
+import threading
+import time
+from typing import Callable, Dict, Any, Optional
+
+import psycopg
 
 from integrations.musicbrainz.release_importer import MBReleaseImporter
 from integrations.spotify.utils import SpotifyMatcher
 from integrations.apple_music.matcher import AppleMusicMatcher
 from db_utils import get_db_connection
 from integrations.musicbrainz.utils import MusicBrainzSearcher, update_song_composer, update_song_wikipedia_url, update_song_composed_year
-from core import research_queue
+from core import authority_matcher, research_queue, response_cache, song_stats
 logger = logging.getLogger(__name__)
 
 # Apple Music matching uses MotherDuck catalog (no rate limits)
@@ -25,13 +34,147 @@ logger = logging.getLogger(__name__)
 APPLE_MUSIC_MATCHING_ENABLED = True
 
 
+class ReleaseStage:
+    """
+    One downstream service in the research pipeline
+
+    Releases handed off by the MusicBrainz import are queued to a dedicated
+    thread per service. Each service's client keeps doing its own rate
+    limiting, but the services now wait on their limits in parallel instead
+    of one after another.
+
+    Args:
+        name: Service name, for logs and the thread name
+        phase: research_queue PHASE_* constant to report progress under
+        load: load(items) -> release dicts to process; called with None for
+              the end-of-import sweep, which should return every release
+              of the song
+        process: process(release) for a single release dict
+        progress_callback: callback(phase, current, total)
+        prepare: Optional prepare(releases), called with each loaded batch's
+                 unprocessed releases before any of them is processed, so
+                 a service can look the whole batch up at once
+    """
+
+    _STOP = object()
+    _SWEEP = object()
+
+    # Concurrent stages update rows that share projections (releases,
+    # recording_list_rows), so an occasional deadlock is expected; the
+    # loser is simply retried
+    DEADLOCK_RETRIES = 2
+
+    def __init__(self, name: str, phase: str, load: Callable, process: Callable,
+                 progress_callback: Callable, prepare: Optional[Callable] = None):
+        self.name = name
+        self.phase = phase
+        self._load = load
+        self._process = process
+        self._prepare = prepare
+        self._progress = progress_callback
+        self._queue = queue.Queue()
+        self._known = set()
+        self._done = set()
+        self._cancelled = False
+        self.errors = 0
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name=f"Research-{name}"
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def submit(self, items: list) -> None:
+        """Queue items (dicts with at least 'id') from the MusicBrainz import"""
+        if items:
+            self._queue.put(items)
+
+    def finish(self, sweep: bool = True) -> None:
+        """
+        Signal the end of the import and wait for the stage to drain.
+
+        With sweep=True the stage finally processes every release of the
+        song it hasn't seen yet (releases imported on earlier runs, or that
+        weren't handed off).
+        """
+        if sweep:
+            self._queue.put(self._SWEEP)
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def cancel(self) -> None:
+        """Stop after the current release, dropping anything still queued"""
+        self._cancelled = True
+        self._queue.put(self._STOP)
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    @property
+    def processed(self) -> int:
+        return len(self._done)
+
+    def _run(self) -> None:
+        while True:
+            batch = self._queue.get()
+            if batch is self._STOP or self._cancelled:
+                return
+            try:
+                releases = self._load(None if batch is self._SWEEP else batch)
+            except Exception as e:
+                logger.error(f"{self.name}: could not load releases: {e}", exc_info=True)
+                self.errors += 1
+                continue
+
+            releases = [r for r in releases if str(r['id']) not in self._done]
+            self._known.update(str(r['id']) for r in releases)
+            if self._prepare and releases:
+                try:
+                    self._prepare(releases)
+                except Exception as e:
+                    logger.warning(f"{self.name}: could not prepare releases: {e}")
+            for release in releases:
+                release_id = str(release['id'])
+                if self._cancelled:
+                    return
+                if release_id in self._done:
+                    continue
+                self._process_one(release)
+                self._done.add(release_id)
+                self._progress(self.phase, len(self._done), len(self._known))
+
+    def _process_one(self, release: dict) -> None:
+        for attempt in range(self.DEADLOCK_RETRIES + 1):
+            try:
+                self._process(release)
+                return
+            except psycopg.errors.DeadlockDetected as e:
+                if attempt < self.DEADLOCK_RETRIES:
+                    logger.info(f"{self.name}: deadlock on release {release['id']}, retrying")
+                    time.sleep(0.1 * (attempt + 1))
+                    continue
+                logger.error(f"{self.name}: error on release {release['id']}: {e}")
+                self.errors += 1
+                return
+            except Exception as e:
+                logger.error(f"{self.name}: error on release {release['id']}: {e}", exc_info=True)
+                self.errors += 1
+                return
+
+
 def research_song(song_id: str, song_name: str, force_refresh: bool = True) -> Dict[str, Any]:
     """
     Research a song and update its data
 
     This is the main entry point called by the background worker thread.
-    It imports MusicBrainz releases and performer credits, then matches
-    Spotify tracks for the song's recordings.
+    It imports MusicBrainz releases and performer credits, and matches the
+    song's releases to Spotify, Apple Music and Cover Art Archive.
+
+    The services run as a pipeline rather than in sequence: the MusicBrainz
+    import commits recording by recording and hands each fully-linked
+    release to a ReleaseStage per service, so Spotify/Apple/CAA matching
+    overlaps the import and wall-clock time approaches that of the slowest
+    service instead of the sum of all of them. Once the import finishes,
+    the Spotify and Apple stages sweep the song's remaining releases.
 
     The function is designed to be fault-tolerant and will not raise exceptions
     to the caller - all errors are logged and returned in the result dict.
@@ -57,21 +200,92 @@ def research_song(song_id: str, song_name: str, force_refresh: bool = True) -> D
     """
     refresh_mode = "deep" if force_refresh else "simple"
     logger.info(f"Starting research for song {song_id} / {song_name} ({refresh_mode} refresh)")
-    
-    # Create a progress callback that updates the research_queue progress state
-    def progress_callback(phase: str, current: int, total: int):
-        research_queue.update_progress(phase, current, total)
-    
+
+    # Bound to this worker's job, so stage threads can report progress too
+    progress_callback = research_queue.progress_reporter()
+    stages = []
+    succeeded = False
+
     try:
+        # Downstream stages. Matchers are created up front so each stage
+        # thread owns its matcher (and its HTTP session and caches).
+        spotify_matcher = SpotifyMatcher(
+            dry_run=False,
+            strict_mode=True,
+            force_refresh=force_refresh,
+            rematch_tracks=force_refresh,
+            logger=logger
+        )
+        song = spotify_matcher.find_song_by_id(str(song_id))
+        if not song:
+            return {
+                'success': False,
+                'song_id': song_id,
+                'song_name': song_name,
+                'error': 'Song not found'
+            }
+
+        spotify_stage = ReleaseStage(
+            'spotify', research_queue.PHASE_SPOTIFY_TRACK_MATCH,
+            load=lambda items: spotify_matcher.get_releases_for_song(
+                song['id'], release_ids=None if items is None else [r['id'] for r in items]
+            ),
+            process=lambda release: spotify_matcher.match_release(song, release),
+            progress_callback=progress_callback
+        )
+        stages.append(spotify_stage)
+
+        apple_matcher = None
+        apple_stage = None
+        if APPLE_MUSIC_MATCHING_ENABLED:
+            apple_matcher = AppleMusicMatcher(
+                dry_run=False,
+                strict_mode=True,
+                force_refresh=force_refresh,
+                logger=logger,
+                local_catalog_only=True,  # Use MotherDuck only, no iTunes API fallback
+            )
+            apple_stage = ReleaseStage(
+                'apple_music', research_queue.PHASE_APPLE_MUSIC_MATCH,
+                load=lambda items: apple_matcher.get_releases_for_song(
+                    str(song['id']), release_ids=None if items is None else [r['id'] for r in items]
+                ),
+                process=lambda release: apple_matcher.match_release(
+                    str(song['id']), song['title'], release
+                ),
+                progress_callback=progress_callback,
+                prepare=apple_matcher.prefetch_catalog
+            )
+            stages.append(apple_stage)
+
+        def hand_off(releases):
+            spotify_stage.submit(releases)
+            if apple_stage:
+                apple_stage.submit(releases)
+            caa_stage.submit([r for r in releases if r['created']])
+
         # Step 1: Import MusicBrainz releases
         # MBReleaseImporter uses MusicBrainzSearcher internally which has caching
         importer = MBReleaseImporter(
             dry_run=False,
             force_refresh=force_refresh,
             logger=logger,
+            progress_callback=progress_callback,
+            release_callback=hand_off
+        )
+        caa_stage = ReleaseStage(
+            'coverart', research_queue.PHASE_CAA_IMPORT,
+            load=lambda items: items or [],
+            process=lambda release: importer.import_cover_art_for_release(
+                release['id'], release['mb_release_id']
+            ),
             progress_callback=progress_callback
         )
-        
+        stages.append(caa_stage)
+
+        for stage in stages:
+            stage.start()
+
         # Get import limit from environment variable, default to 100
         mb_import_limit = int(os.environ.get('MB_IMPORT_LIMIT', 100))
         logger.info(f"Importing MusicBrainz releases...; limiting to {mb_import_limit}")
@@ -94,15 +308,11 @@ def research_song(song_id: str, song_name: str, force_refresh: bool = True) -> D
         logger.info(f"  Releases created: {mb_stats['releases_created']}")
         logger.info(f"  Releases existing: {mb_stats['releases_existing']}")
         logger.info(f"  Performers linked: {mb_stats['performers_linked']}")
-        # Cover Art Archive stats (integrated into MBReleaseImporter)
-        if mb_stats.get('caa_releases_checked', 0) > 0:
-            logger.info(f"  CAA releases checked: {mb_stats['caa_releases_checked']}")
-            logger.info(f"  CAA releases with art: {mb_stats['caa_releases_with_art']}")
-            logger.info(f"  CAA images created: {mb_stats['caa_images_created']}")
         if mb_stats['errors'] > 0:
             logger.info(f"  Errors: {mb_stats['errors']}")
         
         # Step 1.5: Update composer from MusicBrainz if needed
+        # (the stages keep matching meanwhile)
         logger.info("Checking for composer update...")
         composer_updated = update_song_composer(str(song_id))
         if not composer_updated:
@@ -120,28 +330,23 @@ def research_song(song_id: str, song_name: str, force_refresh: bool = True) -> D
         if not composed_year_updated:
             logger.debug("Composed year not updated (already set or not found)")
 
-        # Step 2: Match Spotify releases and tracks
-        # Cache behavior controlled by force_refresh parameter
-        matcher = SpotifyMatcher(
-            dry_run=False,
-            strict_mode=True,
-            force_refresh=force_refresh,
-            rematch_tracks=force_refresh,
-            logger=logger,
-            progress_callback=progress_callback
-        )
-        
-        logger.info("Matching Spotify releases...")
-        spotify_result = matcher.match_releases(str(song_id))
-        
-        if not spotify_result['success']:
-            # Spotify matching failed, but MusicBrainz succeeded
-            # Continue to Apple Music matching
-            error = spotify_result.get('error', 'Unknown error')
-            logger.warning(f"⚠ Spotify matching failed: {error}")
-            spotify_stats = {'error': error}
+        # Step 2: Drain the stages. Cover art only applies to releases this
+        # import created, so it has no sweep.
+        caa_stage.finish(sweep=False)
+        if mb_stats.get('caa_releases_checked', 0) > 0:
+            logger.info(f"✓ Cover Art Archive import complete")
+            logger.info(f"  CAA releases checked: {mb_stats['caa_releases_checked']}")
+            logger.info(f"  CAA releases with art: {mb_stats['caa_releases_with_art']}")
+            logger.info(f"  CAA images created: {mb_stats['caa_images_created']}")
+
+        spotify_stage.finish()
+        spotify_matcher._aggregate_client_stats()
+        if spotify_stage.processed == 0:
+            # Spotify matching found nothing to do, but MusicBrainz succeeded
+            logger.warning(f"⚠ Spotify matching failed: No releases found for this song")
+            spotify_stats = {'error': 'No releases found for this song'}
         else:
-            spotify_stats = spotify_result['stats']
+            spotify_stats = spotify_matcher.stats
             logger.info(f"✓ Spotify matching complete")
             logger.info(f"  Releases processed: {spotify_stats['releases_processed']}")
             logger.info(f"  Spotify matches found: {spotify_stats['releases_with_spotify']}")
@@ -154,39 +359,20 @@ def research_song(song_id: str, song_name: str, force_refresh: bool = True) -> D
             logger.info(f"  Cache hits: {spotify_stats['cache_hits']}")
             logger.info(f"  API calls: {spotify_stats['api_calls']}")
         
-        # Step 3: Match Apple Music releases and tracks
         # AppleMusicMatcher uses the normalized streaming_links tables
-        if APPLE_MUSIC_MATCHING_ENABLED:
-            apple_matcher = AppleMusicMatcher(
-                dry_run=False,
-                strict_mode=True,
-                force_refresh=force_refresh,
-                logger=logger,
-                progress_callback=progress_callback,
-                local_catalog_only=True,  # Use MotherDuck only, no iTunes API fallback
-            )
-
-            logger.info("Matching Apple Music releases...")
-            apple_result = apple_matcher.match_releases(str(song_id))
-
-            if not apple_result['success']:
-                # Apple Music matching failed, but others succeeded
-                # This is a partial success - log warning but don't fail
-                error = apple_result.get('message', 'Unknown error')
-                logger.warning(f"⚠ Apple Music matching failed: {error}")
-                apple_stats = {'error': error}
-            else:
-                apple_stats = apple_result['stats']
-                logger.info(f"✓ Apple Music matching complete")
-                logger.info(f"  Releases processed: {apple_stats['releases_processed']}")
-                logger.info(f"  Apple Music matches found: {apple_stats['releases_matched']}")
-                logger.info(f"  No match found: {apple_stats['releases_no_match']}")
-                logger.info(f"  Already had Apple: {apple_stats['releases_with_apple_music']}")
-                logger.info(f"  Tracks matched: {apple_stats['tracks_matched']}")
-                logger.info(f"  Tracks no match: {apple_stats['tracks_no_match']}")
-                logger.info(f"  Artwork added: {apple_stats['artwork_added']}")
-                logger.info(f"  Cache hits: {apple_stats['cache_hits']}")
-                logger.info(f"  API calls: {apple_stats['api_calls']}")
+        if apple_stage:
+            apple_stage.finish()
+            apple_stats = apple_matcher.aggregate_stats()
+            logger.info(f"✓ Apple Music matching complete")
+            logger.info(f"  Releases processed: {apple_stats['releases_processed']}")
+            logger.info(f"  Apple Music matches found: {apple_stats['releases_matched']}")
+            logger.info(f"  No match found: {apple_stats['releases_no_match']}")
+            logger.info(f"  Already had Apple: {apple_stats['releases_with_apple_music']}")
+            logger.info(f"  Tracks matched: {apple_stats['tracks_matched']}")
+            logger.info(f"  Tracks no match: {apple_stats['tracks_no_match']}")
+            logger.info(f"  Artwork added: {apple_stats['artwork_added']}")
+            logger.info(f"  Cache hits: {apple_stats['cache_hits']}")
+            logger.info(f"  API calls: {apple_stats['api_calls']}")
         else:
             logger.info("⏭ Skipping Apple Music matching (temporarily disabled)")
             apple_stats = {'skipped': True}
@@ -199,6 +385,7 @@ def research_song(song_id: str, song_name: str, force_refresh: bool = True) -> D
         }
 
         logger.info(f"✓ Successfully researched {song_name}")
+        succeeded = True
 
         return {
             'success': True,
@@ -219,6 +406,25 @@ def research_song(song_id: str, song_name: str, force_refresh: bool = True) -> D
             'error': error_msg
         }
 
+    finally:
+        # No-op for stages that already finished; stops the rest on an
+        # early return or error
+        for stage in stages:
+            stage.cancel()
+
+        song_stats.record_research(song_id, succeeded)
+
+        # Research writes recordings, releases and streaming links for the
+        # song (even on partial failure), so cached reads of it are stale
+        response_cache.invalidate_song(song_id)
+
+
+# Handlers for the research queue's non-research job kinds, passed to
+# research_queue.start_worker() alongside research_song
+JOB_HANDLERS = {
+    research_queue.KIND_AUTHORITY_MATCH: authority_matcher.match_song_job,
+}
+
 
 # Future expansion: Additional research functions can be added here
 # For example:
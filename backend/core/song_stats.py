@@ -0,0 +1,60 @@
+"""
+Song Stats Module
+Refresh and research stamping for the song_stats table
+
+The per-song stats on GET /songs/<id>/summary and /songs/index?include=stats
+come from two trigger-maintained tables (sql/migrations/024_song_stats.sql):
+recording counts, streaming coverage and the recording year range from the
+song_streaming_stats rollup (which core/streaming_stats.py reconciles), and
+the authority recommendation count from song_stats.
+
+The one column triggers can't derive is song_stats.last_researched_at.
+research_song calls record_research() when it finishes, which stamps it and
+re-aggregates the song once more as a safety net for the writes the run made.
+"""
+
+import logging
+
+import db_utils as db_tools
+
+logger = logging.getLogger(__name__)
+
+# Optional fields /songs/index adds with ?include=stats: name -> column,
+# read through STATS_JOINS. A song with no rollup row yet (no recordings or
+# recommendations since the backfill) counts 0, as on /songs/<id>/summary.
+INDEX_FIELDS = {
+    'recording_count': 'COALESCE(sss.total_recordings, 0)',
+    'has_any_streaming': 'COALESCE(sss.playable_recordings > 0, FALSE)',
+    'streaming_recording_count': 'COALESCE(sss.playable_recordings, 0)',
+    'authority_recommendation_count': 'COALESCE(ss.authority_recommendation_count, 0)',
+    'earliest_recording_year': 'sss.earliest_recording_year',
+    'latest_recording_year': 'sss.latest_recording_year',
+    'last_researched_at': 'ss.last_researched_at',
+}
+
+STATS_JOINS = """
+    LEFT JOIN song_stats ss ON ss.song_id = s.id
+    LEFT JOIN song_streaming_stats sss ON sss.song_id = s.id
+"""
+
+
+def record_research(song_id, succeeded: bool) -> None:
+    """
+    Re-aggregate a song after a research run, and stamp last_researched_at
+    if the run succeeded. Errors are logged, never raised, since research
+    results must not depend on this bookkeeping.
+    """
+    try:
+        with db_tools.get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT refresh_song_streaming_stats(%s::uuid[])", ([str(song_id)],))
+                cur.execute("SELECT refresh_song_stats(%s::uuid[])", ([str(song_id)],))
+                if succeeded:
+                    cur.execute("""
+                        UPDATE song_stats
+                        SET last_researched_at = CURRENT_TIMESTAMP
+                        WHERE song_id = %s
+                    """, (song_id,))
+            conn.commit()
+    except Exception as e:
+        logger.error(f"Failed to update song_stats for song {song_id}: {e}")
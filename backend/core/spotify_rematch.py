@@ -6,10 +6,13 @@ Used by both:
 - backend/routes/admin.py (admin diagnostic page)
 - backend/scripts/backfill_spotify_track_links.py (bulk backfill loop)
 
-Run records are serialized to backend/data/spotify_rematch_runs/ so the admin
-page can show run history.
+Run records are stored in the spotify_rematch_runs table so the admin page
+can show run history. Runs saved by older versions as JSON files under
+LEGACY_RUNS_DIR are imported by import_legacy_runs()
+(scripts/import_spotify_rematch_runs.py).
 """
 
+import gzip
 import json
 import logging
 import uuid
@@ -21,7 +24,7 @@ from db_utils import get_db_connection
 from integrations.spotify.db import find_song_by_id
 from integrations.spotify.matcher import SpotifyMatcher
 
-RUNS_DIR = Path(__file__).resolve().parent.parent / 'data' / 'spotify_rematch_runs'
+LEGACY_RUNS_DIR = Path(__file__).resolve().parent.parent / 'data' / 'spotify_rematch_runs'
 
 
 def _snapshot_spotify_state(song_id: str) -> dict:
@@ -374,81 +377,161 @@ def run_spotify_rematch_for_song(song_id: str, *, logger: Optional[logging.Logge
 # ----------------------------------------------------------------------------
 # Persistence
 #
-# Runs are serialized to JSON under RUNS_DIR. Filename encodes the timestamp
-# first so directory listings sort newest-last lexicographically, and also
-# includes song_id + run_id for direct lookup.
+# Runs are stored in spotify_rematch_runs (sql/migrations/022): the columns
+# the run lists show, indexed by (song_id, ran_at) and ran_at, plus the
+# complete record as gzip-compressed JSON that only load_run() reads.
 # ----------------------------------------------------------------------------
 
 def _default_json(o):
     return str(o)
 
 
-def _run_filename(run_record: dict) -> str:
-    # Compact UTC timestamp, no colons, no dashes.
-    ts = run_record['ran_at'].replace(':', '').replace('-', '').split('.')[0]
-    return f"{ts}__{run_record['song']['id']}__{run_record['run_id']}.json"
+def _encode_record(run_record: dict) -> bytes:
+    return gzip.compress(
+        json.dumps(run_record, default=_default_json, separators=(',', ':')).encode('utf-8')
+    )
 
 
-def save_run(run_record: dict) -> Path:
-    RUNS_DIR.mkdir(parents=True, exist_ok=True)
-    path = RUNS_DIR / _run_filename(run_record)
-    path.write_text(json.dumps(run_record, indent=2, default=_default_json))
-    return path
-
-
-def _read_run_file(path: Path) -> Optional[dict]:
+def _decode_record(blob) -> Optional[dict]:
     try:
-        return json.loads(path.read_text())
-    except (json.JSONDecodeError, OSError):
+        return json.loads(gzip.decompress(bytes(blob)))
+    except (OSError, ValueError):
         return None
 
 
-def list_runs_for_song(song_id: str) -> list:
-    """Summaries of all runs for a song, newest first."""
-    if not RUNS_DIR.exists():
-        return []
-    summaries = []
-    for path in sorted(RUNS_DIR.iterdir(), reverse=True):
-        if f"__{song_id}__" not in path.name:
-            continue
-        data = _read_run_file(path)
-        if data is None:
-            continue
-        summaries.append({
-            'run_id': data.get('run_id'),
-            'ran_at': data.get('ran_at'),
-            'stats': data.get('stats', {}),
-            'change_count': len(data.get('changes', [])),
-        })
-    return summaries
+def save_run(run_record: dict) -> str:
+    """Store a run record. Saving the same run_id again is a no-op."""
+    song = run_record.get('song') or {}
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                INSERT INTO spotify_rematch_runs
+                    (run_id, song_id, song_title, ran_at, matcher_success,
+                     matcher_error, change_count, stats, record)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s::jsonb, %s)
+                ON CONFLICT (run_id) DO NOTHING
+            """, (
+                run_record['run_id'],
+                song['id'],
+                song.get('title'),
+                run_record['ran_at'],
+                bool(run_record.get('matcher_success')),
+                run_record.get('matcher_error'),
+                len(run_record.get('changes') or []),
+                json.dumps(run_record.get('stats') or {}, default=_default_json),
+                _encode_record(run_record),
+            ))
+    return run_record['run_id']
+
+
+def count_runs(song_id: Optional[str] = None) -> int:
+    """Number of stored runs, for one song or all songs."""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            if song_id:
+                cur.execute(
+                    "SELECT COUNT(*) AS total FROM spotify_rematch_runs WHERE song_id = %s",
+                    (song_id,)
+                )
+            else:
+                cur.execute("SELECT COUNT(*) AS total FROM spotify_rematch_runs")
+            return cur.fetchone()['total']
 
 
-def list_all_runs(limit: int = 50) -> list:
+def list_runs_for_song(song_id: str, limit: int = 50, offset: int = 0) -> list:
+    """Summaries of a song's runs, newest first."""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT run_id, ran_at, stats, change_count
+                FROM spotify_rematch_runs
+                WHERE song_id = %s
+                ORDER BY ran_at DESC, run_id DESC
+                LIMIT %s OFFSET %s
+            """, (song_id, limit, offset))
+            rows = cur.fetchall()
+    return [{
+        'run_id': row['run_id'],
+        'ran_at': row['ran_at'].isoformat(),
+        'stats': row['stats'],
+        'change_count': row['change_count'],
+    } for row in rows]
+
+
+def list_all_runs(limit: int = 50, offset: int = 0) -> list:
     """Summaries of recent runs across all songs, newest first."""
-    if not RUNS_DIR.exists():
-        return []
-    summaries = []
-    for path in sorted(RUNS_DIR.iterdir(), reverse=True):
-        data = _read_run_file(path)
-        if data is None:
-            continue
-        summaries.append({
-            'run_id': data.get('run_id'),
-            'ran_at': data.get('ran_at'),
-            'song': data.get('song', {}),
-            'change_count': len(data.get('changes', [])),
-        })
-        if len(summaries) >= limit:
-            break
-    return summaries
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT run_id, ran_at, song_id::text AS song_id, song_title, change_count
+                FROM spotify_rematch_runs
+                ORDER BY ran_at DESC, run_id DESC
+                LIMIT %s OFFSET %s
+            """, (limit, offset))
+            rows = cur.fetchall()
+    return [{
+        'run_id': row['run_id'],
+        'ran_at': row['ran_at'].isoformat(),
+        'song': {'id': row['song_id'], 'title': row['song_title']},
+        'change_count': row['change_count'],
+    } for row in rows]
 
 
 def load_run(run_id: str) -> Optional[dict]:
     """Look up a run by run_id."""
-    if not RUNS_DIR.exists():
-        return None
-    suffix = f"__{run_id}.json"
-    for path in RUNS_DIR.iterdir():
-        if path.name.endswith(suffix):
-            return _read_run_file(path)
-    return None
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT record FROM spotify_rematch_runs WHERE run_id = %s",
+                (run_id,)
+            )
+            row = cur.fetchone()
+    return _decode_record(row['record']) if row else None
+
+
+def import_legacy_runs(directory: Path = LEGACY_RUNS_DIR, *, dry_run: bool = False,
+                       delete: bool = False,
+                       logger: Optional[logging.Logger] = None) -> dict:
+    """
+    Copy run records saved as JSON files by older versions into the table.
+
+    Runs already stored are skipped by save_run(), so this is safe to re-run.
+
+    Args:
+        directory: Directory of <...>.json run files
+        dry_run: Only count what would be imported
+        delete: Delete each file once it has been imported
+
+    Returns:
+        {'files_found': n, 'imported': n, 'unreadable': n}
+    """
+    log = logger or logging.getLogger(__name__)
+    stats = {'files_found': 0, 'imported': 0, 'unreadable': 0}
+
+    if not directory.exists():
+        log.info(f"No run directory at {directory}; nothing to import")
+        return stats
+
+    for path in sorted(directory.glob('*.json')):
+        stats['files_found'] += 1
+        try:
+            run_record = json.loads(path.read_text())
+        except (json.JSONDecodeError, OSError) as e:
+            log.warning(f"Skipping {path.name}: {e}")
+            stats['unreadable'] += 1
+            continue
+        if not (run_record.get('run_id') and run_record.get('ran_at')
+                and (run_record.get('song') or {}).get('id')):
+            log.warning(f"Skipping {path.name}: missing run_id, ran_at or song id")
+            stats['unreadable'] += 1
+            continue
+
+        if dry_run:
+            log.debug(f"Would import {path.name}")
+        else:
+            save_run(run_record)
+            if delete:
+                path.unlink()
+        stats['imported'] += 1
+
+    return stats
@@ -0,0 +1,138 @@
+"""
+Streaming Stats Module
+Reconcile for the song_streaming_stats rollup
+
+song_streaming_stats (sql/migrations/020_song_streaming_stats.sql) holds the
+per-song streaming coverage counts shown on /admin/streaming-availability,
+and the recording counts and year range on the song summary and index
+(024). Triggers on recording_list_rows, recording_releases and releases
+keep it current on every write, so this module is only the safety net: it
+re-aggregates songs in batches and reports how many rows had drifted (e.g.
+after a bulk load with triggers disabled).
+
+The research worker calls maybe_reconcile() from its maintenance loop;
+scripts/reconcile_song_streaming_stats.py runs reconcile() on demand.
+
+Configuration (environment):
+    SONG_STREAMING_STATS_RECONCILE_SECONDS  gap between catalog-wide
+                                            reconciles per worker process
+                                            (default: 21600, 0 disables)
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Iterable
+
+import db_utils as db_tools
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_INTERVAL_SECONDS = int(os.environ.get('SONG_STREAMING_STATS_RECONCILE_SECONDS', 21600))
+
+# Songs re-aggregated per transaction
+RECONCILE_BATCH_SIZE = 500
+
+# Advisory lock held for each batch transaction, so two processes reconciling
+# at once never re-aggregate concurrently
+_RECONCILE_LOCK_KEY = 0x53535301
+
+_last_reconcile = time.monotonic()
+_reconcile_lock = threading.Lock()
+
+
+def refresh_songs(song_ids: Iterable) -> int:
+    """
+    Re-aggregate the rollup for specific songs.
+
+    Returns:
+        Number of rows whose counts changed
+    """
+    ids = list(song_ids)
+    if not ids:
+        return 0
+    with db_tools.get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT refresh_song_streaming_stats(%s::uuid[]) AS changed", (ids,))
+            changed = cur.fetchone()['changed']
+        conn.commit()
+    return changed
+
+
+def reconcile(batch_size: int = RECONCILE_BATCH_SIZE) -> dict:
+    """
+    Re-aggregate every song, one batch per transaction.
+
+    Each batch transaction takes a transaction-level advisory lock, which
+    ends with the transaction. Behind the transaction pooler a session-level
+    lock could outlive its transaction on another backend (blocking every
+    later reconcile) or be released from the wrong session.
+
+    The lock only keeps two batch transactions from running at once; it
+    does not serialize whole runs, which can interleave between batches.
+    A batch whose lock is taken is skipped and the run carries on with the
+    next one. Re-aggregation is idempotent, so the overlap is harmless, and
+    skipped songs are picked up by the next reconcile.
+
+    Returns:
+        {'songs': n, 'drifted': n, 'skipped': n, 'seconds': s}, where
+        skipped counts songs in batches passed over under contention
+    """
+    start = time.monotonic()
+    with db_tools.get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT id FROM songs ORDER BY id")
+            song_ids = [row['id'] for row in cur.fetchall()]
+            conn.commit()
+
+            drifted = 0
+            skipped = 0
+            for i in range(0, len(song_ids), batch_size):
+                batch = song_ids[i:i + batch_size]
+                cur.execute("SELECT pg_try_advisory_xact_lock(%s) AS locked", (_RECONCILE_LOCK_KEY,))
+                if not cur.fetchone()['locked']:
+                    # Another process is mid-batch; move on rather than wait
+                    conn.rollback()
+                    skipped += len(batch)
+                    continue
+                cur.execute(
+                    "SELECT refresh_song_streaming_stats(%s::uuid[]) AS changed",
+                    (batch,)
+                )
+                drifted += cur.fetchone()['changed']
+                conn.commit()
+
+    result = {
+        'songs': len(song_ids),
+        'drifted': drifted,
+        'skipped': skipped,
+        'seconds': round(time.monotonic() - start, 1),
+    }
+    if drifted:
+        logger.warning(f"song_streaming_stats reconcile fixed {drifted} drifted rows: {result}")
+    else:
+        logger.info(f"song_streaming_stats reconcile: no drift ({result['songs']} songs)")
+    if skipped:
+        logger.info(f"song_streaming_stats reconcile skipped {skipped} songs while another process held the lock")
+    return result
+
+
+def maybe_reconcile() -> None:
+    """
+    Run reconcile() if RECONCILE_INTERVAL_SECONDS have passed since this
+    process last did. Errors are logged, never raised.
+    """
+    global _last_reconcile
+    if RECONCILE_INTERVAL_SECONDS <= 0:
+        return
+    with _reconcile_lock:
+        now = time.monotonic()
+        if now - _last_reconcile < RECONCILE_INTERVAL_SECONDS:
+            return
+        _last_reconcile = now
+
+    try:
+        reconcile()
+    except Exception as e:
+        logger.error(f"song_streaming_stats reconcile failed: {e}")
@@ -13,6 +13,7 @@ KEY IMPROVEMENTS:
 Configuration:
     Set DB_USE_POOLING=true environment variable to enable pooling (for Flask)
     Leave unset or false for simple connections (for scripts)
+    DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE size the pool per process (default 2/5)
 """
 
 import os
@@ -26,6 +27,8 @@ import psycopg
 from psycopg.rows import dict_row
 from unidecode import unidecode
 
+from core.db_profiler import ProfilingCursor, record_pool_wait
+
 # Try to import pooling support - optional for scripts
 try:
     from psycopg_pool import ConnectionPool
@@ -49,6 +52,11 @@ if USE_POOLING and not POOLING_AVAILABLE:
     logger.warning("Pooling requested but psycopg_pool not available. Falling back to simple mode.")
     USE_POOLING = False
 
+# Pool bounds, per process. Every gunicorn worker and the research worker
+# process gets its own pool, so the total is roughly max size x processes.
+POOL_MIN_SIZE = int(os.environ.get('DB_POOL_MIN_SIZE', 2))
+POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', 5))
+
 # Database configuration
 DB_CONFIG = {
     'host': os.environ.get('DB_HOST'),
@@ -114,8 +122,8 @@ def init_connection_pool(max_retries=3, retry_delay=2):
                 # IMPROVED: Better settings for Supabase transaction pooler
                 pool = ConnectionPool(
                     CONNECTION_STRING,
-                    min_size=2,          # Keep 2 connections warm
-                    max_size=5,          # INCREASED from 3 to 5
+                    min_size=POOL_MIN_SIZE,  # Connections kept warm
+                    max_size=POOL_MAX_SIZE,
                     open=True,
                     timeout=30,          # INCREASED from 10 to 30 seconds
                     max_waiting=20,      # INCREASED from 10 to 20 - more requests can queue
@@ -123,6 +131,7 @@ def init_connection_pool(max_retries=3, retry_delay=2):
                     max_idle=600,        # Keep idle for 10 minutes
                     kwargs={
                         'row_factory': dict_row,
+                        'cursor_factory': ProfilingCursor,  # see core/db_profiler.py
                         'connect_timeout': 10,
                         'keepalives': 1,
                         'keepalives_idle': 30,
@@ -357,6 +366,7 @@ def _create_connection():
         conn = psycopg.connect(
             **DB_CONFIG,
             row_factory=dict_row,
+            cursor_factory=ProfilingCursor,
             autocommit=False,
             prepare_threshold=None,
             # TCP keepalive settings to detect dead connections faster
@@ -411,7 +421,9 @@ def get_db_connection():
         
         # Try to get connection from pool
         try:
+            t_checkout = time.perf_counter()
             with pool.connection() as conn:
+                record_pool_wait(time.perf_counter() - t_checkout)
                 yield conn
                 # Transaction committed automatically if no exception
         except psycopg.OperationalError as e:
@@ -1,5 +1,11 @@
 # gunicorn.conf.py
 # Gunicorn configuration file
+#
+# The web tier only serves requests. Research runs in its own process
+# (research_worker.py, the Procfile's `worker` entry), so a long MusicBrainz
+# import no longer shares a GIL or a connection pool with the API. State the
+# workers share -- research jobs, rate-limit counters, cache invalidations --
+# lives in Postgres (see sql/migrations/016 and 019).
 
 import logging
 import os
@@ -10,8 +16,13 @@ errorlog = '-'   # Log to stderr
 loglevel = 'info'
 
 # Worker configuration
-workers = 1
-worker_class = 'sync'
+# gthread: requests are mostly waiting on Postgres/HTTP, so threads let one
+# slow request (a cold song page) stop blocking the rest. Each worker process
+# has its own connection pool (DB_POOL_MAX_SIZE), so keep
+# workers x pool size within the database's connection budget.
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
 timeout = 120
 
 # Server mechanics
@@ -22,26 +33,42 @@ user = None
 group = None
 tmp_upload_dir = None
 
+# Single-dyno deployments without a separate worker process can set
+# RESEARCH_WORKER_IN_WEB=true to run the research worker inside each web
+# worker, as before
+RESEARCH_WORKER_IN_WEB = os.environ.get('RESEARCH_WORKER_IN_WEB', 'false').lower() == 'true'
+
+
 # Hooks
 def post_worker_init(worker):
     """
     Called after a worker has been forked and initialized.
-    This is where we should start the research worker thread.
+    Starts the cache bus poller so this worker sees invalidations made by
+    the other workers and by the research worker process.
     """
     logger = logging.getLogger(__name__)
     logger.info(f"=== Post-worker init hook called for worker PID {os.getpid()} ===")
-    
+
+    try:
+        from core import cache_bus
+        cache_bus.start()
+    except Exception as e:
+        logger.error(f"Error starting cache bus poller in gunicorn worker: {e}", exc_info=True)
+
+    if not RESEARCH_WORKER_IN_WEB:
+        return
+
     try:
         # Import modules here (in worker process)
         from core import research_queue
         from core import song_research
         # Start the worker thread
         if not research_queue._worker_running:
-            research_queue.start_worker(song_research.research_song)
+            research_queue.start_worker(song_research.research_song, job_handlers=song_research.JOB_HANDLERS)
             logger.info(f"Research worker thread initialized in gunicorn worker PID {os.getpid()}")
         else:
             logger.warning(f"Worker thread already running in PID {os.getpid()}")
-            
+
     except Exception as e:
         logger.error(f"Error initializing research worker in gunicorn worker: {e}", exc_info=True)
 
@@ -51,10 +78,12 @@ def worker_exit(server, worker):
     Called when a worker exits.
     """
     logger = logging.getLogger(__name__)
-    logger.info(f"Worker {worker.pid} exiting - stopping research worker")
-    
+    logger.info(f"Worker {worker.pid} exiting - stopping background threads")
+
     try:
+        from core import cache_bus
         from core import research_queue
+        cache_bus.stop()
         research_queue.stop_worker()
     except Exception as e:
-        logger.error(f"Error stopping research worker: {e}")
\ No newline at end of file
+        logger.error(f"Error stopping background threads: {e}")
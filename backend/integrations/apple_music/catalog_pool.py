@@ -0,0 +1,242 @@
+"""
+Apple Music Catalog Connection Pool
+Thread-safe access to the DuckDB catalog database
+
+AppleMusicCatalog used to hold a single DuckDB connection per object,
+shared between threads without locking, torn down every 500 queries and
+rebuilt after any error. That ruled out matching several songs in
+parallel, or the research worker and an admin-triggered match running at
+once. Catalog queries now go through a CatalogPool:
+
+- One database handle per catalog (file path or MotherDuck name) per
+  process, shared by every AppleMusicCatalog.
+- Each thread queries through its own cursor. DuckDB cursors are separate
+  connections to the same database, so threads run their queries in
+  parallel. Temp tables (batch searches) are per cursor too.
+- Cursors are reused. One that has been idle for HEALTH_CHECK_SECONDS
+  runs SELECT 1 before reuse, and a failing cursor is replaced. If no
+  cursor can be opened, the database handle itself is reopened.
+- Query latencies are recorded in a LatencyHistogram, which
+  AppleMusicCatalog.get_catalog_stats() reports.
+
+Usage:
+    pool = get_pool('/path/to/apple_music_catalog.duckdb', read_only=True)
+    conn = pool.cursor()
+    with pool.timed():
+        rows = conn.execute(query, params).fetchall()
+"""
+
+import bisect
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+    duckdb = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Idle time after which a cursor is checked with SELECT 1 before reuse
+HEALTH_CHECK_SECONDS = 60
+
+# Upper bounds (ms) of the latency histogram buckets; slower queries
+# land in an overflow bucket
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram, safe to update from many threads"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, ms: float):
+        index = bisect.bisect_left(self.buckets, ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._total_ms += ms
+            self._max_ms = max(self._max_ms, ms)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        Upper bound (ms) of the bucket holding the p-th percentile, or the
+        slowest query seen when it falls in the overflow bucket
+        """
+        with self._lock:
+            counts = list(self._counts)
+            max_ms = self._max_ms
+        total = sum(counts)
+        if not total:
+            return None
+        rank = max(1, round(p / 100 * total))
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if seen >= rank:
+                return min(self.buckets[index], max_ms) if index < len(self.buckets) else max_ms
+        return max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counts, mean/percentiles/max and per-bucket counts"""
+        with self._lock:
+            counts = list(self._counts)
+            total_ms = self._total_ms
+            max_ms = self._max_ms
+        total = sum(counts)
+
+        labels = [f"<={bound}ms" for bound in self.buckets] + [f">{self.buckets[-1]}ms"]
+        return {
+            'queries': total,
+            'mean_ms': round(total_ms / total, 2) if total else None,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'max_ms': round(max_ms, 2) if total else None,
+            'buckets': dict(zip(labels, counts)),
+        }
+
+
+class CatalogPool:
+    """
+    One DuckDB database handle, with a cursor per thread.
+
+    Use get_pool() rather than constructing pools directly so that every
+    catalog object in the process shares the handle.
+    """
+
+    def __init__(self, target: str, read_only: bool = True):
+        if not DUCKDB_AVAILABLE:
+            raise ImportError("duckdb is required. Install with: pip install duckdb")
+
+        self.target = target
+        self.read_only = read_only
+        self.latency = LatencyHistogram()
+        self.counters = defaultdict(int)
+
+        self._db = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _database(self):
+        """The shared database handle (opened on first use) and its generation"""
+        with self._lock:
+            if self._db is None:
+                if self.read_only:
+                    self._db = duckdb.connect(self.target, read_only=True)
+                else:
+                    self._db = duckdb.connect(self.target)
+                self.counters['databases_opened'] += 1
+                logger.debug(f"Opened catalog database {self.target}")
+            return self._db, self._generation
+
+    def _count(self, name: str):
+        with self._lock:
+            self.counters[name] += 1
+
+    def _healthy(self, cursor) -> bool:
+        try:
+            cursor.execute("SELECT 1").fetchone()
+            return True
+        except Exception as e:
+            logger.debug(f"Catalog cursor failed health check: {e}")
+            self._count('health_check_failures')
+            return False
+
+    def cursor(self):
+        """This thread's cursor, checked if it has been idle for a while"""
+        local = self._local
+        cursor = getattr(local, 'cursor', None)
+
+        if cursor is not None:
+            idle = time.monotonic() - local.used_at
+            if local.generation == self._generation and (
+                idle < HEALTH_CHECK_SECONDS or self._healthy(cursor)
+            ):
+                local.used_at = time.monotonic()
+                return cursor
+            self.discard()
+
+        db, generation = self._database()
+        try:
+            cursor = db.cursor()
+        except Exception as e:
+            logger.warning(f"Could not open catalog cursor, reopening database: {e}")
+            self.reopen(generation)
+            db, generation = self._database()
+            cursor = db.cursor()
+
+        self._count('cursors_opened')
+        local.cursor = cursor
+        local.generation = generation
+        local.used_at = time.monotonic()
+        return cursor
+
+    def discard(self):
+        """Close this thread's cursor; the next cursor() call opens a new one"""
+        cursor = getattr(self._local, 'cursor', None)
+        self._local.cursor = None
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+
+    def reopen(self, generation: int = None):
+        """
+        Close the database handle so it is reopened on next use.
+
+        Pass the generation the caller saw fail, so that threads racing to
+        recover from the same failure reopen it only once.
+        """
+        with self._lock:
+            if self._db is None or (generation is not None and generation != self._generation):
+                return
+            try:
+                self._db.close()
+            except Exception:
+                pass
+            self._db = None
+            # Cursors of the old handle are stale everywhere
+            self._generation += 1
+            self.counters['databases_reopened'] += 1
+
+    @contextmanager
+    def timed(self):
+        """Record the duration of the enclosed query in the latency histogram"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.latency.observe((time.perf_counter() - start) * 1000)
+
+    def stats(self) -> Dict[str, Any]:
+        """Latency histogram plus connection counters"""
+        with self._lock:
+            counters = dict(self.counters)
+        return {**self.latency.snapshot(), **counters}
+
+
+_pools: Dict[tuple, CatalogPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(target: str, read_only: bool = True) -> CatalogPool:
+    """The process-wide pool for a catalog database"""
+    key = (str(target), read_only)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = CatalogPool(str(target), read_only=read_only)
+        return pool
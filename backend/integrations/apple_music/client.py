@@ -19,12 +19,13 @@ import logging
 import json
 import hashlib
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Optional, Dict, List
 from urllib.parse import quote_plus
 import requests
 
-from core.cache_utils import get_cache_dir
+from core import api_cache
+from core.api_cache import CacheKey
+from integrations import rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -85,17 +86,6 @@ class AppleMusicClient:
         self.last_request_time = 0
         self.rate_limited_until = 0  # Timestamp when rate limit cooldown ends
 
-        # Setup cache directories
-        self.cache_dir = get_cache_dir('apple_music')
-        self.search_cache_dir = self.cache_dir / 'searches'
-        self.album_cache_dir = self.cache_dir / 'albums'
-        self.track_cache_dir = self.cache_dir / 'tracks'
-
-        # Create subdirectories
-        self.search_cache_dir.mkdir(parents=True, exist_ok=True)
-        self.album_cache_dir.mkdir(parents=True, exist_ok=True)
-        self.track_cache_dir.mkdir(parents=True, exist_ok=True)
-
         # HTTP session for connection reuse
         self.session = requests.Session()
         self.session.headers.update({
@@ -110,7 +100,7 @@ class AppleMusicClient:
             'rate_limit_waits': 0
         }
 
-        self.logger.debug(f"Apple Music cache: {self.cache_dir} (expires after {cache_days} days)")
+        self.logger.debug(f"Apple Music cache expires after {cache_days} days")
         self.logger.debug(f"Rate limit: {rate_limit_delay}s delay, {max_retries} max retries")
 
     # ========================================================================
@@ -118,12 +108,10 @@ class AppleMusicClient:
     # ========================================================================
 
     def _wait_for_rate_limit(self):
-        """Enforce minimum delay between requests"""
-        if self.rate_limit_delay > 0:
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.rate_limit_delay:
-                sleep_time = self.rate_limit_delay - elapsed
-                time.sleep(sleep_time)
+        """Enforce minimum delay between requests (shared across all clients)"""
+        rate_limiter.get_bucket(
+            rate_limiter.ITUNES, min_interval=self.rate_limit_delay
+        ).acquire()
         self.last_request_time = time.time()
 
     def _make_api_request(self, url: str, params: Dict = None) -> requests.Response:
@@ -168,6 +156,7 @@ class AppleMusicClient:
                     if retry_count >= self.max_retries:
                         # Set a 2-minute cooldown before trying again
                         self.rate_limited_until = time.time() + 120
+                        rate_limiter.report_throttled(rate_limiter.ITUNES, retry_after=120)
                         self.logger.error(f"Rate limit exhausted. Entering 2-minute cooldown.")
                         raise AppleMusicRateLimitError(120)
 
@@ -176,7 +165,7 @@ class AppleMusicClient:
                     self.logger.warning(f"Rate limit hit (attempt {retry_count + 1}/{self.max_retries + 1}). "
                                        f"Waiting {wait_time}s")
                     self.stats['rate_limit_waits'] += 1
-                    time.sleep(wait_time)
+                    rate_limiter.report_throttled(rate_limiter.ITUNES, retry_after=wait_time)
                     retry_count += 1
                     continue
 
@@ -194,61 +183,40 @@ class AppleMusicClient:
     # CACHING
     # ========================================================================
 
-    def _get_search_cache_path(self, query: str, entity: str) -> Path:
-        """Get cache file path for a search query"""
-        cache_key = f"{query}||{entity}"
-        query_hash = hashlib.md5(cache_key.encode()).hexdigest()
+    def _get_search_cache_key(self, query: str, entity: str) -> CacheKey:
+        """Get cache key for a search query"""
+        query_string = f"{query}||{entity}"
+        query_hash = hashlib.md5(query_string.encode()).hexdigest()
         safe_query = re.sub(r'[^a-zA-Z0-9_-]', '_', query.lower())[:50]
-        filename = f"search_{safe_query}_{query_hash}.json"
-        return self.search_cache_dir / filename
+        return CacheKey('apple_music', f"searches/search_{safe_query}_{query_hash}")
 
-    def _get_album_cache_path(self, album_id: str) -> Path:
-        """Get cache file path for an album lookup"""
-        return self.album_cache_dir / f"album_{album_id}.json"
+    def _get_album_cache_key(self, album_id: str) -> CacheKey:
+        """Get cache key for an album lookup"""
+        return CacheKey('apple_music', f"albums/album_{album_id}")
 
-    def _get_track_cache_path(self, track_id: str) -> Path:
-        """Get cache file path for a track lookup"""
-        return self.track_cache_dir / f"track_{track_id}.json"
+    def _get_album_tracks_cache_key(self, album_id: str) -> CacheKey:
+        """Get cache key for an album's track listing"""
+        return CacheKey('apple_music', f"albums/album_{album_id}_tracks")
 
-    def _is_cache_valid(self, cache_path: Path) -> bool:
-        """Check if cache file exists and is not expired"""
-        if self.force_refresh:
-            return False
-        if not cache_path.exists():
-            return False
+    def _get_track_cache_key(self, track_id: str) -> CacheKey:
+        """Get cache key for a track lookup"""
+        return CacheKey('apple_music', f"tracks/track_{track_id}")
 
-        file_mtime = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        age_days = (datetime.now() - file_mtime).days
-        return age_days < self.cache_days
-
-    def _load_from_cache(self, cache_path: Path) -> Any:
-        """Load data from cache if valid"""
-        if not self._is_cache_valid(cache_path):
+    def _load_from_cache(self, cache_key: CacheKey) -> Any:
+        """Load data from the API cache if valid"""
+        if self.force_refresh:
             return _CACHE_MISS
 
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.stats['cache_hits'] += 1
-                self.logger.debug(f"Cache hit: {cache_path.name}")
-                return data
-        except (json.JSONDecodeError, IOError) as e:
-            self.logger.warning(f"Failed to load cache {cache_path}: {e}")
-            try:
-                cache_path.unlink()
-            except:
-                pass
-            return _CACHE_MISS
+        data = api_cache.get(cache_key, max_age_days=self.cache_days, default=_CACHE_MISS)
+        if data is not _CACHE_MISS:
+            self.stats['cache_hits'] += 1
+            self.logger.debug(f"Cache hit: {cache_key.name}")
+        return data
 
-    def _save_to_cache(self, cache_path: Path, data: Any) -> None:
-        """Save data to cache file"""
-        try:
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-            self.logger.debug(f"Cached: {cache_path.name}")
-        except (IOError, TypeError) as e:
-            self.logger.warning(f"Failed to cache {cache_path}: {e}")
+    def _save_to_cache(self, cache_key: CacheKey, data: Any) -> None:
+        """Save data to the API cache"""
+        if api_cache.set(cache_key, data):
+            self.logger.debug(f"Cached: {cache_key.name}")
 
     # ========================================================================
     # API METHODS
@@ -281,8 +249,8 @@ class AppleMusicClient:
             query = artist_name
 
         # Check cache
-        cache_path = self._get_search_cache_path(query, 'album')
-        cached = self._load_from_cache(cache_path)
+        cache_key = self._get_search_cache_key(query, 'album')
+        cached = self._load_from_cache(cache_key)
         if cached is not _CACHE_MISS:
             return cached
 
@@ -314,7 +282,7 @@ class AppleMusicClient:
                 albums.append(album)
 
         # Cache results
-        self._save_to_cache(cache_path, albums)
+        self._save_to_cache(cache_key, albums)
 
         return albums
 
@@ -333,8 +301,8 @@ class AppleMusicClient:
         """
         query = f"{artist_name} {track_title}"
 
-        cache_path = self._get_search_cache_path(query, 'song')
-        cached = self._load_from_cache(cache_path)
+        cache_key = self._get_search_cache_key(query, 'song')
+        cached = self._load_from_cache(cache_key)
         if cached is not _CACHE_MISS:
             return cached
 
@@ -362,7 +330,7 @@ class AppleMusicClient:
             if track:
                 tracks.append(track)
 
-        self._save_to_cache(cache_path, tracks)
+        self._save_to_cache(cache_key, tracks)
         return tracks
 
     def lookup_album(self, album_id: str) -> Optional[Dict]:
@@ -375,8 +343,8 @@ class AppleMusicClient:
         Returns:
             Album dict or None if not found
         """
-        cache_path = self._get_album_cache_path(album_id)
-        cached = self._load_from_cache(cache_path)
+        cache_key = self._get_album_cache_key(album_id)
+        cached = self._load_from_cache(cache_key)
         if cached is not _CACHE_MISS:
             return cached
 
@@ -395,12 +363,12 @@ class AppleMusicClient:
             return None
 
         if data.get('resultCount', 0) == 0:
-            self._save_to_cache(cache_path, None)
+            self._save_to_cache(cache_key, None)
             return None
 
         item = data['results'][0]
         album = self._parse_album_result(item)
-        self._save_to_cache(cache_path, album)
+        self._save_to_cache(cache_key, album)
         return album
 
     def lookup_album_tracks(self, album_id: str) -> List[Dict]:
@@ -414,8 +382,8 @@ class AppleMusicClient:
             List of track dicts for this album
         """
         # This uses a slightly different cache key
-        cache_path = self.album_cache_dir / f"album_{album_id}_tracks.json"
-        cached = self._load_from_cache(cache_path)
+        cache_key = self._get_album_tracks_cache_key(album_id)
+        cached = self._load_from_cache(cache_key)
         if cached is not _CACHE_MISS:
             return cached
 
@@ -442,7 +410,7 @@ class AppleMusicClient:
             if track:
                 tracks.append(track)
 
-        self._save_to_cache(cache_path, tracks)
+        self._save_to_cache(cache_key, tracks)
         return tracks
 
     def lookup_track(self, track_id: str) -> Optional[Dict]:
@@ -455,8 +423,8 @@ class AppleMusicClient:
         Returns:
             Track dict or None
         """
-        cache_path = self._get_track_cache_path(track_id)
-        cached = self._load_from_cache(cache_path)
+        cache_key = self._get_track_cache_key(track_id)
+        cached = self._load_from_cache(cache_key)
         if cached is not _CACHE_MISS:
             return cached
 
@@ -475,12 +443,12 @@ class AppleMusicClient:
             return None
 
         if data.get('resultCount', 0) == 0:
-            self._save_to_cache(cache_path, None)
+            self._save_to_cache(cache_key, None)
             return None
 
         item = data['results'][0]
         track = self._parse_track_result(item)
-        self._save_to_cache(cache_path, track)
+        self._save_to_cache(cache_key, track)
         return track
 
     # ========================================================================
@@ -55,7 +55,8 @@ def find_song_by_id(song_id: str) -> Optional[dict]:
             return cur.fetchone()
 
 
-def get_releases_for_song(song_id: str, artist_filter: str = None) -> List[dict]:
+def get_releases_for_song(song_id: str, artist_filter: str = None,
+                          release_ids: List[str] = None) -> List[dict]:
     """
     Get all releases for a song, with existing Apple Music link status.
 
@@ -65,6 +66,7 @@ def get_releases_for_song(song_id: str, artist_filter: str = None) -> List[dict]
     Args:
         song_id: Our database song ID
         artist_filter: Optional filter by performer name
+        release_ids: Optional list of release IDs to restrict to
 
     Returns:
         List of release dicts with:
@@ -127,6 +129,12 @@ def get_releases_for_song(song_id: str, artist_filter: str = None) -> List[dict]
                 """
                 params.append(artist_filter)
 
+            if release_ids is not None:
+                query += """
+                    AND rel.id = ANY(%s::uuid[])
+                """
+                params.append(list(release_ids))
+
             query += """
                 GROUP BY rel.id, rel.title, rel.artist_credit, rel.release_year,
                          rel.apple_music_searched_at, rsl.service_id, rsl.service_url, rsl.id, rr.recording_id
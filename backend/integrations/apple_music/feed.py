@@ -18,11 +18,15 @@ Environment variables:
 """
 
 import os
+import re
 import jwt
+import math
 import time
 import logging
 import requests
 import hashlib
+import threading
+import unicodedata
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Generator
 from datetime import datetime, timedelta
@@ -43,6 +47,8 @@ except ImportError:
     DUCKDB_AVAILABLE = False
     duckdb = None  # type: ignore
 
+from integrations.apple_music.catalog_pool import CatalogPool, get_pool
+
 logger = logging.getLogger(__name__)
 
 # Apple Music Feed API base URL
@@ -58,6 +64,19 @@ FEEDS = {
 # Default storage location for downloaded catalog data
 DEFAULT_CATALOG_DIR = Path(__file__).parent / "data" / "apple_music_catalog"
 
+# Minimum share of a search term's trigrams a catalog name must contain to be
+# returned by the name index (substring matches always qualify)
+NAME_MIN_SIMILARITY = float(os.environ.get('APPLE_CATALOG_MIN_SIMILARITY', 0.5))
+
+# Trigram posting tables built by build_name_search_index(): source -> (table, key)
+NAME_GRAM_TABLES = {
+    'album': ('album_name_grams', 'id'),
+    'song': ('song_name_grams', 'id'),
+    'artist': ('artist_name_grams', 'artist_norm'),
+}
+
+_NAME_SEPARATOR_RE = re.compile(r'[\W_]+')
+
 
 class AppleMusicFeedError(Exception):
     """Base exception for Apple Music Feed errors"""
@@ -546,6 +565,158 @@ class AppleMusicFeedClient:
         return output_dir
 
 
+# =============================================================================
+# Name search index
+# =============================================================================
+#
+# LOWER(name) LIKE '%x%' can't use an index, so every catalog search scanned
+# all albums or songs. The index builder adds pg_trgm-style trigram posting
+# tables over normalized names (each word padded with two leading spaces and
+# one trailing space):
+#
+#   albums/songs.name_norm, .artist_norm   normalized name columns
+#   album_name_grams(gram, id)             trigram -> album
+#   song_name_grams(gram, id)              trigram -> song
+#   artist_name_grams(gram, artist_norm)   trigram -> distinct artist name
+#   name_gram_stats(source, gram, df)      posting list lengths
+#
+# A search only reads the posting lists of its rarest trigrams: a name that
+# shares at least `need` of the term's n trigrams must contain one of any
+# n - need + 1 of them, so probing those finds every qualifying name
+# (prefix filtering). Candidates are then scored on all trigrams.
+
+
+def normalize_catalog_name(text: Optional[str]) -> str:
+    """
+    Normalize a name for the name index: accents stripped, lowercased,
+    punctuation and whitespace runs collapsed to one space.
+
+    Python twin of name_norm_sql() (DuckDB's strip_accents is an NFD
+    decomposition with the marks dropped).
+    """
+    if not text:
+        return ''
+    decomposed = unicodedata.normalize('NFD', text)
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return _NAME_SEPARATOR_RE.sub(' ', stripped.lower()).strip()
+
+
+def catalog_name_grams(text: Optional[str]) -> List[str]:
+    """Distinct trigrams of a name, as stored in the posting tables"""
+    grams = []
+    for word in normalize_catalog_name(text).split():
+        padded = f'  {word} '
+        grams.extend(padded[i:i + 3] for i in range(len(word) + 1))
+    return list(dict.fromkeys(grams))
+
+
+def name_norm_sql(column: str) -> str:
+    """DuckDB expression normalizing a name column like normalize_catalog_name()"""
+    return (
+        f"trim(regexp_replace(lower(strip_accents({column})), "
+        r"'[^\p{L}\p{N}]+', ' ', 'g'))"
+    )
+
+
+def name_grams_sql(column: str) -> str:
+    """DuckDB expression for the trigram list of a normalized name column"""
+    return (
+        "list_distinct(flatten(list_transform("
+        f"list_filter(string_split({column}, ' '), w -> w <> ''), "
+        "w -> list_transform(range(length(w) + 1), "
+        "i -> substr('  ' || w || ' ', i + 1, 3)))))"
+    )
+
+
+def probe_grams(grams: List[str], need: int, df: Dict[str, int]) -> List[str]:
+    """
+    The posting lists to read for a term: its len(grams) - need + 1 rarest
+    trigrams, given their document frequencies.
+
+    Trigrams missing from the index can't be shared, so they are the
+    cheapest members of the probe set - and cost nothing to read.
+    """
+    rarest = sorted(grams, key=lambda gram: df.get(gram, 0))
+    return [gram for gram in rarest[:len(grams) - need + 1] if gram in df]
+
+
+def term_sql(column: str, prefix: str, q: str, grams: str, n: str):
+    """
+    (hits, gram count, score) expressions scoring a normalized name column
+    against a term given as SQL expressions (its normalized text, trigram
+    list and trigram count). The score expression reads the hits and gram
+    count back as {prefix}_hits and {prefix}_gram_count.
+    """
+    column_grams = name_grams_sql(column)
+    hits = f"len(list_intersect({column_grams}, {grams}))"
+    gram_count = f"len({column_grams})"
+    # Share of the term found in the name, plus exact/substring bonuses
+    # and a little overall similarity so closer-length names win ties
+    score = f"""(
+        {prefix}_hits / {n}
+        + CASE
+            WHEN {column} = {q} THEN 1
+            WHEN contains({column}, {q}) THEN 0.5
+            ELSE 0
+          END
+        + {prefix}_hits / ({prefix}_gram_count + {n} - {prefix}_hits) * 0.25
+    )"""
+    return hits, gram_count, score
+
+
+def build_name_search_index(conn, log: logging.Logger = None, include_songs: bool = True):
+    """
+    Build the trigram posting tables over albums (and songs).
+
+    Expects the name_norm/artist_norm columns written by the index builder.
+    Posting tables are sorted by gram, so the row-group min/max statistics
+    let a probe skip everything but the lists it asks for.
+    """
+    log = log or logger
+    sources = [('album', 'albums')]
+    if include_songs:
+        sources.append(('song', 'songs'))
+
+    for source, table in sources:
+        gram_table, _ = NAME_GRAM_TABLES[source]
+        start = time.time()
+        conn.execute(f"""
+            CREATE OR REPLACE TABLE {gram_table} AS
+            SELECT gram, id
+            FROM (
+                SELECT id, unnest({name_grams_sql('name_norm')}) AS gram
+                FROM {table}
+            )
+            ORDER BY gram
+        """)
+        count = conn.execute(f"SELECT COUNT(*) FROM {gram_table}").fetchone()[0]
+        log.info(f"  {gram_table}: {count:,} postings in {time.time() - start:.1f}s")
+
+    start = time.time()
+    artist_names = " UNION ".join(
+        f"SELECT artist_norm FROM {table}" for _, table in sources
+    )
+    conn.execute(f"""
+        CREATE OR REPLACE TABLE artist_name_grams AS
+        SELECT gram, artist_norm
+        FROM (
+            SELECT artist_norm, unnest({name_grams_sql('artist_norm')}) AS gram
+            FROM ({artist_names})
+            WHERE artist_norm IS NOT NULL AND artist_norm <> ''
+        )
+        ORDER BY gram
+    """)
+    count = conn.execute("SELECT COUNT(*) FROM artist_name_grams").fetchone()[0]
+    log.info(f"  artist_name_grams: {count:,} postings in {time.time() - start:.1f}s")
+
+    conn.execute(" UNION ALL ".join(
+        ["CREATE OR REPLACE TABLE name_gram_stats AS "
+         "SELECT 'artist' AS source, gram, COUNT(*) AS df FROM artist_name_grams GROUP BY gram"]
+        + [f"SELECT '{source}', gram, COUNT(*) FROM {NAME_GRAM_TABLES[source][0]} GROUP BY gram"
+           for source, _ in sources]
+    ))
+
+
 class AppleMusicCatalog:
     """
     Query interface for downloaded Apple Music catalog data.
@@ -600,8 +771,9 @@ class AppleMusicCatalog:
                 self.log.debug(f"Indexed database not found, will scan parquet files (slower)")
                 self.log.debug(f"Run: python scripts/build_apple_catalog_index.py to create index")
 
-        self._conn = None
         self._query_count = 0  # Track number of queries for debugging
+        self._count_lock = threading.Lock()
+        self._table_names = None  # Cached by _tables()
 
     def _get_latest_export_dir(self, feed_name: str) -> Optional[Path]:
         """Get the most recent export directory for a feed."""
@@ -624,31 +796,33 @@ class AppleMusicCatalog:
             raise FileNotFoundError(f"No {feed_name} catalog data found in {self.catalog_dir}")
         return str(export_dir / '*.parquet')
 
-    def _get_conn(self):
-        """Get DuckDB connection."""
-        if self._conn is None:
-            self._create_conn()
-        return self._conn
-
-    def _create_conn(self):
-        """Create a new DuckDB connection."""
+    @property
+    def _pool(self) -> CatalogPool:
+        """The process-wide connection pool for this catalog's database"""
         if self._use_motherduck:
             # MotherDuck connection - db_path is like "md:apple_music_feed"
-            self._conn = duckdb.connect(str(self.db_path))
+            return get_pool(str(self.db_path), read_only=False)
         elif self._use_indexed_db:
-            self._conn = duckdb.connect(str(self.db_path), read_only=True)
+            return get_pool(str(self.db_path), read_only=True)
         else:
-            self._conn = duckdb.connect(':memory:')
+            return get_pool(':memory:', read_only=False)
+
+    def _get_conn(self):
+        """Get this thread's DuckDB cursor (safe to call from any thread)."""
+        return self._pool.cursor()
 
     def _refresh_conn(self):
-        """Close and recreate the DuckDB connection."""
-        if self._conn is not None:
-            try:
-                self._conn.close()
-            except Exception:
-                pass
-            self._conn = None
-        self._create_conn()
+        """Replace this thread's DuckDB cursor (other threads keep theirs)."""
+        self._pool.discard()
+
+    def _fetch(self, conn, query: str, params=None) -> List[tuple]:
+        """Run a query on a cursor from _get_conn(), recording its latency."""
+        with self._pool.timed():
+            return conn.execute(query, params).fetchall()
+
+    def _count_query(self):
+        with self._count_lock:
+            self._query_count += 1
 
     def get_query_count(self) -> int:
         """Get the total number of queries executed."""
@@ -656,7 +830,193 @@ class AppleMusicCatalog:
 
     def reset_query_count(self):
         """Reset the query counter."""
-        self._query_count = 0
+        with self._count_lock:
+            self._query_count = 0
+
+    def _tables(self, conn) -> set:
+        """Names of the tables in the catalog database (cached)"""
+        if self._table_names is None:
+            self._table_names = {
+                row[0] for row in conn.execute(
+                    "SELECT table_name FROM information_schema.tables"
+                ).fetchall()
+            }
+            if 'name_gram_stats' not in self._table_names:
+                self.log.debug("Name index not found, searching with LIKE (slower)")
+                self.log.debug("Run: python scripts/build_apple_catalog_index.py --rebuild to create it")
+        return self._table_names
+
+    def _has_name_index(self, conn, source: str) -> bool:
+        """Whether the database has the trigram name index for a source (older builds don't)"""
+        try:
+            return {'name_gram_stats', NAME_GRAM_TABLES[source][0]} <= self._tables(conn)
+        except Exception:
+            return False
+
+    @staticmethod
+    def _in_list(params: Dict[str, Any], prefix: str, values: List[Any]) -> str:
+        """Bind values as $prefix0, $prefix1, ... and return the IN (...) list"""
+        names = []
+        for i, value in enumerate(values):
+            params[f'{prefix}{i}'] = value
+            names.append(f'${prefix}{i}')
+        return f"({', '.join(names)})"
+
+    def _plan_term(self, conn, source: str, text: str, prefix: str) -> Optional[Dict[str, Any]]:
+        """
+        Plan the index lookup for one search term.
+
+        Returns the term's query params (normalized term, trigrams, overlap
+        needed) plus the rarest trigrams to probe, or None when the term has
+        no trigrams (punctuation only) and the index can't serve it.
+        """
+        grams = catalog_name_grams(text)
+        if not grams:
+            return None
+        need = max(1, math.ceil(NAME_MIN_SIMILARITY * len(grams)))
+
+        params = {'source': source}
+        df = dict(self._fetch(
+            conn,
+            f"SELECT gram, df FROM name_gram_stats "
+            f"WHERE source = $source AND gram IN {self._in_list(params, 'g', grams)}",
+            params
+        ))
+
+        return {
+            'probe': probe_grams(grams, need, df),
+            'params': {
+                f'{prefix}_q': normalize_catalog_name(text),
+                f'{prefix}_grams': grams,
+                f'{prefix}_n': len(grams),
+                f'{prefix}_need': need,
+            },
+        }
+
+    @staticmethod
+    def _term_sql(column: str, prefix: str):
+        """(hits, gram count, score) expressions for a bound term against a column"""
+        return term_sql(column, prefix, f'${prefix}_q', f'${prefix}_grams', f'${prefix}_n')
+
+    def _match_artists(self, conn, artist_name: str) -> Optional[List[tuple]]:
+        """(artist_norm, score) for catalog artist names matching a term, best first"""
+        plan = self._plan_term(conn, 'artist', artist_name, 'artist')
+        if plan is None:
+            return None
+        if not plan['probe']:
+            return []
+
+        params = dict(plan['params'])
+        hits, gram_count, score = self._term_sql('artist_norm', 'artist')
+        query = f"""
+            SELECT artist_norm, {score} AS score
+            FROM (
+                SELECT artist_norm, {hits} AS artist_hits, {gram_count} AS artist_gram_count
+                FROM (
+                    SELECT DISTINCT artist_norm
+                    FROM artist_name_grams
+                    WHERE gram IN {self._in_list(params, 'p', plan['probe'])}
+                )
+            )
+            WHERE artist_hits >= $artist_need
+            ORDER BY score DESC
+        """
+        return self._fetch(conn, query, params)
+
+    def _search_ranked(
+        self,
+        conn,
+        source: str,
+        columns: str,
+        name: str = None,
+        artist_name: str = None,
+        filters: Dict[str, Any] = None,
+        limit: int = 100
+    ) -> Optional[List[tuple]]:
+        """
+        Search albums or songs through the name index, best match first.
+
+        Artist terms are matched against the distinct artist names, name
+        terms by probing the posting lists of their rarest trigrams; only
+        those candidates are scored.
+
+        Args:
+            source: 'album' or 'song'
+            columns: SELECT list (over the table's columns)
+            name: Album/song name term
+            artist_name: Artist name term
+            filters: Extra equality filters, column -> value
+            limit: Maximum results to return
+
+        Returns:
+            Result rows, or None if a term can't be served by the index
+        """
+        table = 'albums' if source == 'album' else 'songs'
+        params = {'limit': limit}
+        derived = []
+        joins = []
+        conditions = []
+        outer = []
+        score = []
+        order = ''
+
+        for column, value in (filters or {}).items():
+            params[f'f_{column}'] = value
+            conditions.append(f"t.{column} = $f_{column}")
+
+        if artist_name:
+            artists = self._match_artists(conn, artist_name)
+            if artists is None:
+                return None
+            if not artists:
+                return []
+            params['artist_names'] = [row[0] for row in artists]
+            params['artist_scores'] = [row[1] for row in artists]
+            conditions.append(
+                f"t.artist_norm IN {self._in_list(params, 'a', params['artist_names'])}"
+            )
+            joins.append(
+                "JOIN (SELECT unnest($artist_names) AS artist_norm, "
+                "unnest($artist_scores) AS artist_score) m ON m.artist_norm = t.artist_norm"
+            )
+            derived.append('m.artist_score')
+            score.append('artist_score')
+
+        if name:
+            plan = self._plan_term(conn, source, name, 'name')
+            if plan is None:
+                return None
+            if not plan['probe']:
+                return []
+            params.update(plan['params'])
+            gram_table, _ = NAME_GRAM_TABLES[source]
+            joins.append(f"""
+                JOIN (
+                    SELECT DISTINCT id
+                    FROM {gram_table}
+                    WHERE gram IN {self._in_list(params, 'p', plan['probe'])}
+                ) c ON c.id = t.id
+            """)
+            hits, gram_count, name_score = self._term_sql('name_norm', 'name')
+            derived.extend([f"{hits} AS name_hits", f"{gram_count} AS name_gram_count"])
+            outer.append("name_hits >= $name_need")
+            score.append(name_score)
+            params['name_length'] = len(name)
+            order = ", ABS(LENGTH(name) - $name_length)"
+
+        query = f"""
+            SELECT {columns}
+            FROM (
+                SELECT t.*, {', '.join(derived)}
+                FROM {table} t
+                {' '.join(joins)}
+                WHERE {' AND '.join(conditions) or '1=1'}
+            )
+            WHERE {' AND '.join(outer) or '1=1'}
+            ORDER BY {' + '.join(score)} DESC{order}, id
+            LIMIT $limit
+        """
+        return self._fetch(conn, query, params)
 
     def search_albums(
         self,
@@ -692,7 +1052,12 @@ class AppleMusicCatalog:
         album_title: str = None,
         limit: int = 100
     ) -> List[Dict]:
-        """Search albums using indexed database (fast)."""
+        """
+        Search albums using indexed database (fast).
+
+        Name and artist terms go through the trigram name index when the
+        database has one, ranked by similarity; older builds filter with LIKE.
+        """
         conditions = []
         params = []
 
@@ -714,8 +1079,7 @@ class AppleMusicCatalog:
             # This helps rank "Midnight in Paris (Soundtrack)" above "Jazz Midnight Paris: The Best..."
             order_clause = f"ORDER BY ABS(LENGTH(name) - {len(album_title)})"
 
-        query = f"""
-            SELECT
+        select = """
                 id,
                 name,
                 artist_name as artistName,
@@ -723,34 +1087,45 @@ class AppleMusicCatalog:
                 track_count as trackCount,
                 upc,
                 url_template as urlTemplate
+        """
+        query = f"""
+            SELECT {select}
             FROM albums
             WHERE {where_clause}
             {order_clause}
             LIMIT {limit}
         """
 
+        def run(conn):
+            if (artist_name or album_title) and self._has_name_index(conn, 'album'):
+                result = self._search_ranked(
+                    conn, 'album', select,
+                    name=album_title, artist_name=artist_name, limit=limit
+                )
+                if result is not None:
+                    return result
+            return self._fetch(conn, query, params)
+
         try:
-            self._query_count += 1
+            self._count_query()
             self.log.debug(f"Album search query: artist={artist_name}, album={album_title}")
 
-            # Refresh connection periodically to avoid stale connection issues
-            if self._query_count % 500 == 0:
-                self.log.debug("Refreshing DuckDB connection (periodic)")
-                self._refresh_conn()
-                conn = self._get_conn()
-
-            result = conn.execute(query, params).fetchall()
+            result = run(conn)
             self.log.debug(f"Album search returned {len(result)} results")
             columns = ['id', 'name', 'artistName', 'releaseDate', 'trackCount', 'upc', 'urlTemplate']
             return [dict(zip(columns, row)) for row in result]
         except Exception as e:
+            if isinstance(e, duckdb.InterruptException):
+                # Cancelled by the caller (timeout) - don't run it again
+                self.log.debug("Album search interrupted")
+                return []
             self.log.error(f"Album search error: {e}")
             # Refresh connection on error and retry once
             try:
                 self.log.debug("Refreshing DuckDB connection after error")
                 self._refresh_conn()
                 conn = self._get_conn()
-                result = conn.execute(query, params).fetchall()
+                result = run(conn)
                 columns = ['id', 'name', 'artistName', 'releaseDate', 'trackCount', 'upc', 'urlTemplate']
                 return [dict(zip(columns, row)) for row in result]
             except Exception as retry_error:
@@ -797,9 +1172,9 @@ class AppleMusicCatalog:
         """
 
         try:
-            self._query_count += 1
+            self._count_query()
             self.log.debug(f"Album search (parquet): artist={artist_name}, album={album_title}")
-            result = conn.execute(query, params).fetchall()
+            result = self._fetch(conn, query, params)
             self.log.debug(f"Album search (parquet) returned {len(result)} results")
             columns = ['id', 'name', 'artistName', 'releaseDate', 'trackCount', 'upc', 'urlTemplate']
             return [dict(zip(columns, row)) for row in result]
@@ -807,6 +1182,209 @@ class AppleMusicCatalog:
             self.log.error(f"Album search error: {e}")
             return []
 
+    def search_albums_batch(
+        self,
+        queries: List[tuple],
+        limit: int = 50,
+        with_tracks: bool = True
+    ) -> Dict[int, List[Dict]]:
+        """
+        Run many album searches at once, optionally with their tracklists.
+
+        The (artist_name, album_title) pairs are loaded into a temp table and
+        answered by one set-based join against the name index, so a song's
+        releases cost a handful of queries instead of one or more each (plus
+        one get_songs_for_album() per candidate).
+
+        Results match search_albums() for the same terms. Queries the batch
+        can't serve - no name index, or a term without trigrams - are left
+        out of the result; run those through search_albums().
+
+        Args:
+            queries: (artist_name or None, album_title) pairs
+            limit: Maximum albums per query
+            with_tracks: Attach each album's songs as 'tracks' (same shape as
+                get_songs_for_album(); empty when songs aren't indexed)
+
+        Returns:
+            Dict mapping query index to its list of matching album dicts
+        """
+        conn = self._get_conn()
+        if not self._use_indexed_db or not self._has_name_index(conn, 'album'):
+            return {}
+
+        terms = []
+        for qid, (artist_name, album_title) in enumerate(queries):
+            title_grams = catalog_name_grams(album_title)
+            artist_grams = catalog_name_grams(artist_name) if artist_name else []
+            if not title_grams or (artist_name and not artist_grams):
+                continue
+            terms.append((qid, album_title, title_grams, artist_name, artist_grams))
+        if not terms:
+            return {}
+
+        self._count_query()
+        self.log.debug(f"Batch album search: {len(terms)} of {len(queries)} queries")
+
+        # Posting list lengths for every trigram in the batch, in one query
+        wanted = sorted({('album', gram) for term in terms for gram in term[2]}
+                        | {('artist', gram) for term in terms for gram in term[4]})
+        conn.execute(
+            "CREATE OR REPLACE TEMP TABLE _batch_grams AS "
+            "SELECT unnest($sources) AS source, unnest($grams) AS gram",
+            {'sources': [key[0] for key in wanted], 'grams': [key[1] for key in wanted]}
+        )
+        df = {'album': {}, 'artist': {}}
+        for source, gram, count in self._fetch(conn, """
+            SELECT s.source, s.gram, s.df
+            FROM name_gram_stats s
+            JOIN _batch_grams b ON b.source = s.source AND b.gram = s.gram
+        """):
+            df[source][gram] = count
+
+        # One row per query, one per (query, trigram) to probe
+        queries_table = {key: [] for key in (
+            'qid', 'title_q', 'title_grams', 'title_n', 'title_need', 'title_length',
+            'artist_q', 'artist_grams', 'artist_n', 'artist_need',
+        )}
+        probes_table = {'qid': [], 'source': [], 'gram': []}
+        for qid, album_title, title_grams, artist_name, artist_grams in terms:
+            title_need = max(1, math.ceil(NAME_MIN_SIMILARITY * len(title_grams)))
+            artist_need = max(1, math.ceil(NAME_MIN_SIMILARITY * len(artist_grams)))
+            row = {
+                'qid': qid,
+                'title_q': normalize_catalog_name(album_title),
+                'title_grams': title_grams,
+                'title_n': len(title_grams),
+                'title_need': title_need,
+                'title_length': len(album_title),
+                'artist_q': normalize_catalog_name(artist_name),
+                'artist_grams': artist_grams or None,
+                'artist_n': len(artist_grams),
+                'artist_need': artist_need,
+            }
+            for key, value in row.items():
+                queries_table[key].append(value)
+
+            probes = [('album', gram) for gram in probe_grams(title_grams, title_need, df['album'])]
+            if artist_grams:
+                probes += [('artist', gram) for gram in probe_grams(artist_grams, artist_need, df['artist'])]
+            for source, gram in probes:
+                probes_table['qid'].append(qid)
+                probes_table['source'].append(source)
+                probes_table['gram'].append(gram)
+
+        for name, table in (('_batch_queries', queries_table), ('_batch_probes', probes_table)):
+            conn.execute(
+                f"CREATE OR REPLACE TEMP TABLE {name} AS SELECT "
+                + ', '.join(f"unnest(${key}) AS {key}" for key in table),
+                table
+            )
+
+        artist_hits, artist_gram_count, artist_score = term_sql(
+            'artist_norm', 'artist', 'artist_q', 'artist_grams', 'artist_n'
+        )
+        name_hits, name_gram_count, name_score = term_sql(
+            'name_norm', 'name', 'title_q', 'title_grams', 'title_n'
+        )
+
+        tracks = "NULL"
+        if with_tracks and 'songs' in self._tables(conn):
+            tracks = """(
+                SELECT list(struct_pack(
+                    id := s.id,
+                    name := s.name,
+                    artistName := s.artist_name,
+                    albumId := s.album_id,
+                    albumName := s.album_name,
+                    discNumber := s.disc_number,
+                    trackNumber := s.track_number,
+                    durationInMillis := s.duration_ms,
+                    isrc := s.isrc,
+                    previewUrl := s.preview_url
+                ) ORDER BY s.disc_number, s.track_number)
+                FROM songs s
+                WHERE s.album_id = r.id
+            )"""
+
+        query = f"""
+            WITH artist_candidates AS (
+                SELECT q.qid, q.artist_q, q.artist_grams, q.artist_n, q.artist_need,
+                       c.artist_norm,
+                       {artist_hits} AS artist_hits,
+                       {artist_gram_count} AS artist_gram_count
+                FROM (
+                    SELECT DISTINCT p.qid, g.artist_norm
+                    FROM _batch_probes p
+                    JOIN artist_name_grams g ON g.gram = p.gram
+                    WHERE p.source = 'artist'
+                ) c
+                JOIN _batch_queries q ON q.qid = c.qid
+            ),
+            artist_matches AS (
+                SELECT qid, artist_norm, {artist_score} AS artist_score
+                FROM artist_candidates
+                WHERE artist_hits >= artist_need
+            ),
+            candidates AS (
+                SELECT DISTINCT p.qid, g.id
+                FROM _batch_probes p
+                JOIN album_name_grams g ON g.gram = p.gram
+                WHERE p.source = 'album'
+            ),
+            scored AS (
+                SELECT
+                    q.qid, q.title_q, q.title_grams, q.title_n, q.title_need, q.title_length,
+                    a.id, a.name, a.artist_name, a.release_date, a.track_count,
+                    a.upc, a.url_template, a.name_norm,
+                    m.artist_score,
+                    {name_hits} AS name_hits,
+                    {name_gram_count} AS name_gram_count
+                FROM candidates c
+                JOIN _batch_queries q ON q.qid = c.qid
+                JOIN albums a ON a.id = c.id
+                LEFT JOIN artist_matches m
+                  ON m.qid = c.qid AND m.artist_norm = a.artist_norm
+                WHERE q.artist_grams IS NULL OR m.artist_norm IS NOT NULL
+            ),
+            ranked AS (
+                SELECT
+                    *,
+                    row_number() OVER (
+                        PARTITION BY qid
+                        ORDER BY {name_score} + COALESCE(artist_score, 0) DESC,
+                                 ABS(LENGTH(name) - title_length), id
+                    ) AS rank
+                FROM scored
+                WHERE name_hits >= title_need
+                QUALIFY rank <= $limit
+            )
+            SELECT
+                r.qid,
+                r.id,
+                r.name,
+                r.artist_name as artistName,
+                r.release_date as releaseDate,
+                r.track_count as trackCount,
+                r.upc,
+                r.url_template as urlTemplate,
+                {tracks} AS tracks
+            FROM ranked r
+            ORDER BY r.qid, r.rank
+        """
+
+        result = self._fetch(conn, query, {'limit': limit})
+        self.log.debug(f"Batch album search returned {len(result)} results")
+
+        columns = ['id', 'name', 'artistName', 'releaseDate', 'trackCount', 'upc', 'urlTemplate']
+        matches = {qid: [] for qid, *_ in terms}
+        for row in result:
+            album = dict(zip(columns, row[1:8]))
+            if with_tracks:
+                album['tracks'] = row[8] or []
+            matches[row[0]].append(album)
+        return matches
+
     def search_songs(
         self,
         artist_name: str = None,
@@ -844,7 +1422,12 @@ class AppleMusicCatalog:
         album_id: str = None,
         limit: int = 100
     ) -> List[Dict]:
-        """Search songs using indexed database (fast)."""
+        """
+        Search songs using indexed database (fast).
+
+        Name and artist terms go through the trigram name index when the
+        database has one, ranked by similarity; older builds filter with LIKE.
+        """
         conditions = []
         params = []
 
@@ -862,8 +1445,7 @@ class AppleMusicCatalog:
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
 
-        query = f"""
-            SELECT
+        select = """
                 id,
                 name,
                 artist_name as artistName,
@@ -874,15 +1456,27 @@ class AppleMusicCatalog:
                 duration_ms as durationInMillis,
                 isrc,
                 preview_url as previewUrl
+        """
+        query = f"""
+            SELECT {select}
             FROM songs
             WHERE {where_clause}
             LIMIT {limit}
         """
 
         try:
-            self._query_count += 1
+            self._count_query()
             self.log.debug(f"Song search query: artist={artist_name}, song={song_title}, album_id={album_id}")
-            result = conn.execute(query, params).fetchall()
+            result = None
+            if (artist_name or song_title) and self._has_name_index(conn, 'song'):
+                result = self._search_ranked(
+                    conn, 'song', select,
+                    name=song_title, artist_name=artist_name,
+                    filters={'album_id': album_id} if album_id else None,
+                    limit=limit
+                )
+            if result is None:
+                result = self._fetch(conn, query, params)
             self.log.debug(f"Song search returned {len(result)} results")
             columns = ['id', 'name', 'artistName', 'albumId', 'albumName', 'discNumber', 'trackNumber', 'durationInMillis', 'isrc', 'previewUrl']
             return [dict(zip(columns, row)) for row in result]
@@ -939,9 +1533,9 @@ class AppleMusicCatalog:
         """
 
         try:
-            self._query_count += 1
+            self._count_query()
             self.log.debug(f"Song search (parquet): artist={artist_name}, song={song_title}, album_id={album_id}")
-            result = conn.execute(query, params).fetchall()
+            result = self._fetch(conn, query, params)
             self.log.debug(f"Song search (parquet) returned {len(result)} results")
             columns = ['id', 'name', 'artistName', 'albumId', 'albumName', 'discNumber', 'trackNumber', 'durationInMillis', 'isrc', 'previewUrl']
             return [dict(zip(columns, row)) for row in result]
@@ -984,9 +1578,9 @@ class AppleMusicCatalog:
             """
 
         try:
-            self._query_count += 1
+            self._count_query()
             self.log.debug(f"Album lookup by ID: {album_id}")
-            result = conn.execute(query, [album_id]).fetchall()
+            result = self._fetch(conn, query, [album_id])
             self.log.debug(f"Album lookup returned {len(result)} results")
             if result:
                 columns = ['id', 'name', 'artistName', 'releaseDate', 'trackCount', 'upc', 'urlTemplate']
@@ -1052,9 +1646,9 @@ class AppleMusicCatalog:
             """
 
         try:
-            self._query_count += 1
+            self._count_query()
             self.log.debug(f"Get songs for album: {album_id}")
-            result = conn.execute(query, [album_id]).fetchall()
+            result = self._fetch(conn, query, [album_id])
             self.log.debug(f"Get songs for album returned {len(result)} tracks")
             columns = ['id', 'name', 'artistName', 'albumId', 'albumName', 'discNumber', 'trackNumber', 'durationInMillis', 'isrc', 'previewUrl']
             return [dict(zip(columns, row)) for row in result]
@@ -1062,8 +1656,64 @@ class AppleMusicCatalog:
             self.log.debug(f"Songs for album error: {e}")
             return []
 
+    def get_songs_for_albums(self, album_ids: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Get the songs of many albums at once.
+
+        One query against the indexed database; the parquet fallback looks
+        each album up in turn.
+
+        Returns:
+            Dict mapping album ID to its songs (same shape as get_songs_for_album())
+        """
+        album_ids = list(dict.fromkeys(str(album_id) for album_id in album_ids))
+        if not album_ids:
+            return {}
+        if not self._use_indexed_db:
+            return {album_id: self.get_songs_for_album(album_id) for album_id in album_ids}
+
+        conn = self._get_conn()
+        try:
+            if 'songs' not in self._tables(conn):
+                self.log.debug("Songs table not available (albums-only mode)")
+                return {}
+        except Exception:
+            return {}
+
+        query = """
+            SELECT
+                id,
+                name,
+                artist_name as artistName,
+                album_id as albumId,
+                album_name as albumName,
+                disc_number as discNumber,
+                track_number as trackNumber,
+                duration_ms as durationInMillis,
+                isrc,
+                preview_url as previewUrl
+            FROM songs
+            WHERE album_id IN (SELECT unnest($album_ids))
+            ORDER BY album_id, disc_number, track_number
+        """
+
+        try:
+            self._count_query()
+            self.log.debug(f"Get songs for {len(album_ids)} albums")
+            result = self._fetch(conn, query, {'album_ids': album_ids})
+            self.log.debug(f"Get songs for albums returned {len(result)} tracks")
+            columns = ['id', 'name', 'artistName', 'albumId', 'albumName', 'discNumber', 'trackNumber', 'durationInMillis', 'isrc', 'previewUrl']
+            songs = {album_id: [] for album_id in album_ids}
+            for row in result:
+                song = dict(zip(columns, row))
+                songs.setdefault(str(song['albumId']), []).append(song)
+            return songs
+        except Exception as e:
+            self.log.debug(f"Songs for albums error: {e}")
+            return {}
+
     def get_catalog_stats(self) -> Dict[str, Any]:
-        """Get statistics about the loaded catalog."""
+        """Get statistics about the loaded catalog and the queries run against it."""
         stats = {}
 
         for feed_name in ['albums', 'artists', 'songs']:
@@ -1087,6 +1737,10 @@ class AppleMusicCatalog:
             else:
                 stats[feed_name] = None
 
+        # Query latency histogram and connection counters, process-wide
+        # for this catalog's database
+        stats['queries'] = self._pool.stats()
+
         return stats
 
 
@@ -21,6 +21,8 @@ Used by:
 """
 
 import logging
+import os
+import re
 from typing import Dict, Any, Optional, List
 
 from db_utils import get_db_connection
@@ -69,6 +71,15 @@ from integrations.spotify.matching import (
 
 logger = logging.getLogger(__name__)
 
+# Catalog searches run on one long-lived thread pool, so each worker keeps its
+# catalog cursor between searches (see catalog_pool) and matchers running in
+# parallel share the workers; the per-search timeout still guards against
+# hung queries
+CATALOG_SEARCH_WORKERS = int(os.environ.get('APPLE_CATALOG_SEARCH_WORKERS', 8))
+_catalog_executor = ThreadPoolExecutor(
+    max_workers=CATALOG_SEARCH_WORKERS, thread_name_prefix='apple-catalog'
+)
+
 
 class AppleMusicMatcher:
     """
@@ -164,6 +175,12 @@ class AppleMusicMatcher:
             'catalog_queries': 0,
         }
 
+        # Catalog results fetched up front for a batch of releases by
+        # prefetch_catalog(): (artist, album) search -> albums, and
+        # Apple album ID -> tracklist
+        self._catalog_searches: Dict[tuple, List[Dict]] = {}
+        self._catalog_tracks: Dict[str, List[Dict]] = {}
+
         # Validation thresholds
         if strict_mode:
             self.min_artist_similarity = 75
@@ -206,7 +223,7 @@ class AppleMusicMatcher:
         self.logger.info(f"Matching Apple Music for: {song_title}")
 
         # Get all releases for this song
-        releases = get_releases_for_song(song_id, self.artist_filter)
+        releases = self.get_releases_for_song(song_id)
 
         if not releases:
             return {
@@ -218,32 +235,17 @@ class AppleMusicMatcher:
 
         self.logger.info(f"Found {len(releases)} releases to process")
 
-        # Process each release with a fresh connection to avoid timeouts
-        # (catalog searches can take a long time for some releases)
-        for i, release in enumerate(releases):
-            if self.progress_callback:
-                self.progress_callback('matching', i + 1, len(releases))
+        self.prefetch_catalog(releases)
+        try:
+            for i, release in enumerate(releases):
+                if self.progress_callback:
+                    self.progress_callback('matching', i + 1, len(releases))
+                self.match_release(song_id, song_title, release, i + 1, len(releases))
+        finally:
+            self._catalog_searches = {}
+            self._catalog_tracks = {}
 
-            try:
-                with get_db_connection() as conn:
-                    self._process_release(conn, song_id, song_title, release, i + 1, len(releases))
-            except Exception as e:
-                # Log error but continue with next release
-                release_title = release.get('title', 'Unknown')
-                self.logger.error(f"  Error processing release {i + 1}/{len(releases)} ({release_title}): {e}")
-                self.stats['errors'] += 1
-                # Refresh the catalog connection if available
-                if self.catalog:
-                    try:
-                        self.catalog._refresh_conn()
-                    except Exception:
-                        pass
-
-        # Aggregate client stats
-        self.stats['cache_hits'] = self.client.stats.get('cache_hits', 0)
-        self.stats['api_calls'] = self.client.stats.get('api_calls', 0)
-        if self.catalog:
-            self.stats['catalog_queries'] = self.catalog.get_query_count()
+        self.aggregate_stats()
 
         return {
             'success': True,
@@ -252,6 +254,110 @@ class AppleMusicMatcher:
             'message': f"Processed {len(releases)} releases"
         }
 
+    def get_releases_for_song(self, song_id: str, release_ids: List[str] = None) -> List[Dict]:
+        """Get all releases for a song, optionally filtered by artist and/or release IDs"""
+        return get_releases_for_song(song_id, self.artist_filter, release_ids=release_ids)
+
+    def match_release(
+        self,
+        song_id: str,
+        song_title: str,
+        release: Dict,
+        current: int = 0,
+        total: int = 0
+    ) -> None:
+        """
+        Match one release, with its own connection and error isolation.
+
+        Called per release by match_releases(), and directly by pipelined
+        song research as releases arrive from the MusicBrainz import.
+        """
+        # A fresh connection per release avoids timeouts
+        # (catalog searches can take a long time for some releases)
+        try:
+            with get_db_connection() as conn:
+                self._process_release(conn, song_id, song_title, release, current, total)
+        except Exception as e:
+            # Log error but continue with next release
+            release_title = release.get('title', 'Unknown')
+            self.logger.error(f"  Error processing release {current}/{total} ({release_title}): {e}")
+            self.stats['errors'] += 1
+            # Refresh the catalog connection if available
+            if self.catalog:
+                try:
+                    self.catalog._refresh_conn()
+                except Exception:
+                    pass
+
+    def _needs_album_search(self, release: Dict) -> bool:
+        """Whether _process_release() will search for this release's album (mirrors its skip checks)"""
+        if release.get('has_apple_music') and not self.rematch:
+            return False
+        if release.get('apple_music_searched_at') and not self.rematch and not self.rematch_failures:
+            return False
+        return True
+
+    def prefetch_catalog(self, releases: List[Dict]) -> None:
+        """
+        Run the local catalog searches for a batch of releases up front.
+
+        Every search strategy of every release that will be searched goes to
+        the catalog as one set-based batch, which also returns the candidate
+        albums' tracklists; tracklists for already-matched albums come in one
+        more query. _search_local_catalog() and _match_track_on_release()
+        then validate against these results in memory, and only fall back to
+        per-release queries for searches the batch couldn't serve.
+
+        Called once per song by match_releases(), and once per handed-off
+        batch by the Apple Music stage of pipelined song research. Each call
+        replaces the previous batch's results.
+        """
+        self._catalog_searches = {}
+        self._catalog_tracks = {}
+        if not self.catalog:
+            return
+
+        searches = []
+        matched_album_ids = []
+        for release in releases:
+            if self._needs_album_search(release):
+                searches.extend(self._catalog_search_strategies(
+                    release['artist_credit'] or '', release['title']
+                ))
+            elif release.get('apple_music_album_id'):
+                matched_album_ids.append(release['apple_music_album_id'])
+        searches = list(dict.fromkeys(searches))
+
+        try:
+            if searches:
+                results = self.catalog.search_albums_batch(searches, limit=50)
+                for qid, albums in results.items():
+                    self._catalog_searches[searches[qid]] = albums
+                    for album in albums:
+                        if album.get('tracks'):
+                            self._catalog_tracks[str(album['id'])] = album['tracks']
+            if matched_album_ids:
+                self._catalog_tracks.update(self.catalog.get_songs_for_albums(matched_album_ids))
+        except Exception as e:
+            self.logger.warning(f"Batch catalog search failed, searching per release: {e}")
+            self._catalog_searches = {}
+            self._catalog_tracks = {}
+            self.catalog._refresh_conn()
+            return
+
+        self.logger.debug(
+            f"Prefetched {len(self._catalog_searches)}/{len(searches)} catalog searches, "
+            f"{len(self._catalog_tracks)} tracklists"
+        )
+
+    def aggregate_stats(self) -> Dict[str, Any]:
+        """Fold client and catalog counters into self.stats"""
+        self.stats['cache_hits'] = self.client.stats.get('cache_hits', 0)
+        self.stats['api_calls'] = self.client.stats.get('api_calls', 0)
+        if self.catalog:
+            self.stats['catalog_queries'] = self.catalog.get_query_count()
+        return self.stats
+
     def _process_release(
         self,
         conn,
@@ -427,6 +533,54 @@ class AppleMusicMatcher:
         if not self.catalog:
             return None
 
+        search_strategies = self._catalog_search_strategies(artist_name, album_title)
+
+        for search_artist, search_album in search_strategies:
+            try:
+                albums = self._catalog_searches.get((search_artist, search_album))
+                if albums is None:
+                    # Use timeout to prevent catalog searches from hanging
+                    albums = self._search_with_timeout(search_artist, search_album, timeout=30)
+
+                if not albums:
+                    continue
+
+                # Convert to our expected format and validate
+                for album_data in albums:
+                    album = self._convert_catalog_album(album_data)
+                    if album:
+                        is_valid, confidence = self._validate_album_match(
+                            album, artist_name, album_title, release_year
+                        )
+                        if is_valid:
+                            album['_match_confidence'] = confidence
+                            album['_source'] = 'local_catalog'
+                            return album
+
+            except FuturesTimeoutError:
+                self.logger.warning(f"    Catalog search timed out for: {search_artist} - {search_album}")
+                continue
+            except Exception as e:
+                self.logger.debug(f"Local catalog search error: {e}")
+                continue
+
+        return None
+
+    def _catalog_search_strategies(
+        self,
+        artist_name: str,
+        album_title: str
+    ) -> List[tuple]:
+        """
+        The (artist, album) catalog searches to try for a release, in order.
+
+        Args:
+            artist_name: Artist/performer name
+            album_title: Album title to search for
+
+        Returns:
+            List of (artist or None, album title) pairs
+        """
         search_strategies = []
 
         # Strategy 1: Full artist + album
@@ -454,7 +608,6 @@ class AppleMusicMatcher:
 
         # Strategy 6: Album with punctuation stripped
         # Handles "Album: Subtitle" vs "Album (Subtitle)" differences
-        import re
         stripped_album = re.sub(r'[:\-\(\)\[\]]', ' ', album_title)
         stripped_album = ' '.join(stripped_album.split())  # normalize whitespace
         if stripped_album != album_title:
@@ -468,37 +621,7 @@ class AppleMusicMatcher:
             if main_title and len(main_title) >= 5 and main_title != album_title:
                 search_strategies.append((None, main_title))
 
-        for search_artist, search_album in search_strategies:
-            try:
-                # Use timeout to prevent catalog searches from hanging
-                albums = self._search_with_timeout(search_artist, search_album, timeout=30)
-
-                if not albums:
-                    continue
-
-                # Convert to our expected format and validate
-                for album_data in albums:
-                    album = self._convert_catalog_album(album_data)
-                    if album:
-                        is_valid, confidence = self._validate_album_match(
-                            album, artist_name, album_title, release_year
-                        )
-                        if is_valid:
-                            album['_match_confidence'] = confidence
-                            album['_source'] = 'local_catalog'
-                            return album
-
-            except FuturesTimeoutError:
-                self.logger.warning(f"    Catalog search timed out for: {search_artist} - {search_album}")
-                # Refresh connection after timeout
-                if self.catalog:
-                    self.catalog._refresh_conn()
-                continue
-            except Exception as e:
-                self.logger.debug(f"Local catalog search error: {e}")
-                continue
-
-        return None
+        return search_strategies
 
     def _search_with_timeout(
         self,
@@ -520,14 +643,24 @@ class AppleMusicMatcher:
         Raises:
             FuturesTimeoutError: If search exceeds timeout
         """
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(
-                self.catalog.search_albums,
+        running = {}
+
+        def search():
+            running['conn'] = self.catalog._get_conn()
+            return self.catalog.search_albums(
                 artist_name=artist_name,
                 album_title=album_title,
                 limit=50
             )
+
+        future = _catalog_executor.submit(search)
+        try:
             return future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            # Stop the query so the worker and its cursor are free again
+            if not future.cancel() and running.get('conn') is not None:
+                running['conn'].interrupt()
+            raise
 
     def _convert_catalog_album(self, catalog_data: Dict) -> Optional[Dict]:
         """
@@ -741,7 +874,9 @@ class AppleMusicMatcher:
 
         if from_local_catalog and self.catalog:
             try:
-                catalog_songs = self.catalog.get_songs_for_album(apple_album_id)
+                catalog_songs = self._catalog_tracks.get(str(apple_album_id))
+                if not catalog_songs:
+                    catalog_songs = self.catalog.get_songs_for_album(apple_album_id)
                 if catalog_songs:
                     # Convert to our expected format
                     am_tracks = []
@@ -13,21 +13,53 @@ This module:
 Similar architecture to mb_release_importer.py - designed to be used by
 CLI scripts or other modules.
 
+CAAImageImporter looks releases up concurrently: a bounded pool of worker
+threads, each with its own CoverArtArchiveClient, all drawing from the
+process-wide CAA rate limiter, so concurrency hides request latency without
+raising the request rate. Releases whose cached MusicBrainz details say CAA
+has no artwork are answered without a CAA request. Results are written in
+batches: one multi-row imagery upsert and one cover_art_checked_at update
+per batch.
+
 SHARED FUNCTIONS:
-- save_release_imagery(): Used by both CAAImageImporter (batch) and
-  MBReleaseImporter (inline during release creation)
+- save_release_imagery(): Used by MBReleaseImporter (inline during release
+  creation)
+- save_release_imagery_batch(): The same for many releases at once, used by
+  CAAImageImporter
 """
 
 import logging
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Optional, Dict, List, Any, Set
 
 from db_utils import get_db_connection
+from core.bulk_writer import BulkWriter
 from integrations.coverart.utils import CoverArtArchiveClient
+from integrations.musicbrainz.utils import MusicBrainzSearcher
+
+# Concurrent CAA lookups in CAAImageImporter. The shared rate limiter still
+# caps the request rate; workers only overlap the waiting on responses.
+CAA_IMPORT_WORKERS = int(os.environ.get('CAA_IMPORT_WORKERS', 4))
+
+# Releases per write transaction in CAAImageImporter. At most this many
+# releases per worker are looked up ahead of the writes.
+CAA_WRITE_BATCH_SIZE = 100
 
 # Module-level logger for shared functions
 _logger = logging.getLogger(__name__)
 
+# release_imagery columns written by save_release_imagery(); the first three
+# are the unique key, the rest are refreshed when the image already exists
+IMAGERY_COLUMNS = (
+    'release_id', 'source', 'type',
+    'source_id', 'source_url',
+    'image_url_small', 'image_url_medium', 'image_url_large',
+    'checksum', 'comment', 'approved',
+)
+
 
 def save_release_imagery(conn, release_id: str, images: List[Dict[str, Any]],
                          logger: Optional[logging.Logger] = None,
@@ -35,9 +67,8 @@ def save_release_imagery(conn, release_id: str, images: List[Dict[str, Any]],
     """
     Save imagery records and mark release as checked.
 
-    This is the shared function used by:
-    - MBReleaseImporter: For newly created releases during import
-    - CAAImageImporter: For batch processing existing releases
+    This is the shared function used by MBReleaseImporter for newly created
+    releases during import.
 
     Args:
         conn: Database connection (caller manages transaction/commit)
@@ -46,88 +77,63 @@ def save_release_imagery(conn, release_id: str, images: List[Dict[str, Any]],
         logger: Optional logger (uses module logger if not provided)
         update_checked_timestamp: If True, update cover_art_checked_at on the release
 
+    Returns:
+        Dict with counts: {'created': int, 'updated': int, 'existing': int}
+    """
+    return save_release_imagery_batch(
+        conn, {release_id: images},
+        logger=logger,
+        update_checked_timestamp=update_checked_timestamp
+    )
+
+
+def save_release_imagery_batch(conn, images_by_release: Dict[str, List[Dict[str, Any]]],
+                               logger: Optional[logging.Logger] = None,
+                               update_checked_timestamp: bool = True) -> Dict[str, int]:
+    """
+    Save imagery records for many releases and mark them all as checked.
+
+    Every image is upserted in one merge on (release_id, source, type) and
+    cover_art_checked_at is set with one UPDATE, however many releases there
+    are. Releases with an empty image list are only marked as checked.
+
+    Args:
+        conn: Database connection (caller manages transaction/commit)
+        images_by_release: Release UUID -> imagery dicts from
+                           CoverArtArchiveClient.extract_imagery_data()
+        logger: Optional logger (uses module logger if not provided)
+        update_checked_timestamp: If True, update cover_art_checked_at on the releases
+
     Returns:
         Dict with counts: {'created': int, 'updated': int, 'existing': int}
     """
     log = logger or _logger
     result = {'created': 0, 'updated': 0, 'existing': 0}
 
-    with conn.cursor() as cur:
-        # Upsert each image
+    writer = BulkWriter(
+        'release_imagery', IMAGERY_COLUMNS,
+        conflict=('release_id', 'source', 'type'),
+        update=IMAGERY_COLUMNS[3:],
+        touch='updated_at',
+        returning=('type',),
+        report_inserted=True,
+    )
+    for release_id, images in images_by_release.items():
         for img in images:
-            # Check if exists
-            cur.execute("""
-                SELECT id FROM release_imagery
-                WHERE release_id = %s AND source = %s::imagery_source AND type = %s::imagery_type
-            """, (release_id, img['source'], img['type']))
+            writer.add((release_id, img['source'], img['type'],
+                        *(img[col] for col in IMAGERY_COLUMNS[3:])))
 
-            existing = cur.fetchone()
+    for row in writer.flush(conn):
+        result['created' if row['inserted'] else 'updated'] += 1
+        log.debug(f"    {'Created' if row['inserted'] else 'Updated'} {row['type']} image")
 
-            if existing:
-                # Update existing record
-                cur.execute("""
-                    UPDATE release_imagery
-                    SET source_id = %s,
-                        source_url = %s,
-                        image_url_small = %s,
-                        image_url_medium = %s,
-                        image_url_large = %s,
-                        checksum = %s,
-                        comment = %s,
-                        approved = %s,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE release_id = %s
-                      AND source = %s::imagery_source
-                      AND type = %s::imagery_type
-                """, (
-                    img['source_id'],
-                    img['source_url'],
-                    img['image_url_small'],
-                    img['image_url_medium'],
-                    img['image_url_large'],
-                    img['checksum'],
-                    img['comment'],
-                    img['approved'],
-                    release_id,
-                    img['source'],
-                    img['type']
-                ))
-                result['updated'] += 1
-                log.debug(f"    Updated {img['type']} image")
-            else:
-                # Insert new record
-                cur.execute("""
-                    INSERT INTO release_imagery (
-                        release_id, source, source_id, source_url, type,
-                        image_url_small, image_url_medium, image_url_large,
-                        checksum, comment, approved
-                    ) VALUES (
-                        %s, %s::imagery_source, %s, %s, %s::imagery_type,
-                        %s, %s, %s, %s, %s, %s
-                    )
-                """, (
-                    release_id,
-                    img['source'],
-                    img['source_id'],
-                    img['source_url'],
-                    img['type'],
-                    img['image_url_small'],
-                    img['image_url_medium'],
-                    img['image_url_large'],
-                    img['checksum'],
-                    img['comment'],
-                    img['approved']
-                ))
-                result['created'] += 1
-                log.debug(f"    Created {img['type']} image")
-
-        # Mark release as checked
-        if update_checked_timestamp:
+    if update_checked_timestamp and images_by_release:
+        with conn.cursor() as cur:
             cur.execute("""
                 UPDATE releases
                 SET cover_art_checked_at = CURRENT_TIMESTAMP
-                WHERE id = %s
-            """, (release_id,))
+                WHERE id = ANY(%s::uuid[])
+            """, ([str(release_id) for release_id in images_by_release],))
 
     return result
 
@@ -137,9 +143,10 @@ class CAAImageImporter:
     Handles Cover Art Archive image import operations.
     
     OPTIMIZATIONS:
-    - Batch pre-fetch of existing imagery to skip API calls
+    - Concurrent CAA lookups (CAA_IMPORT_WORKERS) under the shared rate limit
+    - Releases MusicBrainz reports without art cost no CAA request
     - Updates cover_art_checked_at even when no art found
-    - Single database connection per batch operation
+    - One transaction per CAA_WRITE_BATCH_SIZE releases
     """
     
     def __init__(self, dry_run: bool = False, force_refresh: bool = False,
@@ -155,7 +162,14 @@ class CAAImageImporter:
         self.dry_run = dry_run
         self.force_refresh = force_refresh
         self.logger = logger or logging.getLogger(__name__)
-        self.caa_client = CoverArtArchiveClient(force_refresh=force_refresh)
+
+        # One CAA client (and HTTP session) per worker thread
+        self._local = threading.local()
+        self._clients: List[CoverArtArchiveClient] = []
+        self._clients_lock = threading.Lock()
+
+        # Only reads cached MusicBrainz release details, never the API
+        self._mb_searcher = MusicBrainzSearcher()
         
         self.stats = {
             'releases_processed': 0,
@@ -166,6 +180,7 @@ class CAAImageImporter:
             'images_updated': 0,
             'api_calls': 0,
             'cache_hits': 0,
+            'no_art_from_musicbrainz': 0,
             'errors': 0,
         }
         
@@ -223,10 +238,8 @@ class CAAImageImporter:
         # Process releases
         self._process_releases(releases)
         
-        # Update stats from CAA client
-        caa_stats = self.caa_client.get_stats()
-        self.stats['api_calls'] = caa_stats['api_calls']
-        self.stats['cache_hits'] = caa_stats['cache_hits']
+        # Update stats from the CAA clients
+        self._update_client_stats()
         
         return {
             'success': True,
@@ -261,10 +274,8 @@ class CAAImageImporter:
         # Process releases
         self._process_releases(releases)
         
-        # Update stats from CAA client
-        caa_stats = self.caa_client.get_stats()
-        self.stats['api_calls'] = caa_stats['api_calls']
-        self.stats['cache_hits'] = caa_stats['cache_hits']
+        # Update stats from the CAA clients
+        self._update_client_stats()
         
         return {
             'success': True,
@@ -273,78 +284,136 @@ class CAAImageImporter:
     
     def _process_releases(self, releases: List[Dict[str, Any]]):
         """
-        Process a list of releases, fetching and storing cover art.
-        
+        Look up cover art for releases concurrently and store it in batches.
+
+        Lookups run on up to CAA_IMPORT_WORKERS threads, with at most
+        CAA_WRITE_BATCH_SIZE lookups per worker in flight: the next release
+        is submitted as each one completes, so a large import doesn't queue
+        (and hold results for) every release up front. Results are handled
+        here, on the calling thread, and written every CAA_WRITE_BATCH_SIZE
+        releases. A release whose lookup failed is neither written nor
+        marked as checked, so a later run retries it.
+
         Args:
             releases: List of release dicts with 'id' and 'musicbrainz_release_id'
         """
+        for release in releases:
+            if not release['musicbrainz_release_id']:
+                self.logger.debug(f"Skipping {release.get('title', 'Unknown')} - no MusicBrainz ID")
+        releases = [r for r in releases if r['musicbrainz_release_id']]
         total = len(releases)
-        
-        for idx, release in enumerate(releases, 1):
-            release_id = release['id']
-            mb_release_id = release['musicbrainz_release_id']
-            title = release.get('title', 'Unknown')
-            
-            self.logger.info(f"[{idx}/{total}] Processing: {title}")
-            
-            if not mb_release_id:
-                self.logger.debug(f"  Skipping - no MusicBrainz ID")
-                continue
-            
-            try:
-                # Get cover art from CAA (this may hit cache or API)
-                imagery_data = self.caa_client.extract_imagery_data(mb_release_id)
-                
-                if imagery_data:
-                    # Count front vs back images
-                    front_count = sum(1 for img in imagery_data if img['type'] == 'Front')
-                    back_count = sum(1 for img in imagery_data if img['type'] == 'Back')
-                    self.logger.info(f"  Found cover art: {front_count} front, {back_count} back")
-                    self.stats['releases_with_art'] += 1
-                    
-                    # We only store one of each type due to unique constraint
-                    # Collect the first front and first back image
-                    images_to_store = []
-                    stored_types = set()
-                    for img in imagery_data:
-                        if img['type'] not in stored_types:
-                            images_to_store.append(img)
-                            stored_types.add(img['type'])
-                else:
-                    self.logger.debug(f"  No cover art available")
-                    self.stats['releases_no_art'] += 1
-                    images_to_store = []
-                
-                # Single database connection for all operations on this release
-                self._save_release_imagery(release_id, images_to_store)
-                self.stats['releases_processed'] += 1
-                
-            except Exception as e:
-                self.logger.error(f"  Error processing release: {e}")
-                self.stats['errors'] += 1
-    
-    def _save_release_imagery(self, release_id: str, images: List[Dict[str, Any]]):
+        if not total:
+            return
+
+        workers = max(1, min(CAA_IMPORT_WORKERS, total))
+        window = CAA_WRITE_BATCH_SIZE * workers
+        self.logger.info(f"Looking up cover art for {total} releases ({workers} concurrent)...")
+        pending: Dict[str, List[Dict[str, Any]]] = {}
+        queued = iter(releases)
+        idx = 0
+
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix='caa-import') as pool:
+            futures = {}
+
+            def fill():
+                while len(futures) < window:
+                    release = next(queued, None)
+                    if release is None:
+                        return
+                    futures[pool.submit(self._lookup, release['musicbrainz_release_id'])] = release
+
+            fill()
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    release = futures.pop(future)
+                    idx += 1
+                    self.logger.info(f"[{idx}/{total}] Processing: {release.get('title', 'Unknown')}")
+
+                    try:
+                        imagery_data = future.result()
+                    except Exception as e:
+                        self.logger.error(f"  Error processing release: {e}")
+                        self.stats['errors'] += 1
+                        continue
+
+                    pending[release['id']] = self._images_to_store(imagery_data)
+                    if len(pending) >= CAA_WRITE_BATCH_SIZE:
+                        self._save_release_imagery(pending)
+                        pending = {}
+                fill()
+
+        self._save_release_imagery(pending)
+
+    def _lookup(self, mb_release_id: str) -> List[Dict[str, Any]]:
         """
-        Save imagery records and mark release as checked in a single transaction.
+        Fetch a release's imagery with this worker thread's CAA client,
+        passing along the release's cached MusicBrainz details if any
+        """
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = CoverArtArchiveClient(force_refresh=self.force_refresh)
+            with self._clients_lock:
+                self._clients.append(client)
+        mb_release = None
+        if not self.force_refresh:
+            mb_release = self._mb_searcher.get_cached_release_details(mb_release_id)
+        return client.extract_imagery_data(mb_release_id, mb_release)
+
+    def _images_to_store(self, imagery_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Count a looked-up release and pick the images to store for it"""
+        if not imagery_data:
+            self.logger.debug(f"  No cover art available")
+            self.stats['releases_no_art'] += 1
+            return []
+
+        # Count front vs back images
+        front_count = sum(1 for img in imagery_data if img['type'] == 'Front')
+        back_count = sum(1 for img in imagery_data if img['type'] == 'Back')
+        self.logger.info(f"  Found cover art: {front_count} front, {back_count} back")
+        self.stats['releases_with_art'] += 1
 
-        Uses the shared save_release_imagery() function for the actual database work.
+        # We only store one of each type due to unique constraint
+        # Collect the first front and first back image
+        images_to_store = []
+        stored_types = set()
+        for img in imagery_data:
+            if img['type'] not in stored_types:
+                images_to_store.append(img)
+                stored_types.add(img['type'])
+        return images_to_store
+
+    def _save_release_imagery(self, images_by_release: Dict[str, List[Dict[str, Any]]]):
+        """
+        Save imagery records and mark a batch of releases as checked in a
+        single transaction.
+
+        Uses the shared save_release_imagery_batch() function for the actual
+        database work.
 
         Args:
-            release_id: Database release UUID
-            images: List of imagery dicts to upsert (may be empty)
+            images_by_release: Release UUID -> imagery dicts to upsert (lists
+                               may be empty)
         """
+        if not images_by_release:
+            return
+
         if self.dry_run:
-            for img in images:
-                self.logger.info(f"    [DRY RUN] Would create/update {img['type']} image")
-                self.stats['images_created'] += 1
-            self.logger.debug(f"    [DRY RUN] Would update cover_art_checked_at")
+            for images in images_by_release.values():
+                for img in images:
+                    self.logger.info(f"    [DRY RUN] Would create/update {img['type']} image")
+                    self.stats['images_created'] += 1
+            self.logger.debug(f"    [DRY RUN] Would update cover_art_checked_at "
+                              f"for {len(images_by_release)} releases")
+            self.stats['releases_processed'] += len(images_by_release)
             return
 
         try:
             with get_db_connection() as conn:
                 # Use shared function for database operations
-                result = save_release_imagery(
-                    conn, release_id, images,
+                result = save_release_imagery_batch(
+                    conn, images_by_release,
                     logger=self.logger,
                     update_checked_timestamp=True
                 )
@@ -353,12 +422,18 @@ class CAAImageImporter:
                 # Update stats from result
                 self.stats['images_created'] += result['created']
                 self.stats['images_updated'] += result['updated']
+                self.stats['releases_processed'] += len(images_by_release)
 
         except Exception as e:
-            self.logger.error(f"    Error saving imagery: {e}")
-            self.stats['errors'] += 1
-    
+            self.logger.error(f"    Error saving imagery for {len(images_by_release)} releases: {e}")
+            self.stats['errors'] += len(images_by_release)
 
+    def _update_client_stats(self):
+        """Sum API usage over the worker threads' CAA clients"""
+        with self._clients_lock:
+            client_stats = [client.get_stats() for client in self._clients]
+        for key in ('api_calls', 'cache_hits', 'no_art_from_musicbrainz'):
+            self.stats[key] = sum(stats[key] for stats in client_stats)
 
     def _find_song(self, identifier: str) -> Optional[Dict[str, Any]]:
         """
@@ -16,12 +16,13 @@ import logging
 import time
 import hashlib
 from datetime import datetime
-from pathlib import Path
 from typing import Optional, Dict, List, Any
 
 import requests
 
-from core.cache_utils import get_cache_dir
+from core import api_cache
+from core.api_cache import CacheKey
+from integrations import rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,10 @@ class CoverArtArchiveClient:
     - /release/{mbid}/ - JSON listing of all cover art for a release
     - /release/{mbid}/front - Redirect to front cover image
     - /release/{mbid}/back - Redirect to back cover image
+
+    Callers that already hold the MusicBrainz release (its JSON carries a
+    'cover-art-archive' summary) can pass it in: a release MusicBrainz
+    reports without artwork is answered without a CAA request.
     
     Response codes:
     - 200/307: Success (307 redirects to actual image)
@@ -88,105 +93,57 @@ class CoverArtArchiveClient:
         self.last_made_api_call = False
         self.api_calls_made = 0
         self.cache_hits = 0
+        self.no_art_from_musicbrainz = 0
         
-        # Get cache directory using shared utility
-        self.cache_dir = get_cache_dir('coverart')
-        self.release_cache_dir = self.cache_dir / 'releases'
-        
-        # Create subdirectories
-        self.release_cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        logger.debug(f"CAA cache directory: {self.cache_dir}")
     
-    def _get_release_cache_path(self, release_mbid: str) -> Path:
+    def _get_release_cache_key(self, release_mbid: str) -> CacheKey:
         """
-        Get the cache file path for a release's cover art listing.
+        Get the cache key for a release's cover art listing.
         
         Args:
             release_mbid: MusicBrainz release ID
             
         Returns:
-            Path object for the cache file
+            CacheKey for the api_cache entry
         """
-        filename = f"release_{release_mbid}.json"
-        return self.release_cache_dir / filename
+        return CacheKey('coverart', f"releases/release_{release_mbid}")
     
-    def _is_cache_valid(self, cache_path: Path) -> bool:
+    def _load_from_cache(self, cache_key: CacheKey) -> Optional[Dict]:
         """
-        Check if cache file exists and is not expired.
+        Load data from the API cache.
         
         Args:
-            cache_path: Path to cache file
+            cache_key: CacheKey for the entry
             
         Returns:
-            bool: True if cache is valid and not expired
+            Cached data dict, or None if missing or expired
         """
-        if not cache_path.exists():
-            return False
-        
-        # Check file modification time
-        mtime = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        age = datetime.now() - mtime
-        
-        is_valid = age.days < self.cache_days
-        if is_valid:
-            logger.debug(f"Cache valid (age: {age.days} days): {cache_path.name}")
-        else:
-            logger.debug(f"Cache expired (age: {age.days} days): {cache_path.name}")
-        
-        return is_valid
+        cache_data = api_cache.get(cache_key, max_age_days=self.cache_days)
+        if cache_data is not None:
+            logger.debug(f"Loaded from cache: {cache_key.name}")
+            self.cache_hits += 1
+        return cache_data
     
-    def _load_from_cache(self, cache_path: Path) -> Optional[Dict]:
+    def _save_to_cache(self, cache_key: CacheKey, data: Any):
         """
-        Load data from cache file.
+        Save data to the API cache.
         
         Args:
-            cache_path: Path to cache file
-            
-        Returns:
-            Cached data dict, or None if not in cache
-        """
-        if not self._is_cache_valid(cache_path):
-            return None
-        
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-                logger.debug(f"Loaded from cache: {cache_path.name}")
-                self.cache_hits += 1
-                return cache_data
-        except Exception as e:
-            logger.warning(f"Failed to load cache file {cache_path}: {e}")
-            return None
-    
-    def _save_to_cache(self, cache_path: Path, data: Any):
-        """
-        Save data to cache file.
-        
-        Args:
-            cache_path: Path to cache file
+            cache_key: CacheKey for the entry
             data: Data to cache (will be JSON serialized)
         """
-        try:
-            cache_data = {
-                'data': data,
-                'cached_at': datetime.now().isoformat()
-            }
-            
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
-            logger.debug(f"Saved to cache: {cache_path.name}")
-        except Exception as e:
-            logger.warning(f"Failed to save cache file {cache_path}: {e}")
+        cache_data = {
+            'data': data,
+            'cached_at': datetime.now().isoformat()
+        }
+        if api_cache.set(cache_key, cache_data):
+            logger.debug(f"Saved to cache: {cache_key.name}")
     
     def _rate_limit(self):
-        """Enforce rate limiting for CAA API."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            sleep_time = self.min_request_interval - elapsed
-            logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
+        """Enforce rate limiting for CAA API (shared across all clients)."""
+        rate_limiter.get_bucket(
+            rate_limiter.COVER_ART_ARCHIVE, min_interval=self.min_request_interval
+        ).acquire()
         self.last_request_time = time.time()
     
     def _make_request(self, url: str, allow_redirects: bool = True) -> Optional[requests.Response]:
@@ -227,10 +184,16 @@ class CoverArtArchiveClient:
                     logger.debug(f"No cover art found (404): {url}")
                     return response
                 
-                # Retry transient server errors (5xx) and rate-limit (429)
-                # with exponential backoff. CAA occasionally returns 500 during
-                # upstream outages; these are almost always transient.
-                if response.status_code >= 500 or response.status_code == 429:
+                # Rate limited: pause the shared bucket (honouring
+                # Retry-After) so every CAA client backs off, then retry
+                if response.status_code in (429, 503):
+                    rate_limiter.report_throttled(rate_limiter.COVER_ART_ARCHIVE, response)
+                    continue
+
+                # Retry transient server errors (5xx) with exponential
+                # backoff. CAA occasionally returns 500 during upstream
+                # outages; these are almost always transient.
+                if response.status_code >= 500:
                     delay = self.base_delay * (2 ** attempt)
                     logger.warning(
                         f"Transient status {response.status_code} for {url}, "
@@ -258,7 +221,8 @@ class CoverArtArchiveClient:
         logger.error(f"Failed after {self.max_retries} retries: {last_error}")
         return None
     
-    def get_release_cover_art(self, release_mbid: str) -> Optional[Dict[str, Any]]:
+    def get_release_cover_art(self, release_mbid: str,
+                              mb_release: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
         Get cover art listing for a MusicBrainz release.
         
@@ -267,6 +231,9 @@ class CoverArtArchiveClient:
         
         Args:
             release_mbid: MusicBrainz release ID (UUID)
+            mb_release: Optional MusicBrainz release JSON for the same release;
+                        if its 'cover-art-archive' summary reports no artwork,
+                        no CAA request is made
             
         Returns:
             Dict with 'images' array and 'release' URL, or None if no cover art.
@@ -296,13 +263,24 @@ class CoverArtArchiveClient:
             }
         """
         # Check cache first (unless force_refresh)
-        cache_path = self._get_release_cache_path(release_mbid)
+        cache_key = self._get_release_cache_key(release_mbid)
         if not self.force_refresh:
-            cached = self._load_from_cache(cache_path)
+            cached = self._load_from_cache(cache_key)
             if cached:
                 logger.debug(f"Using cached cover art for release {release_mbid}")
                 self.last_made_api_call = False
                 return cached.get('data')
+
+        # MusicBrainz already knows whether CAA has art for the release. The
+        # answer isn't cached: art added since the release was fetched will
+        # be found by the next lookup without it.
+        if mb_release and not self.force_refresh:
+            caa_summary = mb_release.get('cover-art-archive') or {}
+            if caa_summary.get('artwork') is False:
+                logger.debug(f"No cover art per MusicBrainz for release {release_mbid}")
+                self.last_made_api_call = False
+                self.no_art_from_musicbrainz += 1
+                return {'no_cover_art': True, 'release_mbid': release_mbid}
         
         # Make API request
         self.last_made_api_call = True
@@ -320,7 +298,7 @@ class CoverArtArchiveClient:
         if response.status_code == 404:
             # Cache the negative result to avoid repeated lookups
             result = {'no_cover_art': True, 'release_mbid': release_mbid}
-            self._save_to_cache(cache_path, result)
+            self._save_to_cache(cache_key, result)
             return result
 
         # Any status other than 200/404 is a failure we can't safely treat
@@ -334,7 +312,7 @@ class CoverArtArchiveClient:
         # Parse JSON response
         try:
             data = response.json()
-            self._save_to_cache(cache_path, data)
+            self._save_to_cache(cache_key, data)
             return data
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse CAA response: {e}")
@@ -386,7 +364,8 @@ class CoverArtArchiveClient:
             return url.replace('http://', 'https://', 1)
         return url
     
-    def extract_imagery_data(self, release_mbid: str) -> List[Dict[str, Any]]:
+    def extract_imagery_data(self, release_mbid: str,
+                             mb_release: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Extract imagery data suitable for database insertion.
         
@@ -397,6 +376,8 @@ class CoverArtArchiveClient:
         
         Args:
             release_mbid: MusicBrainz release ID
+            mb_release: Optional MusicBrainz release JSON (see
+                        get_release_cover_art)
             
         Returns:
             List of dicts with keys matching release_imagery columns:
@@ -411,7 +392,7 @@ class CoverArtArchiveClient:
             - comment: Image comment
             - approved: Whether approved
         """
-        data = self.get_release_cover_art(release_mbid)
+        data = self.get_release_cover_art(release_mbid, mb_release)
         
         if not data or data.get('no_cover_art'):
             return []
@@ -452,9 +433,11 @@ class CoverArtArchiveClient:
         Get statistics about API usage.
         
         Returns:
-            Dict with 'api_calls' and 'cache_hits' counts
+            Dict with 'api_calls', 'cache_hits' and 'no_art_from_musicbrainz'
+            counts (releases answered from the MusicBrainz release data)
         """
         return {
             'api_calls': self.api_calls_made,
-            'cache_hits': self.cache_hits
+            'cache_hits': self.cache_hits,
+            'no_art_from_musicbrainz': self.no_art_from_musicbrainz,
         }
\ No newline at end of file
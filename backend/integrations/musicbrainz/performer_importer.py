@@ -12,6 +12,8 @@ PERFORMANCE OPTIMIZATION (2025-12):
 - Batch fetches performer lookups (by MBID and name) in single queries
 - Batch fetches existing performer links in single query
 - Eliminates per-performer database round trips for "already linked" checks
+- recording_performers, performer_instruments and release_performers rows are
+  staged and written with one COPY + merge per table (core/bulk_writer.py)
 """
 
 import logging
@@ -19,6 +21,7 @@ import re
 from datetime import datetime
 from pathlib import Path
 from db_utils import get_db_connection
+from core.bulk_writer import BulkWriter
 from integrations.musicbrainz.utils import MusicBrainzSearcher
 
 
@@ -141,6 +144,8 @@ class PerformerImporter:
             'performer_links_created': 0,
             'recordings_with_new_performers': 0,  # Recordings that got new performers added
         }
+        # Instrument name (lowercase) -> ID of an existing instrument
+        self._instrument_cache = {}
     
     # ========================================================================
     # DATA QUALITY CHECKS: Determine if MusicBrainz has better data
@@ -302,6 +307,15 @@ class PerformerImporter:
         new_performers_added = 0
         new_performer_names = []
 
+        # Links are staged and written together before the leader check
+        performer_links = BulkWriter(
+            'recording_performers',
+            ('recording_id', 'performer_id', 'instrument_id', 'role'),
+        )
+        instrument_links = BulkWriter(
+            'performer_instruments', ('performer_id', 'instrument_id'),
+        )
+
         with conn.cursor() as cur:
             for performer_data in performers_to_add:
                 performer_mbid = performer_data.get('mbid')
@@ -352,31 +366,21 @@ class PerformerImporter:
                         instrument_id = self.get_or_create_instrument(conn, instrument_name)
 
                         if instrument_id:
-                            cur.execute("""
-                                INSERT INTO recording_performers (
-                                    recording_id, performer_id, instrument_id, role
-                                )
-                                VALUES (%s, %s, %s, %s)
-                                ON CONFLICT DO NOTHING
-                            """, (recording_id, performer_id, instrument_id, db_role))
-
-                            self.link_performer_instrument(conn, performer_id, instrument_id)
+                            performer_links.add((recording_id, performer_id, instrument_id, db_role))
+                            instrument_links.add((performer_id, instrument_id))
                             new_performers_added += 1
                             new_performer_names.append(f"{performer_name} ({instrument_name})")
                             # Add to existing_links to prevent duplicate inserts
                             existing_links.add(performer_id)
                 else:
-                    cur.execute("""
-                        INSERT INTO recording_performers (
-                            recording_id, performer_id, role
-                        )
-                        VALUES (%s, %s, %s)
-                        ON CONFLICT DO NOTHING
-                    """, (recording_id, performer_id, db_role))
+                    performer_links.add((recording_id, performer_id, None, db_role))
                     new_performers_added += 1
                     new_performer_names.append(performer_name)
                     existing_links.add(performer_id)
 
+            performer_links.flush(conn)
+            instrument_links.flush(conn)
+
             # Ensure at least one leader
             if new_performers_added > 0:
                 self._ensure_leader_exists(cur, recording_id, 'recording_performers')
@@ -625,10 +629,29 @@ class PerformerImporter:
         if not conn or not release_id:
             return 0
         
-        credits_linked = 0
-        
-        with conn.cursor() as cur:
-            for credit in credits_to_add:
+        # Batch lookup; only credits for unknown performers hit the DB singly
+        performer_cache = self._batch_get_performers(
+            conn,
+            [c['mbid'] for c in credits_to_add if c.get('mbid')],
+            [c['name'] for c in credits_to_add if c.get('name')]
+        )
+
+        # One credit per performer (the first), as the per-row check did;
+        # performers already credited on the release are skipped in the merge
+        release_links = BulkWriter(
+            'release_performers',
+            ('release_id', 'performer_id', 'role'),
+            skip_existing=('release_id', 'performer_id'),
+            returning=('performer_id',),
+        )
+        staged = set()
+        for credit in credits_to_add:
+            performer_id = None
+            if credit.get('mbid'):
+                performer_id = performer_cache.get(f"mbid:{credit['mbid']}")
+            if not performer_id and credit.get('name'):
+                performer_id = performer_cache.get(f"name:{credit['name'].lower()}")
+            if not performer_id:
                 performer_id = self.get_or_create_performer(
                     conn,
                     credit['name'],
@@ -638,29 +661,12 @@ class PerformerImporter:
                     disambiguation=credit.get('disambiguation')
                 )
 
-                if not performer_id:
-                    continue
-                
-                # Check if already linked
-                cur.execute("""
-                    SELECT COUNT(*) as count
-                    FROM release_performers
-                    WHERE release_id = %s AND performer_id = %s
-                """, (release_id, performer_id))
-                
-                if cur.fetchone()['count'] > 0:
-                    continue
-                
-                # Add the credit
-                cur.execute("""
-                    INSERT INTO release_performers (release_id, performer_id, role)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT DO NOTHING
-                """, (release_id, performer_id, credit['role']))
-                
-                credits_linked += 1
-        
-        return credits_linked
+            if not performer_id or performer_id in staged:
+                continue
+            staged.add(performer_id)
+            release_links.add((release_id, performer_id, credit['role']))
+
+        return len(release_links.flush(conn))
     
     def _extract_release_credits(self, release_details):
         """Extract non-performer credits from release data"""
@@ -1185,6 +1191,12 @@ class PerformerImporter:
     
     def get_or_create_instrument(self, conn, instrument_name):
         """Get existing instrument or create new one"""
+        # Only instruments already in the DB are cached: a new one disappears
+        # if the recording's transaction is rolled back
+        cache_key = instrument_name.lower()
+        if cache_key in self._instrument_cache:
+            return self._instrument_cache[cache_key]
+
         with conn.cursor() as cur:
             cur.execute("""
                 SELECT id FROM instruments
@@ -1193,6 +1205,7 @@ class PerformerImporter:
             result = cur.fetchone()
             
             if result:
+                self._instrument_cache[cache_key] = result['id']
                 return result['id']
             
             if self.dry_run:
@@ -10,6 +10,12 @@ PERFORMANCE OPTIMIZATIONS:
    - Single query to get all recordings that already have performers
    - Skips add_performers_to_recording() entirely for these recordings
    - Reduces "everything cached" case from 4 queries/recording to 1 query total
+6. Release details are prefetched concurrently (bounded, sharing the global
+   MusicBrainz rate limit) before the write transaction is opened, so the
+   DB connection is held for the inserts only, not for the API round-trips
+7. A recording's new releases and recording_releases links are staged and
+   written with COPY + one INSERT ... ON CONFLICT merge each (core/bulk_writer.py)
+   instead of one INSERT per release and per link
 
 KEY ARCHITECTURE:
 - Recording = a specific sound recording (same audio across all releases)
@@ -26,10 +32,15 @@ COVER ART ARCHIVE INTEGRATION (2025-12):
 """
 
 import logging
+import os
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional, Dict, List, Any, Set, Tuple
+from typing import Callable, Optional, Dict, List, Any, Set, Tuple
 
 from db_utils import get_db_connection
+from core.bulk_writer import BulkWriter
 from integrations.musicbrainz.performer_importer import PerformerImporter
 from integrations.musicbrainz.utils import MusicBrainzSearcher
 from integrations.coverart.utils import CoverArtArchiveClient
@@ -42,6 +53,42 @@ _logger = logging.getLogger(__name__)
 JAZZBOT_EMAIL = "jazzbot@approachnote.com"
 JAZZBOT_DISPLAY_NAME = "JazzBot"
 
+# Concurrent MusicBrainz release-detail requests during the prefetch stage
+RELEASE_PREFETCH_WORKERS = int(os.environ.get('MB_RELEASE_PREFETCH_WORKERS', 3))
+
+# Release details fetched per chunk of recordings; each chunk is written and
+# committed (and handed off) before the import moves on to the next one
+RELEASE_PREFETCH_CHUNK_SIZE = int(os.environ.get('MB_RELEASE_PREFETCH_CHUNK_SIZE', 25))
+
+# releases columns written on import, in _release_row() order
+RELEASE_COLUMNS = (
+    'musicbrainz_release_id', 'musicbrainz_release_group_id',
+    'title', 'artist_credit', 'disambiguation',
+    'release_date', 'release_year', 'country',
+    'label', 'catalog_number', 'barcode',
+    'format_id', 'packaging_id', 'status_id',
+    'language', 'script', 'total_tracks', 'total_discs',
+    'data_quality',
+)
+
+
+class _ReleaseWriteBatch:
+    """Releases and recording_releases links staged for one recording"""
+
+    def __init__(self):
+        # Conflicts return the existing row's ID (no-op update)
+        self.releases = BulkWriter(
+            'releases', RELEASE_COLUMNS,
+            conflict=('musicbrainz_release_id',),
+            update=('musicbrainz_release_id',),
+            returning=('id', 'musicbrainz_release_id'),
+        )
+        # MB release ID -> full release details, for releases being created
+        self.new_releases: Dict[str, Dict[str, Any]] = {}
+        # (release_id or None if not created yet, mb_release_id,
+        #  track_number, disc_number), in MusicBrainz order
+        self.links: List[tuple] = []
+
 
 def parse_mb_date(date_str: str) -> Tuple[Optional[str], Optional[int], Optional[str]]:
     """
@@ -236,7 +283,8 @@ class MBReleaseImporter:
     def __init__(self, dry_run: bool = False, force_refresh: bool = False,
                  logger: Optional[logging.Logger] = None,
                  progress_callback: Optional[callable] = None,
-                 import_cover_art: bool = True):
+                 import_cover_art: bool = True,
+                 release_callback: Optional[callable] = None):
         """
         Initialize the importer
 
@@ -246,11 +294,18 @@ class MBReleaseImporter:
             logger: Optional logger instance (creates one if not provided)
             progress_callback: Optional callback(phase, current, total) for progress tracking
             import_cover_art: If True, fetch cover art from CAA for new releases
+            release_callback: Optional callback(releases) for pipelined research.
+                When set, each recording is committed as soon as it is processed
+                and the callback receives the releases that are now fully linked
+                (dicts with 'id', 'mb_release_id' and 'created'). Cover art is
+                then left to the caller: call import_cover_art_for_release()
+                for each created release.
         """
         self.dry_run = dry_run
         self.force_refresh = force_refresh
         self.logger = logger or logging.getLogger(__name__)
         self.progress_callback = progress_callback
+        self.release_callback = release_callback
         self.mb_searcher = MusicBrainzSearcher(force_refresh=force_refresh)
         self.performer_importer = PerformerImporter(dry_run=dry_run)
 
@@ -289,6 +344,13 @@ class MBReleaseImporter:
         # Cache for JazzBot user ID (for auto-generated vocal/instrumental contributions)
         self._jazzbot_user_id = None
 
+        # Release hand-off state for release_callback (MB release ID -> our ID)
+        self._release_ids_by_mb = {}
+        self._created_mb_release_ids = set()
+
+        # Release details fetched ahead of the write transaction (MB release ID -> details)
+        self._prefetched_releases = {}
+
         self.logger.info(f"MBReleaseImporter initialized (optimized version, force_refresh={force_refresh}, import_cover_art={import_cover_art})")
     
     def find_song(self, song_identifier: str) -> Optional[Dict[str, Any]]:
@@ -373,7 +435,8 @@ class MBReleaseImporter:
         
         self.logger.info(f"Found {len(recordings)} recordings to process")
         
-        # Process each recording with a SINGLE connection
+        # Song-level pre-fetch of ALL database state needed, on a short-lived
+        # connection (released before the network-bound release prefetch)
         with get_db_connection() as conn:
             # Pre-load lookup table caches (one-time cost)
             self._load_lookup_caches(conn)
@@ -420,38 +483,79 @@ class MBReleaseImporter:
                 conn, existing_recording_db_ids
             )
             self.logger.debug(f"  Pre-fetched {len(all_existing_links)} existing links")
-            
-            for i, mb_recording in enumerate(recordings, 1):
-                recording_title = mb_recording.get('title', 'Unknown')
-                source_work_id = mb_recording.get('_source_mb_work_id')
-                is_secondary = source_work_id == second_mb_id if second_mb_id else False
-                source_label = " [from secondary MB work]" if is_secondary else ""
-                self.logger.info(f"\n[{i}/{len(recordings)}] Processing: {recording_title}{source_label}")
-
-                # Report progress via callback
-                if self.progress_callback:
-                    self.progress_callback('musicbrainz_recording_import', i, len(recordings))
-
-                try:
-                    self._process_recording_fast(
-                        conn, song['id'], mb_recording,
-                        recordings_with_performers,
-                        existing_recordings,
-                        existing_releases_all,
-                        all_existing_links,
-                        source_mb_work_id=source_work_id
-                    )
-                    self.stats['recordings_found'] += 1
-                except Exception as e:
-                    self.logger.error(f"  Error processing recording: {e}", exc_info=True)
-                    self.stats['errors'] += 1
-                    # Rollback the failed transaction so subsequent operations can proceed
-                    try:
-                        conn.rollback()
-                    except Exception:
-                        pass  # Connection might already be closed
-                    # Continue with next recording
-                    continue
+
+        # 5. Fetch release details in chunks of recordings, never while a
+        # write transaction is open. Each chunk is written and committed (and
+        # its releases handed off) as soon as its details are in, while the
+        # next chunk's details are already being fetched.
+        self._prefetched_releases = {}
+        chunks = self._release_fetch_chunks(
+            recordings, existing_recordings, existing_releases_all, all_existing_links
+        )
+        fetch_total = sum(len(mb_release_ids) for _, mb_release_ids in chunks)
+        if fetch_total:
+            self.logger.info(
+                f"Prefetching details for {fetch_total} releases in {len(chunks)} chunks "
+                f"({RELEASE_PREFETCH_WORKERS} concurrent)..."
+            )
+
+        # For release_callback: how many of this import's recordings still
+        # have to be processed before each release is fully linked
+        pending_links = Counter(
+            rel.get('id')
+            for rec in recordings
+            for rel in {r.get('id'): r for r in (rec.get('releases') or [])}.values()
+            if rel.get('id')
+        )
+
+        i = 0
+        with ThreadPoolExecutor(max_workers=max(1, RELEASE_PREFETCH_WORKERS),
+                                thread_name_prefix='mb-release-prefetch') as pool:
+            fetch = self._release_fetcher()
+            fetched = 0
+            pending = self._submit_release_fetches(pool, fetch, chunks[0][1] if chunks else [])
+            for n, (chunk, _) in enumerate(chunks):
+                fetched = self._collect_release_fetches(pending, fetched, fetch_total)
+                pending = self._submit_release_fetches(
+                    pool, fetch, chunks[n + 1][1] if n + 1 < len(chunks) else []
+                )
+
+                # One connection per chunk; without release_callback the
+                # chunk is committed when the connection is released
+                with get_db_connection() as conn:
+                    for mb_recording in chunk:
+                        i += 1
+                        recording_title = mb_recording.get('title', 'Unknown')
+                        source_work_id = mb_recording.get('_source_mb_work_id')
+                        is_secondary = source_work_id == second_mb_id if second_mb_id else False
+                        source_label = " [from secondary MB work]" if is_secondary else ""
+                        self.logger.info(f"\n[{i}/{len(recordings)}] Processing: {recording_title}{source_label}")
+
+                        # Report progress via callback
+                        if self.progress_callback:
+                            self.progress_callback('musicbrainz_recording_import', i, len(recordings))
+
+                        try:
+                            self._process_recording_fast(
+                                conn, song['id'], mb_recording,
+                                recordings_with_performers,
+                                existing_recordings,
+                                existing_releases_all,
+                                all_existing_links,
+                                source_mb_work_id=source_work_id
+                            )
+                            self.stats['recordings_found'] += 1
+                        except Exception as e:
+                            self.logger.error(f"  Error processing recording: {e}", exc_info=True)
+                            self.stats['errors'] += 1
+                            # Rollback the failed transaction so subsequent operations can proceed
+                            try:
+                                conn.rollback()
+                            except Exception:
+                                pass  # Connection might already be closed
+                        finally:
+                            if self.release_callback:
+                                self._hand_off_releases(conn, mb_recording, pending_links)
         return {
             'success': True,
             'song': song,
@@ -459,6 +563,148 @@ class MBReleaseImporter:
             'stats': self.stats
         }
     
+    def _release_ids_to_fetch(self, recordings: List[Dict[str, Any]],
+                              existing_recordings: Dict[str, str],
+                              existing_releases_all: Dict[str, str],
+                              all_existing_links: Dict[str, Set[str]],
+                              seen: Optional[Set[str]] = None) -> List[str]:
+        """
+        MB release IDs whose details processing will ask for: releases not in
+        our DB yet, and existing releases that still need linking to the
+        recording (track positions come from the release details). IDs
+        already in `seen` are skipped, and the returned ones are added to it.
+        """
+        needed = []
+        seen = set() if seen is None else seen
+        for rec in recordings:
+            recording_id = existing_recordings.get(rec.get('id'))
+            links = all_existing_links.get(recording_id, set()) if recording_id else set()
+            for rel in (rec.get('releases') or []):
+                mb_release_id = rel.get('id')
+                if not mb_release_id or mb_release_id in seen:
+                    continue
+                release_id = existing_releases_all.get(mb_release_id)
+                if release_id is None or release_id not in links:
+                    seen.add(mb_release_id)
+                    needed.append(mb_release_id)
+        return needed
+
+    def _release_fetch_chunks(self, recordings: List[Dict[str, Any]],
+                              existing_recordings: Dict[str, str],
+                              existing_releases_all: Dict[str, str],
+                              all_existing_links: Dict[str, Set[str]]
+                              ) -> List[Tuple[List[Dict[str, Any]], List[str]]]:
+        """
+        Split the recordings, in order, into chunks that each need about
+        RELEASE_PREFETCH_CHUNK_SIZE release details fetched.
+
+        Returns (recordings, MB release IDs first needed by them) pairs. A
+        release shared with an earlier chunk is fetched with that chunk only.
+        """
+        chunks = []
+        seen = set()
+        chunk, chunk_ids = [], []
+        for rec in recordings:
+            chunk.append(rec)
+            chunk_ids.extend(self._release_ids_to_fetch(
+                [rec], existing_recordings, existing_releases_all, all_existing_links, seen
+            ))
+            if len(chunk_ids) >= RELEASE_PREFETCH_CHUNK_SIZE:
+                chunks.append((chunk, chunk_ids))
+                chunk, chunk_ids = [], []
+        if chunk:
+            chunks.append((chunk, chunk_ids))
+        return chunks
+
+    def _release_fetcher(self) -> Callable[[str], Optional[Dict[str, Any]]]:
+        """
+        A fetch(mb_release_id) for prefetch worker threads.
+
+        Each worker thread has its own MusicBrainzSearcher (sessions are not
+        shared across threads); all of them draw from the process-wide
+        MusicBrainz rate limiter, so concurrency only hides request latency
+        and never raises the request rate. Responses also land in the API
+        cache.
+        """
+        local = threading.local()
+
+        def fetch(mb_release_id):
+            searcher = getattr(local, 'searcher', None)
+            if searcher is None:
+                searcher = local.searcher = MusicBrainzSearcher(force_refresh=self.force_refresh)
+            return searcher.get_release_details(mb_release_id)
+
+        return fetch
+
+    def _submit_release_fetches(self, pool: ThreadPoolExecutor, fetch: Callable,
+                                mb_release_ids: List[str]) -> Dict[Future, str]:
+        """Start fetching release details; returns future -> MB release ID"""
+        return {pool.submit(fetch, mb_release_id): mb_release_id
+                for mb_release_id in mb_release_ids}
+
+    def _collect_release_fetches(self, futures: Dict[Future, str],
+                                 done: int, total: int) -> int:
+        """
+        Wait for release detail fetches into self._prefetched_releases.
+
+        A release that fails is recorded as None so processing does not
+        retry it from inside the transaction. Returns the running count of
+        fetched releases, for progress.
+        """
+        for future in as_completed(futures):
+            mb_release_id = futures[future]
+            try:
+                self._prefetched_releases[mb_release_id] = future.result()
+            except Exception as e:
+                self.logger.warning(f"  Error prefetching release {mb_release_id}: {e}")
+                self._prefetched_releases[mb_release_id] = None
+            done += 1
+            if self.progress_callback:
+                self.progress_callback('musicbrainz_release_prefetch', done, total)
+        return done
+
+    def _get_release_details(self, mb_release_id: str) -> Optional[Dict[str, Any]]:
+        """Release details from the prefetch, falling back to MusicBrainz"""
+        if mb_release_id in self._prefetched_releases:
+            return self._prefetched_releases[mb_release_id]
+        return self.mb_searcher.get_release_details(mb_release_id)
+
+    def _hand_off_releases(self, conn, mb_recording: Dict[str, Any],
+                           pending_links: Counter) -> None:
+        """
+        Commit the recording just processed and pass on releases that have
+        no more recordings waiting to be linked to them.
+
+        A release is handed off once, after the last recording of this import
+        that appears on it, so downstream track matching sees every link.
+        """
+        try:
+            conn.commit()
+        except Exception as e:
+            self.logger.error(f"  Error committing recording: {e}")
+            return
+
+        ready = []
+        for mb_release_id in {r.get('id') for r in (mb_recording.get('releases') or [])}:
+            if not mb_release_id:
+                continue
+            pending_links[mb_release_id] -= 1
+            if pending_links[mb_release_id] > 0:
+                continue
+            release_id = self._release_ids_by_mb.get(mb_release_id)
+            if release_id:
+                ready.append({
+                    'id': str(release_id),
+                    'mb_release_id': mb_release_id,
+                    'created': mb_release_id in self._created_mb_release_ids,
+                })
+
+        if ready:
+            try:
+                self.release_callback(ready)
+            except Exception as e:
+                self.logger.error(f"  Error handing off releases: {e}", exc_info=True)
+
     def _get_recordings_with_performers(self, conn, mb_recording_ids: List[str],
                                          song_id: str) -> Set[str]:
         """
@@ -708,12 +954,17 @@ class MBReleaseImporter:
                        f"({len(existing_releases)} in DB, {fully_linked_count} already linked, "
                        f"{needs_linking_count} need linking, {new_releases_count} new)...")
         
-        # STEP 5: Process each release (only does work for new/unlinked releases)
+        # STEP 5: Process each release (only does work for new/unlinked releases).
+        # New releases and links are staged, then written in bulk below.
+        batch = _ReleaseWriteBatch()
         for mb_release in mb_releases:
             self._process_release_in_transaction(
                 conn, recording_id, mb_recording_id, mb_recording, 
-                mb_release, existing_releases, existing_links
+                mb_release, existing_releases, existing_links, batch
             )
+
+        # STEP 6: Write this recording's new releases and links
+        self._flush_release_batch(conn, recording_id, mb_recording, batch)
     
     def _create_recording(self, conn, song_id: str, mb_recording_id: str,
                            date_info: Dict[str, Any],
@@ -909,7 +1160,8 @@ class MBReleaseImporter:
     def _process_release_in_transaction(
         self, conn, recording_id: Optional[str], mb_recording_id: str,
         mb_recording: Dict[str, Any], mb_release: Dict[str, Any],
-        existing_releases: Dict[str, str], existing_links: Set[str]
+        existing_releases: Dict[str, str], existing_links: Set[str],
+        batch: '_ReleaseWriteBatch'
     ) -> None:
         """
         Process a single release within an existing transaction
@@ -918,7 +1170,8 @@ class MBReleaseImporter:
         - Uses pre-fetched existing_releases mapping (MB ID -> our ID)
         - Uses pre-fetched existing_links set (our release IDs already linked)
         - Skips entirely for releases that are already fully linked
-        - No individual DB queries for existing releases
+        - No individual DB queries: new releases and links are staged in
+          ``batch`` and written by _flush_release_batch()
         
         UPDATED: Recording-Centric Performer Architecture
         - Performers are added to RECORDINGS, not releases
@@ -932,6 +1185,7 @@ class MBReleaseImporter:
             mb_release: Basic MusicBrainz release data
             existing_releases: Dict mapping MB release ID -> our release ID
             existing_links: Set of our release IDs already linked to this recording
+            batch: Pending release/link rows for this recording
         """
         mb_release_id = mb_release.get('id')
         release_title = mb_release.get('title', 'Unknown')
@@ -939,6 +1193,7 @@ class MBReleaseImporter:
         # OPTIMIZATION: Check if release exists using pre-fetched data
         if mb_release_id in existing_releases:
             release_id = existing_releases[mb_release_id]
+            self._release_ids_by_mb[mb_release_id] = release_id
             self.stats['releases_existing'] += 1
 
             # Check if already linked using pre-fetched data (no DB query!)
@@ -952,15 +1207,15 @@ class MBReleaseImporter:
                 self.logger.debug(f"    Creating link for existing release: {release_title[:40]}")
                 # Fetch full release details to get track positions
                 # (will use cache if available, so not as slow as it sounds)
-                release_details = self.mb_searcher.get_release_details(mb_release_id)
-                self._link_recording_to_release(
-                    conn, recording_id, release_id, mb_recording_id,
-                    release_details or mb_release
-                )
+                release_details = self._get_release_details(mb_release_id)
+                batch.links.append((
+                    release_id, mb_release_id,
+                    *self._find_track_position(mb_recording_id, release_details or mb_release)
+                ))
             return
         
         # Release doesn't exist - fetch full details from MusicBrainz
-        release_details = self.mb_searcher.get_release_details(mb_release_id)
+        release_details = self._get_release_details(mb_release_id)
         
         if not release_details:
             self.logger.warning(f"    Could not fetch details for release: {release_title[:40]}")
@@ -975,16 +1230,67 @@ class MBReleaseImporter:
             self._log_release_info(release_data)
             return
         
-        # Create the release
-        release_id = self._create_release(conn, release_data)
+        # Stage the release (and its link) for the bulk write
+        if mb_release_id in batch.new_releases:
+            return
+        batch.releases.add(self._release_row(conn, release_data))
+        batch.new_releases[mb_release_id] = release_details
+        if recording_id:
+            # Use release_details, which has full track info
+            batch.links.append((
+                None, mb_release_id,
+                *self._find_track_position(mb_recording_id, release_details)
+            ))
 
-        if release_id:
-            self.stats['releases_created'] += 1
-            self.logger.info(f"    ✓ Created release: {release_title[:40]}")
+    def _flush_release_batch(self, conn, recording_id: Optional[str],
+                             mb_recording: Dict[str, Any],
+                             batch: '_ReleaseWriteBatch') -> None:
+        """
+        Write a recording's staged releases and links, then attach
+        release credits and cover art to the new releases.
 
-            # Link recording to release (use release_details which has full track info)
-            if recording_id:
-                self._link_recording_to_release(conn, recording_id, release_id, mb_recording_id, release_details)
+        One COPY + merge for the releases (returning their IDs), one for the
+        recording_releases links, and one default_release_id update, instead
+        of an INSERT per release and per link.
+        """
+        if not batch.new_releases and not batch.links:
+            return
+
+        # Releases: ON CONFLICT returns the existing ID for releases created
+        # between our pre-fetch check and now
+        created = {
+            row['musicbrainz_release_id']: row['id']
+            for row in batch.releases.flush(conn)
+        }
+
+        link_writer = BulkWriter(
+            'recording_releases',
+            ('recording_id', 'release_id', 'track_number', 'disc_number'),
+            conflict=('recording_id', 'release_id'),
+        )
+        first_release_id = None
+        for release_id, mb_release_id, track_number, disc_number in batch.links:
+            release_id = release_id or created.get(mb_release_id)
+            if not release_id:
+                continue
+            link_writer.add((recording_id, release_id, track_number, disc_number))
+            first_release_id = first_release_id or release_id
+        self.stats['links_created'] += len(link_writer)
+        link_writer.flush(conn)
+
+        # Set default_release_id if recording doesn't have one
+        if first_release_id:
+            with conn.cursor() as cur:
+                self._maybe_set_default_release(cur, recording_id, first_release_id)
+
+        for mb_release_id, release_details in batch.new_releases.items():
+            release_id = created.get(mb_release_id)
+            if not release_id:
+                continue
+            self._release_ids_by_mb[mb_release_id] = release_id
+            self._created_mb_release_ids.add(mb_release_id)
+            self.stats['releases_created'] += 1
+            self.logger.info(f"    ✓ Created release: {release_details.get('title', 'Unknown')[:40]}")
 
             # Link release-specific credits (producers, engineers, etc.)
             # These go to the RELEASE, not the recording
@@ -994,8 +1300,10 @@ class MBReleaseImporter:
             if credits_linked > 0:
                 self.stats['release_credits_linked'] += credits_linked
 
-            # Import cover art from Cover Art Archive
-            self._import_cover_art_for_release(conn, release_id, mb_release_id)
+            # Import cover art from Cover Art Archive (deferred to the
+            # caller's CAA stage when releases are being handed off)
+            if not self.release_callback:
+                self._import_cover_art_for_release(conn, release_id, mb_release_id)
     
     def _get_release_id_by_mb_id(self, conn, mb_release_id: str) -> Optional[str]:
         """Get our database release ID by MusicBrainz release ID"""
@@ -1082,66 +1390,87 @@ class MBReleaseImporter:
 
             return recording_id
 
-    def _create_release(self, conn, release_data: Dict[str, Any]) -> Optional[str]:
+    def _release_row(self, conn, release_data: Dict[str, Any]) -> tuple:
         """
-        Create a new release in the database, or return existing ID if duplicate
+        Build a releases row (RELEASE_COLUMNS order) for the bulk write
         
         Args:
-            conn: Database connection
+            conn: Database connection (for format/packaging creation)
             release_data: Parsed release data dict
             
         Returns:
-            Release ID (new or existing) or None
+            Tuple of column values
         """
         # Get foreign key IDs
         format_id = self._get_or_create_format(conn, release_data.get('format_name'))
         status_id = self._get_status_id(release_data.get('status_name'))
         packaging_id = self._get_or_create_packaging(conn, release_data.get('packaging_name'))
-        
-        mb_release_id = release_data.get('musicbrainz_release_id')
-        
+
+        return (
+            release_data.get('musicbrainz_release_id'),
+            release_data.get('musicbrainz_release_group_id'),
+            release_data.get('title'),
+            release_data.get('artist_credit'),
+            release_data.get('disambiguation'),
+            release_data.get('release_date'),
+            release_data.get('release_year'),
+            release_data.get('country'),
+            release_data.get('label'),
+            release_data.get('catalog_number'),
+            release_data.get('barcode'),
+            format_id,
+            packaging_id,
+            status_id,
+            release_data.get('language'),
+            release_data.get('script'),
+            release_data.get('total_tracks'),
+            release_data.get('total_discs'),
+            release_data.get('data_quality'),
+        )
+
+    def _create_release(self, conn, release_data: Dict[str, Any]) -> Optional[str]:
+        """
+        Create a single release, or return the existing ID if duplicate
+
+        For one-off creation (admin orphan import); the import path stages
+        releases with _release_row() and writes them in bulk.
+
+        Args:
+            conn: Database connection
+            release_data: Parsed release data dict
+
+        Returns:
+            Release ID (new or existing) or None
+        """
         with conn.cursor() as cur:
             # Use ON CONFLICT to handle race conditions where release was created
             # between our pre-fetch check and now
-            cur.execute("""
-                INSERT INTO releases (
-                    musicbrainz_release_id, musicbrainz_release_group_id,
-                    title, artist_credit, disambiguation,
-                    release_date, release_year, country,
-                    label, catalog_number, barcode,
-                    format_id, packaging_id, status_id,
-                    language, script, total_tracks, total_discs,
-                    data_quality
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            cur.execute(f"""
+                INSERT INTO releases ({', '.join(RELEASE_COLUMNS)})
+                VALUES ({', '.join(['%s'] * len(RELEASE_COLUMNS))})
                 ON CONFLICT (musicbrainz_release_id) DO UPDATE SET
                     musicbrainz_release_id = EXCLUDED.musicbrainz_release_id
                 RETURNING id
-            """, (
-                mb_release_id,
-                release_data.get('musicbrainz_release_group_id'),
-                release_data.get('title'),
-                release_data.get('artist_credit'),
-                release_data.get('disambiguation'),
-                release_data.get('release_date'),
-                release_data.get('release_year'),
-                release_data.get('country'),
-                release_data.get('label'),
-                release_data.get('catalog_number'),
-                release_data.get('barcode'),
-                format_id,
-                packaging_id,
-                status_id,
-                release_data.get('language'),
-                release_data.get('script'),
-                release_data.get('total_tracks'),
-                release_data.get('total_discs'),
-                release_data.get('data_quality'),
-            ))
-            
+            """, self._release_row(conn, release_data))
+
             result = cur.fetchone()
             return result['id'] if result else None
 
+    def import_cover_art_for_release(self, release_id: str, mb_release_id: str) -> None:
+        """
+        Import cover art for a created release in its own transaction.
+
+        Used by pipelined research (see release_callback) so CAA requests
+        run alongside the MusicBrainz import instead of inside it. The
+        rate-limited CAA lookup runs first; a pooled connection is only
+        taken for the write.
+        """
+        images_to_store = self._fetch_cover_art(mb_release_id)
+        if images_to_store is None:
+            return
+        with get_db_connection() as conn:
+            self._store_cover_art(conn, release_id, images_to_store)
+
     def _import_cover_art_for_release(self, conn, release_id: str,
                                        mb_release_id: str) -> None:
         """
@@ -1155,25 +1484,57 @@ class MBReleaseImporter:
             release_id: Our database release UUID
             mb_release_id: MusicBrainz release ID
         """
+        images_to_store = self._fetch_cover_art(mb_release_id)
+        if images_to_store is not None:
+            self._store_cover_art(conn, release_id, images_to_store)
+
+    def _fetch_cover_art(self, mb_release_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up a release's cover art on Cover Art Archive.
+
+        Returns:
+            At most one Front and one Back image to store (empty if the
+            release has no art), or None if cover art import is off, this
+            is a dry run, or the lookup failed
+        """
         if not self.import_cover_art or not self.caa_client:
-            return
+            return None
 
         if self.dry_run:
             self.logger.debug(f"      [DRY RUN] Would check CAA for cover art")
-            return
+            return None
 
         try:
-            # Get imagery data from CAA (uses cache)
-            imagery_data = self.caa_client.extract_imagery_data(mb_release_id)
+            # Get imagery data from CAA (uses cache); the release details
+            # fetched for the import answer "no art" without a CAA request
+            imagery_data = self.caa_client.extract_imagery_data(
+                mb_release_id, self._prefetched_releases.get(mb_release_id)
+            )
+        except Exception as e:
+            self.logger.warning(f"      CAA error (non-fatal): {e}")
+            # Don't increment error count - CAA failures shouldn't fail the release import
+            return None
 
-            # Dedupe to one Front, one Back (CAA may return multiple of each type)
-            images_to_store = []
-            stored_types = set()
-            for img in (imagery_data or []):
-                if img['type'] not in stored_types:
-                    images_to_store.append(img)
-                    stored_types.add(img['type'])
+        # Dedupe to one Front, one Back (CAA may return multiple of each type)
+        images_to_store = []
+        stored_types = set()
+        for img in (imagery_data or []):
+            if img['type'] not in stored_types:
+                images_to_store.append(img)
+                stored_types.add(img['type'])
+        return images_to_store
+
+    def _store_cover_art(self, conn, release_id: str,
+                         images_to_store: List[Dict[str, Any]]) -> None:
+        """
+        Save looked-up cover art for a release (caller manages transaction)
 
+        Args:
+            conn: Database connection
+            release_id: Our database release UUID
+            images_to_store: Images from _fetch_cover_art()
+        """
+        try:
             # Save using shared function (doesn't commit - caller does)
             result = save_release_imagery(
                 conn, release_id, images_to_store,
@@ -1211,22 +1572,15 @@ class MBReleaseImporter:
               AND default_release_id IS NULL
         """, (release_id, recording_id))
 
-    def _link_recording_to_release(self, conn, recording_id: str, release_id: str,
-                                    mb_recording_id: str, mb_release: Dict[str, Any]) -> None:
+    def _find_track_position(self, mb_recording_id: str,
+                             mb_release: Dict[str, Any]) -> Tuple[Optional[int], Optional[int]]:
         """
-        Link a recording to a release
+        Find a recording's (track_number, disc_number) on a release
 
         Args:
-            conn: Database connection
-            recording_id: Our database recording ID
-            release_id: Our database release ID
-            mb_recording_id: MusicBrainz recording ID (to find track position)
+            mb_recording_id: MusicBrainz recording ID
             mb_release: MusicBrainz release data (must include media/tracks)
         """
-        # Find track position by matching recording ID
-        track_number = None
-        disc_number = None
-
         # Search through media/tracks for the matching recording
         media = mb_release.get('media') or mb_release.get('medium-list') or []
         for medium in media:
@@ -1243,27 +1597,11 @@ class MBReleaseImporter:
                 if track_recording_id == mb_recording_id:
                     # Use MusicBrainz's 'position' field (integer), not 'number' (string like "A6")
                     track_number = track.get('position')
-                    disc_number = medium_position
-                    self.logger.debug(f"      Found track position: disc {disc_number}, track {track_number}")
-                    break
-
-            if track_number is not None:
-                break
-
-        if track_number is None:
-            self.logger.debug(f"      Could not find track position for recording {mb_recording_id[:8]}")
-
-        with conn.cursor() as cur:
-            cur.execute("""
-                INSERT INTO recording_releases (recording_id, release_id, track_number, disc_number)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (recording_id, release_id) DO NOTHING
-            """, (recording_id, release_id, track_number, disc_number))
-
-            self.stats['links_created'] += 1
+                    self.logger.debug(f"      Found track position: disc {medium_position}, track {track_number}")
+                    return track_number, medium_position
 
-            # Set default_release_id if recording doesn't have one
-            self._maybe_set_default_release(cur, recording_id, release_id)
+        self.logger.debug(f"      Could not find track position for recording {mb_recording_id[:8]}")
+        return None, None
 
     def _parse_release_data(self, mb_release: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -11,9 +11,10 @@ import json
 import hashlib
 import re
 from datetime import datetime
-from pathlib import Path
 
-from core.cache_utils import get_cache_dir
+from core import api_cache
+from core.api_cache import CacheKey
+from integrations import rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +35,10 @@ import json
 import hashlib
 import re
 from datetime import datetime
-from pathlib import Path
 
-from core.cache_utils import get_cache_dir
+from core import api_cache
+from core.api_cache import CacheKey
+from integrations import rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -58,9 +60,8 @@ class MusicBrainzSearcher:
             'Accept': 'application/json'
         })
         
-        # Rate limiting
+        # Rate limiting: see integrations/rate_limiter.py (shared per host)
         self.last_request_time = 0
-        self.min_request_interval = 0.6  # ~150 requests/minute with proper User-Agent
         
         # Cache configuration
         self.cache_days = cache_days
@@ -69,25 +70,6 @@ class MusicBrainzSearcher:
         # Track whether last operation made an API call
         self.last_made_api_call = False
         
-        # Get cache directories using the shared utility
-        # This ensures we use the persistent disk mount on Render
-        self.cache_dir = get_cache_dir('musicbrainz')
-        self.search_cache_dir = self.cache_dir / 'searches'
-        self.artist_cache_dir = self.cache_dir / 'artists'
-        self.work_cache_dir = self.cache_dir / 'works'
-        self.recording_cache_dir = self.cache_dir / 'recordings'
-        self.release_cache_dir = self.cache_dir / 'releases'
-        self.wikidata_cache_dir = self.cache_dir / 'wikidata'
-        
-        # Create subdirectories
-        self.search_cache_dir.mkdir(parents=True, exist_ok=True)
-        self.artist_cache_dir.mkdir(parents=True, exist_ok=True)
-        self.work_cache_dir.mkdir(parents=True, exist_ok=True)
-        self.recording_cache_dir.mkdir(parents=True, exist_ok=True)
-        self.release_cache_dir.mkdir(parents=True, exist_ok=True)
-        self.wikidata_cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        logger.debug(f"MusicBrainz cache directory: {self.cache_dir}")
 
     def verify_musicbrainz_reference(self, artist_name, mb_id, context):
         """
@@ -148,178 +130,136 @@ class MusicBrainzSearcher:
                 'reason': f'Verification error: {str(e)}'
             }
     
-    def _get_work_search_cache_path(self, title, composer):
+    def _get_work_search_cache_key(self, title, composer):
         """
-        Get the cache file path for a work search query
+        Get the cache key for a work search query
         
         Args:
             title: Song title
             composer: Composer name
             
         Returns:
-            Path object for the cache file
+            CacheKey for the api_cache entry
         """
         query_string = f"{title}||{composer or ''}"
         query_hash = hashlib.md5(query_string.encode()).hexdigest()
         safe_title = re.sub(r'[^a-zA-Z0-9_-]', '_', title.lower())[:50]
-        filename = f"work_{safe_title}_{query_hash}.json"
-        return self.search_cache_dir / filename
+        name = f"work_{safe_title}_{query_hash}"
+        return CacheKey('musicbrainz', f"searches/{name}")
     
-    def _get_artist_search_cache_path(self, artist_name):
+    def _get_artist_search_cache_key(self, artist_name):
         """
-        Get the cache file path for an artist search query
+        Get the cache key for an artist search query
         
         Args:
             artist_name: Artist name to search for
             
         Returns:
-            Path object for the cache file
+            CacheKey for the api_cache entry
         """
         query_hash = hashlib.md5(artist_name.encode()).hexdigest()
         safe_name = re.sub(r'[^a-zA-Z0-9_-]', '_', artist_name.lower())[:50]
-        filename = f"artist_search_{safe_name}_{query_hash}.json"
-        return self.search_cache_dir / filename
+        name = f"artist_search_{safe_name}_{query_hash}"
+        return CacheKey('musicbrainz', f"searches/{name}")
     
-    def _get_artist_detail_cache_path(self, mb_id):
+    def _get_artist_detail_cache_key(self, mb_id):
         """
-        Get the cache file path for an artist detail lookup
+        Get the cache key for an artist detail lookup
         
         Args:
             mb_id: MusicBrainz artist ID
             
         Returns:
-            Path object for the cache file
+            CacheKey for the api_cache entry
         """
-        filename = f"artist_{mb_id}.json"
-        return self.artist_cache_dir / filename
+        name = f"artist_{mb_id}"
+        return CacheKey('musicbrainz', f"artists/{name}")
     
-    def _get_work_detail_cache_path(self, work_id):
+    def _get_work_detail_cache_key(self, work_id):
         """
-        Get the cache file path for a work detail lookup
+        Get the cache key for a work detail lookup
         
         Args:
             work_id: MusicBrainz work ID
             
         Returns:
-            Path object for the cache file
+            CacheKey for the api_cache entry
         """
-        filename = f"work_{work_id}.json"
-        return self.work_cache_dir / filename
+        name = f"work_{work_id}"
+        return CacheKey('musicbrainz', f"works/{name}")
     
-    def _get_recording_detail_cache_path(self, recording_id):
+    def _get_recording_detail_cache_key(self, recording_id):
         """
-        Get the cache file path for a recording detail lookup
+        Get the cache key for a recording detail lookup
         
         Args:
             recording_id: MusicBrainz recording ID
             
         Returns:
-            Path object for the cache file
+            CacheKey for the api_cache entry
         """
-        filename = f"recording_{recording_id}.json"
-        return self.recording_cache_dir / filename
+        name = f"recording_{recording_id}"
+        return CacheKey('musicbrainz', f"recordings/{name}")
     
-    def _get_release_detail_cache_path(self, release_id):
+    def _get_release_detail_cache_key(self, release_id):
         """
-        Get the cache file path for a release detail lookup
+        Get the cache key for a release detail lookup
         
         Args:
             release_id: MusicBrainz release ID
             
         Returns:
-            Path object for the cache file
+            CacheKey for the api_cache entry
         """
-        filename = f"release_{release_id}.json"
-        return self.release_cache_dir / filename
+        name = f"release_{release_id}"
+        return CacheKey('musicbrainz', f"releases/{name}")
     
-    def _get_wikidata_cache_path(self, wikidata_id):
+    def _get_wikidata_cache_key(self, wikidata_id):
         """
-        Get the cache file path for a Wikidata lookup
+        Get the cache key for a Wikidata lookup
         
         Args:
             wikidata_id: Wikidata ID (e.g., 'Q12345')
             
         Returns:
-            Path object for the cache file
+            CacheKey for the api_cache entry
         """
-        filename = f"wikidata_{wikidata_id}.json"
-        return self.wikidata_cache_dir / filename
+        name = f"wikidata_{wikidata_id}"
+        return CacheKey('musicbrainz', f"wikidata/{name}")
     
-    def _is_cache_valid(self, cache_path):
+    def _load_from_cache(self, cache_key):
         """
-        Check if cache file exists and is not expired
+        Load data from the API cache
         
         Args:
-            cache_path: Path to cache file
+            cache_key: CacheKey for the entry
             
         Returns:
-            bool: True if cache is valid and not expired
+            Cached data dict ('data', 'cached_at'), or None if missing or expired
         """
-        if not cache_path.exists():
-            return False
-        
-        # Check file modification time
-        mtime = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        age = datetime.now() - mtime
-        
-        is_valid = age.days < self.cache_days
-        if is_valid:
-            logger.debug(f"Cache valid (age: {age.days} days): {cache_path.name}")
-        else:
-            logger.debug(f"Cache expired (age: {age.days} days): {cache_path.name}")
-        
-        return is_valid
-    
-    def _load_from_cache(self, cache_path):
-        """
-        Load data from cache file
-        
-        Args:
-            cache_path: Path to cache file
-            
-        Returns:
-            Cached data dict, or None if not in cache
-        """
-        if not self._is_cache_valid(cache_path):
-            return None
-        
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-                logger.debug(f"Loaded from cache: {cache_path.name}")
-                return cache_data
-        except Exception as e:
-            logger.warning(f"Failed to load cache file {cache_path}: {e}")
-            return None
+        cache_data = api_cache.get(cache_key, max_age_days=self.cache_days)
+        if cache_data is not None:
+            logger.debug(f"Loaded from cache: {cache_key.name}")
+        return cache_data
     
-    def _save_to_cache(self, cache_path, data):
+    def _save_to_cache(self, cache_key, data):
         """
-        Save data to cache file
+        Save data to the API cache
         
         Args:
-            cache_path: Path to cache file
+            cache_key: CacheKey for the entry
             data: Data to cache (will be JSON serialized)
         """
-        try:
-            cache_data = {
-                'data': data,
-                'cached_at': datetime.now().isoformat()
-            }
-            
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
-            logger.debug(f"Saved to cache: {cache_path.name}")
-        except Exception as e:
-            logger.warning(f"Failed to save cache file {cache_path}: {e}")
+        cache_data = {
+            'data': data,
+            'cached_at': datetime.now().isoformat()
+        }
+        if api_cache.set(cache_key, cache_data):
+            logger.debug(f"Saved to cache: {cache_key.name}")
     
     def rate_limit(self):
-        """Enforce rate limiting for MusicBrainz API"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            sleep_time = self.min_request_interval - elapsed
-            logger.debug("rate_limit: sleep")
-            time.sleep(sleep_time)
+        """Enforce rate limiting for MusicBrainz API (shared across all clients)"""
+        rate_limiter.acquire(rate_limiter.MUSICBRAINZ)
         self.last_request_time = time.time()
     
     def normalize_title(self, title):
@@ -370,9 +310,9 @@ class MusicBrainzSearcher:
             MusicBrainz Work ID if found, None otherwise
         """
         # Check cache first (unless force_refresh is enabled)
-        cache_path = self._get_work_search_cache_path(title, composer)
+        cache_key = self._get_work_search_cache_key(title, composer)
         if not self.force_refresh:
-            cached = self._load_from_cache(cache_path)
+            cached = self._load_from_cache(cache_key)
             if cached:
                 logger.debug(f"  Using cached work search result (cached: {cached['cached_at'][:10]})")
                 self.last_made_api_call = False
@@ -428,7 +368,7 @@ class MusicBrainzSearcher:
             if not works:
                 logger.debug(f"    ✗ No MusicBrainz works found")
                 # Cache the negative result too
-                self._save_to_cache(cache_path, None)
+                self._save_to_cache(cache_key, None)
                 return None
             
             # Normalize search title for comparison
@@ -452,7 +392,7 @@ class MusicBrainzSearcher:
                             logger.debug(f"       Composer(s): {', '.join(composers)}")
                     
                     # Cache the result
-                    self._save_to_cache(cache_path, mb_id)
+                    self._save_to_cache(cache_key, mb_id)
                     return mb_id
             
             # If no exact match, show what was found
@@ -461,7 +401,7 @@ class MusicBrainzSearcher:
                 logger.debug(f"       - '{work['title']}'")
 
             # Cache the negative result
-            self._save_to_cache(cache_path, None)
+            self._save_to_cache(cache_key, None)
             return None
 
         except requests.exceptions.Timeout:
@@ -607,9 +547,9 @@ class MusicBrainzSearcher:
             List of matching artist dicts with 'id', 'name', 'score', etc.
         """
         # Check cache first (unless force_refresh is enabled)
-        cache_path = self._get_artist_search_cache_path(artist_name)
+        cache_key = self._get_artist_search_cache_key(artist_name)
         if not self.force_refresh:
-            cached = self._load_from_cache(cache_path)
+            cached = self._load_from_cache(cache_key)
             if cached:
                 logger.debug(f"  Using cached artist search result (cached: {cached['cached_at'][:10]})")
                 self.last_made_api_call = False
@@ -641,7 +581,7 @@ class MusicBrainzSearcher:
             artists = data.get('artists', [])
             
             # Cache the results
-            self._save_to_cache(cache_path, artists)
+            self._save_to_cache(cache_key, artists)
             
             return artists
             
@@ -662,9 +602,9 @@ class MusicBrainzSearcher:
             Artist data dict or None
         """
         # Check cache first (unless force_refresh is enabled)
-        cache_path = self._get_artist_detail_cache_path(mb_id)
+        cache_key = self._get_artist_detail_cache_key(mb_id)
         if not self.force_refresh:
-            cached = self._load_from_cache(cache_path)
+            cached = self._load_from_cache(cache_key)
             if cached:
                 logger.debug(f"  Using cached artist details (cached: {cached['cached_at'][:10]})")
                 self.last_made_api_call = False
@@ -680,10 +620,10 @@ class MusicBrainzSearcher:
                                    f"waiting {backoff_time}s before retry (mb_id={mb_id})")
                     time.sleep(backoff_time)
                 
-                # Rate limiting for first attempt
-                if attempt == 0:
-                    self.last_made_api_call = True
-                    self.rate_limit()
+                # Rate limiting (every attempt; the bucket is shared with
+                # every other MusicBrainz client in the process)
+                self.last_made_api_call = True
+                self.rate_limit()
                 
                 url = f"https://musicbrainz.org/ws/2/artist/{mb_id}"
                 params = {
@@ -698,16 +638,17 @@ class MusicBrainzSearcher:
                 if response.status_code == 200:
                     data = response.json()
                     # Cache the successful result
-                    self._save_to_cache(cache_path, data)
+                    self._save_to_cache(cache_key, data)
                     return data
                 elif response.status_code == 404:
                     # Cache the negative result (404 is not transient)
-                    self._save_to_cache(cache_path, None)
+                    self._save_to_cache(cache_key, None)
                     logger.warning(f"Artist not found in MusicBrainz: {mb_id}")
                     return None
                 elif response.status_code == 503:
-                    # Service unavailable - retry
+                    # Service unavailable (MusicBrainz's rate-limit response) - retry
                     logger.warning(f"MusicBrainz service unavailable (503), will retry...")
+                    rate_limiter.report_throttled(rate_limiter.MUSICBRAINZ, response)
                     if attempt < max_retries - 1:
                         continue
                     logger.error("All retry attempts failed (503)")
@@ -751,9 +692,9 @@ class MusicBrainzSearcher:
             Dict with work data including recording relations, or None if not found
         """
         # Check cache first (unless force_refresh is enabled)
-        cache_path = self._get_work_detail_cache_path(work_id)
+        cache_key = self._get_work_detail_cache_key(work_id)
         if not self.force_refresh:
-            cached = self._load_from_cache(cache_path)
+            cached = self._load_from_cache(cache_key)
             if cached:
                 logger.debug(f"  Using cached work recordings (cached: {cached['cached_at'][:10]})")
                 self.last_made_api_call = False
@@ -769,10 +710,10 @@ class MusicBrainzSearcher:
                                    f"waiting {backoff_time}s before retry (work_id={work_id})")
                     time.sleep(backoff_time)
                 
-                # Rate limiting for first attempt
-                if attempt == 0:
-                    self.last_made_api_call = True
-                    self.rate_limit()
+                # Rate limiting (every attempt; the bucket is shared with
+                # every other MusicBrainz client in the process)
+                self.last_made_api_call = True
+                self.rate_limit()
                 
                 url = f"https://musicbrainz.org/ws/2/work/{work_id}"
                 params = {
@@ -787,16 +728,17 @@ class MusicBrainzSearcher:
                 if response.status_code == 200:
                     data = response.json()
                     # Cache the successful result
-                    self._save_to_cache(cache_path, data)
+                    self._save_to_cache(cache_key, data)
                     return data
                 elif response.status_code == 404:
                     # Cache the negative result (404 is not transient)
-                    self._save_to_cache(cache_path, None)
+                    self._save_to_cache(cache_key, None)
                     logger.warning(f"Work not found in MusicBrainz: {work_id}")
                     return None
                 elif response.status_code == 503:
-                    # Service unavailable - retry
+                    # Service unavailable (MusicBrainz's rate-limit response) - retry
                     logger.warning(f"MusicBrainz service unavailable (503), will retry...")
+                    rate_limiter.report_throttled(rate_limiter.MUSICBRAINZ, response)
                     if attempt < max_retries - 1:
                         continue
                     logger.error("All retry attempts failed (503)")
@@ -840,9 +782,9 @@ class MusicBrainzSearcher:
             Dict with recording details, or None if not found
         """
         # Check cache first (unless force_refresh is enabled)
-        cache_path = self._get_recording_detail_cache_path(recording_id)
+        cache_key = self._get_recording_detail_cache_key(recording_id)
         if not self.force_refresh:
-            cached = self._load_from_cache(cache_path)
+            cached = self._load_from_cache(cache_key)
             if cached:
                 logger.debug(f"  Using cached recording details (cached: {cached['cached_at'][:10]})")
                 self.last_made_api_call = False
@@ -858,10 +800,10 @@ class MusicBrainzSearcher:
                                    f"waiting {backoff_time}s before retry (recording_id={recording_id})")
                     time.sleep(backoff_time)
                 
-                # Rate limiting for first attempt
-                if attempt == 0:
-                    self.last_made_api_call = True
-                    self.rate_limit()
+                # Rate limiting (every attempt; the bucket is shared with
+                # every other MusicBrainz client in the process)
+                self.last_made_api_call = True
+                self.rate_limit()
                 
                 url = f"https://musicbrainz.org/ws/2/recording/{recording_id}"
                 params = {
@@ -876,16 +818,17 @@ class MusicBrainzSearcher:
                 if response.status_code == 200:
                     data = response.json()
                     # Cache the successful result
-                    self._save_to_cache(cache_path, data)
+                    self._save_to_cache(cache_key, data)
                     return data
                 elif response.status_code == 404:
                     # Cache the negative result (404 is not transient)
-                    self._save_to_cache(cache_path, None)
+                    self._save_to_cache(cache_key, None)
                     logger.warning(f"Recording not found in MusicBrainz: {recording_id}")
                     return None
                 elif response.status_code == 503:
-                    # Service unavailable - retry
+                    # Service unavailable (MusicBrainz's rate-limit response) - retry
                     logger.warning(f"MusicBrainz service unavailable (503), will retry...")
+                    rate_limiter.report_throttled(rate_limiter.MUSICBRAINZ, response)
                     if attempt < max_retries - 1:
                         continue
                     logger.error("All retry attempts failed (503)")
@@ -930,9 +873,9 @@ class MusicBrainzSearcher:
             Dict with release details, or None if not found
         """
         # Check cache first (unless force_refresh is enabled)
-        cache_path = self._get_release_detail_cache_path(release_id)
+        cache_key = self._get_release_detail_cache_key(release_id)
         if not self.force_refresh:
-            cached = self._load_from_cache(cache_path)
+            cached = self._load_from_cache(cache_key)
             if cached:
                 logger.debug(f"  Using cached release details (cached: {cached['cached_at'][:10]})")
                 self.last_made_api_call = False
@@ -948,10 +891,10 @@ class MusicBrainzSearcher:
                                    f"waiting {backoff_time}s before retry (release_id={release_id})")
                     time.sleep(backoff_time)
                 
-                # Rate limiting for first attempt
-                if attempt == 0:
-                    self.last_made_api_call = True
-                    self.rate_limit()
+                # Rate limiting (every attempt; the bucket is shared with
+                # every other MusicBrainz client in the process)
+                self.last_made_api_call = True
+                self.rate_limit()
                 
                 url = f"https://musicbrainz.org/ws/2/release/{release_id}"
                 params = {
@@ -968,16 +911,17 @@ class MusicBrainzSearcher:
                 if response.status_code == 200:
                     data = response.json()
                     # Cache the successful result
-                    self._save_to_cache(cache_path, data)
+                    self._save_to_cache(cache_key, data)
                     return data
                 elif response.status_code == 404:
                     # Cache the negative result (404 is not transient)
-                    self._save_to_cache(cache_path, None)
+                    self._save_to_cache(cache_key, None)
                     logger.warning(f"Release not found in MusicBrainz: {release_id}")
                     return None
                 elif response.status_code == 503:
-                    # Service unavailable - retry
+                    # Service unavailable (MusicBrainz's rate-limit response) - retry
                     logger.warning(f"MusicBrainz service unavailable (503), will retry...")
+                    rate_limiter.report_throttled(rate_limiter.MUSICBRAINZ, response)
                     if attempt < max_retries - 1:
                         continue
                     logger.error("All retry attempts failed (503)")
@@ -985,8 +929,8 @@ class MusicBrainzSearcher:
                 elif response.status_code == 429:
                     # Rate limited - use longer backoff
                     logger.warning(f"BACKOFF: MusicBrainz rate limit (429), will retry with longer delay...")
+                    rate_limiter.report_throttled(rate_limiter.MUSICBRAINZ, response)
                     if attempt < max_retries - 1:
-                        time.sleep(5)  # Extra delay for rate limiting
                         continue
                     logger.error("All retry attempts failed (429 rate limit)")
                     return None
@@ -1017,6 +961,20 @@ class MusicBrainzSearcher:
         
         return None
     
+    def get_cached_release_details(self, release_id):
+        """
+        Get release details from the cache only, never from the API
+
+        Args:
+            release_id: MusicBrainz release ID
+
+        Returns:
+            Dict with release details, or None if not cached (or cached as
+            not found)
+        """
+        cached = self._load_from_cache(self._get_release_detail_cache_key(release_id))
+        return cached.get('data') if cached else None
+    
     def clear_cache(self, search_only=False):
         """
         Clear the MusicBrainz cache
@@ -1024,24 +982,12 @@ class MusicBrainzSearcher:
         Args:
             search_only: If True, only clear search cache (not artist details)
         """
-        import shutil
-        
         if search_only:
-            if self.search_cache_dir.exists():
-                shutil.rmtree(self.search_cache_dir)
-                self.search_cache_dir.mkdir(parents=True, exist_ok=True)
-                logger.info("Cleared MusicBrainz search cache")
+            api_cache.clear('musicbrainz', 'searches/')
+            logger.info("Cleared MusicBrainz search cache")
         else:
-            if self.cache_dir.exists():
-                shutil.rmtree(self.cache_dir)
-                self.cache_dir.mkdir(parents=True, exist_ok=True)
-                self.search_cache_dir.mkdir(parents=True, exist_ok=True)
-                self.artist_cache_dir.mkdir(parents=True, exist_ok=True)
-                self.work_cache_dir.mkdir(parents=True, exist_ok=True)
-                self.recording_cache_dir.mkdir(parents=True, exist_ok=True)
-                self.release_cache_dir.mkdir(parents=True, exist_ok=True)
-                self.wikidata_cache_dir.mkdir(parents=True, exist_ok=True)
-                logger.info("Cleared all MusicBrainz cache")
+            api_cache.clear('musicbrainz')
+            logger.info("Cleared all MusicBrainz cache")
     
     def get_wikipedia_from_wikidata(self, wikidata_id):
         """
@@ -1054,9 +1000,9 @@ class MusicBrainzSearcher:
             Wikipedia URL string, or None if not found
         """
         # Check cache first (unless force_refresh is enabled)
-        cache_path = self._get_wikidata_cache_path(wikidata_id)
+        cache_key = self._get_wikidata_cache_key(wikidata_id)
         if not self.force_refresh:
-            cached = self._load_from_cache(cache_path)
+            cached = self._load_from_cache(cache_key)
             if cached:
                 logger.debug(f"  Using cached Wikidata lookup (cached: {cached['cached_at'][:10]})")
                 self.last_made_api_call = False
@@ -1067,12 +1013,8 @@ class MusicBrainzSearcher:
         # We'll still rate limit but at 0.5 seconds instead of 1 second
         self.last_made_api_call = True
         
-        # Apply lighter rate limiting for Wikidata (0.5 seconds)
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < 0.5:
-            time.sleep(0.5 - time_since_last)
-        self.last_request_time = time.time()
+        # Apply lighter rate limiting for Wikidata (its own shared bucket)
+        rate_limiter.acquire(rate_limiter.WIKIDATA)
         
         try:
             url = "https://www.wikidata.org/w/api.php"
@@ -1089,7 +1031,7 @@ class MusicBrainzSearcher:
             
             if response.status_code != 200:
                 logger.debug(f"Wikidata API returned status {response.status_code}")
-                self._save_to_cache(cache_path, None)
+                self._save_to_cache(cache_key, None)
                 return None
             
             data = response.json()
@@ -1102,7 +1044,7 @@ class MusicBrainzSearcher:
             
             if not enwiki:
                 logger.debug(f"No English Wikipedia link found for Wikidata ID {wikidata_id}")
-                self._save_to_cache(cache_path, None)
+                self._save_to_cache(cache_key, None)
                 return None
             
             # Construct Wikipedia URL from title
@@ -1114,12 +1056,12 @@ class MusicBrainzSearcher:
                 wikipedia_url = f"https://en.wikipedia.org/wiki/{encoded_title}"
                 
                 # Cache the result
-                self._save_to_cache(cache_path, wikipedia_url)
+                self._save_to_cache(cache_key, wikipedia_url)
                 
                 logger.debug(f"Found Wikipedia URL from Wikidata: {wikipedia_url}")
                 return wikipedia_url
             
-            self._save_to_cache(cache_path, None)
+            self._save_to_cache(cache_key, None)
             return None
             
         except Exception as e:
@@ -0,0 +1,301 @@
+"""
+Outbound API Rate Limiter
+Token buckets for the external services we call, shared by every process
+
+(Not to be confused with rate_limit.py, which limits *inbound* requests to
+our Flask API.)
+
+Each integration client used to keep its own last_request_time and sleep
+per instance, so two matchers running in the same process (pipelined
+research, several research worker threads) doubled the request rate to
+MusicBrainz and got 503s. Clients now acquire from one bucket per host
+instead:
+
+    from integrations import rate_limiter
+
+    rate_limiter.acquire(rate_limiter.MUSICBRAINZ)
+    response = session.get(...)
+    if response.status_code in (429, 503):
+        rate_limiter.report_throttled(rate_limiter.MUSICBRAINZ, response)
+
+- A bucket refills at ``rate`` tokens per second up to ``burst`` tokens, so
+  a client that has been idle can make a short burst of requests and is
+  then held to the steady rate.
+
+- report_throttled() honours Retry-After (seconds or HTTP date) by pausing
+  the whole bucket: every thread waits, not just the one that got the 429.
+  Without a Retry-After it pauses for DEFAULT_BACKOFF_SECONDS.
+
+- The buckets are shared across processes. MusicBrainz and Spotify are
+  called from the research worker process and directly from web workers
+  (admin tools, the MusicBrainz search route, recording refreshes), and a
+  bucket per process would multiply each host's limit by the process
+  count. Tokens and pauses live in the outbound_rate_buckets table
+  (sql/migrations/026_outbound_rate_buckets.sql) and are taken with one
+  acquire_outbound_token() call per request. If the database can't be
+  reached the bucket falls back to its in-process state for
+  SHARED_RETRY_SECONDS, logging a warning, rather than failing the call.
+  Set OUTBOUND_RATE_LIMIT_STORAGE=memory to keep buckets per process
+  (single-process tools without a database).
+
+- Counters per host (requests, time spent waiting, throttled responses)
+  are kept per process and are available from get_stats() for
+  diagnostics.
+
+A client constructed with a slower interval than the default (e.g. a
+script's --rate-delay) slows the bucket down for the rest of the process;
+buckets are never loosened at runtime.
+"""
+
+import email.utils
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Hosts
+MUSICBRAINZ = 'musicbrainz.org'
+COVER_ART_ARCHIVE = 'coverartarchive.org'
+SPOTIFY = 'api.spotify.com'
+WIKIPEDIA = 'en.wikipedia.org'
+WIKIDATA = 'www.wikidata.org'
+ITUNES = 'itunes.apple.com'
+
+# host -> (steady requests per second, burst size)
+DEFAULT_LIMITS = {
+    MUSICBRAINZ: (1 / 0.6, 2),        # ~100/minute with a proper User-Agent
+    COVER_ART_ARCHIVE: (2.0, 4),      # No published limit; be courteous
+    SPOTIFY: (5.0, 10),
+    WIKIPEDIA: (1.0, 2),
+    WIKIDATA: (2.0, 2),
+    ITUNES: (2.0, 2),                 # Undocumented and aggressive (403s)
+}
+
+# Fallback for hosts without an entry above
+DEFAULT_RATE = (1.0, 1)
+
+# Pause applied by report_throttled() when the response has no Retry-After
+DEFAULT_BACKOFF_SECONDS = 5.0
+
+# Keep bucket state in Postgres (shared by all processes) or per process
+SHARED = os.environ.get('OUTBOUND_RATE_LIMIT_STORAGE', 'postgres').lower() != 'memory'
+
+# How long a bucket uses its in-process state after the shared store failed
+SHARED_RETRY_SECONDS = 60.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket with a pause for upstream Retry-After"""
+
+    def __init__(self, host: str, rate: float, burst: int):
+        self.host = host
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'waits': 0, 'wait_seconds': 0.0, 'throttled': 0}
+
+    def acquire(self) -> float:
+        """Block until a request may be made. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    # Tolerate float rounding so a refill of exactly one
+                    # token is not re-slept in ever smaller increments
+                    if self._tokens >= 1 - 1e-9:
+                        self._tokens = max(0.0, self._tokens - 1)
+                        self._stats['requests'] += 1
+                        if waited:
+                            self._stats['waits'] += 1
+                            self._stats['wait_seconds'] += waited
+                        return waited
+                    delay = (1 - self._tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for ``seconds`` (extends, never shortens, a pause)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            # Resume at the steady rate rather than with a full burst:
+            # tokens start accruing only once the pause ends
+            self._tokens = 0.0
+            self._updated = self._paused_until
+            self._stats['throttled'] += 1
+
+    def slow_to(self, min_interval: float) -> None:
+        """Lower the steady rate to at most one request per ``min_interval``"""
+        if min_interval <= 0:
+            return
+        with self._lock:
+            if 1 / min_interval < self.rate:
+                self.rate = 1 / min_interval
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['wait_seconds'] = round(stats['wait_seconds'], 3)
+            stats['rate'] = round(self.rate, 3)
+            stats['burst'] = self.burst
+            stats['paused_for'] = round(max(0.0, self._paused_until - time.monotonic()), 3)
+            return stats
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    TokenBucket whose tokens and pause live in outbound_rate_buckets
+
+    The rate and burst still come from this process (so slow_to() works as
+    before) and are passed along with every acquire.
+    """
+
+    def __init__(self, host: str, rate: float, burst: int):
+        super().__init__(host, rate, burst)
+        self._local_until = 0.0
+
+    def acquire(self) -> float:
+        waited = 0.0
+        while True:
+            delay = self._take_shared()
+            if delay is None:
+                return waited + super().acquire()
+            if delay <= 0:
+                with self._lock:
+                    self._stats['requests'] += 1
+                    if waited:
+                        self._stats['waits'] += 1
+                        self._stats['wait_seconds'] += waited
+                return waited
+
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        super().pause(seconds)
+        if self._use_shared():
+            try:
+                from db_utils import execute_update
+                execute_update("""
+                    INSERT INTO outbound_rate_buckets (host, tokens, updated_at, paused_until)
+                    VALUES (%(host)s, 0,
+                            clock_timestamp() + make_interval(secs => %(seconds)s),
+                            clock_timestamp() + make_interval(secs => %(seconds)s))
+                    ON CONFLICT (host) DO UPDATE SET
+                        paused_until = GREATEST(outbound_rate_buckets.paused_until,
+                                                EXCLUDED.paused_until),
+                        updated_at = GREATEST(outbound_rate_buckets.paused_until,
+                                              EXCLUDED.paused_until),
+                        tokens = 0
+                """, {'host': self.host, 'seconds': seconds})
+            except Exception as e:
+                self._fall_back(e)
+
+    def _use_shared(self) -> bool:
+        return time.monotonic() >= self._local_until
+
+    def _take_shared(self) -> Optional[float]:
+        """Seconds to wait (0 = token taken), or None to use local state"""
+        if not self._use_shared():
+            return None
+        try:
+            from db_utils import execute_query
+            with self._lock:
+                rate, burst = self.rate, self.burst
+            row = execute_query(
+                "SELECT acquire_outbound_token(%s, %s, %s) AS wait",
+                (self.host, rate, burst), fetch_one=True
+            )
+            return row['wait']
+        except Exception as e:
+            self._fall_back(e)
+            return None
+
+    def _fall_back(self, error: Exception) -> None:
+        self._local_until = time.monotonic() + SHARED_RETRY_SECONDS
+        logger.warning(
+            f"Rate limiter: shared bucket for {self.host} unavailable ({error}); "
+            f"limiting in-process for {SHARED_RETRY_SECONDS:.0f}s"
+        )
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_registry_lock = threading.Lock()
+
+
+def get_bucket(host: str, min_interval: Optional[float] = None) -> TokenBucket:
+    """
+    Get (creating on first use) the shared bucket for ``host``
+
+    Args:
+        host: One of the host constants above
+        min_interval: Optional minimum seconds between requests requested by
+                      the caller; slows the bucket down if it is faster
+    """
+    with _registry_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            rate, burst = DEFAULT_LIMITS.get(host, DEFAULT_RATE)
+            bucket_class = SharedTokenBucket if SHARED else TokenBucket
+            bucket = _buckets[host] = bucket_class(host, rate, burst)
+    if min_interval:
+        bucket.slow_to(min_interval)
+    return bucket
+
+
+def acquire(host: str) -> float:
+    """Block until a request to ``host`` may be made. Returns seconds waited."""
+    waited = get_bucket(host).acquire()
+    if waited >= 1:
+        logger.debug(f"Rate limiter: waited {waited:.2f}s for {host}")
+    return waited
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+        return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid Retry-After header: {value}")
+        return None
+
+
+def report_throttled(host: str, response=None, retry_after: Optional[float] = None) -> float:
+    """
+    Record a throttled response (429/503/403-as-limit) from ``host``
+
+    Pauses the host's bucket for the response's Retry-After, an explicit
+    ``retry_after``, or DEFAULT_BACKOFF_SECONDS. Returns the pause applied.
+    """
+    if retry_after is None and response is not None:
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+    if retry_after is None:
+        retry_after = DEFAULT_BACKOFF_SECONDS
+    get_bucket(host).pause(retry_after)
+    logger.warning(f"Rate limiter: {host} throttled us; pausing {retry_after:.1f}s")
+    return retry_after
+
+
+def get_stats() -> dict:
+    """Per-host counters: requests, waits, wait_seconds, throttled, rate, burst"""
+    with _registry_lock:
+        buckets = list(_buckets.values())
+    return {bucket.host: bucket.get_stats() for bucket in buckets}
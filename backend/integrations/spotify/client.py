@@ -17,11 +17,12 @@ import logging
 import json
 import hashlib
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Optional
 import requests
 
-from core.cache_utils import get_cache_dir
+from core import api_cache
+from core.api_cache import CacheKey
+from integrations import rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -67,24 +68,10 @@ class SpotifyClient:
         self.rate_limit_hits = 0  # Track how many times we hit rate limits
         self.last_request_time = 0  # Track time of last request
         
-        # Get cache directories using the shared utility
-        # This ensures we use the persistent disk mount on Render
-        self.cache_dir = get_cache_dir('spotify')
-        self.search_cache_dir = self.cache_dir / 'searches'
-        self.track_cache_dir = self.cache_dir / 'tracks'
-        self.album_cache_dir = self.cache_dir / 'albums'
-        
-        # Create subdirectories
-        self.search_cache_dir.mkdir(parents=True, exist_ok=True)
-        self.track_cache_dir.mkdir(parents=True, exist_ok=True)
-        self.album_cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        self.logger.debug(f"Spotify cache directory: {self.cache_dir}")
-
         # Track whether last operation made an API call
         self.last_made_api_call = False
         
-        self.logger.debug(f"Spotify cache: {self.cache_dir} (expires after {cache_days} days, force_refresh={force_refresh})")
+        self.logger.debug(f"Spotify cache expires after {cache_days} days, force_refresh={force_refresh}")
         self.logger.debug(f"Rate limit: {rate_limit_delay}s delay, {max_retries} max retries")
         
         # Stats tracking - will be updated by SpotifyMatcher
@@ -100,12 +87,10 @@ class SpotifyClient:
     # ========================================================================
     
     def _wait_for_rate_limit(self):
-        """Enforce minimum delay between requests"""
-        if self.rate_limit_delay > 0:
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.rate_limit_delay:
-                sleep_time = self.rate_limit_delay - elapsed
-                time.sleep(sleep_time)
+        """Enforce minimum delay between requests (shared across all clients)"""
+        rate_limiter.get_bucket(
+            rate_limiter.SPOTIFY, min_interval=self.rate_limit_delay
+        ).acquire()
         self.last_request_time = time.time()
     
     def _handle_rate_limit_response(self, response: requests.Response) -> Optional[int]:
@@ -199,7 +184,9 @@ class SpotifyClient:
                                           f"Using exponential backoff: {wait_time}s")
                     
                     self.stats['rate_limit_waits'] += 1
-                    time.sleep(wait_time)
+                    # Pause the shared bucket so every Spotify client in the
+                    # process waits, not just this one
+                    rate_limiter.report_throttled(rate_limiter.SPOTIFY, retry_after=wait_time)
                     retry_count += 1
                     continue
                 
@@ -217,10 +204,10 @@ class SpotifyClient:
     # CACHE METHODS
     # ========================================================================
     
-    def _get_search_cache_path(self, song_title: str, album_title: str = None, 
-                               artist_name: str = None, year: int = None) -> Path:
+    def _get_search_cache_key(self, song_title: str, album_title: str = None, 
+                               artist_name: str = None, year: int = None) -> CacheKey:
         """
-        Get the cache file path for a search query
+        Get the cache key for a search query
         
         Args:
             song_title: Song title to search for
@@ -229,7 +216,7 @@ class SpotifyClient:
             year: Recording year (optional)
             
         Returns:
-            Path object for the cache file
+            CacheKey for the api_cache entry
         """
         # Create a unique identifier for this search combination
         query_parts = [song_title or '']
@@ -243,107 +230,76 @@ class SpotifyClient:
         query_string = '||'.join(query_parts)
         query_hash = hashlib.md5(query_string.encode()).hexdigest()
         
-        # Create readable filename prefix
+        # Readable key prefix
         safe_title = re.sub(r'[^a-zA-Z0-9_-]', '_', song_title.lower())[:50]
-        filename = f"search_{safe_title}_{query_hash}.json"
-        
-        return self.search_cache_dir / filename
+        return CacheKey('spotify', f"searches/search_{safe_title}_{query_hash}")
     
-    def _get_track_cache_path(self, track_id: str) -> Path:
+    def _get_track_cache_key(self, track_id: str) -> CacheKey:
         """
-        Get the cache file path for a track detail lookup
+        Get the cache key for a track detail lookup
         
         Args:
             track_id: Spotify track ID
             
         Returns:
-            Path object for the cache file
+            CacheKey for the api_cache entry
         """
-        filename = f"track_{track_id}.json"
-        return self.track_cache_dir / filename
+        return CacheKey('spotify', f"tracks/track_{track_id}")
     
-    def _get_album_cache_path(self, album_id: str) -> Path:
+    def _get_album_cache_key(self, album_id: str) -> CacheKey:
         """
-        Get the cache file path for an album detail lookup
+        Get the cache key for an album detail lookup
         
         Args:
             album_id: Spotify album ID
             
         Returns:
-            Path object for the cache file
+            CacheKey for the api_cache entry
         """
-        filename = f"album_{album_id}.json"
-        return self.album_cache_dir / filename
-    
-    def _is_cache_valid(self, cache_path: Path) -> bool:
+        return CacheKey('spotify', f"albums/album_{album_id}")
+
+    def _get_artist_cache_key(self, artist_id: str) -> CacheKey:
         """
-        Check if a cache file exists and is still valid (not expired)
+        Get the cache key for an artist detail lookup
         
         Args:
-            cache_path: Path to the cache file
+            artist_id: Spotify artist ID
             
         Returns:
-            True if cache exists and is valid, False otherwise
+            CacheKey for the api_cache entry
         """
-        if self.force_refresh:
-            return False
-        
-        if not cache_path.exists():
-            return False
-        
-        # Check file modification time
-        file_mtime = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        age_days = (datetime.now() - file_mtime).days
-        
-        return age_days < self.cache_days
+        return CacheKey('spotify', f"artists/artist_{artist_id}")
     
-    def _load_from_cache(self, cache_path: Path) -> Any:
+    def _load_from_cache(self, cache_key: CacheKey) -> Any:
         """
-        Load data from cache file if valid
+        Load data from the API cache if valid
         
         Args:
-            cache_path: Path to the cache file
+            cache_key: CacheKey for the entry
             
         Returns:
             Cached data if valid, _CACHE_MISS sentinel if no cache exists or is invalid
         """
-        if not self._is_cache_valid(cache_path):
+        if self.force_refresh:
             return _CACHE_MISS
         
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.stats['cache_hits'] += 1
-                self.last_made_api_call = False
-                self.logger.debug(f"Cache hit: {cache_path.name}")
-                return data
-        except (json.JSONDecodeError, IOError) as e:
-            self.logger.warning(f"Failed to load cache file {cache_path}: {e}")
-            # Delete corrupted cache file
-            try:
-                cache_path.unlink()
-            except:
-                pass
-            return _CACHE_MISS
+        data = api_cache.get(cache_key, max_age_days=self.cache_days, default=_CACHE_MISS)
+        if data is not _CACHE_MISS:
+            self.stats['cache_hits'] += 1
+            self.last_made_api_call = False
+            self.logger.debug(f"Cache hit: {cache_key.name}")
+        return data
     
-    def _save_to_cache(self, cache_path: Path, data: Any) -> None:
+    def _save_to_cache(self, cache_key: CacheKey, data: Any) -> None:
         """
-        Save data to cache file
+        Save data to the API cache
         
         Args:
-            cache_path: Path to the cache file
+            cache_key: CacheKey for the entry
             data: Data to cache (must be JSON serializable)
         """
-        try:
-            # Ensure directory exists
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-                
-            self.logger.debug(f"Cached: {cache_path.name}")
-        except (IOError, TypeError) as e:
-            self.logger.warning(f"Failed to save cache file {cache_path}: {e}")
+        if api_cache.set(cache_key, data):
+            self.logger.debug(f"Cached: {cache_key.name}")
     
     # ========================================================================
     # AUTHENTICATION
@@ -405,25 +361,30 @@ class SpotifyClient:
     # BATCH API METHODS
     # ========================================================================
 
-    def get_tracks_batch(self, track_ids: list[str]) -> Optional[dict[str, dict]]:
+    # Largest number of IDs each "get several" endpoint accepts per call
+    BATCH_LIMITS = {'tracks': 50, 'albums': 20, 'artists': 50}
+
+    def get_batch(self, resource: str, ids: list[str]) -> Optional[dict[str, Optional[dict]]]:
         """
-        Fetch up to 50 tracks in a single API call.
+        Fetch several tracks, albums or artists in a single API call.
 
-        Uses Spotify's batch endpoint: GET /v1/tracks?ids=id1,id2,...
+        Uses Spotify's batch endpoints: GET /v1/{resource}?ids=id1,id2,...
 
         Args:
-            track_ids: List of Spotify track IDs (max 50)
+            resource: 'tracks', 'albums' or 'artists'
+            ids: Spotify IDs (at most BATCH_LIMITS[resource])
 
         Returns:
-            Dict mapping track_id -> track data, or None if request failed.
-            Tracks that don't exist will be omitted from the result.
+            Dict mapping id -> object, or None if the request failed.
+            IDs that don't exist will be omitted from the result.
         """
-        if not track_ids:
+        if not ids:
             return {}
 
-        if len(track_ids) > 50:
-            self.logger.warning(f"get_tracks_batch called with {len(track_ids)} IDs, truncating to 50")
-            track_ids = track_ids[:50]
+        limit = self.BATCH_LIMITS[resource]
+        if len(ids) > limit:
+            self.logger.warning(f"get_batch({resource}) called with {len(ids)} IDs, truncating to {limit}")
+            ids = ids[:limit]
 
         token = self.get_spotify_auth_token()
         if not token:
@@ -431,11 +392,11 @@ class SpotifyClient:
 
         try:
             # Join IDs with comma for batch request
-            ids_param = ','.join(track_ids)
+            ids_param = ','.join(ids)
 
             response = self._make_api_request(
                 'get',
-                'https://api.spotify.com/v1/tracks',
+                f'https://api.spotify.com/v1/{resource}',
                 headers={'Authorization': f'Bearer {token}'},
                 params={'ids': ids_param},
                 timeout=30
@@ -448,21 +409,33 @@ class SpotifyClient:
             self.stats['api_calls'] = self.stats.get('api_calls', 0) + 1
             self.last_made_api_call = True
 
-            # Build result dict mapping track_id -> track data
+            # Build result dict mapping id -> object
             result = {}
-            for track in data.get('tracks', []):
-                if track:  # null entries for non-existent tracks
-                    result[track['id']] = track
+            for item in data.get(resource, []):
+                if item:  # null entries for non-existent IDs
+                    result[item['id']] = item
 
-            self.logger.debug(f"Batch fetched {len(result)} tracks out of {len(track_ids)} requested")
+            self.logger.debug(f"Batch fetched {len(result)} {resource} out of {len(ids)} requested")
             return result
 
         except SpotifyRateLimitError as e:
-            self.logger.error(f"Rate limit exceeded in batch tracks request: {e}")
+            self.logger.error(f"Rate limit exceeded in batch {resource} request: {e}")
             return None
         except requests.exceptions.HTTPError as e:
-            self.logger.error(f"Spotify batch tracks API error: {e}")
+            self.logger.error(f"Spotify batch {resource} API error: {e}")
             return None
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to fetch batch tracks: {e}")
-            return None
\ No newline at end of file
+            self.logger.error(f"Failed to fetch batch {resource}: {e}")
+            return None
+
+    def get_tracks_batch(self, track_ids: list[str]) -> Optional[dict[str, dict]]:
+        """Fetch up to 50 tracks in a single API call (see get_batch)"""
+        return self.get_batch('tracks', track_ids)
+
+    def get_albums_batch(self, album_ids: list[str]) -> Optional[dict[str, dict]]:
+        """Fetch up to 20 albums in a single API call (see get_batch)"""
+        return self.get_batch('albums', album_ids)
+
+    def get_artists_batch(self, artist_ids: list[str]) -> Optional[dict[str, dict]]:
+        """Fetch up to 50 artists in a single API call (see get_batch)"""
+        return self.get_batch('artists', artist_ids)
@@ -143,10 +143,11 @@ def get_recordings_for_song(song_id: str, artist_filter: str = None) -> List[dic
             return cur.fetchall()
 
 
-def get_releases_for_song(song_id: str, artist_filter: str = None) -> List[dict]:
+def get_releases_for_song(song_id: str, artist_filter: str = None,
+                          release_ids: List[str] = None) -> List[dict]:
     """
     Get all releases for a song (via recording_releases junction),
-    optionally filtered by artist
+    optionally filtered by artist and/or to specific release IDs
     
     UPDATED: Recording-Centric Architecture
     - Performers now come from recording_performers (not release_performers)
@@ -204,6 +205,12 @@ def get_releases_for_song(song_id: str, artist_filter: str = None) -> List[dict]
                     )
                 """
                 params.append(artist_filter)
+
+            if release_ids is not None:
+                query += """
+                    AND rel.id = ANY(%s::uuid[])
+                """
+                params.append(list(release_ids))
             
             query += """
                 GROUP BY rel.id, rel.title, rel.artist_credit, rel.release_year, rel.spotify_album_id, rr.recording_id
@@ -0,0 +1,205 @@
+"""
+Spotify Hydration
+Batched, cache-aware lookups of tracks, albums and artists by ID
+
+Audits and backfills used to fetch one object per HTTP call
+(GET /v1/tracks/{id}), so checking a catalog's worth of track IDs cost one
+Spotify request per ID. SpotifyHydrator collects the IDs a caller is
+about to need and resolves them together:
+
+- IDs already in the api_cache (same keys as the single-ID lookups, so
+  both paths share entries) are served from the cache.
+- The rest go to Spotify's "get several" endpoints, 50 tracks, 20 albums
+  or 50 artists per call, and every result is written back per ID. IDs
+  Spotify doesn't know are cached as None, like a 404 on the single-ID
+  endpoint.
+- Repeated and already-queued IDs are only looked up once.
+
+Queue IDs ahead of a loop, then ask for them one at a time; the first
+get_*() call flushes everything queued of that kind:
+
+    hydrator = SpotifyHydrator(client)
+    hydrator.request_tracks(row['track_id'] for row in rows)
+    for row in rows:
+        track = hydrator.get_track(row['track_id'])   # no HTTP after the first
+
+For a long list, let prefetch() queue the IDs a window at a time as the
+loop reaches them, so results come back incrementally and only one
+window's responses are held at once:
+
+    for row in hydrator.prefetch_tracks(rows, lambda row: row['track_id']):
+        track = hydrator.get_track(row['track_id'])
+
+or resolve a list at once with get_tracks(ids) / get_albums(ids) /
+get_artists(ids).
+
+Results wait in the hydrator only until they are handed out, so a
+long-lived hydrator (SpotifyMatcher keeps one) doesn't grow; asking again
+for an ID is a cache hit.
+"""
+
+import logging
+from collections import defaultdict
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, Optional, TypeVar
+
+from core.api_cache import CacheKey
+from integrations.spotify.client import SpotifyClient, _CACHE_MISS
+
+logger = logging.getLogger(__name__)
+
+TRACKS = 'tracks'
+ALBUMS = 'albums'
+ARTISTS = 'artists'
+
+# Rows whose IDs prefetch() queues at a time (a handful of batch calls)
+PREFETCH_WINDOW = 250
+
+T = TypeVar('T')
+
+
+class SpotifyHydrator:
+    """
+    Coalesces track, album and artist lookups into batch API calls
+    """
+
+    def __init__(self, client: SpotifyClient, logger=None):
+        self.client = client
+        self.logger = logger or client.logger
+        # Queued IDs per resource (dicts as insertion-ordered sets)
+        self._pending: Dict[str, Dict[str, None]] = {TRACKS: {}, ALBUMS: {}, ARTISTS: {}}
+        # Looked-up objects not yet handed out; None means "not on Spotify"
+        self._resolved: Dict[str, Dict[str, Optional[dict]]] = {TRACKS: {}, ALBUMS: {}, ARTISTS: {}}
+        self.stats = defaultdict(int)
+
+    def _cache_key(self, resource: str, spotify_id: str) -> CacheKey:
+        if resource == TRACKS:
+            return self.client._get_track_cache_key(spotify_id)
+        if resource == ALBUMS:
+            # The plain album key holds the album's track list
+            return self.client._get_album_cache_key(f"{spotify_id}_details")
+        return self.client._get_artist_cache_key(spotify_id)
+
+    # ------------------------------------------------------------------
+    # Queueing and flushing
+    # ------------------------------------------------------------------
+
+    def request(self, resource: str, ids: Iterable[str]) -> None:
+        """Queue IDs for the next flush of this resource"""
+        pending = self._pending[resource]
+        resolved = self._resolved[resource]
+        for spotify_id in ids:
+            if spotify_id and spotify_id not in resolved:
+                pending[spotify_id] = None
+
+    def flush(self, resource: str) -> None:
+        """Resolve every queued ID of a resource, cache first"""
+        pending = list(self._pending[resource])
+        self._pending[resource].clear()
+        if not pending:
+            return
+
+        resolved = self._resolved[resource]
+        misses = []
+        for spotify_id in pending:
+            cached = self.client._load_from_cache(self._cache_key(resource, spotify_id))
+            if cached is _CACHE_MISS:
+                misses.append(spotify_id)
+            else:
+                resolved[spotify_id] = cached
+                self.stats['cache_hits'] += 1
+
+        limit = SpotifyClient.BATCH_LIMITS[resource]
+        for start in range(0, len(misses), limit):
+            chunk = misses[start:start + limit]
+            fetched = self.client.get_batch(resource, chunk)
+            self.stats['api_calls'] += 1
+            if fetched is None:
+                # Left unresolved: get_*() reports them as missing
+                self.stats['failed'] += len(chunk)
+                continue
+            for spotify_id in chunk:
+                data = fetched.get(spotify_id)
+                resolved[spotify_id] = data
+                self.client._save_to_cache(self._cache_key(resource, spotify_id), data)
+            self.stats[f'{resource}_fetched'] += len(chunk)
+
+        self.logger.debug(
+            f"Hydrated {len(pending)} {resource}: {len(pending) - len(misses)} cached, "
+            f"{len(misses)} fetched"
+        )
+
+    def prefetch(self, resource: str, items: Iterable[T], key: Callable[[T], str],
+                 window: int = PREFETCH_WINDOW) -> Iterator[T]:
+        """
+        Yield items, queueing the IDs of each window of them (key(item))
+        just before the first of the window is handed out.
+
+        Queueing a whole catalog up front would make the first get() fetch
+        every batch before returning anything, and hold every response
+        until it is asked for.
+        """
+        items = iter(items)
+        while True:
+            chunk = list(islice(items, window))
+            if not chunk:
+                return
+            self.request(resource, (key(item) for item in chunk))
+            yield from chunk
+
+    def get(self, resource: str, spotify_id: str) -> Optional[dict]:
+        """One object, flushing everything queued of its kind alongside it"""
+        if not spotify_id:
+            return None
+        if spotify_id not in self._resolved[resource]:
+            self.request(resource, [spotify_id])
+            self.flush(resource)
+        return self._resolved[resource].pop(spotify_id, None)
+
+    def get_many(self, resource: str, ids: Iterable[str]) -> Dict[str, Optional[dict]]:
+        """
+        Look up several IDs.
+
+        Returns a dict with an entry for every ID that could be resolved:
+        the object, or None if Spotify doesn't have it. IDs whose batch
+        request failed are left out.
+        """
+        ids = [spotify_id for spotify_id in dict.fromkeys(ids) if spotify_id]
+        self.request(resource, ids)
+        self.flush(resource)
+        resolved = self._resolved[resource]
+        return {spotify_id: resolved.pop(spotify_id) for spotify_id in ids if spotify_id in resolved}
+
+    # ------------------------------------------------------------------
+    # Per-resource conveniences
+    # ------------------------------------------------------------------
+
+    def request_tracks(self, ids: Iterable[str]) -> None:
+        self.request(TRACKS, ids)
+
+    def request_albums(self, ids: Iterable[str]) -> None:
+        self.request(ALBUMS, ids)
+
+    def request_artists(self, ids: Iterable[str]) -> None:
+        self.request(ARTISTS, ids)
+
+    def prefetch_tracks(self, items: Iterable[T], key: Callable[[T], str]) -> Iterator[T]:
+        return self.prefetch(TRACKS, items, key)
+
+    def get_track(self, track_id: str) -> Optional[dict]:
+        return self.get(TRACKS, track_id)
+
+    def get_album(self, album_id: str) -> Optional[dict]:
+        return self.get(ALBUMS, album_id)
+
+    def get_artist(self, artist_id: str) -> Optional[dict]:
+        return self.get(ARTISTS, artist_id)
+
+    def get_tracks(self, ids: Iterable[str]) -> Dict[str, Optional[dict]]:
+        return self.get_many(TRACKS, ids)
+
+    def get_albums(self, ids: Iterable[str]) -> Dict[str, Optional[dict]]:
+        return self.get_many(ALBUMS, ids)
+
+    def get_artists(self, ids: Iterable[str]) -> Dict[str, Optional[dict]]:
+        return self.get_many(ARTISTS, ids)
@@ -24,17 +24,21 @@ Used by:
 import re
 import logging
 from typing import Dict, Any, Optional, List
+import numpy as np
 import requests
 
 from db_utils import get_db_connection
 
+from core.api_cache import CacheKey
 from integrations.spotify.client import SpotifyClient, SpotifyRateLimitError, _CACHE_MISS
+from integrations.spotify.hydration import SpotifyHydrator, TRACKS, ALBUMS
 from integrations.spotify.matching import (
     strip_ensemble_suffix,
     strip_live_suffix,
     normalize_for_comparison,
     normalize_for_search,
     calculate_similarity,
+    similarity_matrix,
     is_substring_title_match,
     extract_primary_artist,
     validate_track_match,
@@ -120,6 +124,8 @@ class SpotifyMatcher:
             max_retries=max_retries,
             logger=self.logger
         )
+        # Batched track/album lookups (get_track_details, get_album_details)
+        self.hydrator = SpotifyHydrator(self.client, logger=self.logger)
         
         # Stats - updated for releases and tracks
         self.stats = {
@@ -171,22 +177,19 @@ class SpotifyMatcher:
         self.stats['rate_limit_hits'] = self.client.stats.get('rate_limit_hits', 0)
         self.stats['rate_limit_waits'] = self.client.stats.get('rate_limit_waits', 0)
     
-    def _get_track_match_failure_cache_path(self, song_id: str, release_id: str, 
-                                            spotify_album_id: str) -> 'Path':
+    def _get_track_match_failure_cache_key(self, song_id: str, release_id: str,
+                                           spotify_album_id: str) -> CacheKey:
         """
-        Get cache path for track match failure results.
+        Get cache key for track match failure results.
         
         This caches the result of "album matched but track not found" to avoid
         repeated DB queries on subsequent runs.
         """
-        from pathlib import Path
-        # Use the client's cache directory structure
-        failure_cache_dir = self.client.cache_dir / 'track_failures'
-        failure_cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create a deterministic filename from the three IDs (convert UUIDs to strings)
-        filename = f"fail_{str(song_id)}_{str(release_id)}_{str(spotify_album_id)}.json"
-        return failure_cache_dir / filename
+        # Deterministic key from the three IDs (convert UUIDs to strings)
+        return CacheKey(
+            'spotify',
+            f"track_failures/fail_{str(song_id)}_{str(release_id)}_{str(spotify_album_id)}"
+        )
     
     def _is_track_match_cached_failure(self, song_id: str, release_id: str,
                                        spotify_album_id: str) -> bool:
@@ -195,42 +198,29 @@ class SpotifyMatcher:
         
         Returns True if we have a cached "no match" result, False otherwise.
         """
-        cache_path = self._get_track_match_failure_cache_path(song_id, release_id, spotify_album_id)
-        
-        if self.client.force_refresh:
-            return False
+        cache_key = self._get_track_match_failure_cache_key(song_id, release_id, spotify_album_id)
         
-        if not cache_path.exists():
+        # _load_from_cache honours force_refresh and counts the cache hit
+        if self.client._load_from_cache(cache_key) is _CACHE_MISS:
             return False
         
-        # Check if cache is still valid
-        if self.client._is_cache_valid(cache_path):
-            self.client.stats['cache_hits'] = self.client.stats.get('cache_hits', 0) + 1
-            self.logger.debug(f"    Track match failure cache hit")
-            return True
-        
-        return False
+        self.logger.debug(f"    Track match failure cache hit")
+        return True
     
     def _cache_track_match_failure(self, song_id: str, release_id: str,
                                    spotify_album_id: str, song_title: str) -> None:
         """
         Cache the fact that track matching failed for this song/release/album combination.
         """
-        import json
-        cache_path = self._get_track_match_failure_cache_path(song_id, release_id, spotify_album_id)
-        
-        try:
-            with open(cache_path, 'w') as f:
-                json.dump({
-                    'song_id': str(song_id),
-                    'release_id': str(release_id),
-                    'spotify_album_id': str(spotify_album_id),
-                    'song_title': song_title,
-                    'result': 'no_track_match'
-                }, f)
-            self.logger.debug(f"    Cached track match failure")
-        except Exception as e:
-            self.logger.warning(f"    Failed to cache track match failure: {e}")
+        cache_key = self._get_track_match_failure_cache_key(song_id, release_id, spotify_album_id)
+        self.client._save_to_cache(cache_key, {
+            'song_id': str(song_id),
+            'release_id': str(release_id),
+            'spotify_album_id': str(spotify_album_id),
+            'song_title': song_title,
+            'result': 'no_track_match'
+        })
+        self.logger.debug(f"    Cached track match failure")
 
     def _log_duration_rejection(self, song_title: str, recording_id: str,
                                 release_id: str, spotify_track_id: str,
@@ -395,9 +385,9 @@ class SpotifyMatcher:
         """Get all recordings for a song, optionally filtered by artist"""
         return get_recordings_for_song(song_id, self.artist_filter)
     
-    def get_releases_for_song(self, song_id: str) -> List[dict]:
-        """Get all releases for a song, optionally filtered by artist"""
-        return get_releases_for_song(song_id, self.artist_filter)
+    def get_releases_for_song(self, song_id: str, release_ids: List[str] = None) -> List[dict]:
+        """Get all releases for a song, optionally filtered by artist and/or release IDs"""
+        return get_releases_for_song(song_id, self.artist_filter, release_ids=release_ids)
     
     def get_releases_without_artwork(self) -> List[dict]:
         """Get releases with Spotify URL but no cover artwork"""
@@ -525,9 +515,19 @@ class SpotifyMatcher:
         
         return None
     
+    def _hydrate(self, resource: str, spotify_id: str) -> Optional[dict]:
+        """Look up one ID through the hydrator, counting any batch calls it makes"""
+        calls = self.hydrator.stats['api_calls']
+        data = self.hydrator.get(resource, spotify_id)
+        self.stats['api_calls'] += self.hydrator.stats['api_calls'] - calls
+        return data
+
     def get_track_details(self, track_id: str) -> Optional[dict]:
         """
         Get detailed information about a Spotify track by ID with caching
+
+        Goes through self.hydrator, so tracks queued with
+        self.hydrator.request_tracks() are fetched 50 per API call.
         
         Args:
             track_id: Spotify track ID
@@ -535,56 +535,14 @@ class SpotifyMatcher:
         Returns:
             Track data dict or None if not found
         """
-        # Check cache first
-        cache_path = self.client._get_track_cache_path(track_id)
-        cached_data = self.client._load_from_cache(cache_path)
-        
-        if cached_data is not _CACHE_MISS:
-            # Cache hit - return cached data (which might be None for "not found")
-            return cached_data
-        
-        # Not in cache or cache expired - fetch from API
-        token = self.client.get_spotify_auth_token()
-        if not token:
-            return None
-        
-        try:
-            response = self.client._make_api_request(
-                'get',
-                f'https://api.spotify.com/v1/tracks/{track_id}',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
-            )
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            # Track API call
-            self.stats['api_calls'] += 1
-            self.client.last_made_api_call = True
-            
-            # Save to cache
-            self.client._save_to_cache(cache_path, data)
-            
-            return data
-            
-        except SpotifyRateLimitError as e:
-            self.logger.error(f"Rate limit exceeded fetching track details: {e}")
-            return None
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                # Cache the "not found" result
-                self.client._save_to_cache(cache_path, None)
-                return None
-            self.logger.error(f"Spotify API error: {e}")
-            return None
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to fetch track details: {e}")
-            return None
+        return self._hydrate(TRACKS, track_id)
     
     def get_album_details(self, album_id: str) -> Optional[dict]:
         """
         Fetch album details from Spotify
+
+        Goes through self.hydrator, so albums queued with
+        self.hydrator.request_albums() are fetched 20 per API call.
         
         Args:
             album_id: Spotify album ID
@@ -592,43 +550,7 @@ class SpotifyMatcher:
         Returns:
             Album dict or None if failed
         """
-        # Check cache first
-        cache_path = self.client._get_album_cache_path(f"{album_id}_details")
-        cached_result = self.client._load_from_cache(cache_path)
-        
-        if cached_result is not _CACHE_MISS:
-            return cached_result
-        
-        token = self.client.get_spotify_auth_token()
-        if not token:
-            return None
-        
-        try:
-            response = self.client._make_api_request(
-                'get',
-                f'https://api.spotify.com/v1/albums/{album_id}',
-                headers={'Authorization': f'Bearer {token}'},
-                timeout=10
-            )
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            self.stats['api_calls'] += 1
-            self.client.last_made_api_call = True
-            
-            self.client._save_to_cache(cache_path, data)
-            return data
-            
-        except SpotifyRateLimitError as e:
-            self.logger.error(f"Rate limit exceeded fetching album: {e}")
-            return None
-        except requests.exceptions.HTTPError as e:
-            self.logger.error(f"Spotify API error fetching album: {e}")
-            return None
-        except Exception as e:
-            self.logger.error(f"Error fetching album: {e}")
-            return None
+        return self._hydrate(ALBUMS, album_id)
     
     def get_album_tracks(self, album_id: str) -> Optional[List[dict]]:
         """
@@ -642,8 +564,8 @@ class SpotifyMatcher:
             or None if failed
         """
         # Check cache first
-        cache_path = self.client._get_album_cache_path(album_id)
-        cached_result = self.client._load_from_cache(cache_path)
+        cache_key = self.client._get_album_cache_key(album_id)
+        cached_result = self.client._load_from_cache(cache_key)
 
         if cached_result is not _CACHE_MISS:
             return cached_result
@@ -687,7 +609,7 @@ class SpotifyMatcher:
                 url = data.get('next')
 
             self.logger.debug(f"    Fetched {len(tracks)} total tracks from album")
-            self.client._save_to_cache(cache_path, tracks)
+            self.client._save_to_cache(cache_key, tracks)
             return tracks
 
         except SpotifyRateLimitError as e:
@@ -717,8 +639,8 @@ class SpotifyMatcher:
             or None if no valid match found
         """
         # Check cache first
-        cache_path = self.client._get_search_cache_path(song_title, album_title, artist_name, year)
-        cached_result = self.client._load_from_cache(cache_path)
+        cache_key = self.client._get_search_cache_key(song_title, album_title, artist_name, year)
+        cached_result = self.client._load_from_cache(cache_key)
         
         if cached_result is not _CACHE_MISS:
             # Cache hit - return cached result (which might be None for "no match found")
@@ -727,7 +649,7 @@ class SpotifyMatcher:
         # Not in cache - perform search
         token = self.client.get_spotify_auth_token()
         if not token:
-            self.client._save_to_cache(cache_path, None)
+            self.client._save_to_cache(cache_key, None)
             return None
         
         # Progressive search strategy
@@ -843,7 +765,7 @@ class SpotifyMatcher:
                             }
                             
                             # Cache successful result
-                            self.client._save_to_cache(cache_path, result)
+                            self.client._save_to_cache(cache_key, result)
                             
                             self.logger.debug(f"    ✓ Valid match found (candidate #{i+1})")
                             return result
@@ -881,7 +803,7 @@ class SpotifyMatcher:
         self.logger.debug(f"    ✗ No valid Spotify matches found after trying all strategies")
         
         # Cache the "no match" result
-        self.client._save_to_cache(cache_path, None)
+        self.client._save_to_cache(cache_key, None)
         
         return None
     
@@ -902,15 +824,15 @@ class SpotifyMatcher:
             or None if no valid match found
         """
         # Check cache first (reuse search cache with 'album' prefix)
-        cache_path = self.client._get_search_cache_path('album', album_title, artist_name)
-        cached_result = self.client._load_from_cache(cache_path)
+        cache_key = self.client._get_search_cache_key('album', album_title, artist_name)
+        cached_result = self.client._load_from_cache(cache_key)
         
         if cached_result is not _CACHE_MISS:
             return cached_result
         
         token = self.client.get_spotify_auth_token()
         if not token:
-            self.client._save_to_cache(cache_path, None)
+            self.client._save_to_cache(cache_key, None)
             return None
         
         # Progressive search strategy
@@ -1060,7 +982,7 @@ class SpotifyMatcher:
                                     'album_art': album_art,
                                     'similarity_scores': scores
                                 }
-                                self.client._save_to_cache(cache_path, result)
+                                self.client._save_to_cache(cache_key, result)
                                 return result
 
                         # Exact title matches exist but failed artist validation
@@ -1127,7 +1049,7 @@ class SpotifyMatcher:
                                 'similarity_scores': scores
                             }
                             
-                            self.client._save_to_cache(cache_path, result)
+                            self.client._save_to_cache(cache_key, result)
                             self.logger.debug(f"    ✓ Valid match found (candidate #{cr['index']+1})")
                             return result
                     
@@ -1149,7 +1071,7 @@ class SpotifyMatcher:
                 return None
         
         self.logger.debug(f"    ✗ No valid Spotify matches found after trying all strategies")
-        self.client._save_to_cache(cache_path, None)
+        self.client._save_to_cache(cache_key, None)
         return None
     
     # ========================================================================
@@ -1221,184 +1143,11 @@ class SpotifyMatcher:
                 if i < start_from:
                     continue
 
-                self.stats['releases_processed'] += 1
-
                 # Report progress via callback
                 if self.progress_callback:
                     self.progress_callback('spotify_track_match', i, len(releases))
-                
-                title = release['title'] or 'Unknown Album'
-                year = release['release_year']
-                
-                # Get artist - prefer artist_credit (full credit from MusicBrainz release)
-                # This preserves ensemble names like "Gene Krupa & His Orchestra"
-                # which would otherwise be truncated by extract_primary_artist
-                artist_credit = release.get('artist_credit')
-                artist_name = artist_credit
-
-                if not artist_name:
-                    performers = release.get('performers') or []
-                    leaders = [p['name'] for p in performers if p.get('role') == 'leader']
-                    artist_name = leaders[0] if leaders else (
-                        performers[0]['name'] if performers else None
-                    )
-                
-                self.logger.debug(f"[{i}/{len(releases)}] {title}")
-                self.logger.debug(f"    Artist: {artist_name or 'Unknown'}")
-                self.logger.debug(f"    Year: {year or 'Unknown'}")
-                
-                # Check if already has Spotify ID (skip unless rematch or rematch_tracks mode)
-                if release.get('spotify_album_id') and not self.rematch and not self.rematch_tracks:
-                    self.logger.info(f"[{i}/{len(releases)}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ⊙ Already has Spotify ID, skipping")
-                    self.stats['releases_skipped'] += 1
-                    continue
-                elif release.get('spotify_album_id') and self.rematch_tracks and not self.rematch_all:
-                    # rematch_tracks mode (not rematch_all): Re-run track matching for releases with album IDs
-                    # but only if there are recordings missing track IDs
-                    existing_album_id = release.get('spotify_album_id')
-                    recordings = self.get_recordings_for_release(song['id'], release['id'])
-                    needs_track_match = any(not r.get('spotify_track_id') for r in recordings)
-
-                    if not needs_track_match:
-                        self.logger.debug(f"[{i}/{len(releases)}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ⊙ All tracks already matched, skipping")
-                        self.stats['releases_skipped'] += 1
-                        continue
-
-                    self.logger.info(f"[{i}/{len(releases)}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ↻ Re-matching tracks...")
-                    # Fetch Spotify tracks BEFORE opening DB connection
-                    # to avoid holding the connection idle during API calls
-                    spotify_tracks = self.get_album_tracks(existing_album_id)
-                    if not spotify_tracks:
-                        self.logger.info(f"[{i}/{len(releases)}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ✗ Could not fetch Spotify album tracks")
-                        self.stats['releases_no_match'] += 1
-                        continue
-
-                    with get_db_connection() as conn:
-                        track_matched = self.match_tracks_for_release(
-                            conn,
-                            song['id'],
-                            release['id'],
-                            existing_album_id,
-                            song['title'],
-                            alt_titles=song.get('alt_titles'),
-                            spotify_tracks=spotify_tracks
-                        )
-                        if track_matched:
-                            self.stats['releases_with_spotify'] += 1
-                        else:
-                            self.stats['releases_no_match'] += 1
-                    continue
-                elif release.get('spotify_album_id') and self.rematch_all:
-                    # rematch_all mode: Re-search for album AND re-match all tracks
-                    self.logger.info(f"[{i}/{len(releases)}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ↻ Full re-match...")
-                    # Fall through to album search below
-                elif release.get('spotify_album_id') and self.rematch:
-                    self.logger.info(f"[{i}/{len(releases)}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ↻ Re-matching...")
-                elif self.rematch_tracks and not self.rematch_all and not release.get('spotify_album_id'):
-                    # In rematch_tracks mode (not rematch_all), skip releases without album IDs
-                    self.logger.debug(f"[{i}/{len(releases)}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ⊙ No album ID, skipping (rematch-tracks mode)")
-                    self.stats['releases_skipped'] += 1
-                    continue
-
-                # Track whether this release had previous Spotify data (for cleanup on rematch failure)
-                had_previous_spotify = bool(release.get('spotify_album_id'))
-
-                # Search Spotify for album (with song title for track verification fallback)
-                spotify_match = self.search_spotify_album(title, artist_name, song['title'])
-
-                if spotify_match:
-                    # Check if this album is blocked for this song
-                    if is_album_blocked(song['id'], spotify_match['id']):
-                        self.logger.info(f"[{i}/{len(releases)}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ⊘ Album blocked (in blocklist)")
-                        self.stats['releases_blocked'] += 1
-                        if had_previous_spotify:
-                            with get_db_connection() as conn:
-                                clear_release_spotify_data(conn, release['id'],
-                                                          dry_run=self.dry_run, log=self.logger)
-                            self.logger.info(f"    ✓ Cleared stale Spotify data")
-                            self.stats['releases_cleared'] += 1
-                        continue
-                    # Check if we already know track matching fails for this combination
-                    # This avoids opening a DB connection just to reach the same "no match" conclusion
-                    # Skip this cache check in rematch_all mode
-                    if not self.rematch_all and self._is_track_match_cached_failure(song['id'], release['id'], spotify_match['id']):
-                        self.logger.info(f"[{i}/{len(releases)}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ✗ Album matched but track not found (cached)")
-                        self.stats['releases_no_match'] += 1
-                        continue
-
-                    # IMPORTANT: Fetch Spotify tracks BEFORE opening DB connection
-                    # to avoid holding the connection idle during API calls
-                    # (Supabase's PgBouncer has ~6 min idle timeout)
-                    spotify_tracks = self.get_album_tracks(spotify_match['id'])
-                    if not spotify_tracks:
-                        self.logger.info(f"[{i}/{len(releases)}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ✗ Could not fetch Spotify album tracks")
-                        self.stats['releases_no_match'] += 1
-                        continue
 
-                    with get_db_connection() as conn:
-                        # Match tracks using pre-fetched data (no API calls inside DB transaction)
-                        track_matched = self.match_tracks_for_release(
-                            conn,
-                            song['id'],
-                            release['id'],
-                            spotify_match['id'],
-                            song['title'],
-                            alt_titles=song.get('alt_titles'),
-                            spotify_tracks=spotify_tracks
-                        )
-
-                        if track_matched:
-                            # Only store album data if track was found (validates album match)
-                            self.stats['releases_with_spotify'] += 1
-                            self.update_release_spotify_data(
-                                conn,
-                                release['id'],
-                                spotify_match,
-                                title,
-                                artist_name,
-                                year,
-                                i,
-                                len(releases)
-                            )
-
-                            # NEW: Set this as the default release for linked recordings
-                            # (only if they don't already have a better default)
-                            self.update_recording_default_release(
-                                conn,
-                                song['id'],
-                                release['id']
-                            )
-                        else:
-                            # Album matched but no track found - cache this for future runs
-                            self._cache_track_match_failure(
-                                song['id'], release['id'], spotify_match['id'], song['title']
-                            )
-                            self.logger.info(f"[{i}/{len(releases)}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ✗ Album matched but track not found (possible false positive)")
-                            self.stats['releases_no_match'] += 1
-                            # Clear stale Spotify data if this was a rematch
-                            if had_previous_spotify:
-                                clear_release_spotify_data(conn, release['id'],
-                                                          dry_run=self.dry_run, log=self.logger)
-                                self.logger.info(f"    ✓ Cleared stale Spotify data")
-                                self.stats['releases_cleared'] += 1
-                else:
-                    self.logger.info(f"[{i}/{len(releases)}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ✗ No valid Spotify match found")
-                    self.stats['releases_no_match'] += 1
-                    # Clear stale data if this was a rematch or duration-mismatches mode
-                    if had_previous_spotify or self.duration_mismatch_threshold is not None:
-                        with get_db_connection() as conn:
-                            if had_previous_spotify:
-                                clear_release_spotify_data(conn, release['id'],
-                                                          dry_run=self.dry_run, log=self.logger)
-                                self.logger.info(f"    ✓ Cleared stale Spotify data")
-                                self.stats['releases_cleared'] += 1
-                            # Also clear track-level links (may exist even if release-level was already cleared)
-                            recordings = self.get_recordings_for_release(song['id'], release['id'], conn=conn)
-                            for recording in recordings:
-                                if recording.get('spotify_track_id'):
-                                    clear_recording_release_track(
-                                        conn, recording['recording_id'], release['id'],
-                                        dry_run=self.dry_run, log=self.logger)
+                self.match_release(song, release, i, len(releases))
             
             self._aggregate_client_stats()
             return {
@@ -1416,6 +1165,194 @@ class SpotifyMatcher:
                 'stats': self.stats
             }
     
+    def match_release(self, song: dict, release: dict, i: int = 1, total: int = 1) -> None:
+        """
+        Match one release to a Spotify album and its tracks to our recordings
+
+        Called per release by match_releases(), and directly by pipelined
+        song research as releases arrive from the MusicBrainz import.
+
+        Args:
+            song: Song dict (id, title, alt_titles)
+            release: Release dict as returned by get_releases_for_song()
+            i: Position of this release, for log output
+            total: Number of releases being processed, for log output
+        """
+        self.stats['releases_processed'] += 1
+
+        title = release['title'] or 'Unknown Album'
+        year = release['release_year']
+        
+        # Get artist - prefer artist_credit (full credit from MusicBrainz release)
+        # This preserves ensemble names like "Gene Krupa & His Orchestra"
+        # which would otherwise be truncated by extract_primary_artist
+        artist_credit = release.get('artist_credit')
+        artist_name = artist_credit
+
+        if not artist_name:
+            performers = release.get('performers') or []
+            leaders = [p['name'] for p in performers if p.get('role') == 'leader']
+            artist_name = leaders[0] if leaders else (
+                performers[0]['name'] if performers else None
+            )
+        
+        self.logger.debug(f"[{i}/{total}] {title}")
+        self.logger.debug(f"    Artist: {artist_name or 'Unknown'}")
+        self.logger.debug(f"    Year: {year or 'Unknown'}")
+        
+        # Check if already has Spotify ID (skip unless rematch or rematch_tracks mode)
+        if release.get('spotify_album_id') and not self.rematch and not self.rematch_tracks:
+            self.logger.info(f"[{i}/{total}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ⊙ Already has Spotify ID, skipping")
+            self.stats['releases_skipped'] += 1
+            return
+        elif release.get('spotify_album_id') and self.rematch_tracks and not self.rematch_all:
+            # rematch_tracks mode (not rematch_all): Re-run track matching for releases with album IDs
+            # but only if there are recordings missing track IDs
+            existing_album_id = release.get('spotify_album_id')
+            recordings = self.get_recordings_for_release(song['id'], release['id'])
+            needs_track_match = any(not r.get('spotify_track_id') for r in recordings)
+
+            if not needs_track_match:
+                self.logger.debug(f"[{i}/{total}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ⊙ All tracks already matched, skipping")
+                self.stats['releases_skipped'] += 1
+                return
+
+            self.logger.info(f"[{i}/{total}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ↻ Re-matching tracks...")
+            # Fetch Spotify tracks BEFORE opening DB connection
+            # to avoid holding the connection idle during API calls
+            spotify_tracks = self.get_album_tracks(existing_album_id)
+            if not spotify_tracks:
+                self.logger.info(f"[{i}/{total}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ✗ Could not fetch Spotify album tracks")
+                self.stats['releases_no_match'] += 1
+                return
+
+            with get_db_connection() as conn:
+                track_matched = self.match_tracks_for_release(
+                    conn,
+                    song['id'],
+                    release['id'],
+                    existing_album_id,
+                    song['title'],
+                    alt_titles=song.get('alt_titles'),
+                    spotify_tracks=spotify_tracks
+                )
+                if track_matched:
+                    self.stats['releases_with_spotify'] += 1
+                else:
+                    self.stats['releases_no_match'] += 1
+            return
+        elif release.get('spotify_album_id') and self.rematch_all:
+            # rematch_all mode: Re-search for album AND re-match all tracks
+            self.logger.info(f"[{i}/{total}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ↻ Full re-match...")
+            # Fall through to album search below
+        elif release.get('spotify_album_id') and self.rematch:
+            self.logger.info(f"[{i}/{total}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ↻ Re-matching...")
+        elif self.rematch_tracks and not self.rematch_all and not release.get('spotify_album_id'):
+            # In rematch_tracks mode (not rematch_all), skip releases without album IDs
+            self.logger.debug(f"[{i}/{total}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ⊙ No album ID, skipping (rematch-tracks mode)")
+            self.stats['releases_skipped'] += 1
+            return
+
+        # Track whether this release had previous Spotify data (for cleanup on rematch failure)
+        had_previous_spotify = bool(release.get('spotify_album_id'))
+
+        # Search Spotify for album (with song title for track verification fallback)
+        spotify_match = self.search_spotify_album(title, artist_name, song['title'])
+
+        if spotify_match:
+            # Check if this album is blocked for this song
+            if is_album_blocked(song['id'], spotify_match['id']):
+                self.logger.info(f"[{i}/{total}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ⊘ Album blocked (in blocklist)")
+                self.stats['releases_blocked'] += 1
+                if had_previous_spotify:
+                    with get_db_connection() as conn:
+                        clear_release_spotify_data(conn, release['id'],
+                                                  dry_run=self.dry_run, log=self.logger)
+                    self.logger.info(f"    ✓ Cleared stale Spotify data")
+                    self.stats['releases_cleared'] += 1
+                return
+            # Check if we already know track matching fails for this combination
+            # This avoids opening a DB connection just to reach the same "no match" conclusion
+            # Skip this cache check in rematch_all mode
+            if not self.rematch_all and self._is_track_match_cached_failure(song['id'], release['id'], spotify_match['id']):
+                self.logger.info(f"[{i}/{total}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ✗ Album matched but track not found (cached)")
+                self.stats['releases_no_match'] += 1
+                return
+
+            # IMPORTANT: Fetch Spotify tracks BEFORE opening DB connection
+            # to avoid holding the connection idle during API calls
+            # (Supabase's PgBouncer has ~6 min idle timeout)
+            spotify_tracks = self.get_album_tracks(spotify_match['id'])
+            if not spotify_tracks:
+                self.logger.info(f"[{i}/{total}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ✗ Could not fetch Spotify album tracks")
+                self.stats['releases_no_match'] += 1
+                return
+
+            with get_db_connection() as conn:
+                # Match tracks using pre-fetched data (no API calls inside DB transaction)
+                track_matched = self.match_tracks_for_release(
+                    conn,
+                    song['id'],
+                    release['id'],
+                    spotify_match['id'],
+                    song['title'],
+                    alt_titles=song.get('alt_titles'),
+                    spotify_tracks=spotify_tracks
+                )
+
+                if track_matched:
+                    # Only store album data if track was found (validates album match)
+                    self.stats['releases_with_spotify'] += 1
+                    self.update_release_spotify_data(
+                        conn,
+                        release['id'],
+                        spotify_match,
+                        title,
+                        artist_name,
+                        year,
+                        i,
+                        total
+                    )
+
+                    # NEW: Set this as the default release for linked recordings
+                    # (only if they don't already have a better default)
+                    self.update_recording_default_release(
+                        conn,
+                        song['id'],
+                        release['id']
+                    )
+                else:
+                    # Album matched but no track found - cache this for future runs
+                    self._cache_track_match_failure(
+                        song['id'], release['id'], spotify_match['id'], song['title']
+                    )
+                    self.logger.info(f"[{i}/{total}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ✗ Album matched but track not found (possible false positive)")
+                    self.stats['releases_no_match'] += 1
+                    # Clear stale Spotify data if this was a rematch
+                    if had_previous_spotify:
+                        clear_release_spotify_data(conn, release['id'],
+                                                  dry_run=self.dry_run, log=self.logger)
+                        self.logger.info(f"    ✓ Cleared stale Spotify data")
+                        self.stats['releases_cleared'] += 1
+        else:
+            self.logger.info(f"[{i}/{total}] {title} ({artist_name or 'Unknown'}, {year or 'Unknown'}) - ✗ No valid Spotify match found")
+            self.stats['releases_no_match'] += 1
+            # Clear stale data if this was a rematch or duration-mismatches mode
+            if had_previous_spotify or self.duration_mismatch_threshold is not None:
+                with get_db_connection() as conn:
+                    if had_previous_spotify:
+                        clear_release_spotify_data(conn, release['id'],
+                                                  dry_run=self.dry_run, log=self.logger)
+                        self.logger.info(f"    ✓ Cleared stale Spotify data")
+                        self.stats['releases_cleared'] += 1
+                    # Also clear track-level links (may exist even if release-level was already cleared)
+                    recordings = self.get_recordings_for_release(song['id'], release['id'], conn=conn)
+                    for recording in recordings:
+                        if recording.get('spotify_track_id'):
+                            clear_recording_release_track(
+                                conn, recording['recording_id'], release['id'],
+                                dry_run=self.dry_run, log=self.logger)
+
     def _duration_confidence(self, expected_ms: int, actual_ms: int) -> float:
         """
         Calculate a confidence score (0.0-1.0) based on duration difference.
@@ -1639,57 +1576,44 @@ class SpotifyMatcher:
             if blocked_track_ids:
                 self.logger.debug(f"      Found {len(blocked_track_ids)} blocked track(s) for this song")
 
-        # First pass: standard fuzzy matching with primary title, duration-adjusted
+        candidates = []
         for track in spotify_tracks:
             # Check if this track is blocked for this song
             if track['id'] in blocked_track_ids:
                 self.logger.debug(f"      Skipping blocked track: {track['id']} ('{track['name']}')")
                 self.stats['tracks_blocked'] += 1
                 continue
+            candidates.append(track)
+
+        # Score the primary title (row 0) and every alt title against every
+        # candidate in one vectorized pass; pairs that can't reach the
+        # threshold are pruned by rapidfuzz and come back as 0
+        titles = [song_title] + list(alt_titles or [])
+        scores = similarity_matrix(
+            titles, [track['name'] for track in candidates],
+            score_cutoff=self.min_track_similarity
+        )
 
-            title_score = self.calculate_similarity(song_title, track['name'])
-
-            if title_score >= self.min_track_similarity:
+        # First pass: primary title; second pass: alternative titles in order.
+        # Duration-adjusted, so among equal titles the closer duration wins.
+        for row, title in enumerate(titles):
+            for col in np.flatnonzero(scores[row] >= self.min_track_similarity):
+                track = candidates[col]
                 adjusted_score = self._duration_adjusted_score(
-                    title_score, expected_duration_ms, track.get('duration_ms'))
+                    float(scores[row, col]), expected_duration_ms, track.get('duration_ms'))
 
                 if adjusted_score > best_score:
                     best_score = adjusted_score
                     best_match = track
 
-        if best_match:
-            duration_info = ""
-            if expected_duration_ms and best_match.get('duration_ms'):
-                diff = abs(expected_duration_ms - best_match['duration_ms']) / 1000
-                duration_info = f", duration diff {diff:.0f}s"
-            self.logger.debug(f"      Track match: '{song_title}' → '{best_match['name']}' ({best_score:.0f}%{duration_info})")
-            return best_match
-
-        # Second pass: try alternative titles
-        if alt_titles:
-            for alt_title in alt_titles:
-                for track in spotify_tracks:
-                    # Check if this track is blocked for this song
-                    if track['id'] in blocked_track_ids:
-                        continue
-
-                    title_score = self.calculate_similarity(alt_title, track['name'])
-
-                    if title_score >= self.min_track_similarity:
-                        adjusted_score = self._duration_adjusted_score(
-                            title_score, expected_duration_ms, track.get('duration_ms'))
-
-                        if adjusted_score > best_score:
-                            best_score = adjusted_score
-                            best_match = track
-
-                if best_match:
-                    duration_info = ""
-                    if expected_duration_ms and best_match.get('duration_ms'):
-                        diff = abs(expected_duration_ms - best_match['duration_ms']) / 1000
-                        duration_info = f", duration diff {diff:.0f}s"
-                    self.logger.debug(f"      Track match via alt title: '{alt_title}' → '{best_match['name']}' ({best_score:.0f}%{duration_info})")
-                    return best_match
+            if best_match:
+                duration_info = ""
+                if expected_duration_ms and best_match.get('duration_ms'):
+                    diff = abs(expected_duration_ms - best_match['duration_ms']) / 1000
+                    duration_info = f", duration diff {diff:.0f}s"
+                via = f" via alt title: '{title}'" if row else f": '{song_title}'"
+                self.logger.debug(f"      Track match{via} → '{best_match['name']}' ({best_score:.0f}%{duration_info})")
+                return best_match
 
         # Fallback: if positions provided and no fuzzy match, try position-based substring match
         # This handles cases like "An Affair to Remember" vs
@@ -1927,6 +1851,9 @@ class SpotifyMatcher:
         
         self.logger.info(f"Found {len(releases)} releases to process")
         self.logger.info("")
+
+        # Fetch album details 20 per API call as the loop asks for them
+        self.hydrator.request_albums(r['spotify_album_id'] for r in releases)
         
         # Process each release
         with get_db_connection() as conn:
@@ -5,15 +5,36 @@ Text normalization, fuzzy matching, and validation logic for matching
 our database records to Spotify API results.
 
 Functions in this module are stateless and can be used independently.
+
+PERFORMANCE:
+- normalize_for_comparison() is memoized: the same album, track and artist
+  names are compared many times per run (every candidate, every alt title,
+  every release of a discography), and the ~40 regex passes per call were
+  the bulk of matching CPU.
+- similarity_matrix() scores a list of titles against a list of candidates
+  in one rapidfuzz.process.cdist call (C loop, no per-pair Python overhead)
+  with exactly calculate_similarity()'s semantics. score_cutoff lets
+  rapidfuzz skip pairs whose lengths alone rule out reaching the threshold.
 """
 
 import re
 import logging
-from typing import List, Optional
-from rapidfuzz import fuzz
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import numpy as np
+from rapidfuzz import fuzz, process
 
 logger = logging.getLogger(__name__)
 
+# Distinct strings kept by the normalization memo (a few MB at most)
+NORMALIZE_CACHE_SIZE = 65536
+
+# calculate_similarity() retries without parenthetical content below this score
+PARENTHETICAL_RETRY_BELOW = 80
+
+_PARENTHETICAL_RE = re.compile(r'\s*\([^)]*\)\s*')
+
 
 # Common jazz ensemble suffixes that may not appear in Spotify artist names
 # e.g., "Bill Evans Trio" in our DB might be just "Bill Evans" on Spotify
@@ -297,10 +318,22 @@ def normalize_for_comparison(text: str) -> str:
     """
     Normalize text for fuzzy comparison
     Removes common variations that shouldn't affect matching
+
+    Memoized (see clear_normalization_cache()).
     """
     if not text:
         return ""
-    
+    return _normalize_for_comparison(text)
+
+
+def clear_normalization_cache() -> None:
+    """Drop memoized normalizations (e.g. between long batch runs)"""
+    _normalize_for_comparison.cache_clear()
+    _strip_parentheticals.cache_clear()
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_for_comparison(text: str) -> str:
     text = text.lower()
 
     # Replace apostrophes with spaces
@@ -399,6 +432,11 @@ def normalize_for_comparison(text: str) -> str:
     return text
 
 
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _strip_parentheticals(normalized: str) -> str:
+    return _PARENTHETICAL_RE.sub(' ', normalized).strip()
+
+
 def calculate_similarity(text1: str, text2: str) -> float:
     """
     Calculate similarity between two strings using fuzzy matching.
@@ -420,10 +458,10 @@ def calculate_similarity(text1: str, text2: str) -> float:
     
     # If score is below threshold, try comparing without parenthetical content
     # This handles cases like "Who Cares?" vs "Who Cares (As Long As You Care For Me)"
-    if score < 80:
+    if score < PARENTHETICAL_RETRY_BELOW:
         # Strip parenthetical content from both
-        stripped1 = re.sub(r'\s*\([^)]*\)\s*', ' ', norm1).strip()
-        stripped2 = re.sub(r'\s*\([^)]*\)\s*', ' ', norm2).strip()
+        stripped1 = _strip_parentheticals(norm1)
+        stripped2 = _strip_parentheticals(norm2)
         
         # Only use stripped comparison if something was actually removed
         if stripped1 != norm1 or stripped2 != norm2:
@@ -435,6 +473,59 @@ def calculate_similarity(text1: str, text2: str) -> float:
     return score
 
 
+def token_sort_matrix(queries: Sequence[str], choices: Sequence[str],
+                      score_cutoff: Optional[float] = None) -> np.ndarray:
+    """
+    fuzz.token_sort_ratio for every (query, choice) pair of already
+    normalized strings, as a len(queries) x len(choices) float matrix.
+
+    Pairs scoring below score_cutoff are reported as 0.
+    """
+    return process.cdist(
+        queries, choices, scorer=fuzz.token_sort_ratio,
+        score_cutoff=score_cutoff, dtype=np.float64
+    )
+
+
+def similarity_matrix(titles: Sequence[str], candidates: Sequence[str],
+                      score_cutoff: Optional[float] = None) -> np.ndarray:
+    """
+    calculate_similarity() for every (title, candidate) pair, vectorized.
+
+    Returns a len(titles) x len(candidates) matrix. Scores at or above
+    score_cutoff equal calculate_similarity() exactly; lower scores may be
+    reported as 0, so only pass a cutoff when comparing against a threshold.
+    """
+    if not titles or not candidates:
+        return np.zeros((len(titles), len(candidates)))
+
+    norm_titles = [normalize_for_comparison(t) for t in titles]
+    norm_candidates = [normalize_for_comparison(c) for c in candidates]
+    # The retry decision needs real scores up to PARENTHETICAL_RETRY_BELOW,
+    # so the first pass never cuts above it: a pair scoring 80-84 under a
+    # cutoff of 85 must stay 80-84, not read as 0 and get retried
+    first_cutoff = (None if score_cutoff is None
+                    else min(score_cutoff, PARENTHETICAL_RETRY_BELOW))
+    scores = token_sort_matrix(norm_titles, norm_candidates, first_cutoff)
+
+    # Parenthetical fallback, only where a side actually had parentheticals
+    stripped_titles = [_strip_parentheticals(n) for n in norm_titles]
+    stripped_candidates = [_strip_parentheticals(n) for n in norm_candidates]
+    title_changed = np.array([a != b for a, b in zip(stripped_titles, norm_titles)])
+    candidate_changed = np.array([a != b for a, b in zip(stripped_candidates, norm_candidates)])
+    retry = (scores < PARENTHETICAL_RETRY_BELOW) & (
+        title_changed[:, None] | candidate_changed[None, :]
+    )
+    if retry.any():
+        stripped = token_sort_matrix(stripped_titles, stripped_candidates, score_cutoff)
+        scores = np.where(retry, np.maximum(scores, stripped), scores)
+
+    # calculate_similarity() scores empty inputs as 0
+    scores[[not t for t in titles], :] = 0
+    scores[:, [not c for c in candidates]] = 0
+    return scores
+
+
 def is_substring_title_match(title1: str, title2: str) -> bool:
     """
     Check if one normalized title is a complete substring of the other.
@@ -543,13 +634,11 @@ def validate_track_match(spotify_track: dict, expected_song: str,
             logger.debug(f"       [Normalization] Spotify:  '{spotify_song}' → '{norm_spotify}'")
     
     # Calculate artist similarity - handle multi-artist tracks
-    individual_artist_scores = [
-        calculate_similarity(expected_artist, spotify_artist)
-        for spotify_artist in spotify_artist_list
-    ]
-    best_individual_match = max(individual_artist_scores) if individual_artist_scores else 0
+    # (each credited artist and the full credit string, scored in one pass)
+    artist_scores = similarity_matrix([expected_artist], spotify_artist_list + [spotify_artists])[0]
+    best_individual_match = float(artist_scores[:-1].max()) if spotify_artist_list else 0
     
-    full_artist_similarity = calculate_similarity(expected_artist, spotify_artists)
+    full_artist_similarity = float(artist_scores[-1])
     
     artist_similarity = max(best_individual_match, full_artist_similarity)
     
@@ -13,9 +13,10 @@ import os
 import json
 import hashlib
 from datetime import datetime, timedelta
-from pathlib import Path
 
-from core.cache_utils import get_cache_dir
+from core import api_cache
+from core.api_cache import CacheKey
+from integrations import rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -45,82 +46,39 @@ class WikipediaSearcher:
         self.cache_days = cache_days
         self.force_refresh = force_refresh        
 
-        # Get cache directories using the shared utility
-        # This ensures we use the persistent disk mount on Render
-        self.cache_dir = get_cache_dir('wikipedia')
-        self.search_cache_dir = self.cache_dir / 'searches'
-        
-        # Create subdirectories
-        self.search_cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        logger.debug(f"Wikipedia cache directory: {self.cache_dir}")        
-        
         # Track whether last operation made an API call
         self.last_made_api_call = False
         
-        # Create cache directories if they don't exist
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.search_cache_dir = self.cache_dir / 'searches'
-        self.search_cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        logger.debug(f"Wikipedia cache: {self.cache_dir} (expires after {cache_days} days, force_refresh={force_refresh})")
+        logger.debug(f"Wikipedia cache expires after {cache_days} days, force_refresh={force_refresh}")
     
-    def _get_cache_path(self, url):
+    def _get_cache_key(self, url):
         """
-        Get the cache file path for a Wikipedia URL
+        Get the cache key for a Wikipedia URL
         
         Args:
             url: Wikipedia URL
             
         Returns:
-            Path object for the cache file
+            CacheKey for the api_cache entry
         """
-        # Create a safe filename from the URL using hash
+        # Key on a hash of the URL, with a human-readable part from the URL
         url_hash = hashlib.md5(url.encode()).hexdigest()
-        # Also include a human-readable part from the URL
         url_part = url.split('/')[-1][:50]  # Last part of URL, max 50 chars
-        filename = f"{url_part}_{url_hash}.json"
-        return self.cache_dir / filename
+        return CacheKey('wikipedia', f"{url_part}_{url_hash}")
     
-    def _get_search_cache_path(self, search_query):
+    def _get_search_cache_key(self, search_query):
         """
-        Get the cache file path for a search query
+        Get the cache key for a search query
         
         Args:
             search_query: Search query string
             
         Returns:
-            Path object for the cache file
+            CacheKey for the api_cache entry
         """
         query_hash = hashlib.md5(search_query.encode()).hexdigest()
         safe_query = re.sub(r'[^a-zA-Z0-9_-]', '_', search_query.lower())[:50]
-        filename = f"search_{safe_query}_{query_hash}.json"
-        return self.search_cache_dir / filename
-    
-    def _is_cache_valid(self, cache_path):
-        """
-        Check if cache file exists and is not expired
-        
-        Args:
-            cache_path: Path to cache file
-            
-        Returns:
-            bool: True if cache is valid and not expired
-        """
-        if not cache_path.exists():
-            return False
-        
-        # Check file modification time
-        mtime = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        age = datetime.now() - mtime
-        
-        is_valid = age.days < self.cache_days
-        if is_valid:
-            logger.debug(f"Cache valid (age: {age.days} days): {cache_path.name}")
-        else:
-            logger.debug(f"Cache expired (age: {age.days} days): {cache_path.name}")
-        
-        return is_valid
+        return CacheKey('wikipedia', f"searches/search_{safe_query}_{query_hash}")
     
     def _load_from_cache(self, url):
         """
@@ -132,19 +90,10 @@ class WikipediaSearcher:
         Returns:
             dict with 'html' and 'fetched_at', or None if not in cache
         """
-        cache_path = self._get_cache_path(url)
-        
-        if not self._is_cache_valid(cache_path):
-            return None
-        
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-                logger.debug(f"Loaded from cache: {url}")
-                return cache_data
-        except Exception as e:
-            logger.warning(f"Failed to load cache file {cache_path}: {e}")
-            return None
+        cache_data = api_cache.get(self._get_cache_key(url), max_age_days=self.cache_days)
+        if cache_data is not None:
+            logger.debug(f"Loaded from cache: {url}")
+        return cache_data
     
     def _save_to_cache(self, url, html_content):
         """
@@ -154,55 +103,32 @@ class WikipediaSearcher:
             url: Wikipedia URL
             html_content: HTML content to cache
         """
-        cache_path = self._get_cache_path(url)
-        
-        try:
-            cache_data = {
-                'url': url,
-                'html': html_content,
-                'fetched_at': datetime.now().isoformat()
-            }
-            
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
+        cache_data = {
+            'url': url,
+            'html': html_content,
+            'fetched_at': datetime.now().isoformat()
+        }
+        if api_cache.set(self._get_cache_key(url), cache_data):
             logger.debug(f"Saved to cache: {url}")
-        except Exception as e:
-            logger.warning(f"Failed to save cache file {cache_path}: {e}")
     
     def _load_search_from_cache(self, search_query):
         """Load search results from cache"""
-        cache_path = self._get_search_cache_path(search_query)
-        
-        if not self._is_cache_valid(cache_path):
-            return None
-        
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-                logger.debug(f"Loaded search from cache: {search_query}")
-                return cache_data.get('results')
-        except Exception as e:
-            logger.warning(f"Failed to load search cache: {e}")
+        cache_data = api_cache.get(self._get_search_cache_key(search_query),
+                                   max_age_days=self.cache_days)
+        if cache_data is None:
             return None
+        logger.debug(f"Loaded search from cache: {search_query}")
+        return cache_data.get('results')
     
     def _save_search_to_cache(self, search_query, search_results):
         """Save search results to cache"""
-        cache_path = self._get_search_cache_path(search_query)
-        
-        try:
-            cache_data = {
-                'query': search_query,
-                'results': search_results,
-                'cached_at': datetime.now().isoformat()
-            }
-            
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
+        cache_data = {
+            'query': search_query,
+            'results': search_results,
+            'cached_at': datetime.now().isoformat()
+        }
+        if api_cache.set(self._get_search_cache_key(search_query), cache_data):
             logger.debug(f"Saved search to cache: {search_query}")
-        except Exception as e:
-            logger.warning(f"Failed to save search cache: {e}")
     
     def _fetch_wikipedia_page(self, url):
         """
@@ -244,12 +170,10 @@ class WikipediaSearcher:
             return None
     
     def rate_limit(self):
-        """Enforce rate limiting for Wikipedia API"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            sleep_time = self.min_request_interval - elapsed
-            logger.debug("sleeping in rate_limit")
-            time.sleep(sleep_time)
+        """Enforce rate limiting for Wikipedia API (shared across all clients)"""
+        rate_limiter.get_bucket(
+            rate_limiter.WIKIPEDIA, min_interval=self.min_request_interval
+        ).acquire()
         self.last_request_time = time.time()
 
     def verify_wikipedia_reference(self, performer_name, wikipedia_url, context):
@@ -37,7 +37,7 @@ from core.auth_utils import (
     ADMIN_CSRF_COOKIE,
     decode_token,
 )
-from db_utils import get_db_connection
+from core.principal_cache import refresh_principal
 
 
 logger = logging.getLogger(__name__)
@@ -104,18 +104,13 @@ def _forbidden(message: str = 'Admin access required'):
 
 
 def _load_user(user_id: str):
-    """Return the user dict if active + unlocked + admin, else None."""
-    with get_db_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT id, email, display_name, is_active, account_locked, is_admin
-                FROM users
-                WHERE id = %s
-                """,
-                (user_id,),
-            )
-            user = cur.fetchone()
+    """Return the user dict if active + unlocked + admin, else None.
+
+    Always reads the row fresh (admin traffic is light and a revoked admin
+    must lose access at once) and refreshes the cached principal the
+    public auth middleware uses with what it saw.
+    """
+    user = refresh_principal(user_id)
 
     if not user or not user['is_active'] or user['account_locked']:
         return None
@@ -4,6 +4,9 @@ Authentication middleware for protecting Flask routes
 This module provides decorators for:
 - require_auth: Require valid JWT access token
 - optional_auth: Load user if token present, but don't require it
+
+The users row behind a token is read through core.principal_cache, so
+repeat requests from a signed-in user don't take a pooled connection.
 """
 
 from functools import wraps
@@ -15,7 +18,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.auth_utils import decode_token
-from db_utils import get_db_connection
+from core.principal_cache import get_principal
 
 
 def require_auth(f):
@@ -57,30 +60,24 @@ def require_auth(f):
             if payload.get('type') != 'access':
                 return jsonify({'error': 'Invalid token type'}), 401
             
-            # Load user from database
+            # Load user (cached principal, else database)
             user_id = payload['user_id']
+            user = get_principal(user_id)
             
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT id, email, display_name, is_active, account_locked
-                        FROM users
-                        WHERE id = %s
-                    """, (user_id,))
-                    
-                    user = cur.fetchone()
-                    
-                    if not user:
-                        return jsonify({'error': 'User not found'}), 401
-                    
-                    if not user['is_active']:
-                        return jsonify({'error': 'Account is inactive'}), 401
-                    
-                    if user['account_locked']:
-                        return jsonify({'error': 'Account is locked'}), 401
-                    
-                    # Store user in Flask's g object for use in route
-                    g.current_user = user
+            if not user:
+                return jsonify({'error': 'User not found'}), 401
+            
+            if not user['is_active']:
+                return jsonify({'error': 'Account is inactive'}), 401
+            
+            if user['account_locked']:
+                return jsonify({'error': 'Account is locked'}), 401
+            
+            # Store user in Flask's g object for use in route
+            g.current_user = {
+                key: user[key]
+                for key in ('id', 'email', 'display_name', 'is_active', 'account_locked')
+            }
             
             return f(*args, **kwargs)
             
@@ -122,19 +119,11 @@ def optional_auth(f):
                     payload = decode_token(token)
                     
                     if payload.get('type') == 'access':
-                        user_id = payload['user_id']
-                        
-                        with get_db_connection() as conn:
-                            with conn.cursor() as cur:
-                                cur.execute("""
-                                    SELECT id, email, display_name
-                                    FROM users
-                                    WHERE id = %s AND is_active = true
-                                """, (user_id,))
-                                
-                                user = cur.fetchone()
-                                if user:
-                                    g.current_user = user
+                        user = get_principal(payload['user_id'])
+                        if user and user['is_active']:
+                            g.current_user = {
+                                key: user[key] for key in ('id', 'email', 'display_name')
+                            }
             except:
                 pass  # Invalid token, but that's okay for optional auth
         
@@ -7,12 +7,13 @@ app in ``app.py`` and used as a decorator on the endpoints that need it
 
 Design notes:
 
-- Storage is in-memory by default. The backend runs under gunicorn with
-  ``workers = 1`` (see ``gunicorn.conf.py``) so one shared in-memory
-  counter is authoritative. If you ever scale to multiple workers or
-  multiple instances, set ``RATELIMIT_STORAGE_URI=redis://...`` in the
-  environment — Flask-Limiter will pick it up automatically and no code
-  change is required.
+- Counters are stored in Postgres by default (``app-postgres://``, see
+  ``core/rate_limit_storage.py``). The backend runs several gunicorn
+  workers (see ``gunicorn.conf.py``), and per-process ``memory://``
+  counters would multiply every limit by the worker count. Set
+  ``RATELIMIT_STORAGE_URI`` to override (``redis://...`` if one is ever
+  added, ``memory://`` for a single-process dev server). Storage errors
+  are logged and the request is let through rather than failing it.
 
 - Rate limits are identified by real client IP. The backend runs behind
   Render's reverse proxy, so ``request.remote_addr`` by itself reports
@@ -40,6 +41,9 @@ from flask import jsonify, request
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 
+# Registers the app-postgres:// storage scheme with the limits package
+import core.rate_limit_storage  # noqa: F401
+
 logger = logging.getLogger(__name__)
 
 
@@ -101,12 +105,14 @@ def _user_id_or_ip_key():
 # sees the real client IP from the very first request.
 
 _enabled = os.environ.get('RATELIMIT_ENABLED', 'true').lower() != 'false'
+_storage_uri = os.environ.get('RATELIMIT_STORAGE_URI', 'app-postgres://')
 
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=[],          # No blanket default — we set limits per-route.
-    storage_uri=os.environ.get('RATELIMIT_STORAGE_URI', 'memory://'),
+    storage_uri=_storage_uri,
     enabled=_enabled,
+    swallow_errors=True,        # A storage outage shouldn't take login down.
     headers_enabled=True,       # Emit X-RateLimit-* headers on each response,
                                 # so well-behaved clients can back off voluntarily.
     strategy='fixed-window',    # Simplest and most predictable. Sliding-window
@@ -147,6 +153,5 @@ def init_rate_limiter(app):
         )
     else:
         logger.info(
-            "Rate limiting is enabled. Storage: "
-            f"{os.environ.get('RATELIMIT_STORAGE_URI', 'memory://')}"
+            f"Rate limiting is enabled. Storage: {_storage_uri}"
         )
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Research Worker Process
+Drains the research_jobs queue outside the web tier
+
+Research (MusicBrainz imports, Spotify/Apple matching, cover art) used to run
+as a thread inside the gunicorn worker, so a long import competed with API
+requests for the GIL and the connection pool. This is its own process with its
+own pool; the web tier only enqueues jobs and reads their status, both through
+the research_jobs table (see core/research_queue.py).
+
+Usage:
+    python research_worker.py                 # Procfile: worker
+    RESEARCH_WORKER_THREADS=2 python research_worker.py
+
+Runs until SIGTERM/SIGINT, then lets the current jobs' threads wind down.
+A job interrupted mid-run stops heartbeating and is re-queued by the next
+worker's stale-job recovery.
+
+Configuration (environment):
+    RESEARCH_WORKER_THREADS   worker threads in this process (default: 1)
+    RESEARCH_DB_POOL_MAX_SIZE pool size for this process (default: threads x 6
+                              + 2; see _CONNECTIONS_PER_JOB)
+    plus the RESEARCH_* settings documented in core/research_queue.py
+"""
+
+import logging
+import os
+import signal
+import threading
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from config import configure_logging, set_db_pooling_mode  # noqa: E402
+
+# Pooling must be on, and sized for this process, before db_utils is imported
+set_db_pooling_mode()
+_threads = int(os.environ.get('RESEARCH_WORKER_THREADS', 1))
+
+# Connections one running job can hold at once: the MusicBrainz import, one
+# per ReleaseStage thread (Spotify, Apple Music, Cover Art Archive; see
+# core/song_research.py), one for a progress flush or cache_bus publish in
+# between, and one that those threads take in turn for a few milliseconds
+# per outbound request (the shared buckets in integrations/rate_limiter.py).
+# An undersized pool stalls those for up to its 30s timeout.
+_CONNECTIONS_PER_JOB = 6
+
+# Process-wide: the keepalive thread and the maintenance heartbeat
+_MAINTENANCE_CONNECTIONS = 2
+
+os.environ['DB_POOL_MAX_SIZE'] = os.environ.get(
+    'RESEARCH_DB_POOL_MAX_SIZE',
+    str(_threads * _CONNECTIONS_PER_JOB + _MAINTENANCE_CONNECTIONS)
+)
+
+import db_utils as db_tools  # noqa: E402
+from core import research_queue  # noqa: E402
+from core import song_research  # noqa: E402
+
+logger = configure_logging()
+
+_shutdown = threading.Event()
+
+
+def _handle_signal(signum, frame):
+    logger.info(f"Research worker received signal {signum}, shutting down...")
+    _shutdown.set()
+
+
+def main() -> int:
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
+    logger.info(f"=== Research worker process starting in PID {os.getpid()} ({_threads} thread(s)) ===")
+    if not db_tools.init_connection_pool():
+        logger.error("Could not connect to the database; exiting")
+        return 1
+    db_tools.start_keepalive_thread()
+
+    research_queue.start_worker(
+        song_research.research_song,
+        num_threads=_threads,
+        job_handlers=song_research.JOB_HANDLERS,
+    )
+    try:
+        _shutdown.wait()
+    finally:
+        research_queue.stop_worker()
+        db_tools.stop_keepalive_thread()
+        db_tools.close_connection_pool()
+        logger.info("=== Research worker process stopped ===")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -22,12 +22,16 @@ from integrations.musicbrainz.release_importer import MBReleaseImporter
 from integrations.musicbrainz.performer_importer import PerformerImporter
 from integrations.musicbrainz.utils import MusicBrainzSearcher
 from integrations.spotify.db import is_track_manual_override
+from core.response_cache import invalidate_on_write
+from core import db_profiler, research_queue
+from core.authority_matcher import AuthorityRecommendationMatcher
 from core.spotify_rematch import (
     run_spotify_rematch_for_song,
     save_run,
     list_runs_for_song,
     list_all_runs,
     load_run,
+    count_runs,
 )
 
 logger = logging.getLogger(__name__)
@@ -35,6 +39,20 @@ logger = logging.getLogger(__name__)
 admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
 
 
+# Endpoints that POST without touching catalog data
+_CACHE_NEUTRAL_ENDPOINTS = {
+    'admin.admin_login_submit', 'admin.admin_logout', 'admin.performance_reset',
+}
+
+
+@admin_bp.after_request
+def invalidate_response_cache(response):
+    """Admin actions edit catalog data; drop affected cached responses"""
+    if request.endpoint in _CACHE_NEUTRAL_ENDPOINTS:
+        return response
+    return invalidate_on_write(response)
+
+
 @admin_bp.route('/')
 def admin_index():
     """Admin dashboard with links to all admin services"""
@@ -1570,12 +1588,6 @@ def run_matcher_for_song(song_id):
     This re-attempts to match unmatched recommendations to recordings.
     """
     try:
-        # Import the matcher class
-        import sys
-        from pathlib import Path
-        sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
-        from jazzs_match_authorityrecs import AuthorityRecommendationMatcher
-
         with get_db_connection() as db:
             with db.cursor() as cur:
                 # Get song name
@@ -1587,11 +1599,12 @@ def run_matcher_for_song(song_id):
 
                 song_name = song['title']
 
-        # Run the matcher for this song
+        # Run the matcher for this song (one song's index is quick to build,
+        # so this stays synchronous)
         matcher = AuthorityRecommendationMatcher(
             dry_run=False,
             min_confidence='medium',
-            song_name=song_name,
+            song_id=song_id,
             strategy='performer'
         )
         matcher.run()
@@ -1612,31 +1625,39 @@ def run_matcher_for_song(song_id):
 @admin_bp.route('/recommendations/run-matcher-all', methods=['POST'])
 def run_matcher_all():
     """
-    Run the authority recommendation matcher for all songs with unmatched recommendations.
+    Queue the authority recommendation matcher for every song with unmatched
+    recommendations. Each song is one job on the research queue, run by the
+    research worker process.
     """
     try:
-        # Import the matcher class
-        import sys
-        from pathlib import Path
-        sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
-        from jazzs_match_authorityrecs import AuthorityRecommendationMatcher
+        with get_db_connection() as db:
+            with db.cursor() as cur:
+                cur.execute("""
+                    SELECT s.id, s.title
+                    FROM songs s
+                    WHERE EXISTS (
+                        SELECT 1 FROM song_authority_recommendations sar
+                        WHERE sar.song_id = s.id AND sar.recording_id IS NULL
+                    )
+                    ORDER BY s.title
+                """)
+                songs = cur.fetchall()
 
-        # Run the matcher for all songs
-        matcher = AuthorityRecommendationMatcher(
-            dry_run=False,
-            min_confidence='medium',
-            song_name=None,  # No filter = all songs
-            strategy='performer'
+        queued_count = research_queue.add_songs_to_queue(
+            songs, kind=research_queue.KIND_AUTHORITY_MATCH
         )
-        matcher.run()
+        logger.info(f"Admin: Queued {queued_count}/{len(songs)} songs for authority matching")
 
         return jsonify({
             'success': True,
-            'stats': matcher.stats
-        })
+            'total_songs': len(songs),
+            'songs_queued': queued_count,
+            'queue_size': research_queue.get_queue_size(research_queue.KIND_AUTHORITY_MATCH),
+            'worker_active': bool(research_queue.get_worker_processes())
+        }), 202  # 202 Accepted - the research worker runs the jobs
 
     except Exception as e:
-        logger.error(f"Error running matcher for all songs: {e}")
+        logger.error(f"Error queueing matcher for all songs: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
@@ -2128,51 +2149,26 @@ def streaming_availability():
 
     with get_db_connection() as db:
         with db.cursor() as cur:
-            # Build the base query
-            # We need to count recordings that have track-level streaming links
-            #
-            # DATA MODELS:
-            # - Both Spotify and Apple Music use recording_release_streaming_links
-            # - Spotify also has legacy spotify_track_id column (checked for backwards compatibility)
-            #
-            # First aggregate streaming availability at the recording level,
-            # then count recordings per song. This avoids double-counting when
-            # a recording has multiple releases with different streaming status.
+            # Per-song counts come from the song_streaming_stats rollup
+            # (sql/migrations/020), kept current by triggers on every
+            # streaming link write and reconciled by the research worker.
+            # Songs without a rollup row yet (no recordings) read as zeros.
             query = """
-                WITH recording_streaming AS (
-                    -- Determine if each recording has Spotify/Apple across ANY of its releases
-                    SELECT
-                        r.id as recording_id,
-                        r.song_id,
-                        -- Has Spotify: check streaming_links table
-                        BOOL_OR(rrsl_spotify.id IS NOT NULL) as has_spotify,
-                        -- Has Apple if ANY release has apple music link
-                        BOOL_OR(rrsl_apple.id IS NOT NULL) as has_apple
-                    FROM recordings r
-                    LEFT JOIN recording_releases rr ON rr.recording_id = r.id
-                    LEFT JOIN recording_release_streaming_links rrsl_spotify
-                        ON rrsl_spotify.recording_release_id = rr.id
-                        AND rrsl_spotify.service = 'spotify'
-                    LEFT JOIN recording_release_streaming_links rrsl_apple
-                        ON rrsl_apple.recording_release_id = rr.id
-                        AND rrsl_apple.service = 'apple_music'
-                    GROUP BY r.id, r.song_id
-                ),
-                song_recording_counts AS (
+                SELECT * FROM (
                     SELECT
                         s.id as song_id,
                         s.title,
                         s.composer,
-                        COUNT(rs.recording_id) as total_recordings,
-                        COUNT(CASE WHEN rs.has_spotify THEN 1 END) as spotify_recordings,
-                        COUNT(CASE WHEN rs.has_apple THEN 1 END) as apple_recordings,
-                        COUNT(CASE WHEN rs.has_spotify AND rs.has_apple THEN 1 END) as both_recordings,
-                        COUNT(CASE WHEN rs.has_spotify OR rs.has_apple THEN 1 END) as any_playable_recordings,
-                        COUNT(CASE WHEN NOT rs.has_spotify AND NOT rs.has_apple THEN 1 END) as no_streaming_recordings,
-                        COUNT(CASE WHEN rs.has_spotify AND NOT rs.has_apple THEN 1 END) as spotify_only_recordings,
-                        COUNT(CASE WHEN NOT rs.has_spotify AND rs.has_apple THEN 1 END) as apple_only_recordings
+                        COALESCE(sss.total_recordings, 0) as total_recordings,
+                        COALESCE(sss.spotify_recordings, 0) as spotify_recordings,
+                        COALESCE(sss.apple_recordings, 0) as apple_recordings,
+                        COALESCE(sss.both_recordings, 0) as both_recordings,
+                        COALESCE(sss.any_playable_recordings, 0) as any_playable_recordings,
+                        COALESCE(sss.no_streaming_recordings, 0) as no_streaming_recordings,
+                        COALESCE(sss.spotify_only_recordings, 0) as spotify_only_recordings,
+                        COALESCE(sss.apple_only_recordings, 0) as apple_only_recordings
                     FROM songs s
-                    LEFT JOIN recording_streaming rs ON rs.song_id = s.id
+                    LEFT JOIN song_streaming_stats sss ON sss.song_id = s.id
             """
 
             # Add repertoire join if filtering
@@ -2185,9 +2181,7 @@ def streaming_availability():
                 params.append(repertoire_id)
 
             query += """
-                    GROUP BY s.id, s.title, s.composer
-                )
-                SELECT * FROM song_recording_counts
+                ) song_recording_counts
             """
 
             # Add filter conditions
@@ -2949,6 +2943,29 @@ def users_list():
     )
 
 
+# ============================================================================
+# Database Performance
+#
+# Report from core.db_profiler: heaviest statements and per-endpoint query
+# counts for the gunicorn worker that serves the page.
+# ============================================================================
+
+@admin_bp.route('/performance')
+def performance():
+    """Slow statements and likely N+1 endpoints (this worker's view)"""
+    report = db_profiler.get_report()
+    if request.args.get('format') == 'json':
+        return jsonify(report)
+    return render_template('admin/performance.html', report=report)
+
+
+@admin_bp.route('/performance/reset', methods=['POST'])
+def performance_reset():
+    """Start a fresh profiling window in this worker"""
+    db_profiler.reset()
+    return jsonify({'success': True})
+
+
 # ============================================================================
 # Spotify Rematch Diagnostics
 #
@@ -2957,6 +2974,19 @@ def users_list():
 # logic lives in core.spotify_rematch; the backfill script uses it too.
 # ============================================================================
 
+RUN_HISTORY_PER_PAGE = 25
+
+
+def _run_history_page(total: int):
+    """(page, total_pages) for a run history list, from ?page="""
+    try:
+        page = max(1, int(request.args.get('page', 1)))
+    except ValueError:
+        page = 1
+    total_pages = max(1, (total + RUN_HISTORY_PER_PAGE - 1) // RUN_HISTORY_PER_PAGE)
+    return min(page, total_pages), total_pages
+
+
 @admin_bp.route('/spotify-rematch')
 def spotify_rematch_list():
     """
@@ -3016,13 +3046,18 @@ def spotify_rematch_list():
                 """)
             songs = [dict(row) for row in cur.fetchall()]
 
-    recent_runs = list_all_runs(limit=25)
+    page, total_pages = _run_history_page(count_runs())
+    recent_runs = list_all_runs(
+        limit=RUN_HISTORY_PER_PAGE, offset=(page - 1) * RUN_HISTORY_PER_PAGE
+    )
 
     return render_template(
         'admin/spotify_rematch_list.html',
         songs=songs,
         search=search,
         recent_runs=recent_runs,
+        page=page,
+        total_pages=total_pages,
     )
 
 
@@ -3043,6 +3078,8 @@ def spotify_rematch_detail(song_id):
                     song=None,
                     summary=None,
                     runs=[],
+                    page=1,
+                    total_pages=1,
                 ), 404
 
             # Current state summary — no snapshot, just aggregate counts.
@@ -3075,13 +3112,18 @@ def spotify_rematch_detail(song_id):
             """, (song_id,))
             summary = dict(cur.fetchone() or {})
 
-    runs = list_runs_for_song(song_id)
+    page, total_pages = _run_history_page(count_runs(song_id))
+    runs = list_runs_for_song(
+        song_id, limit=RUN_HISTORY_PER_PAGE, offset=(page - 1) * RUN_HISTORY_PER_PAGE
+    )
 
     return render_template(
         'admin/spotify_rematch_detail.html',
         song=dict(song),
         summary=summary,
         runs=runs,
+        page=page,
+        total_pages=total_pages,
     )
 
 
@@ -43,6 +43,7 @@ from core.auth_utils import (
     ADMIN_CSRF_COOKIE,
 )
 from middleware.admin_middleware import cookie_secure, generate_csrf_token
+from core.principal_cache import invalidate_user
 from rate_limit import limiter, LOGIN_LIMIT
 
 # Google OAuth: accept tokens from both the iOS/Mac client and the web client.
@@ -289,6 +290,7 @@ def _login_password(*, email: str, password: str, wants_json: bool):
                         (user['id'],),
                     )
                     conn.commit()
+                    invalidate_user(user['id'])
                     return _respond_login_failed(wants_json, 401, 'Invalid credentials')
 
                 if not user['is_admin']:
@@ -26,6 +26,7 @@ from core.auth_utils import (
     decode_token
 )
 from middleware.auth_middleware import require_auth
+from core.principal_cache import invalidate_user
 from core.email_service import send_welcome_email
 from rate_limit import (
     limiter,
@@ -225,6 +226,7 @@ def login():
                         WHERE id = %s
                     """, (user['id'],))
                     conn.commit()
+                    invalidate_user(user['id'])
                     
                     return jsonify({'error': 'Invalid credentials'}), 401
                 
@@ -16,9 +16,11 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from db_utils import get_db_connection
+from core.response_cache import invalidate_on_write
 
 logger = logging.getLogger(__name__)
 authorities_bp = Blueprint('authorities', __name__)
+authorities_bp.after_request(invalidate_on_write)
 
 
 # =============================================================================
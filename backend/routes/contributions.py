@@ -7,15 +7,18 @@ CRUD operations for user-contributed recording metadata:
 - Tempo (BPM)
 - Instrumental/Vocal flag
 
-Contributions are aggregated using simple majority consensus.
+Contributions are aggregated using simple majority consensus, kept in the
+recording_consensus table by database triggers.
 """
 from flask import Blueprint, jsonify, request, g
 import logging
 import db_utils as db_tools
 from middleware.auth_middleware import require_auth, optional_auth
+from core.response_cache import invalidate_on_write
 
 logger = logging.getLogger(__name__)
 contributions_bp = Blueprint('contributions', __name__)
+contributions_bp.after_request(invalidate_on_write)
 
 # Valid performance keys (using flats for consistency)
 # Major keys use root note only, minor keys use 'm' suffix
@@ -34,53 +37,29 @@ MAX_TEMPO = 400
 
 def get_consensus_data(recording_id):
     """
-    Calculate consensus values for a recording's community-contributed metadata.
+    Read consensus values for a recording's community-contributed metadata.
 
     Uses simple majority (mode) for key, tempo marking, and instrumental/vocal.
-    Ties are broken by most recent update.
+    Ties are broken by most recent update. The values live in
+    recording_consensus, which triggers on recording_contributions keep
+    current (sql/migrations/023_recording_consensus.sql), so this is a
+    primary-key read; a recording with no contributions has no row.
 
     Returns dict with consensus values and counts.
     """
     query = """
         SELECT
-            -- Mode for performance_key (most common, ties broken by most recent)
-            (SELECT performance_key
-             FROM recording_contributions
-             WHERE recording_id = %s AND performance_key IS NOT NULL
-             GROUP BY performance_key
-             ORDER BY COUNT(*) DESC, MAX(updated_at) DESC
-             LIMIT 1) as consensus_key,
-
-            -- Mode for tempo_marking (most common, ties broken by most recent)
-            (SELECT tempo_marking
-             FROM recording_contributions
-             WHERE recording_id = %s AND tempo_marking IS NOT NULL
-             GROUP BY tempo_marking
-             ORDER BY COUNT(*) DESC, MAX(updated_at) DESC
-             LIMIT 1) as consensus_tempo_marking,
-
-            -- Mode for is_instrumental (most common, ties broken by most recent)
-            (SELECT is_instrumental
-             FROM recording_contributions
-             WHERE recording_id = %s AND is_instrumental IS NOT NULL
-             GROUP BY is_instrumental
-             ORDER BY COUNT(*) DESC, MAX(updated_at) DESC
-             LIMIT 1) as consensus_instrumental,
-
-            -- Contribution counts per field
-            (SELECT COUNT(*) FROM recording_contributions
-             WHERE recording_id = %s AND performance_key IS NOT NULL) as key_count,
-            (SELECT COUNT(*) FROM recording_contributions
-             WHERE recording_id = %s AND tempo_marking IS NOT NULL) as tempo_count,
-            (SELECT COUNT(*) FROM recording_contributions
-             WHERE recording_id = %s AND is_instrumental IS NOT NULL) as instrumental_count
+            performance_key as consensus_key,
+            tempo_marking as consensus_tempo_marking,
+            is_instrumental as consensus_instrumental,
+            key_count,
+            tempo_count,
+            instrumental_count
+        FROM recording_consensus
+        WHERE recording_id = %s
     """
 
-    result = db_tools.execute_query(
-        query,
-        (recording_id, recording_id, recording_id, recording_id, recording_id, recording_id),
-        fetch_one=True
-    )
+    result = db_tools.execute_query(query, (recording_id,), fetch_one=True)
 
     if not result:
         return {
@@ -3,6 +3,9 @@ from flask import Blueprint, jsonify
 import logging
 import time
 import db_utils as db_tools
+from core.response_cache import get_cache_stats
+from core import cache_bus, principal_cache
+from integrations import rate_limiter
 
 logger = logging.getLogger(__name__)
 health_bp = Blueprint('health', __name__)
@@ -31,6 +34,10 @@ def health_check():
             'pool_available': pool_stats.get('pool_available', 0),
             'requests_waiting': pool_stats.get('requests_waiting', 0)
         }
+        health_status['response_cache'] = get_cache_stats()
+        health_status['auth_principal_cache'] = principal_cache.get_cache_stats()
+        health_status['cache_bus'] = cache_bus.get_stats()
+        health_status['outbound_rate_limits'] = rate_limiter.get_stats()
         
         # Test database connection
         result = db_tools.execute_query("SELECT version(), current_timestamp", fetch_one=True)
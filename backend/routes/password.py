@@ -19,6 +19,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db_utils import get_db_connection
 from core.auth_utils import hash_password, verify_password, generate_reset_token
 from middleware.auth_middleware import require_auth
+from core.principal_cache import invalidate_user
 from core.email_service import send_password_reset_email
 from rate_limit import (
     limiter,
@@ -163,6 +164,7 @@ def reset_password():
                 """, (token,))
                 
                 conn.commit()
+                invalidate_user(user_id)
                 
                 logger.info(f"Password reset completed for user: {user_id}")
                 
@@ -239,6 +241,7 @@ def change_password():
                 """, (new_password_hash, user_id))
                 
                 conn.commit()
+                invalidate_user(user_id)
                 
                 logger.info(f"Password changed for user: {user_id}")
                 
@@ -1,27 +1,158 @@
 # routes/performers.py
 from flask import Blueprint, jsonify, request, g
 import logging
+import time
+from uuid import UUID
 import db_utils as db_tools
 from utils.helpers import safe_strip
 from middleware.auth_middleware import require_auth
+from core.response_cache import cached_response, invalidate_on_write, TAG_INDEX
+from core import json_stream, pagination, search
+from core.json_stream import compressed_response
 
 logger = logging.getLogger(__name__)
 performers_bp = Blueprint('performers', __name__)
+performers_bp.after_request(invalidate_on_write)
 
 # Performer endpoints:
 # - GET /performers              - List performers (supports pagination via limit/offset)
 # - GET /performers/index        - Lightweight list (id, name, sort_name only) for alphabet index
 # - POST /performers             - Create a new performer
 # - GET /performers/<performer_id> - Get performer details
+# - GET /performers/<performer_id>/recordings       - Recording list rows (keyset pages via limit/after)
+# - GET /performers/<performer_id>/recordings/shell - Metadata-only rows; hydrate via /recordings/batch
 # - GET /performers/search       - Search performers by name
 
+
+# ============================================================================
+# PERFORMER RECORDINGS
+# ============================================================================
+# One row per recording the performer plays on. Cover art and album info
+# come from the trigger-maintained recording_list_rows projection
+# (sql/migrations/015), so art is resolved once per recording at write
+# time instead of by four correlated release_imagery subqueries per row.
+#
+# Rows are ordered by a key with no NULLs and a recording-id tiebreaker so
+# that pages can resume with a row comparison (keyset pagination):
+#   year: recording_year DESC NULLS LAST, song title, id
+#   name: song title, recording_year DESC NULLS LAST, id
+# -COALESCE(year, -1) sorts ascending exactly like year DESC NULLS LAST.
+
+_YEAR_KEY_SQL = "-COALESCE(r.recording_year, -1)"
+
+PERFORMER_RECORDING_SORT_KEYS = {
+    'year': (_YEAR_KEY_SQL, 's.title', 'r.id'),
+    'name': ('s.title', _YEAR_KEY_SQL, 'r.id'),
+}
+
+# Types of those key values, for validating ?after= cursors
+PERFORMER_RECORDING_CURSOR_TYPES = {
+    'year': (int, str, UUID),
+    'name': (str, int, UUID),
+}
+
+# A performer credited more than once on a recording (several
+# instruments or roles) gets one row, with their most prominent role
+PERFORMER_RECORDINGS_CTE_SQL = """
+    performer_recordings AS (
+        SELECT
+            rp.recording_id,
+            (array_agg(rp.role ORDER BY
+                CASE rp.role WHEN 'leader' THEN 1 WHEN 'sideman' THEN 2 ELSE 3 END
+            ))[1] as role
+        FROM recording_performers rp
+        WHERE rp.performer_id = %(performer_id)s
+        GROUP BY rp.recording_id
+    )"""
+
+
+def _sort_param():
+    return 'name' if request.args.get('sort', 'year') == 'name' else 'year'
+
+
+def query_performer_recordings(performer_id, columns, sort_by='year', limit=None, after=None):
+    """
+    Rows for a performer's recordings in sort order.
+
+    Args:
+        columns: SELECT list over r (recordings), s (songs), pr (the
+                 performer's role) and rlr (recording_list_rows)
+        sort_by: 'year' or 'name'
+        limit: Page size; fetches limit + 1 rows so the caller can tell
+               whether there is a next page. None returns every row.
+        after: Sort key of the last row of the previous page
+               (from pagination.decode_cursor)
+    """
+    key = PERFORMER_RECORDING_SORT_KEYS[sort_by]
+    params = {'performer_id': performer_id}
+
+    keyset = ''
+    if after is not None:
+        keyset = f"WHERE ({', '.join(key)}) > (%(after_0)s, %(after_1)s, %(after_2)s::uuid)"
+        params.update({f'after_{i}': value for i, value in enumerate(after)})
+
+    query = f"""
+        WITH {PERFORMER_RECORDINGS_CTE_SQL}
+        SELECT {columns},
+               {key[0]} as sort_key_0, {key[1]} as sort_key_1
+        FROM performer_recordings pr
+        JOIN recordings r ON r.id = pr.recording_id
+        JOIN songs s ON s.id = r.song_id
+        LEFT JOIN recording_list_rows rlr ON rlr.recording_id = r.id
+        {keyset}
+        ORDER BY {', '.join(key)}
+    """
+    if limit is not None:
+        query += "LIMIT %(limit)s"
+        params['limit'] = limit + 1
+
+    return db_tools.execute_query(query, params)
+
+
+def _sort_key(row):
+    """Cursor key of a row from query_performer_recordings()"""
+    return (row['sort_key_0'], row['sort_key_1'], row['recording_id'])
+
+
+def _strip_sort_keys(rows):
+    for row in rows:
+        row.pop('sort_key_0', None)
+        row.pop('sort_key_1', None)
+    return rows
+
+
+PERFORMER_RECORDING_COLUMNS_SQL = """
+    s.id as song_id,
+    s.title as song_title,
+    r.id as recording_id,
+    rlr.album_title,
+    rlr.artist_credit,
+    r.recording_year,
+    r.is_canonical,
+    pr.role,
+    rlr.best_cover_art_small,
+    rlr.best_cover_art_medium"""
+
+# Shell: what the performer page needs to group, sort and count rows.
+# Album title/artist credit and cover art come from GET /recordings/batch.
+PERFORMER_RECORDING_SHELL_COLUMNS_SQL = """
+    r.id as recording_id,
+    s.id as song_id,
+    s.title as song_title,
+    r.recording_year,
+    r.is_canonical,
+    pr.role"""
+
 @performers_bp.route('/performers', methods=['GET'])
+@compressed_response
 def get_performers():
     """
     Get performers with optional search and pagination.
 
     Query Parameters:
-        search: Filter performers by name (case-insensitive partial match)
+        search: Filter performers by name (typo tolerant, accent-insensitive);
+                results are then ranked by match instead of sort name
+        mode: 'prefix' to match from the start of a word (typeahead)
         limit: Maximum number of results to return (default: no limit for backward compat)
         offset: Number of results to skip (default: 0)
 
@@ -43,12 +174,21 @@ def get_performers():
 
     try:
         # Build WHERE clause
-        where_clause = "WHERE name ILIKE %s" if search_query else ""
-        base_params = (f'%{search_query}%',) if search_query else ()
+        if search_query:
+            clause = search.performer_clause(
+                search_query, prefix=search.is_prefix_mode(request.args.get('mode'))
+            )
+            where_clause = f"WHERE {clause.where}"
+            order_by = f"{clause.score} DESC, COALESCE(sort_name, name)"
+            run = lambda query, **kwargs: search.execute(query, clause.params, **kwargs)
+        else:
+            where_clause = ""
+            order_by = "COALESCE(sort_name, name)"
+            run = lambda query, **kwargs: db_tools.execute_query(query, **kwargs)
 
         # Get total count first
         count_query = f"SELECT COUNT(*) as count FROM performers {where_clause}"
-        count_result = db_tools.execute_query(count_query, base_params if base_params else None, fetch_one=True)
+        count_result = run(count_query, fetch_one=True)
         total_count = count_result['count'] if count_result else 0
 
         # Build main query with pagination
@@ -57,28 +197,26 @@ def get_performers():
                 external_links, wikipedia_url, musicbrainz_id
             FROM performers
             {where_clause}
-            ORDER BY COALESCE(sort_name, name)
+            ORDER BY {order_by}
         """
 
         # Add pagination if limit specified
         if limit is not None:
             query += f" LIMIT {limit} OFFSET {offset}"
-            params = base_params if base_params else None
-        else:
-            params = base_params if base_params else None
-
-        performers = db_tools.execute_query(query, params)
-
-        # Build response with pagination headers
-        response = jsonify(performers)
-        response.headers['X-Total-Count'] = str(total_count)
-
-        if limit is not None:
+            performers = run(query)
+            response = json_stream.rows_response(performers)
             has_more = (offset + len(performers)) < total_count
             response.headers['X-Has-More'] = 'true' if has_more else 'false'
+        elif search_query:
+            response = json_stream.rows_response(run(query))
+            response.headers['X-Has-More'] = 'false'
         else:
+            # Full catalog: streamed from a server-side cursor
+            response = json_stream.stream_query(query)
             response.headers['X-Has-More'] = 'false'
 
+        response.headers['X-Total-Count'] = str(total_count)
+
         # Allow these headers to be read by JavaScript/iOS clients
         response.headers['Access-Control-Expose-Headers'] = 'X-Total-Count, X-Has-More'
 
@@ -235,51 +373,9 @@ def get_performer_detail(performer_id):
         
         # Get recordings (album_title, artist_credit, and album art from default release)
         # Support sort parameter: 'year' (default) or 'name' (by song title)
-        sort_by = request.args.get('sort', 'year')
-
-        if sort_by == 'name':
-            order_clause = "s.title ASC, r.recording_year DESC NULLS LAST"
-        else:
-            order_clause = "r.recording_year DESC NULLS LAST, s.title ASC"
-
-        recordings_query = f"""
-            SELECT DISTINCT s.id as song_id, s.title as song_title,
-                   r.id as recording_id, def_rel.title as album_title,
-                   def_rel.artist_credit as artist_credit,
-                   r.recording_year,
-                   r.is_canonical, rp.role,
-                   COALESCE(
-                       (SELECT ri.image_url_small FROM release_imagery ri
-                        WHERE ri.release_id = r.default_release_id AND ri.type = 'Front'
-                        ORDER BY CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END
-                        LIMIT 1),
-                       (SELECT ri.image_url_small
-                        FROM recording_releases rr_sub
-                        JOIN release_imagery ri ON rr_sub.release_id = ri.release_id
-                        WHERE rr_sub.recording_id = r.id AND ri.type = 'Front'
-                        ORDER BY CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END
-                        LIMIT 1)
-                   ) as best_cover_art_small,
-                   COALESCE(
-                       (SELECT ri.image_url_medium FROM release_imagery ri
-                        WHERE ri.release_id = r.default_release_id AND ri.type = 'Front'
-                        ORDER BY CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END
-                        LIMIT 1),
-                       (SELECT ri.image_url_medium
-                        FROM recording_releases rr_sub
-                        JOIN release_imagery ri ON rr_sub.release_id = ri.release_id
-                        WHERE rr_sub.recording_id = r.id AND ri.type = 'Front'
-                        ORDER BY CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END
-                        LIMIT 1)
-                   ) as best_cover_art_medium
-            FROM recording_performers rp
-            JOIN recordings r ON rp.recording_id = r.id
-            JOIN songs s ON r.song_id = s.id
-            LEFT JOIN releases def_rel ON r.default_release_id = def_rel.id
-            WHERE rp.performer_id = %s
-            ORDER BY {order_clause}
-        """
-        performer['recordings'] = db_tools.execute_query(recordings_query, (performer_id,))
+        performer['recordings'] = _strip_sort_keys(query_performer_recordings(
+            performer_id, PERFORMER_RECORDING_COLUMNS_SQL, _sort_param()
+        ))
         
         # Get images
         images_query = """
@@ -387,8 +483,18 @@ def get_performer_summary(performer_id):
 @performers_bp.route('/performers/<performer_id>/recordings', methods=['GET'])
 def get_performer_recordings(performer_id):
     """
-    Get all recordings for a performer (heavier endpoint, call after summary loads).
+    Get recordings for a performer (heavier endpoint, call after summary loads).
     Supports sorting by 'year' (default) or 'name' (song title).
+
+    Query Parameters:
+        sort: 'year' (default) or 'name'
+        limit: Page size (1-200). Without it every recording is returned.
+        after: next_cursor from the previous page
+
+    Returns:
+        {recordings, recording_count, next_cursor}; next_cursor is null on
+        the last page. recording_count counts the rows in this response -
+        the summary endpoint has the performer's total.
     """
     try:
         # Verify performer exists
@@ -400,56 +506,29 @@ def get_performer_recordings(performer_id):
         if not performer_check:
             return jsonify({'error': 'Performer not found'}), 404
 
-        # Support sort parameter: 'year' (default) or 'name' (by song title)
-        sort_by = request.args.get('sort', 'year')
+        sort_by = _sort_param()
+        paginated = 'limit' in request.args or 'after' in request.args
+        limit = pagination.parse_page_limit(request.args.get('limit')) if paginated else None
+
+        try:
+            after = pagination.decode_cursor(
+                request.args.get('after'), sort_by, PERFORMER_RECORDING_CURSOR_TYPES[sort_by]
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
 
-        if sort_by == 'name':
-            order_clause = "s.title ASC, r.recording_year DESC NULLS LAST"
+        rows = query_performer_recordings(
+            performer_id, PERFORMER_RECORDING_COLUMNS_SQL, sort_by, limit=limit, after=after
+        )
+        if paginated:
+            recordings, next_cursor = pagination.paginate(rows, limit, sort_by, _sort_key)
         else:
-            order_clause = "r.recording_year DESC NULLS LAST, s.title ASC"
-
-        recordings_query = f"""
-            SELECT DISTINCT s.id as song_id, s.title as song_title,
-                   r.id as recording_id, def_rel.title as album_title,
-                   def_rel.artist_credit as artist_credit,
-                   r.recording_year,
-                   r.is_canonical, rp.role,
-                   COALESCE(
-                       (SELECT ri.image_url_small FROM release_imagery ri
-                        WHERE ri.release_id = r.default_release_id AND ri.type = 'Front'
-                        ORDER BY CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END
-                        LIMIT 1),
-                       (SELECT ri.image_url_small
-                        FROM recording_releases rr_sub
-                        JOIN release_imagery ri ON rr_sub.release_id = ri.release_id
-                        WHERE rr_sub.recording_id = r.id AND ri.type = 'Front'
-                        ORDER BY CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END
-                        LIMIT 1)
-                   ) as best_cover_art_small,
-                   COALESCE(
-                       (SELECT ri.image_url_medium FROM release_imagery ri
-                        WHERE ri.release_id = r.default_release_id AND ri.type = 'Front'
-                        ORDER BY CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END
-                        LIMIT 1),
-                       (SELECT ri.image_url_medium
-                        FROM recording_releases rr_sub
-                        JOIN release_imagery ri ON rr_sub.release_id = ri.release_id
-                        WHERE rr_sub.recording_id = r.id AND ri.type = 'Front'
-                        ORDER BY CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END
-                        LIMIT 1)
-                   ) as best_cover_art_medium
-            FROM recording_performers rp
-            JOIN recordings r ON rp.recording_id = r.id
-            JOIN songs s ON r.song_id = s.id
-            LEFT JOIN releases def_rel ON r.default_release_id = def_rel.id
-            WHERE rp.performer_id = %s
-            ORDER BY {order_clause}
-        """
-        recordings = db_tools.execute_query(recordings_query, (performer_id,))
+            recordings, next_cursor = rows, None
 
         return jsonify({
-            'recordings': recordings,
-            'recording_count': len(recordings)
+            'recordings': _strip_sort_keys(recordings),
+            'recording_count': len(recordings),
+            'next_cursor': next_cursor
         })
 
     except Exception as e:
@@ -457,13 +536,67 @@ def get_performer_recordings(performer_id):
         return jsonify({'error': 'Failed to fetch performer recordings', 'detail': str(e)}), 500
 
 
+@performers_bp.route('/performers/<performer_id>/recordings/shell', methods=['GET'])
+@cached_response(lambda performer_id: [TAG_INDEX])
+def get_performer_recordings_shell(performer_id):
+    """
+    Shell (metadata-only) payload for a performer's recordings list.
+
+    The performer-page counterpart of GET /songs/<id>/recordings/shell:
+    every recording in display order with just enough to build year/song
+    sections and the role filter. The client then calls
+    GET /api/recordings/batch with the IDs of rows scrolling into view to
+    fill in album title, artist credit and cover art.
+
+    Tagged 'index' in the response cache: every song write (research,
+    admin edits) drops index entries, and a performer's recordings only
+    change through those.
+
+    Query Parameters:
+        sort: 'year' (default) or 'name'
+    """
+    try:
+        performer_check = db_tools.execute_query(
+            "SELECT id FROM performers WHERE id = %s",
+            (performer_id,),
+            fetch_one=True
+        )
+        if not performer_check:
+            return jsonify({'error': 'Performer not found'}), 404
+
+        t_start = time.perf_counter()
+        recordings = _strip_sort_keys(query_performer_recordings(
+            performer_id, PERFORMER_RECORDING_SHELL_COLUMNS_SQL, _sort_param()
+        ))
+        t_query_done = time.perf_counter()
+
+        response = jsonify({
+            'performer_id': performer_id,
+            'recordings': recordings,
+            'recording_count': len(recordings)
+        })
+
+        logger.info(
+            f"shell performer={performer_id} rows={len(recordings)} "
+            f"query_ms={(t_query_done - t_start) * 1000:.0f} "
+            f"serialize_ms={(time.perf_counter() - t_query_done) * 1000:.0f}"
+        )
+        return response
+
+    except Exception as e:
+        logger.error(f"Error fetching performer recordings shell: {e}", exc_info=True)
+        return jsonify({'error': 'Failed to fetch shell', 'detail': str(e)}), 500
+
+
 @performers_bp.route('/performers/search', methods=['GET'])
 def search_performers():
     """
-    Search for performers by name
+    Search for performers by name, best matches first
     
     Query Parameters:
-        name: Performer name to search for (case-insensitive partial match)
+        name: Performer name to search for (typo tolerant, accent-insensitive)
+        mode: 'fuzzy' (default) or 'prefix' for typeahead
+        limit: Maximum results (default: 10, max: 100)
         
     Returns:
         List of matching performers with their details
@@ -474,49 +607,48 @@ def search_performers():
         return jsonify({'error': 'Name parameter is required'}), 400
     
     try:
-        with db_tools.get_db_connection() as conn:
-            with conn.cursor() as cur:
-            
-                # Search for performers with names containing the search term (case-insensitive)
-                # Use ILIKE for case-insensitive matching
-                cur.execute("""
-                    SELECT
-                        id,
-                        name,
-                        sort_name,
-                        biography,
-                        birth_date,
-                        death_date,
-                        musicbrainz_id
-                    FROM performers
-                    WHERE LOWER(name) LIKE LOWER(%s)
-                    ORDER BY
-                        -- Exact matches first
-                        CASE WHEN LOWER(name) = LOWER(%s) THEN 0 ELSE 1 END,
-                        -- Then by sort_name (falling back to name)
-                        COALESCE(sort_name, name)
-                    LIMIT 10
-                """, (f'%{name}%', name))
-                
-                performers = cur.fetchall()
-                
-                if not performers:
-                    return jsonify([]), 404
-                
-                # Format the results
-                results = []
-                for performer in performers:
-                    results.append({
-                        'id': str(performer['id']),
-                        'name': performer['name'],
-                        'sort_name': performer['sort_name'],
-                        'biography': performer['biography'],
-                        'birth_date': performer['birth_date'].isoformat() if performer['birth_date'] else None,
-                        'death_date': performer['death_date'].isoformat() if performer['death_date'] else None,
-                        'musicbrainz_id': performer['musicbrainz_id']
-                    })
-                
-                return jsonify(results)
+        clause = search.performer_clause(
+            name, prefix=search.is_prefix_mode(request.args.get('mode'))
+        )
+        params = dict(clause.params, limit=search.parse_limit(request.args.get('limit'), 10))
+
+        performers = search.execute(f"""
+            SELECT
+                id,
+                name,
+                sort_name,
+                biography,
+                birth_date,
+                death_date,
+                musicbrainz_id,
+                round({clause.score}::numeric, 3)::float AS score
+            FROM performers
+            WHERE {clause.where}
+            ORDER BY
+                score DESC,
+                COALESCE(sort_name, name)
+            LIMIT %(limit)s
+        """, params)
+
+
+        if not performers:
+            return jsonify([]), 404
+
+        # Format the results
+        results = []
+        for performer in performers:
+            results.append({
+                'id': str(performer['id']),
+                'name': performer['name'],
+                'sort_name': performer['sort_name'],
+                'biography': performer['biography'],
+                'birth_date': performer['birth_date'].isoformat() if performer['birth_date'] else None,
+                'death_date': performer['death_date'].isoformat() if performer['death_date'] else None,
+                'musicbrainz_id': performer['musicbrainz_id'],
+                'score': performer['score']
+            })
+
+        return jsonify(results)
 
     except Exception as e:
         logger.error(f"Error searching performers: {e}", exc_info=True)
@@ -524,6 +656,8 @@ def search_performers():
 
 
 @performers_bp.route('/performers/index', methods=['GET'])
+@compressed_response
+@cached_response(lambda: [TAG_INDEX])
 def get_performers_index():
     """
     Get lightweight list of all performers for building an alphabet index.
@@ -533,34 +667,41 @@ def get_performers_index():
     while loading detailed data progressively.
 
     Query Parameters:
-        search: Filter performers by name (case-insensitive partial match)
+        search: Filter performers by name (typo tolerant, accent-insensitive);
+                results are ranked by match
+        mode: 'prefix' to match from the start of a word (typeahead)
+        format: 'columns' for parallel arrays,
+                {count, columns: {id: [...], name: [...], sort_name: [...]}}
 
     Returns:
         Array of {id, name, sort_name} objects
     """
     search_query = request.args.get('search', '')
+    columnar = json_stream.wants_columns()
 
     try:
         if search_query:
-            query = """
-                SELECT id, name, sort_name
-                FROM performers
-                WHERE name ILIKE %s
-                ORDER BY COALESCE(sort_name, name)
-            """
-            params = (f'%{search_query}%',)
-        else:
-            query = """
+            clause = search.performer_clause(
+                search_query, prefix=search.is_prefix_mode(request.args.get('mode'))
+            )
+            performers = search.execute(f"""
                 SELECT id, name, sort_name
                 FROM performers
-                ORDER BY COALESCE(sort_name, name)
-            """
-            params = None
-
-        performers = db_tools.execute_query(query, params)
-
-        response = jsonify(performers)
-        response.headers['X-Total-Count'] = str(len(performers))
+                WHERE {clause.where}
+                ORDER BY {clause.score} DESC, COALESCE(sort_name, name)
+            """, clause.params)
+            response = json_stream.rows_response(performers, columnar=columnar)
+            response.headers['X-Total-Count'] = str(len(performers))
+            return response
+
+        # Counted up front: a streamed body can't set headers afterwards
+        total = db_tools.execute_query("SELECT COUNT(*) AS n FROM performers", fetch_one=True)
+        response = json_stream.stream_query("""
+            SELECT id, name, sort_name
+            FROM performers
+            ORDER BY COALESCE(sort_name, name)
+        """, columnar=columnar)
+        response.headers['X-Total-Count'] = str(total['n'])
 
         return response
 
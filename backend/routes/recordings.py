@@ -21,9 +21,11 @@ import uuid
 import db_utils as db_tools
 from middleware.auth_middleware import optional_auth, require_auth
 from rate_limit import limiter, BATCH_RECORDINGS_LIMIT
+from core.response_cache import invalidate_on_write
 
 logger = logging.getLogger(__name__)
 recordings_bp = Blueprint('recordings', __name__)
+recordings_bp.after_request(invalidate_on_write)
 
 # Maximum IDs per GET /api/recordings/batch request. Keeps the query
 # bounded and prevents clients (accidentally or maliciously) from asking
@@ -249,6 +251,47 @@ HAS_SPOTIFY_SQL = """
            WHERE rr2.recording_id = r.id AND rrsl.service = 'spotify')"""
 
 
+# ============================================================================
+# LIST-ROW PROJECTION
+# ============================================================================
+# SELECT list over the recording_list_rows projection (alias 'rlr'). Shared
+# by GET /api/songs/<id>/recordings and GET /api/recordings/batch so both
+# return the exact contract pinned by backend/tests/test_song_recordings.py.
+# The projection is kept current by triggers (sql/migrations/015) on
+# recordings, releases, recording_releases, release_imagery,
+# recording_release_streaming_links, recording_performers, performers,
+# instruments, song_authority_recommendations and recording_contributions.
+
+RECORDING_LIST_ROW_COLUMNS_SQL = """
+    rlr.recording_id as id,
+    rlr.title,
+    rlr.album_title,
+    rlr.artist_credit,
+    rlr.recording_year,
+    rlr.best_spotify_url,
+    rlr.best_cover_art_small,
+    rlr.best_cover_art_medium,
+    rlr.best_cover_art_large,
+    rlr.best_cover_art_source,
+    rlr.best_cover_art_source_url,
+    rlr.back_cover_art_small,
+    rlr.back_cover_art_medium,
+    rlr.back_cover_art_large,
+    rlr.has_back_cover,
+    rlr.back_cover_source,
+    rlr.back_cover_source_url,
+    rlr.is_canonical,
+    rlr.performers,
+    rlr.authority_count,
+    rlr.authority_sources,
+    rlr.has_streaming,
+    rlr.has_spotify,
+    rlr.has_apple_music,
+    rlr.has_youtube,
+    rlr.streaming_services,
+    rlr.community_data"""
+
+
 @recordings_bp.route('/recordings/count', methods=['GET'])
 def get_recordings_count():
     """
@@ -601,21 +644,18 @@ def get_recording_detail(recording_id):
                 LEFT JOIN users u ON rf.user_id = u.id
                 WHERE rf.recording_id = %s
             ),
-            -- Community-contributed metadata consensus
+            -- Community-contributed metadata consensus (one row, kept by
+            -- triggers on recording_contributions)
             community_consensus AS (
                 SELECT
-                    (SELECT performance_key FROM recording_contributions
-                     WHERE recording_id = %s AND performance_key IS NOT NULL
-                     GROUP BY performance_key ORDER BY COUNT(*) DESC, MAX(updated_at) DESC LIMIT 1) as consensus_key,
-                    (SELECT tempo_marking FROM recording_contributions
-                     WHERE recording_id = %s AND tempo_marking IS NOT NULL
-                     GROUP BY tempo_marking ORDER BY COUNT(*) DESC, MAX(updated_at) DESC LIMIT 1) as consensus_tempo_marking,
-                    (SELECT is_instrumental FROM recording_contributions
-                     WHERE recording_id = %s AND is_instrumental IS NOT NULL
-                     GROUP BY is_instrumental ORDER BY COUNT(*) DESC, MAX(updated_at) DESC LIMIT 1) as consensus_instrumental,
-                    (SELECT COUNT(*) FROM recording_contributions WHERE recording_id = %s AND performance_key IS NOT NULL) as key_count,
-                    (SELECT COUNT(*) FROM recording_contributions WHERE recording_id = %s AND tempo_marking IS NOT NULL) as tempo_count,
-                    (SELECT COUNT(*) FROM recording_contributions WHERE recording_id = %s AND is_instrumental IS NOT NULL) as instrumental_count
+                    performance_key as consensus_key,
+                    tempo_marking as consensus_tempo_marking,
+                    is_instrumental as consensus_instrumental,
+                    key_count,
+                    tempo_count,
+                    instrumental_count
+                FROM recording_consensus
+                WHERE recording_id = %s
             )
             SELECT
                 (SELECT row_to_json(recording_data.*) FROM recording_data) as recording,
@@ -628,10 +668,10 @@ def get_recording_detail(recording_id):
                 (SELECT row_to_json(community_consensus.*) FROM community_consensus) as community_consensus
         """
 
-        # Execute the single query with recording_id passed 13 times (for each CTE)
+        # Execute the single query with recording_id passed 8 times (for each CTE)
         result = db_tools.execute_query(
             combined_query,
-            (recording_id,) * 13,
+            (recording_id,) * 8,
             fetch_one=True
         )
 
@@ -789,160 +829,15 @@ def get_recordings_batch():
             except (ValueError, TypeError):
                 return jsonify({'error': f'Invalid UUID: {rid!r}'}), 400
 
-        # Query mirrors the CTE structure of get_song_recordings (the list
-        # endpoint) but scopes every CTE by recording id, not song id. Same
-        # SELECT list, same GROUP BY — so the response contract is the same
-        # as what iOS already knows how to parse from the list endpoint.
-        batch_query = """
-            WITH
-            front_art AS (
-                SELECT DISTINCT ON (sub.recording_id)
-                    sub.recording_id,
-                    sub.image_url_small, sub.image_url_medium, sub.image_url_large,
-                    sub.source, sub.source_url
-                FROM (
-                    SELECT r.id as recording_id,
-                           ri.image_url_small, ri.image_url_medium, ri.image_url_large,
-                           ri.source::text as source, ri.source_url,
-                           1 as priority,
-                           CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END as source_order
-                    FROM recordings r
-                    JOIN release_imagery ri ON ri.release_id = r.default_release_id AND ri.type = 'Front'
-                    WHERE r.id = ANY(%s::uuid[])
-                    UNION ALL
-                    SELECT r.id, ri.image_url_small, ri.image_url_medium, ri.image_url_large,
-                           ri.source::text, ri.source_url,
-                           2 as priority,
-                           CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END
-                    FROM recordings r
-                    JOIN recording_releases rr ON rr.recording_id = r.id
-                    JOIN release_imagery ri ON ri.release_id = rr.release_id AND ri.type = 'Front'
-                    WHERE r.id = ANY(%s::uuid[])
-                ) sub
-                ORDER BY sub.recording_id, sub.priority, sub.source_order
-            ),
-            back_art AS (
-                SELECT DISTINCT ON (r.id)
-                    r.id as recording_id,
-                    ri.image_url_small, ri.image_url_medium, ri.image_url_large,
-                    ri.source::text as source, ri.source_url,
-                    TRUE as has_back_cover
-                FROM recordings r
-                JOIN release_imagery ri ON ri.release_id = r.default_release_id AND ri.type = 'Back'
-                WHERE r.id = ANY(%s::uuid[])
-            ),
-            streaming AS (
-                SELECT
-                    rr.recording_id,
-                    bool_or(TRUE) as has_streaming,
-                    bool_or(rrsl.service = 'spotify') as has_spotify,
-                    bool_or(rrsl.service = 'apple_music') as has_apple_music,
-                    bool_or(rrsl.service = 'youtube') as has_youtube,
-                    array_agg(DISTINCT rrsl.service) as streaming_services
-                FROM recording_releases rr
-                JOIN recording_release_streaming_links rrsl ON rrsl.recording_release_id = rr.id
-                WHERE rr.recording_id = ANY(%s::uuid[])
-                GROUP BY rr.recording_id
-            ),
-            spotify_urls AS (
-                SELECT DISTINCT ON (rr.recording_id)
-                    rr.recording_id,
-                    rrsl.service_url as best_spotify_url
-                FROM recording_releases rr
-                JOIN recording_release_streaming_links rrsl
-                    ON rrsl.recording_release_id = rr.id AND rrsl.service = 'spotify'
-                WHERE rr.recording_id = ANY(%s::uuid[])
-                ORDER BY rr.recording_id,
-                    CASE WHEN rr.release_id = (
-                        SELECT default_release_id FROM recordings WHERE id = rr.recording_id
-                    ) THEN 0 ELSE 1 END
-            ),
-            community AS (
-                SELECT
-                    rc.recording_id,
-                    jsonb_build_object(
-                        'consensus', jsonb_build_object(
-                            'is_instrumental', (
-                                SELECT is_instrumental FROM recording_contributions rc2
-                                WHERE rc2.recording_id = rc.recording_id AND rc2.is_instrumental IS NOT NULL
-                                GROUP BY is_instrumental ORDER BY COUNT(*) DESC, MAX(updated_at) DESC LIMIT 1
-                            )
-                        ),
-                        'counts', jsonb_build_object(
-                            'instrumental', COUNT(*) FILTER (WHERE rc.is_instrumental IS NOT NULL)
-                        )
-                    ) as community_data
-                FROM recording_contributions rc
-                WHERE rc.recording_id = ANY(%s::uuid[])
-                GROUP BY rc.recording_id
-            )
-            SELECT
-                r.id,
-                r.title,
-                def_rel.title as album_title,
-                def_rel.artist_credit as artist_credit,
-                r.recording_year,
-                su.best_spotify_url,
-                fa.image_url_small as best_cover_art_small,
-                fa.image_url_medium as best_cover_art_medium,
-                fa.image_url_large as best_cover_art_large,
-                fa.source as best_cover_art_source,
-                fa.source_url as best_cover_art_source_url,
-                ba.image_url_small as back_cover_art_small,
-                ba.image_url_medium as back_cover_art_medium,
-                ba.image_url_large as back_cover_art_large,
-                COALESCE(ba.has_back_cover, FALSE) as has_back_cover,
-                ba.source as back_cover_source,
-                ba.source_url as back_cover_source_url,
-                r.is_canonical,
-                COALESCE(
-                    json_agg(
-                        json_build_object(
-                            'id', p.id,
-                            'name', p.name,
-                            'sort_name', p.sort_name,
-                            'instrument', i.name,
-                            'role', rp.role
-                        ) ORDER BY
-                            CASE rp.role
-                                WHEN 'leader' THEN 1
-                                WHEN 'sideman' THEN 2
-                                ELSE 3
-                            END,
-                            COALESCE(p.sort_name, p.name)
-                    ) FILTER (WHERE p.id IS NOT NULL),
-                    '[]'::json
-                ) as performers,
-                COUNT(DISTINCT sar.id) as authority_count,
-                COALESCE(
-                    array_agg(DISTINCT sar.source) FILTER (WHERE sar.source IS NOT NULL),
-                    ARRAY[]::text[]
-                ) as authority_sources,
-                COALESCE(st.has_streaming, FALSE) as has_streaming,
-                COALESCE(st.has_spotify, FALSE) as has_spotify,
-                COALESCE(st.has_apple_music, FALSE) as has_apple_music,
-                COALESCE(st.has_youtube, FALSE) as has_youtube,
-                COALESCE(st.streaming_services, ARRAY[]::varchar[]) as streaming_services,
-                cm.community_data
-            FROM recordings r
-            LEFT JOIN releases def_rel ON r.default_release_id = def_rel.id
-            LEFT JOIN recording_performers rp ON r.id = rp.recording_id
-            LEFT JOIN performers p ON rp.performer_id = p.id
-            LEFT JOIN instruments i ON rp.instrument_id = i.id
-            LEFT JOIN song_authority_recommendations sar ON r.id = sar.recording_id
-            LEFT JOIN front_art fa ON fa.recording_id = r.id
-            LEFT JOIN back_art ba ON ba.recording_id = r.id
-            LEFT JOIN streaming st ON st.recording_id = r.id
-            LEFT JOIN spotify_urls su ON su.recording_id = r.id
-            LEFT JOIN community cm ON cm.recording_id = r.id
-            WHERE r.id = ANY(%s::uuid[])
-            GROUP BY r.id, def_rel.title, def_rel.artist_credit, r.recording_year,
-                     r.is_canonical,
-                     su.best_spotify_url,
-                     fa.image_url_small, fa.image_url_medium, fa.image_url_large, fa.source, fa.source_url,
-                     ba.image_url_small, ba.image_url_medium, ba.image_url_large, ba.has_back_cover, ba.source, ba.source_url,
-                     st.has_streaming, st.has_spotify, st.has_apple_music, st.has_youtube, st.streaming_services,
-                     cm.community_data
+        # List rows are served from the trigger-maintained
+        # recording_list_rows projection (sql/migrations/015), the same
+        # table GET /songs/<id>/recordings reads, so the response contract
+        # is the same as what iOS already knows how to parse from the list
+        # endpoint.
+        batch_query = f"""
+            SELECT {RECORDING_LIST_ROW_COLUMNS_SQL}
+            FROM recording_list_rows rlr
+            WHERE rlr.recording_id = ANY(%s::uuid[])
         """
 
         # See the shell handler in routes/songs.py for why we log query vs.
@@ -952,13 +847,7 @@ def get_recordings_batch():
         # makes it obvious if the bottleneck is CPU-bound serialization.
         t_start = time.perf_counter()
 
-        # 6 occurrences of the IDs array: 2 in front_art CTE, 1 in back_art,
-        # 1 in streaming, 1 in spotify_urls, 1 in community, 1 in main WHERE
-        # = 7 params.
-        rows = db_tools.execute_query(
-            batch_query,
-            (validated_ids,) * 7
-        )
+        rows = db_tools.execute_query(batch_query, (validated_ids,))
         t_query_done = time.perf_counter()
 
         response = jsonify({
@@ -66,15 +66,21 @@ def refresh_song_data(song_id):
 
 @research_bp.route('/research/queue', methods=['GET'])
 def get_queue_status():
-    """Get the current status of the research queue"""
+    """Get the current status of the research queue (across all workers)"""
     current_song = research_queue.get_current_song()
     current_progress = research_queue.get_current_progress()
+    # Research normally runs in its own process (research_worker.py), so
+    # liveness comes from the worker heartbeats, not this process's flag
+    worker_processes = research_queue.get_worker_processes()
     
     response = {
         'queue_size': research_queue.get_queue_size(),
-        'worker_active': research_queue._worker_running,
+        'worker_active': bool(worker_processes),
+        'worker_processes': worker_processes,
         'current_song': current_song,
-        'progress': current_progress
+        'progress': current_progress,
+        # Every running job across all worker threads/processes
+        'active_jobs': research_queue.get_active_jobs()
     }
     
     return jsonify(response)
@@ -151,36 +157,20 @@ def queue_all_songs_for_research():
                 'queue_size': research_queue.get_queue_size()
             }), 200
         
-        # Queue each song for research
-        queued_count = 0
-        failed_songs = []
+        # Queue every song in one statement; songs already waiting are
+        # deduplicated by the job table rather than queued twice
+        queued_count = research_queue.add_songs_to_queue(songs, force_refresh=force_refresh)
 
-        for song in songs:
-            success = research_queue.add_song_to_queue(song['id'], song['title'], force_refresh=force_refresh)
-            if success:
-                queued_count += 1
-            else:
-                failed_songs.append({
-                    'id': song['id'],
-                    'title': song['title']
-                })
-        
-        # Prepare response
         response_data = {
             'success': True,
             'message': f'Queued {queued_count} songs for research',
             'total_songs': len(songs),
             'songs_queued': queued_count,
-            'songs_failed': len(failed_songs),
+            'songs_failed': research_queue.get_failed_count(),
             'force_refresh': force_refresh,
             'queue_size': research_queue.get_queue_size()
         }
         
-        # Include failed songs if any
-        if failed_songs:
-            response_data['failed_songs'] = failed_songs
-            logger.warning(f"Failed to queue {len(failed_songs)} songs")
-        
         logger.info(f"Admin: Queued {queued_count}/{len(songs)} songs for research")
         
         return jsonify(response_data), 202  # 202 Accepted - processing will happen asynchronously
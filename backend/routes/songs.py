@@ -20,9 +20,16 @@ import time
 import db_utils as db_tools
 from utils.helpers import safe_strip
 from middleware.auth_middleware import require_auth
+from routes.recordings import RECORDING_LIST_ROW_COLUMNS_SQL
+from core.response_cache import (
+    cached_response, invalidate_on_write, song_tag, TAG_INDEX
+)
+from core import json_stream, search, song_stats
+from core.json_stream import compressed_response
 
 logger = logging.getLogger(__name__)
 songs_bp = Blueprint('songs', __name__)
+songs_bp.after_request(invalidate_on_write)
 
 
 # ============================================================================
@@ -204,33 +211,38 @@ HAS_SPOTIFY_SQL = """
 
 
 @songs_bp.route('/songs', methods=['GET'])
+@compressed_response
 def get_songs():
-    """Get all songs or search songs by title"""
+    """
+    Get all songs or search songs by title
+
+    Query Parameters:
+        search: Filter songs by title, alternate title or composer, ranked
+        mode: 'prefix' to match from the start of a word (typeahead)
+    """
     search_query = request.args.get('search', '')
     
     try:
         if search_query:
-            query = """
-                SELECT id, title, composer, composed_year, composed_key, structure, musicbrainz_id, wikipedia_url, song_reference, external_references,
-                       created_at, updated_at
-                FROM songs
-                WHERE title ILIKE %s
-                   OR composer ILIKE %s
-                   OR EXISTS (SELECT 1 FROM unnest(alt_titles) AS alt WHERE alt ILIKE %s)
-                ORDER BY title
-            """
-            params = (f'%{search_query}%', f'%{search_query}%', f'%{search_query}%')
-        else:
-            query = """
+            clause = search.song_clause(
+                search_query, prefix=search.is_prefix_mode(request.args.get('mode'))
+            )
+            songs = search.execute(f"""
                 SELECT id, title, composer, composed_year, composed_key, structure, musicbrainz_id, wikipedia_url, song_reference, external_references,
                        created_at, updated_at
                 FROM songs
-                ORDER BY title
-            """
-            params = None
-        
-        songs = db_tools.execute_query(query, params)
-        return jsonify(songs)
+                WHERE {clause.where}
+                ORDER BY {clause.score} DESC, title
+            """, clause.params)
+            return json_stream.rows_response(songs)
+
+        # Full catalog: streamed from a server-side cursor
+        return json_stream.stream_query("""
+            SELECT id, title, composer, composed_year, composed_key, structure, musicbrainz_id, wikipedia_url, song_reference, external_references,
+                   created_at, updated_at
+            FROM songs
+            ORDER BY title
+        """)
         
     except Exception as e:
         logger.error(f"Error fetching songs: {e}")
@@ -239,6 +251,7 @@ def get_songs():
 
 
 @songs_bp.route('/songs/<song_id>/summary', methods=['GET'])
+@cached_response(lambda song_id: [song_tag(song_id)])
 def get_song_summary(song_id):
     """
     Get song metadata, transcriptions, and featured (authoritative) recordings ONLY.
@@ -259,23 +272,14 @@ def get_song_summary(song_id):
                     s.structure, s.song_reference,
                     s.musicbrainz_id, s.wikipedia_url, s.external_references,
                     s.created_at, s.updated_at,
-                    (SELECT COUNT(*)
-                     FROM song_authority_recommendations
-                     WHERE song_id = s.id) as authority_recommendation_count,
-                    (SELECT COUNT(*) FROM recordings WHERE song_id = s.id) as recording_count,
-                    -- Check if any recording has streaming links (for play button)
-                    EXISTS(
-                        SELECT 1 FROM recordings r2
-                        JOIN recording_releases rr2 ON rr2.recording_id = r2.id
-                        JOIN recording_release_streaming_links rrsl ON rrsl.recording_release_id = rr2.id
-                        WHERE r2.song_id = s.id
-                    ) OR EXISTS(
-                        SELECT 1 FROM recordings r2
-                        JOIN recording_releases rr2 ON rr2.recording_id = r2.id
-                        JOIN releases rel2 ON rr2.release_id = rel2.id
-                        WHERE r2.song_id = s.id AND rel2.spotify_album_id IS NOT NULL
-                    ) as has_any_streaming
+                    -- Trigger-maintained aggregates (migration 024); a song
+                    -- with no row yet has nothing to count
+                    COALESCE(ss.authority_recommendation_count, 0) as authority_recommendation_count,
+                    COALESCE(sss.total_recordings, 0) as recording_count,
+                    -- Any recording with streaming links (for play button)
+                    COALESCE(sss.playable_recordings > 0, FALSE) as has_any_streaming
                 FROM songs s
+                {song_stats.STATS_JOINS}
                 WHERE s.id = %s
             ),
             featured_recordings AS (
@@ -411,201 +415,40 @@ def get_song_recordings(song_id):
 
     Supports sort parameter: 'year' (default) or 'name' (by leader's last name)
 
-    PERFORMANCE: Uses CTEs to pre-compute album art, streaming data, and
-    community contributions in bulk, then JOINs them. This avoids ~25
-    correlated subqueries per recording row which caused O(N*25) query
-    evaluations for songs with many recordings.
+    PERFORMANCE: Reads the recording_list_rows projection (one row per
+    recording, maintained by triggers — see sql/migrations/015) instead of
+    rebuilding the front_art/back_art/streaming/spotify_urls/community CTEs
+    and the performers json_agg on every call. The per-song read is a
+    single scan of idx_recording_list_rows_song_year (or _song_leader for
+    sort=name).
     """
     try:
         sort_by = request.args.get('sort', 'year')
 
         if sort_by == 'name':
+            # leader_sort_key is the first leader's COALESCE(sort_name, name),
+            # NULL when the recording has no leader credit.
             recordings_order = """
-                (
-                    SELECT COALESCE(p2.sort_name, p2.name, 'ZZZ')
-                    FROM recording_performers rp2
-                    JOIN performers p2 ON rp2.performer_id = p2.id
-                    WHERE rp2.recording_id = r.id AND rp2.role = 'leader'
-                    ORDER BY COALESCE(p2.sort_name, p2.name)
-                    LIMIT 1
-                ) ASC NULLS LAST,
-                r.recording_year ASC NULLS LAST
+                rlr.leader_sort_key ASC NULLS LAST,
+                rlr.recording_year ASC NULLS LAST
             """
         else:
-            recordings_order = "r.recording_year ASC NULLS LAST"
-
+            recordings_order = "rlr.recording_year ASC NULLS LAST"
+
+        # Fields deliberately excluded from this LIST-VIEW payload because
+        # no list-row view reads them (recording detail re-fetches via
+        # /api/recordings/<id>, which carries the full payload):
+        #   r.musicbrainz_id, r.default_release_id, r.recording_date,
+        #   r.label, r.notes
+        # See backend/tests/test_song_recordings.py for the field contract.
         recordings_query = f"""
-            WITH
-            -- CTE 1: Front cover art (default release preferred, fallback to any linked release)
-            front_art AS (
-                SELECT DISTINCT ON (sub.recording_id)
-                    sub.recording_id,
-                    sub.image_url_small, sub.image_url_medium, sub.image_url_large,
-                    sub.source, sub.source_url
-                FROM (
-                    SELECT r.id as recording_id,
-                           ri.image_url_small, ri.image_url_medium, ri.image_url_large,
-                           ri.source::text as source, ri.source_url,
-                           1 as priority,
-                           CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END as source_order
-                    FROM recordings r
-                    JOIN release_imagery ri ON ri.release_id = r.default_release_id AND ri.type = 'Front'
-                    WHERE r.song_id = %s
-                    UNION ALL
-                    SELECT r.id, ri.image_url_small, ri.image_url_medium, ri.image_url_large,
-                           ri.source::text, ri.source_url,
-                           2 as priority,
-                           CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END
-                    FROM recordings r
-                    JOIN recording_releases rr ON rr.recording_id = r.id
-                    JOIN release_imagery ri ON ri.release_id = rr.release_id AND ri.type = 'Front'
-                    WHERE r.song_id = %s
-                ) sub
-                ORDER BY sub.recording_id, sub.priority, sub.source_order
-            ),
-            -- CTE 2: Back cover art (default release only, for consistency with front)
-            back_art AS (
-                SELECT DISTINCT ON (r.id)
-                    r.id as recording_id,
-                    ri.image_url_small, ri.image_url_medium, ri.image_url_large,
-                    ri.source::text as source, ri.source_url,
-                    TRUE as has_back_cover
-                FROM recordings r
-                JOIN release_imagery ri ON ri.release_id = r.default_release_id AND ri.type = 'Back'
-                WHERE r.song_id = %s
-            ),
-            -- CTE 3: Streaming availability (all services in one pass)
-            streaming AS (
-                SELECT
-                    rr.recording_id,
-                    bool_or(TRUE) as has_streaming,
-                    bool_or(rrsl.service = 'spotify') as has_spotify,
-                    bool_or(rrsl.service = 'apple_music') as has_apple_music,
-                    bool_or(rrsl.service = 'youtube') as has_youtube,
-                    array_agg(DISTINCT rrsl.service) as streaming_services
-                FROM recording_releases rr
-                JOIN recording_release_streaming_links rrsl ON rrsl.recording_release_id = rr.id
-                WHERE rr.recording_id IN (SELECT id FROM recordings WHERE song_id = %s)
-                GROUP BY rr.recording_id
-            ),
-            -- CTE 4: Best Spotify URL per recording (prefer default release)
-            spotify_urls AS (
-                SELECT DISTINCT ON (rr.recording_id)
-                    rr.recording_id,
-                    rrsl.service_url as best_spotify_url
-                FROM recording_releases rr
-                JOIN recording_release_streaming_links rrsl
-                    ON rrsl.recording_release_id = rr.id AND rrsl.service = 'spotify'
-                WHERE rr.recording_id IN (SELECT id FROM recordings WHERE song_id = %s)
-                ORDER BY rr.recording_id,
-                    CASE WHEN rr.release_id = (
-                        SELECT default_release_id FROM recordings WHERE id = rr.recording_id
-                    ) THEN 0 ELSE 1 END
-            ),
-            -- CTE 5: Lightweight community data — only is_instrumental consensus
-            -- (used for vocal/instrumental filter in recordings list; full community
-            -- data is fetched by the recording detail endpoint when needed)
-            community AS (
-                SELECT
-                    rc.recording_id,
-                    jsonb_build_object(
-                        'consensus', jsonb_build_object(
-                            'is_instrumental', (
-                                SELECT is_instrumental FROM recording_contributions rc2
-                                WHERE rc2.recording_id = rc.recording_id AND rc2.is_instrumental IS NOT NULL
-                                GROUP BY is_instrumental ORDER BY COUNT(*) DESC, MAX(updated_at) DESC LIMIT 1
-                            )
-                        ),
-                        'counts', jsonb_build_object(
-                            'instrumental', COUNT(*) FILTER (WHERE rc.is_instrumental IS NOT NULL)
-                        )
-                    ) as community_data
-                FROM recording_contributions rc
-                WHERE rc.recording_id IN (SELECT id FROM recordings WHERE song_id = %s)
-                GROUP BY rc.recording_id
-            )
-            -- Main query: JOIN pre-computed CTEs instead of correlated subqueries
-            -- Fields deliberately excluded from this LIST-VIEW payload because
-            -- no list-row view reads them (recording detail re-fetches via
-            -- /api/recordings/<id>, which carries the full payload):
-            --   r.musicbrainz_id, r.default_release_id, r.recording_date,
-            --   r.label, r.notes
-            -- See backend/tests/test_song_recordings.py for the field contract.
-            SELECT
-                r.id,
-                r.title,
-                def_rel.title as album_title,
-                def_rel.artist_credit as artist_credit,
-                r.recording_year,
-                su.best_spotify_url,
-                fa.image_url_small as best_cover_art_small,
-                fa.image_url_medium as best_cover_art_medium,
-                fa.image_url_large as best_cover_art_large,
-                fa.source as best_cover_art_source,
-                fa.source_url as best_cover_art_source_url,
-                ba.image_url_small as back_cover_art_small,
-                ba.image_url_medium as back_cover_art_medium,
-                ba.image_url_large as back_cover_art_large,
-                COALESCE(ba.has_back_cover, FALSE) as has_back_cover,
-                ba.source as back_cover_source,
-                ba.source_url as back_cover_source_url,
-                r.is_canonical,
-                COALESCE(
-                    json_agg(
-                        json_build_object(
-                            'id', p.id,
-                            'name', p.name,
-                            'sort_name', p.sort_name,
-                            'instrument', i.name,
-                            'role', rp.role
-                        ) ORDER BY
-                            CASE rp.role
-                                WHEN 'leader' THEN 1
-                                WHEN 'sideman' THEN 2
-                                ELSE 3
-                            END,
-                            COALESCE(p.sort_name, p.name)
-                    ) FILTER (WHERE p.id IS NOT NULL),
-                    '[]'::json
-                ) as performers,
-                COUNT(DISTINCT sar.id) as authority_count,
-                COALESCE(
-                    array_agg(DISTINCT sar.source) FILTER (WHERE sar.source IS NOT NULL),
-                    ARRAY[]::text[]
-                ) as authority_sources,
-                COALESCE(st.has_streaming, FALSE) as has_streaming,
-                COALESCE(st.has_spotify, FALSE) as has_spotify,
-                COALESCE(st.has_apple_music, FALSE) as has_apple_music,
-                COALESCE(st.has_youtube, FALSE) as has_youtube,
-                COALESCE(st.streaming_services, ARRAY[]::varchar[]) as streaming_services,
-                cm.community_data
-            FROM recordings r
-            LEFT JOIN releases def_rel ON r.default_release_id = def_rel.id
-            LEFT JOIN recording_performers rp ON r.id = rp.recording_id
-            LEFT JOIN performers p ON rp.performer_id = p.id
-            LEFT JOIN instruments i ON rp.instrument_id = i.id
-            LEFT JOIN song_authority_recommendations sar ON r.id = sar.recording_id
-            LEFT JOIN front_art fa ON fa.recording_id = r.id
-            LEFT JOIN back_art ba ON ba.recording_id = r.id
-            LEFT JOIN streaming st ON st.recording_id = r.id
-            LEFT JOIN spotify_urls su ON su.recording_id = r.id
-            LEFT JOIN community cm ON cm.recording_id = r.id
-            WHERE r.song_id = %s
-            GROUP BY r.id, def_rel.title, def_rel.artist_credit, r.recording_year,
-                     r.is_canonical,
-                     su.best_spotify_url,
-                     fa.image_url_small, fa.image_url_medium, fa.image_url_large, fa.source, fa.source_url,
-                     ba.image_url_small, ba.image_url_medium, ba.image_url_large, ba.has_back_cover, ba.source, ba.source_url,
-                     st.has_streaming, st.has_spotify, st.has_apple_music, st.has_youtube, st.streaming_services,
-                     cm.community_data
+            SELECT {RECORDING_LIST_ROW_COLUMNS_SQL}
+            FROM recording_list_rows rlr
+            WHERE rlr.song_id = %s
             ORDER BY {recordings_order}
         """
 
-        # CTEs use song_id 6 times + main WHERE uses it once = 7 params
-        recordings = db_tools.execute_query(
-            recordings_query,
-            (song_id, song_id, song_id, song_id, song_id, song_id, song_id)
-        )
+        recordings = db_tools.execute_query(recordings_query, (song_id,))
 
         return jsonify({
             'song_id': song_id,
@@ -619,6 +462,7 @@ def get_song_recordings(song_id):
 
 
 @songs_bp.route('/songs/<song_id>/recordings/shell', methods=['GET'])
+@cached_response(lambda song_id: [song_tag(song_id)])
 def get_song_recordings_shell(song_id):
     """
     Shell (metadata-only) payload for a song's recordings list.
@@ -659,9 +503,10 @@ def get_song_recordings_shell(song_id):
         # recording. The iOS instrument-family filter reads this, so we
         # need *every* performer's instrument — not just the leader's.
         #
-        # is_instrumental: most-common consensus value (same tiebreaker
-        # as the full endpoint's community CTE), but surfaced as a plain
-        # bool column rather than wrapped in a community_data jsonb.
+        # is_instrumental: the consensus value from recording_consensus
+        # (the same row the full endpoint's community_data is built from),
+        # surfaced as a plain bool column rather than wrapped in a
+        # community_data jsonb.
 
         if sort_by == 'name':
             shell_order = """
@@ -715,20 +560,6 @@ def get_song_recordings_shell(song_id):
                 WHERE rr.recording_id IN (SELECT id FROM recordings WHERE song_id = %s)
                 GROUP BY rr.recording_id
             ),
-            community_vocal AS (
-                SELECT DISTINCT
-                    rc.recording_id,
-                    (
-                        SELECT is_instrumental FROM recording_contributions rc2
-                        WHERE rc2.recording_id = rc.recording_id
-                          AND rc2.is_instrumental IS NOT NULL
-                        GROUP BY is_instrumental
-                        ORDER BY COUNT(*) DESC, MAX(updated_at) DESC
-                        LIMIT 1
-                    ) as is_instrumental
-                FROM recording_contributions rc
-                WHERE rc.recording_id IN (SELECT id FROM recordings WHERE song_id = %s)
-            ),
             -- authority_count as a pre-aggregated CTE so the main query needs
             -- no GROUP BY (json performers has no equality operator and so
             -- can't appear in a GROUP BY clause).
@@ -747,7 +578,7 @@ def get_song_recordings_shell(song_id):
                 r.is_canonical,
                 COALESCE(l.performers, '[]'::json) as performers,
                 COALESCE(ip.instruments, ARRAY[]::text[]) as instruments_present,
-                cv.is_instrumental,
+                rcon.is_instrumental,
                 COALESCE(st.has_streaming, FALSE) as has_streaming,
                 COALESCE(st.has_spotify, FALSE) as has_spotify,
                 COALESCE(st.has_apple_music, FALSE) as has_apple_music,
@@ -758,7 +589,7 @@ def get_song_recordings_shell(song_id):
             LEFT JOIN leader l ON l.recording_id = r.id
             LEFT JOIN instruments_present ip ON ip.recording_id = r.id
             LEFT JOIN streaming st ON st.recording_id = r.id
-            LEFT JOIN community_vocal cv ON cv.recording_id = r.id
+            LEFT JOIN recording_consensus rcon ON rcon.recording_id = r.id
             LEFT JOIN authority a ON a.recording_id = r.id
             WHERE r.song_id = %s
             ORDER BY {shell_order}
@@ -773,10 +604,10 @@ def get_song_recordings_shell(song_id):
         # high, the remaining time is in Flask/gunicorn/Render ingress.
         t_start = time.perf_counter()
 
-        # 5 CTEs use song_id once each + main WHERE uses it once = 6 params
+        # 4 CTEs use song_id once each + main WHERE uses it once = 5 params
         recordings = db_tools.execute_query(
             shell_query,
-            (song_id, song_id, song_id, song_id, song_id, song_id)
+            (song_id, song_id, song_id, song_id, song_id)
         )
         t_query_done = time.perf_counter()
 
@@ -856,11 +687,10 @@ def get_song_detail(song_id):
                     s.structure, s.song_reference,
                     s.musicbrainz_id, s.wikipedia_url, s.external_references,
                     s.created_at, s.updated_at,
-                    -- NEW: Count total authority recommendations for this song
-                    (SELECT COUNT(*)
-                     FROM song_authority_recommendations
-                     WHERE song_id = s.id) as authority_recommendation_count
+                    -- Total authority recommendations for this song (song_stats)
+                    COALESCE(ss.authority_recommendation_count, 0) as authority_recommendation_count
                 FROM songs s
+                LEFT JOIN song_stats ss ON ss.song_id = s.id
                 WHERE s.id = %s
             ),
             recordings_with_performers AS (
@@ -980,9 +810,8 @@ def get_song_detail(song_id):
 
 # NOTES ON CHANGES:
 # 
-# 1. SONG DATA CTE - Added subquery for authority_recommendation_count
-#    - Uses (SELECT COUNT(*) FROM song_authority_recommendations WHERE song_id = s.id)
-#    - No joins needed, keeps it simple
+# 1. SONG DATA CTE - authority_recommendation_count
+#    - Read from song_stats (trigger-maintained, migration 024)
 #
 # 2. RECORDINGS CTE - Recording-Centric Architecture Updates
 #    - REMOVED: r.spotify_url, r.spotify_track_id, r.album_art_small/medium/large (dropped columns)
@@ -1104,32 +933,38 @@ def create_song():
 
 @songs_bp.route('/songs/search', methods=['GET'])
 def search_songs():
-    """Search songs by title and optionally composer - returns first 20 matches"""
+    """
+    Search songs by title, alternate titles and composer, best matches first
+
+    Typo tolerant (trigram similarity) and accent-insensitive.
+
+    Query Parameters:
+        q: Search text
+        mode: 'fuzzy' (default) or 'prefix' for typeahead
+        limit: Maximum results (default: 20, max: 100)
+
+    Returns:
+        Array of {id, title, composer, musicbrainz_id, score}
+    """
     search_query = request.args.get('q', '').strip()
     
     if not search_query:
         return jsonify([])
     
     try:
-        query = """
-            SELECT id, title, composer, musicbrainz_id
-            FROM songs
-            WHERE title ILIKE %s
-               OR composer ILIKE %s
-               OR EXISTS (SELECT 1 FROM unnest(alt_titles) AS alt WHERE alt ILIKE %s)
-            ORDER BY
-                CASE WHEN title ILIKE %s THEN 0 ELSE 1 END,
-                title
-            LIMIT 20
-        """
-        params = (
-            f'%{search_query}%',
-            f'%{search_query}%',
-            f'%{search_query}%',
-            f'{search_query}%'  # Exact prefix match ranked higher
+        clause = search.song_clause(
+            search_query, prefix=search.is_prefix_mode(request.args.get('mode'))
         )
+        params = dict(clause.params, limit=search.parse_limit(request.args.get('limit'), 20))
         
-        songs = db_tools.execute_query(query, params)
+        songs = search.execute(f"""
+            SELECT id, title, composer, musicbrainz_id,
+                   round({clause.score}::numeric, 3)::float AS score
+            FROM songs
+            WHERE {clause.where}
+            ORDER BY score DESC, title
+            LIMIT %(limit)s
+        """, params)
         return jsonify(songs if songs else [])
         
     except Exception as e:
@@ -1341,6 +1176,8 @@ def format_external_references(external_refs):
 # ============================================================================
 
 @songs_bp.route('/songs/index', methods=['GET'])
+@compressed_response
+@cached_response(lambda: [TAG_INDEX])
 def get_songs_index():
     """
     Get lightweight list of all songs for building the list view.
@@ -1350,34 +1187,50 @@ def get_songs_index():
     detailed data only when a song is selected.
 
     Query Parameters:
-        search: Filter songs by title or composer (case-insensitive partial match)
+        search: Filter songs by title, alternate title or composer (typo
+                tolerant, accent-insensitive); results are ranked by match
+        mode: 'prefix' to match from the start of a word (typeahead)
+        format: 'columns' for parallel arrays,
+                {count, columns: {id: [...], title: [...], ...}}
+        include: 'stats' to add the per-song stats to each song
+                 (recording_count, has_any_streaming, streaming_recording_count,
+                 authority_recommendation_count, earliest_recording_year,
+                 latest_recording_year, last_researched_at)
 
     Returns:
         Array of {id, title, composer, composed_year} objects
     """
     search_query = request.args.get('search', '')
+    columnar = json_stream.wants_columns()
+    include_stats = 'stats' in request.args.get('include', '').split(',')
+
+    columns = "s.id, s.title, s.composer, s.composed_year"
+    stats_join = ""
+    if include_stats:
+        columns += "".join(f", {column} as {field}"
+                           for field, column in song_stats.INDEX_FIELDS.items())
+        stats_join = song_stats.STATS_JOINS
 
     try:
         if search_query:
-            query = """
-                SELECT id, title, composer, composed_year
-                FROM songs
-                WHERE title ILIKE %s
-                   OR composer ILIKE %s
-                   OR EXISTS (SELECT 1 FROM unnest(alt_titles) AS alt WHERE alt ILIKE %s)
-                ORDER BY title
-            """
-            params = (f'%{search_query}%', f'%{search_query}%', f'%{search_query}%')
-        else:
-            query = """
-                SELECT id, title, composer, composed_year
-                FROM songs
-                ORDER BY title
-            """
-            params = None
-
-        songs = db_tools.execute_query(query, params)
-        return jsonify(songs)
+            clause = search.song_clause(
+                search_query, prefix=search.is_prefix_mode(request.args.get('mode'))
+            )
+            songs = search.execute(f"""
+                SELECT {columns}
+                FROM songs s
+                {stats_join}
+                WHERE {clause.where}
+                ORDER BY {clause.score} DESC, s.title
+            """, clause.params)
+            return json_stream.rows_response(songs, columnar=columnar)
+
+        return json_stream.stream_query(f"""
+            SELECT {columns}
+            FROM songs s
+            {stats_join}
+            ORDER BY s.title
+        """, columnar=columnar)
 
     except Exception as e:
         logger.error(f"Error fetching songs index: {e}")
@@ -2,9 +2,11 @@
 from flask import Blueprint, jsonify, request
 import logging
 import db_utils as db_tools
+from core.response_cache import invalidate_on_write
 
 logger = logging.getLogger(__name__)
 transcriptions_bp = Blueprint('transcriptions', __name__)
+transcriptions_bp.after_request(invalidate_on_write)
 
 # Transcription endpoints:
 # - GET /songs/<song_id>/transcriptions
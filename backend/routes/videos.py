@@ -2,9 +2,11 @@
 from flask import Blueprint, jsonify, request
 import logging
 import db_utils as db_tools
+from core.response_cache import invalidate_on_write
 
 logger = logging.getLogger(__name__)
 videos_bp = Blueprint('videos', __name__)
+videos_bp.after_request(invalidate_on_write)
 
 
 @videos_bp.route('/videos', methods=['POST'])
@@ -250,7 +250,8 @@ def audit_existing_matches(song_name: str, matcher: SpotifyMatcher) -> dict:
 
     seen_track_ids = set()
 
-    for rec in existing:
+    # Fetch the tracks 50 per API call, a window of rows ahead of the loop
+    for rec in matcher.hydrator.prefetch_tracks(existing, lambda rec: rec['spotify_track_id']):
         track_id = rec['spotify_track_id']
 
         # Skip duplicates (same track on multiple recordings)
@@ -587,6 +588,33 @@ def get_tracks_with_albums(song_id: str) -> list:
             return cur.fetchall()
 
 
+def album_tracks_from_details(album: dict) -> list:
+    """
+    Track list embedded in a batched album lookup, in the shape
+    SpotifyMatcher.get_album_tracks() returns, or None if the album has
+    more tracks than fit on the embedded first page
+    """
+    page = (album or {}).get('tracks') or {}
+    if not album or page.get('next'):
+        return None
+    return [{
+        'id': item['id'],
+        'name': item['name'],
+        'track_number': item['track_number'],
+        'disc_number': item['disc_number'],
+        'url': item['external_urls']['spotify'],
+        'duration_ms': item.get('duration_ms'),
+    } for item in page.get('items', [])]
+
+
+def get_album_tracks(matcher: SpotifyMatcher, album_id: str, albums: dict) -> list:
+    """Album tracks from the prefetched album details, else from the API"""
+    tracks = album_tracks_from_details(albums.get(album_id))
+    if tracks is not None:
+        return tracks
+    return matcher.get_album_tracks(album_id)
+
+
 def verify_track_album_consistency(song_name: str, matcher: SpotifyMatcher) -> dict:
     """
     Mode 4: Verify track/album consistency.
@@ -620,6 +648,15 @@ def verify_track_album_consistency(song_name: str, matcher: SpotifyMatcher) -> d
     # Cache album tracks to avoid redundant API calls
     album_tracks_cache = {}
 
+    # A track object names its album, so most entries are verified from
+    # batched track lookups (50 per call) without listing the album
+    track_details = matcher.hydrator.get_tracks(rec['spotify_track_id'] for rec in tracks)
+    albums = matcher.hydrator.get_albums(
+        rec['spotify_album_id'] for rec in tracks
+        if (track_details.get(rec['spotify_track_id']) or {}).get('album', {}).get('id')
+        != rec['spotify_album_id']
+    )
+
     for rec in tracks:
         track_id = rec['spotify_track_id']
         album_id = rec['spotify_album_id']
@@ -629,9 +666,30 @@ def verify_track_album_consistency(song_name: str, matcher: SpotifyMatcher) -> d
         logger.info(f"  Track ID: {track_id}")
         logger.info(f"  Album ID: {album_id}")
 
+        track = track_details.get(track_id)
+        if track and (track.get('album') or {}).get('id') == album_id:
+            logger.info(f"  ✓ CONSISTENT - Track found on album (#{track.get('track_number', '?')}: \"{track.get('name')}\")")
+            stats['consistent'] += 1
+            results.append({
+                'release_title': rec['release_title'],
+                'release_id': str(rec['release_id']),
+                'recording_id': str(rec['recording_id']),
+                'artist': artist,
+                'release_year': rec['release_year'],
+                'spotify_track_id': track_id,
+                'spotify_track_url': rec['spotify_track_url'],
+                'spotify_album_id': album_id,
+                'spotify_album_url': rec['spotify_album_url'],
+                'status': 'consistent',
+                'track_name': track.get('name'),
+                'track_number': track.get('track_number', '?')
+            })
+            logger.info("")
+            continue
+
         # Get album tracks (from cache or API)
         if album_id not in album_tracks_cache:
-            album_tracks = matcher.get_album_tracks(album_id)
+            album_tracks = get_album_tracks(matcher, album_id, albums)
             album_tracks_cache[album_id] = album_tracks
         else:
             album_tracks = album_tracks_cache[album_id]
@@ -832,6 +890,9 @@ def find_orphaned_albums(song_name: str, matcher: SpotifyMatcher, fix: bool = Fa
 
     results = []
 
+    # Album details come 20 per API call and carry the first 50 tracks
+    albums = matcher.hydrator.get_albums(rel['spotify_album_id'] for rel in orphaned)
+
     for rel in orphaned:
         artist = rel['artist_credit'] or rel['leader_name'] or 'Unknown'
         album_id = rel['spotify_album_id']
@@ -843,7 +904,7 @@ def find_orphaned_albums(song_name: str, matcher: SpotifyMatcher, fix: bool = Fa
         logger.info(f"  Spotify:     {rel['spotify_album_url']}")
 
         # Fetch album details to show what tracks ARE on it
-        album_tracks = matcher.get_album_tracks(album_id)
+        album_tracks = get_album_tracks(matcher, album_id, albums)
 
         if album_tracks:
             logger.info(f"  Album has {len(album_tracks)} tracks:")
@@ -15,12 +15,10 @@ Usage:
     python backfill_mb_durations.py --debug
 """
 
-import json
-from pathlib import Path
-
 from script_base import ScriptBase, run_script
 from db_utils import get_db_connection
-from core.cache_utils import get_cache_dir
+from core import api_cache
+from core.api_cache import CacheKey
 
 
 def main():
@@ -97,39 +95,30 @@ Examples:
 
     # Phase 1: Read from local cache
     if not args.api_only:
-        cache_dir = get_cache_dir('musicbrainz') / 'recordings'
-        script.logger.info(f"Phase 1: Reading from MB cache ({cache_dir})...")
+        script.logger.info("Phase 1: Reading from MB cache...")
 
         updates = []  # (db_id, duration_ms) pairs
 
         for mb_id in list(remaining_mb_ids):
-            cache_path = cache_dir / f"recording_{mb_id}.json"
-            if not cache_path.exists():
+            # Any cached copy will do, however old: durations don't change
+            cache_data = api_cache.get(
+                CacheKey('musicbrainz', f"recordings/recording_{mb_id}"),
+                max_age_days=float('inf'),
+            )
+            data = cache_data.get('data') if cache_data else None
+            if not data:
                 stats['cache_misses'] += 1
                 continue
 
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-
-                data = cache_data.get('data')
-                if not data:
-                    stats['cache_misses'] += 1
-                    continue
-
-                length = data.get('length')
-                if length is None:
-                    stats['cache_no_duration'] += 1
-                    # Keep in remaining_mb_ids so Phase 2 can re-fetch from API
-                    continue
-
-                stats['cache_hits'] += 1
-                updates.append((int(length), mb_to_db[mb_id]))
-                remaining_mb_ids.discard(mb_id)
+            length = data.get('length')
+            if length is None:
+                stats['cache_no_duration'] += 1
+                # Keep in remaining_mb_ids so Phase 2 can re-fetch from API
+                continue
 
-            except (json.JSONDecodeError, KeyError) as e:
-                script.logger.debug(f"  Cache read error for {mb_id}: {e}")
-                stats['cache_misses'] += 1
+            stats['cache_hits'] += 1
+            updates.append((int(length), mb_to_db[mb_id]))
+            remaining_mb_ids.discard(mb_id)
 
         script.logger.info(f"  Cache: {stats['cache_hits']} hits, "
                           f"{stats['cache_misses']} misses, "
@@ -20,6 +20,7 @@ Rate Limiting:
 from script_base import ScriptBase, run_script
 from db_utils import get_db_connection
 from integrations.musicbrainz.utils import MusicBrainzSearcher
+from integrations import rate_limiter
 
 
 def main():
@@ -78,7 +79,8 @@ Examples:
 
     # Initialize MusicBrainz API client (handles rate limiting internally)
     mb_searcher = MusicBrainzSearcher()
-    script.logger.info(f"MusicBrainz rate limit: {mb_searcher.min_request_interval}s between requests")
+    mb_bucket = rate_limiter.get_bucket(rate_limiter.MUSICBRAINZ)
+    script.logger.info(f"MusicBrainz rate limit: {1 / mb_bucket.rate:.2f}s between requests")
 
     # Process each recording
     for i, recording in enumerate(recordings, 1):
@@ -16,6 +16,7 @@ Usage:
 from script_base import ScriptBase, run_script
 from db_utils import get_db_connection
 from integrations.spotify.client import SpotifyClient
+from integrations.spotify.hydration import SpotifyHydrator
 
 
 def main():
@@ -46,6 +47,7 @@ Examples:
         'durations_updated': 0,
         'tracks_not_found': 0,
         'tracks_no_duration': 0,
+        'cache_hits': 0,
         'api_calls': 0,
         'errors': 0,
     }
@@ -74,6 +76,7 @@ Examples:
         return True
 
     spotify_client = SpotifyClient(logger=script.logger)
+    hydrator = SpotifyHydrator(spotify_client)
 
     # Batch into groups of 50
     batch_size = 50
@@ -88,10 +91,9 @@ Examples:
         track_ids = [link['service_id'] for link in batch]
 
         try:
-            tracks_data = spotify_client.get_tracks_batch(track_ids)
-            stats['api_calls'] += 1
+            tracks_data = hydrator.get_tracks(track_ids)
 
-            if tracks_data is None:
+            if any(track_id not in tracks_data for track_id in track_ids):
                 script.logger.error(f"  Failed to fetch batch from Spotify")
                 stats['errors'] += 1
                 continue
@@ -134,6 +136,8 @@ Examples:
             script.logger.error(f"  Error processing batch: {e}")
             stats['errors'] += 1
 
+    stats['cache_hits'] = hydrator.stats['cache_hits']
+    stats['api_calls'] = hydrator.stats['api_calls']
     script.print_summary(stats)
     return stats['errors'] == 0
 
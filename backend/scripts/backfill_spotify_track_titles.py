@@ -20,6 +20,7 @@ Rate Limiting:
 from script_base import ScriptBase, run_script
 from db_utils import get_db_connection
 from integrations.spotify.client import SpotifyClient
+from integrations.spotify.hydration import SpotifyHydrator
 
 
 def main():
@@ -49,6 +50,7 @@ Examples:
         'batches_processed': 0,
         'tracks_updated': 0,
         'tracks_not_found_in_spotify': 0,
+        'cache_hits': 0,
         'api_calls': 0,
         'errors': 0,
     }
@@ -79,6 +81,7 @@ Examples:
 
     # Initialize Spotify client
     spotify_client = SpotifyClient(logger=script.logger)
+    hydrator = SpotifyHydrator(spotify_client)
 
     # Batch track IDs into groups of 50
     batch_size = 50
@@ -105,11 +108,10 @@ Examples:
         track_ids = [link['service_id'] for link in batch]
 
         try:
-            # Fetch track data in batch
-            tracks_data = spotify_client.get_tracks_batch(track_ids)
-            stats['api_calls'] += 1
+            # Fetch track data in batch (cached tracks skip the API)
+            tracks_data = hydrator.get_tracks(track_ids)
 
-            if tracks_data is None:
+            if any(track_id not in tracks_data for track_id in track_ids):
                 script.logger.error(f"  Failed to fetch batch from Spotify")
                 stats['errors'] += 1
                 continue
@@ -154,6 +156,8 @@ Examples:
             script.logger.error(f"  Error processing batch: {e}")
             stats['errors'] += 1
 
+    stats['cache_hits'] = hydrator.stats['cache_hits']
+    stats['api_calls'] = hydrator.stats['api_calls']
     script.print_summary(stats)
     return stats['errors'] == 0
 
@@ -118,34 +118,21 @@ def run_explain(song_id, sort_by='year'):
         ),
         community AS (
             SELECT
-                rc.recording_id,
+                rcon.recording_id,
                 jsonb_build_object(
                     'consensus', jsonb_build_object(
-                        'performance_key', (
-                            SELECT performance_key FROM recording_contributions rc2
-                            WHERE rc2.recording_id = rc.recording_id AND rc2.performance_key IS NOT NULL
-                            GROUP BY performance_key ORDER BY COUNT(*) DESC, MAX(updated_at) DESC LIMIT 1
-                        ),
-                        'tempo_marking', (
-                            SELECT tempo_marking FROM recording_contributions rc2
-                            WHERE rc2.recording_id = rc.recording_id AND rc2.tempo_marking IS NOT NULL
-                            GROUP BY tempo_marking ORDER BY COUNT(*) DESC, MAX(updated_at) DESC LIMIT 1
-                        ),
-                        'is_instrumental', (
-                            SELECT is_instrumental FROM recording_contributions rc2
-                            WHERE rc2.recording_id = rc.recording_id AND rc2.is_instrumental IS NOT NULL
-                            GROUP BY is_instrumental ORDER BY COUNT(*) DESC, MAX(updated_at) DESC LIMIT 1
-                        )
+                        'performance_key', rcon.performance_key,
+                        'tempo_marking', rcon.tempo_marking,
+                        'is_instrumental', rcon.is_instrumental
                     ),
                     'counts', jsonb_build_object(
-                        'key', COUNT(*) FILTER (WHERE rc.performance_key IS NOT NULL),
-                        'tempo', COUNT(*) FILTER (WHERE rc.tempo_marking IS NOT NULL),
-                        'instrumental', COUNT(*) FILTER (WHERE rc.is_instrumental IS NOT NULL)
+                        'key', rcon.key_count,
+                        'tempo', rcon.tempo_count,
+                        'instrumental', rcon.instrumental_count
                     )
                 ) as community_data
-            FROM recording_contributions rc
-            WHERE rc.recording_id IN (SELECT id FROM recordings WHERE song_id = %s)
-            GROUP BY rc.recording_id
+            FROM recording_consensus rcon
+            WHERE rcon.recording_id IN (SELECT id FROM recordings WHERE song_id = %s)
         )
         SELECT
             r.id, r.title,
@@ -146,7 +146,8 @@ def fetch_popularity_data(song_name: str, output_file: str = None) -> dict:
 
     seen_track_ids = set()  # Avoid duplicate API calls for same track
 
-    for rec in recordings:
+    # Fetch the tracks 50 per API call, a window of rows ahead of the loop
+    for rec in matcher.hydrator.prefetch_tracks(recordings, lambda rec: rec['spotify_track_id']):
         track_id = rec['spotify_track_id']
 
         # Skip if we've already fetched this track
@@ -48,6 +48,8 @@ Notes:
   - By default, releases that have already been checked are SKIPPED
   - Use --force-refresh to re-check already processed releases
   - The CAA API has no rate limiting, but we use conservative delays
+  - Lookups run concurrently (CAA_IMPORT_WORKERS, default 4) under one
+    shared request rate, and results are written in batches
   - Results are cached locally to avoid repeated API calls
   - Only Front and Back cover types are imported
   - Releases without MusicBrainz IDs are skipped
@@ -123,6 +125,7 @@ Notes:
         script.print_section("API Performance", {
             "API calls": stats['api_calls'],
             "Cache hits": stats['cache_hits'],
+            "No art (from MusicBrainz)": stats['no_art_from_musicbrainz'],
         })
 
         script.logger.info(f"Errors: {stats['errors']}")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Import legacy Spotify rematch run files
+
+Spotify rematch runs used to be saved as JSON files under
+backend/data/spotify_rematch_runs/. They now live in the spotify_rematch_runs
+table (sql/migrations/022_spotify_rematch_runs.sql). This copies the old
+files into the table so the admin run history keeps them. Runs already in
+the table are skipped, so it is safe to re-run.
+
+Usage:
+    python import_spotify_rematch_runs.py
+    python import_spotify_rematch_runs.py --dry-run
+    python import_spotify_rematch_runs.py --dir /path/to/spotify_rematch_runs
+"""
+
+from pathlib import Path
+
+from script_base import ScriptBase, run_script
+from core.spotify_rematch import LEGACY_RUNS_DIR, import_legacy_runs
+
+
+def main():
+    script = ScriptBase(
+        name="import_spotify_rematch_runs",
+        description="Copy legacy Spotify rematch run JSON files into spotify_rematch_runs",
+        epilog="""
+Examples:
+  python import_spotify_rematch_runs.py --dry-run
+  python import_spotify_rematch_runs.py --delete
+        """
+    )
+
+    script.parser.add_argument(
+        '--dir',
+        type=Path,
+        default=LEGACY_RUNS_DIR,
+        help=f'Directory of run files (default: {LEGACY_RUNS_DIR})'
+    )
+    script.parser.add_argument(
+        '--delete',
+        action='store_true',
+        help='Delete each file once it has been imported'
+    )
+    script.add_dry_run_arg()
+    script.add_debug_arg()
+
+    args = script.parse_args()
+
+    script.print_header({"DRY RUN": args.dry_run, "DELETE": args.delete})
+
+    stats = import_legacy_runs(
+        args.dir, dry_run=args.dry_run, delete=args.delete, logger=script.logger
+    )
+
+    script.print_summary(stats)
+    return True
+
+
+if __name__ == "__main__":
+    run_script(main)
@@ -43,9 +43,12 @@ os.environ['DB_USE_POOLING'] = 'true'
 
 from script_base import ScriptBase, run_script
 from db_utils import get_db_connection
+from core.api_cache import CacheKey
 from integrations.spotify.client import SpotifyClient, _CACHE_MISS
-from rapidfuzz import fuzz
-from integrations.spotify.matching import calculate_similarity, normalize_for_comparison
+import numpy as np
+from integrations.spotify.matching import (
+    calculate_similarity, normalize_for_comparison, token_sort_matrix
+)
 from integrations.spotify.db import (
     update_release_spotify_data,
     update_recording_default_release,
@@ -121,6 +124,7 @@ class TrackListMatcher:
             'tracks_updated': 0,
             'api_calls': 0,
             'cache_hits': 0,
+            'albums_pruned': 0,
         }
 
     def get_unmatched_releases_for_artist(self, artist_name: str) -> List[dict]:
@@ -172,8 +176,8 @@ class TrackListMatcher:
 
     def get_spotify_artist_id(self, artist_name: str) -> Optional[str]:
         """Search for artist on Spotify and return their ID"""
-        cache_path = self._get_artist_cache_path(artist_name)
-        cached = self.client._load_from_cache(cache_path)
+        cache_key = self._get_artist_cache_key(artist_name)
+        cached = self.client._load_from_cache(cache_key)
 
         if cached is not _CACHE_MISS:
             self.stats['cache_hits'] += 1
@@ -213,11 +217,11 @@ class TrackListMatcher:
 
             if best_match and best_score >= 80:
                 artist_id = best_match['id']
-                self.client._save_to_cache(cache_path, artist_id)
+                self.client._save_to_cache(cache_key, artist_id)
                 self.logger.debug(f"Found Spotify artist: {best_match['name']} (ID: {artist_id}, score: {best_score}%)")
                 return artist_id
 
-            self.client._save_to_cache(cache_path, None)
+            self.client._save_to_cache(cache_key, None)
             return None
 
         except Exception as e:
@@ -226,8 +230,8 @@ class TrackListMatcher:
 
     def get_spotify_artist_albums(self, artist_id: str) -> List[dict]:
         """Fetch all albums for an artist from Spotify"""
-        cache_path = self._get_artist_albums_cache_path(artist_id)
-        cached = self.client._load_from_cache(cache_path)
+        cache_key = self._get_artist_albums_cache_key(artist_id)
+        cached = self.client._load_from_cache(cache_key)
 
         if cached is not _CACHE_MISS:
             self.stats['cache_hits'] += 1
@@ -267,7 +271,7 @@ class TrackListMatcher:
                 offset += limit
 
             self.logger.debug(f"Found {len(all_albums)} albums for artist")
-            self.client._save_to_cache(cache_path, all_albums)
+            self.client._save_to_cache(cache_key, all_albums)
             return all_albums
 
         except Exception as e:
@@ -276,8 +280,8 @@ class TrackListMatcher:
 
     def get_spotify_album_tracks(self, album_id: str) -> List[TrackInfo]:
         """Fetch tracks for a Spotify album"""
-        cache_path = self.client._get_album_cache_path(album_id)
-        cached = self.client._load_from_cache(cache_path)
+        cache_key = self.client._get_album_cache_key(album_id)
+        cached = self.client._load_from_cache(cache_key)
 
         if cached is not _CACHE_MISS:
             self.stats['cache_hits'] += 1
@@ -319,7 +323,7 @@ class TrackListMatcher:
                 'disc_number': item['disc_number'],
                 'url': item['external_urls']['spotify']
             } for item in items]
-            self.client._save_to_cache(cache_path, cache_data)
+            self.client._save_to_cache(cache_key, cache_data)
 
             # Return as TrackInfo (including Spotify IDs and normalized title)
             return [TrackInfo(
@@ -364,40 +368,28 @@ class TrackListMatcher:
 
         matched_tracks: List[TrackMatch] = []
         unmatched_mb_tracks = []
-        used_spotify_indices = set()
-
-        # Pre-normalize MB track titles once
-        mb_normalized = {id(t): normalize_for_comparison(t.title) for t in mb_tracks}
-
-        # For each MusicBrainz track, find best matching Spotify track
-        for mb_track in mb_tracks:
-            best_match: Optional[TrackInfo] = None
-            best_score = 0
-            best_idx = -1
-            mb_norm = mb_normalized[id(mb_track)]
-
-            for idx, sp_track in enumerate(spotify_tracks):
-                if idx in used_spotify_indices:
-                    continue
 
-                # Use pre-normalized Spotify title if available, otherwise normalize
-                sp_norm = sp_track.normalized_title if sp_track.normalized_title else normalize_for_comparison(sp_track.title)
+        # Score every MB track against every Spotify track in one vectorized
+        # pass (titles are normalized once; normalization is memoized)
+        mb_norms = [normalize_for_comparison(t.title) for t in mb_tracks]
+        sp_norms = [t.normalized_title or normalize_for_comparison(t.title) for t in spotify_tracks]
+        scores = token_sort_matrix(mb_norms, sp_norms)
 
-                # Direct fuzzy comparison on normalized strings (faster than calculate_similarity)
-                score = fuzz.token_sort_ratio(mb_norm, sp_norm)
+        # Bonus for matching position (only if tracks in similar position)
+        mb_positions = np.array([t.position for t in mb_tracks])
+        sp_positions = np.array([t.position for t in spotify_tracks])
+        near = np.abs(mb_positions[:, None] - sp_positions[None, :]) <= 2
+        scores = np.where(near & (scores >= 70), np.minimum(100, scores + 5), scores)
 
-                # Bonus for matching position (only if tracks in similar position)
-                position_diff = abs(mb_track.position - sp_track.position)
-                if position_diff <= 2 and score >= 70:
-                    score = min(100, score + 5)
-
-                if score > best_score:
-                    best_score = score
-                    best_match = sp_track
-                    best_idx = idx
+        # For each MusicBrainz track (in order), take the best unused Spotify
+        # track; ties go to the earliest Spotify track
+        for row, mb_track in enumerate(mb_tracks):
+            best_idx = int(np.argmax(scores[row]))
+            best_score = float(scores[row, best_idx])
 
             # Accept match if similarity is high enough
-            if best_match and best_score >= 75:
+            if best_score >= 75:
+                best_match = spotify_tracks[best_idx]
                 matched_tracks.append(TrackMatch(
                     mb_title=mb_track.title,
                     mb_position=mb_track.position,
@@ -409,7 +401,8 @@ class TrackListMatcher:
                     spotify_track_url=best_match.spotify_track_url,
                     similarity=best_score
                 ))
-                used_spotify_indices.add(best_idx)
+                # Used: never chosen again
+                scores[:, best_idx] = -1
             else:
                 unmatched_mb_tracks.append(mb_track.title)
 
@@ -456,6 +449,15 @@ class TrackListMatcher:
             reason=reason
         )
 
+    @staticmethod
+    def _max_possible_score(mb_count: int, spotify_count: int) -> float:
+        """Upper bound of compare_track_lists()' score for these track counts"""
+        if not mb_count or not spotify_count:
+            return 0
+        matchable = min(mb_count, spotify_count)
+        count_ratio = matchable / max(mb_count, spotify_count)
+        return matchable / mb_count * 100 * (0.8 + 0.2 * count_ratio)
+
     def _extract_album_art(self, spotify_album: dict) -> Dict[str, str]:
         """Extract album art URLs from Spotify album"""
         album_art = {}
@@ -510,16 +512,14 @@ class TrackListMatcher:
 
         return True
 
-    def _get_artist_cache_path(self, artist_name: str) -> Path:
-        """Get cache path for artist ID lookup"""
+    def _get_artist_cache_key(self, artist_name: str) -> CacheKey:
+        """Get cache key for artist ID lookup"""
         safe_name = hashlib.md5(artist_name.lower().encode()).hexdigest()
-        return self.client.cache_dir / 'artists' / f'artist_{safe_name}.json'
+        return CacheKey('spotify', f'artists/artist_{safe_name}')
 
-    def _get_artist_albums_cache_path(self, artist_id: str) -> Path:
-        """Get cache path for artist albums"""
-        cache_dir = self.client.cache_dir / 'artist_albums'
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir / f'albums_{artist_id}.json'
+    def _get_artist_albums_cache_key(self, artist_id: str) -> CacheKey:
+        """Get cache key for artist albums"""
+        return CacheKey('spotify', f'artist_albums/albums_{artist_id}')
 
     def preload_spotify_album_tracks(self, spotify_albums: List[dict]) -> Dict[str, List[TrackInfo]]:
         """
@@ -567,6 +567,12 @@ class TrackListMatcher:
             if not spotify_tracks:
                 continue
 
+            # Blocking on track count: skip albums that could not beat the
+            # current best even if every possible track matched
+            if self._max_possible_score(len(mb_tracks), len(spotify_tracks)) <= best_score:
+                self.stats['albums_pruned'] += 1
+                continue
+
             result = self.compare_track_lists(mb_tracks, spotify_tracks, album)
 
             if result.score > best_score:
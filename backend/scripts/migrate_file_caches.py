@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Migrate File Caches
+
+One-shot import of the old per-file API caches (cache/<service>/**/*.json)
+into the consolidated SQLite cache (core/api_cache.py).
+
+Each file becomes the entry its client now looks up: namespace is the
+service directory, key is the path below it without the .json extension,
+and the file's mtime is kept as the entry's stored_at so freshness is
+unchanged. Entries already in the database with a newer stored_at are left
+alone, so the script is safe to re-run (e.g. after a partial run).
+
+Usage:
+    python migrate_file_caches.py --dry-run
+    python migrate_file_caches.py
+    python migrate_file_caches.py --namespace musicbrainz --delete-files
+"""
+
+import json
+
+from script_base import ScriptBase, run_script
+from core import api_cache
+from core.api_cache import CacheKey
+from core.cache_utils import get_cache_root
+
+NAMESPACES = ['musicbrainz', 'spotify', 'apple_music', 'coverart', 'wikipedia']
+
+
+def iter_cache_files(namespace_dir):
+    """Yield every cached JSON file under a service directory"""
+    for path in namespace_dir.rglob('*.json'):
+        if path.is_file():
+            yield path
+
+
+def migrate_namespace(script, namespace, args, stats):
+    namespace_dir = get_cache_root() / namespace
+    if not namespace_dir.is_dir():
+        script.logger.info(f"{namespace}: no cache directory, skipping")
+        return
+
+    script.logger.info(f"{namespace}: importing from {namespace_dir}")
+    batch = []
+    imported_paths = []
+    seen = 0
+
+    def flush():
+        if not args.dry_run:
+            api_cache.get_cache().set_many(batch)
+            if args.delete_files:
+                for path in imported_paths:
+                    path.unlink(missing_ok=True)
+        stats['entries_imported'] += len(batch)
+        batch.clear()
+        imported_paths.clear()
+
+    for path in iter_cache_files(namespace_dir):
+        seen += 1
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            stored_at = path.stat().st_mtime
+        except (OSError, ValueError) as e:
+            script.logger.debug(f"  Unreadable cache file {path}: {e}")
+            stats['files_unreadable'] += 1
+            continue
+
+        key = path.relative_to(namespace_dir).with_suffix('').as_posix()
+        batch.append((CacheKey(namespace, key), value, stored_at))
+        imported_paths.append(path)
+        stats['bytes_read'] += path.stat().st_size
+
+        if len(batch) >= args.batch_size:
+            flush()
+        if seen % 10000 == 0:
+            script.logger.info(f"  {namespace}: {seen} files scanned")
+
+    if batch:
+        flush()
+    stats['files_scanned'] += seen
+    script.logger.info(f"  {namespace}: {seen} files scanned")
+
+
+def main():
+    script = ScriptBase(
+        name="migrate_file_caches",
+        description="Import per-file API caches into the consolidated SQLite cache",
+        epilog="""
+Examples:
+  python migrate_file_caches.py --dry-run
+  python migrate_file_caches.py
+  python migrate_file_caches.py --namespace spotify --delete-files
+        """
+    )
+
+    script.add_dry_run_arg()
+    script.add_debug_arg()
+    script.parser.add_argument(
+        '--namespace',
+        choices=NAMESPACES,
+        action='append',
+        help='Only migrate this service (repeatable; default: all)'
+    )
+    script.parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=1000,
+        help='Entries written per transaction (default: 1000)'
+    )
+    script.parser.add_argument(
+        '--delete-files',
+        action='store_true',
+        help='Delete each cache file once its entry is committed'
+    )
+
+    args = script.parse_args()
+
+    script.print_header({
+        "DRY RUN": args.dry_run,
+        "DELETE FILES": args.delete_files,
+    })
+
+    stats = {
+        'files_scanned': 0,
+        'files_unreadable': 0,
+        'entries_imported': 0,
+        'bytes_read': 0,
+    }
+
+    for namespace in args.namespace or NAMESPACES:
+        migrate_namespace(script, namespace, args, stats)
+
+    if not args.dry_run:
+        stats['cache_bytes_stored'] = api_cache.get_cache().total_bytes()
+
+    script.print_summary(stats)
+    return True
+
+
+if __name__ == "__main__":
+    run_script(main)
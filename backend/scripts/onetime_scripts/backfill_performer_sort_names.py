@@ -6,7 +6,7 @@ Fetches sort_name, artist_type, and disambiguation from MusicBrainz for
 performers that have a musicbrainz_id but are missing these fields.
 
 This script uses a two-phase approach:
-1. First, extract artist data from cached release files (no API calls needed)
+1. First, extract artist data from cached release details (no API calls needed)
 2. Then, for any remaining performers, fetch from MusicBrainz API
 
 This is a one-time migration script to populate the new fields added to
@@ -18,32 +18,30 @@ Run after applying the migration in jazz-db-schema.sql that adds:
 - disambiguation VARCHAR(500)
 """
 
-import json
 import time
-from pathlib import Path
 from script_base import ScriptBase, run_script
 from db_utils import get_db_connection
 from integrations.musicbrainz.utils import MusicBrainzSearcher
-from core.cache_utils import get_cache_dir
+from core import api_cache
+
+# Read every cached release, however old
+ANY_AGE = float('inf')
 
 
 def extract_artists_from_release_cache():
     """
-    Extract artist metadata from all cached release files.
+    Extract artist metadata from all cached MusicBrainz release details.
 
     Returns:
         dict: Mapping of artist MBID -> {sort_name, artist_type, disambiguation}
     """
-    release_cache_dir = get_cache_dir('musicbrainz') / 'releases'
     artists = {}
 
-    if not release_cache_dir.exists():
-        return artists
-
-    for cache_file in release_cache_dir.glob('release_*.json'):
+    for cache_key in api_cache.keys('musicbrainz', 'releases/release_'):
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            cache_data = api_cache.get(cache_key, max_age_days=ANY_AGE)
+            if not cache_data:
+                continue
 
             release_data = cache_data.get('data')
             if not release_data:
@@ -107,7 +105,7 @@ def extract_artists_from_release_cache():
                         }
 
         except Exception as e:
-            # Skip files we can't parse
+            # Skip entries we can't parse
             continue
 
     return artists
@@ -199,7 +197,7 @@ Examples:
     # =========================================================================
     # Phase 1: Bulk update from release cache (no API calls)
     # =========================================================================
-    script.logger.info("Phase 1: Extracting artist data from release cache files...")
+    script.logger.info("Phase 1: Extracting artist data from cached release details...")
     release_cache_artists = extract_artists_from_release_cache()
     stats['phase1_cache_artists'] = len(release_cache_artists)
     script.logger.info(f"Found {len(release_cache_artists)} unique artists in release cache")
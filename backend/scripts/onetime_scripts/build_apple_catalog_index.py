@@ -6,6 +6,10 @@ Loads the downloaded Apple Music parquet files into an indexed DuckDB database
 for fast searching. This is a one-time operation that makes subsequent searches
 nearly instant.
 
+Album, song and artist names also get a trigram name index (posting tables
+of normalized-name trigrams) that AppleMusicCatalog uses for ranked,
+typo-tolerant substring search instead of scanning with LIKE '%x%'.
+
 IMPORTANT: The Apple Music Feed has a known issue where primaryArtists[].name
 contains localized names (e.g., Japanese) instead of English. To get English
 artist names, you must also download the 'artists' catalog, which contains
@@ -30,6 +34,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pathlib import Path
 from script_base import ScriptBase, run_script
+from integrations.apple_music.feed import (
+    AppleMusicCatalog, build_name_search_index, name_norm_sql
+)
 
 try:
     import duckdb
@@ -140,7 +147,7 @@ Examples:
         script.logger.info("=" * 50)
 
         # Get table counts
-        for table in ['albums', 'songs']:
+        for table in ['albums', 'songs', 'album_name_grams', 'song_name_grams', 'artist_name_grams']:
             try:
                 count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
                 script.logger.info(f"  {table}: {count:,} records")
@@ -165,6 +172,12 @@ Examples:
         script.logger.info(f"  'Kind of Blue' search: {elapsed:.1f}ms ({len(result)} results)")
 
         conn.close()
+
+        catalog = AppleMusicCatalog(db_path=str(db_path), logger=script.logger)
+        start = time.time()
+        result = catalog.search_albums(artist_name='Miles Davis', album_title='Kind of Blue', limit=5)
+        elapsed = (time.time() - start) * 1000
+        script.logger.info(f"  'Kind of Blue' catalog search: {elapsed:.1f}ms ({len(result)} results)")
         return True
 
     # Build mode
@@ -251,7 +264,9 @@ Examples:
                 a.upc,
                 a.urlTemplate as url_template,
                 -- Store full primaryArtists for multi-artist albums
-                CAST(a.primaryArtists AS VARCHAR) as primary_artists_json
+                CAST(a.primaryArtists AS VARCHAR) as primary_artists_json,
+                {name_norm_sql('a.nameDefault')} as name_norm,
+                {name_norm_sql('COALESCE(art.name_english, a.primaryArtists[1].name)')} as artist_norm
             FROM read_parquet('{albums_glob}') a
             LEFT JOIN artists art ON a.primaryArtists[1].id = art.id
             WHERE a.nameDefault IS NOT NULL
@@ -270,7 +285,9 @@ Examples:
                 upc,
                 urlTemplate as url_template,
                 -- Store full primaryArtists for multi-artist albums
-                CAST(primaryArtists AS VARCHAR) as primary_artists_json
+                CAST(primaryArtists AS VARCHAR) as primary_artists_json,
+                {name_norm_sql('nameDefault')} as name_norm,
+                {name_norm_sql('primaryArtists[1].name')} as artist_norm
             FROM read_parquet('{albums_glob}')
             WHERE nameDefault IS NOT NULL
         """)
@@ -293,8 +310,8 @@ Examples:
     script.logger.info("Creating album indexes...")
     start = time.time()
 
-    conn.execute("CREATE INDEX idx_album_name ON albums(LOWER(name))")
-    conn.execute("CREATE INDEX idx_album_artist ON albums(LOWER(artist_name))")
+    # Name/artist searches go through the trigram name index below
+    conn.execute("CREATE INDEX idx_album_artist_norm ON albums(artist_norm)")
     conn.execute("CREATE INDEX idx_album_id ON albums(id)")
 
     elapsed = time.time() - start
@@ -320,7 +337,9 @@ Examples:
                     s.trackNumber as track_number,
                     s.durationInMillis as duration_ms,
                     s.isrc,
-                    s.shortPreview as preview_url
+                    s.shortPreview as preview_url,
+                    {name_norm_sql('s.nameDefault')} as name_norm,
+                    {name_norm_sql('COALESCE(art.name_english, s.primaryArtists[1].name)')} as artist_norm
                 FROM read_parquet('{songs_glob}') s
                 LEFT JOIN artists art ON s.primaryArtists[1].id = art.id
                 WHERE s.nameDefault IS NOT NULL
@@ -340,7 +359,9 @@ Examples:
                     trackNumber as track_number,
                     durationInMillis as duration_ms,
                     isrc,
-                    shortPreview as preview_url
+                    shortPreview as preview_url,
+                    {name_norm_sql('nameDefault')} as name_norm,
+                    {name_norm_sql('primaryArtists[1].name')} as artist_norm
                 FROM read_parquet('{songs_glob}')
                 WHERE nameDefault IS NOT NULL
             """)
@@ -356,8 +377,7 @@ Examples:
             script.logger.info("Creating song indexes...")
             start = time.time()
 
-            conn.execute("CREATE INDEX idx_song_name ON songs(LOWER(name))")
-            conn.execute("CREATE INDEX idx_song_artist ON songs(LOWER(artist_name))")
+            conn.execute("CREATE INDEX idx_song_artist_norm ON songs(artist_norm)")
             conn.execute("CREATE INDEX idx_song_album ON songs(album_id)")
             conn.execute("CREATE INDEX idx_song_id ON songs(id)")
 
@@ -366,6 +386,14 @@ Examples:
     elif args.albums_only:
         script.logger.info("Skipping songs (--albums-only mode)")
 
+    # Trigram name index (songs only when their indexes are built)
+    index_songs = bool(songs_glob) and not args.albums_only and not args.skip_song_indexes
+    script.logger.info("Building name search index...")
+    start = time.time()
+    build_name_search_index(conn, script.logger, include_songs=index_songs)
+    elapsed = time.time() - start
+    script.logger.info(f"  Built name search index in {elapsed:.1f}s")
+
     # Drop the artists lookup table to save space (data is now in albums/songs)
     if has_artists:
         script.logger.info("Dropping artists lookup table (no longer needed)...")
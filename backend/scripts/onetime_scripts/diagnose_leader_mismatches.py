@@ -2,8 +2,9 @@
 """
 Diagnose Leader Mismatches
 
-Scans cached MusicBrainz recording files and compares the expected leader
-(derived from artist-credit) against the actual leader in the database.
+Scans cached MusicBrainz recordings (core/api_cache) and compares the
+expected leader (derived from artist-credit) against the actual leader in
+the database.
 
 This helps identify recordings where the wrong performer was marked as leader
 due to the "&" vs "and" normalization bug.
@@ -13,12 +14,11 @@ Usage:
 
 Options:
     --fix       Actually fix the mismatches in the database
-    --limit N   Only process first N cached files (for testing)
+    --limit N   Only process first N cached recordings (for testing)
 """
 
 import sys
 import os
-import json
 import argparse
 from pathlib import Path
 
@@ -27,7 +27,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from db_utils import get_db_connection
 from integrations.musicbrainz.performer_importer import normalize_group_name, is_performer_leader_of_group
-from core.cache_utils import get_cache_dir
+from core import api_cache
+
+# Read every cached recording, however old
+ANY_AGE = float('inf')
 
 def get_expected_leader_name(recording_data):
     """
@@ -60,37 +63,32 @@ def find_mismatches(limit=None, verbose=True):
 
     Returns list of dicts with mismatch info.
     """
-    cache_dir = get_cache_dir('musicbrainz') / 'recordings'
-
-    if not cache_dir.exists():
-        print(f"Cache directory not found: {cache_dir}")
-        return []
-
     mismatches = []
     processed = 0
 
-    # Get all cached recording files
-    cache_files = list(cache_dir.glob('recording_*.json'))
-    print(f"Found {len(cache_files)} cached recording files")
+    # Get all cached recordings
+    cache_keys = list(api_cache.keys('musicbrainz', 'recordings/recording_'))
+    print(f"Found {len(cache_keys)} cached recordings")
 
     if limit:
-        cache_files = cache_files[:limit]
-        print(f"Processing first {limit} files")
+        cache_keys = cache_keys[:limit]
+        print(f"Processing first {limit} recordings")
 
     with get_db_connection() as conn:
         with conn.cursor() as cur:
-            for cache_file in cache_files:
+            for cache_key in cache_keys:
                 processed += 1
 
                 if processed % 500 == 0:
-                    print(f"  Processed {processed} files...")
+                    print(f"  Processed {processed} recordings...")
 
                 try:
-                    with open(cache_file) as f:
-                        cache_data = json.load(f)
+                    cache_data = api_cache.get(cache_key, max_age_days=ANY_AGE)
+                    if not cache_data:
+                        continue
 
-                    recording_data = cache_data.get('data', {})
-                    mb_recording_id = cache_file.stem.replace('recording_', '')
+                    recording_data = cache_data.get('data') or {}
+                    mb_recording_id = cache_key.name.replace('recording_', '')
 
                     # Get expected leader from artist-credit
                     expected_leader = get_expected_leader_name(recording_data)
@@ -168,7 +166,7 @@ def find_mismatches(limit=None, verbose=True):
 
                 except Exception as e:
                     if verbose:
-                        print(f"Error processing {cache_file}: {e}")
+                        print(f"Error processing {cache_key.name}: {e}")
                     continue
 
     return mismatches
@@ -216,7 +214,7 @@ def fix_mismatches(mismatches):
 def main():
     parser = argparse.ArgumentParser(description='Diagnose leader mismatches in recordings')
     parser.add_argument('--fix', action='store_true', help='Actually fix the mismatches')
-    parser.add_argument('--limit', type=int, help='Limit number of files to process')
+    parser.add_argument('--limit', type=int, help='Limit number of cached recordings to process')
     parser.add_argument('--quiet', action='store_true', help='Suppress individual mismatch output')
     args = parser.parse_args()
 
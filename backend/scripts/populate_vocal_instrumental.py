@@ -98,6 +98,25 @@ def get_existing_contributions(cur, bot_user_id: str):
     return {str(row['recording_id']) for row in cur.fetchall()}
 
 
+def insert_batch(cur, batch_values):
+    """
+    Upsert a batch of (recording_id, user_id, is_instrumental) rows.
+
+    One multi-row statement rather than executemany, so the statement-level
+    triggers that refresh recording_consensus run once per batch instead of
+    once per row.
+    """
+    recording_ids, user_ids, flags = zip(*batch_values)
+    cur.execute("""
+        INSERT INTO recording_contributions
+            (recording_id, user_id, is_instrumental)
+        SELECT * FROM unnest(%s::uuid[], %s::uuid[], %s::boolean[])
+        ON CONFLICT (recording_id, user_id)
+        DO UPDATE SET is_instrumental = EXCLUDED.is_instrumental,
+                      updated_at = CURRENT_TIMESTAMP
+    """, (list(recording_ids), list(user_ids), list(flags)))
+
+
 def main():
     script = ScriptBase(
         name="populate_vocal_instrumental",
@@ -172,28 +191,14 @@ Examples:
 
                     # Insert in batches
                     if len(batch_values) >= batch_size:
-                        cur.executemany("""
-                            INSERT INTO recording_contributions
-                                (recording_id, user_id, is_instrumental)
-                            VALUES (%s, %s, %s)
-                            ON CONFLICT (recording_id, user_id)
-                            DO UPDATE SET is_instrumental = EXCLUDED.is_instrumental,
-                                          updated_at = CURRENT_TIMESTAMP
-                        """, batch_values)
+                        insert_batch(cur, batch_values)
                         conn.commit()
                         script.logger.info(f"  Inserted batch of {len(batch_values)} contributions...")
                         batch_values = []
 
             # Insert remaining batch
             if batch_values and not args.dry_run:
-                cur.executemany("""
-                    INSERT INTO recording_contributions
-                        (recording_id, user_id, is_instrumental)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT (recording_id, user_id)
-                    DO UPDATE SET is_instrumental = EXCLUDED.is_instrumental,
-                                  updated_at = CURRENT_TIMESTAMP
-                """, batch_values)
+                insert_batch(cur, batch_values)
                 conn.commit()
                 script.logger.info(f"  Inserted final batch of {len(batch_values)} contributions")
 
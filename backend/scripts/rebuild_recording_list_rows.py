@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Rebuild the recording_list_rows projection
+
+recording_list_rows (sql/migrations/015_recording_list_rows.sql) holds one
+pre-computed list row per recording for GET /songs/<id>/recordings and
+GET /recordings/batch. Triggers keep it current on every write, so this
+script is only needed as a reconcile step: after restoring a dump taken
+with triggers disabled, after a bulk load with session_replication_role =
+replica, or whenever a row is suspected to have drifted.
+
+Rows are rebuilt song by song, one transaction per song, so a catalog-wide
+run never holds locks on more than one song's recordings at a time.
+
+Usage:
+    python rebuild_recording_list_rows.py --name "Body and Soul"
+    python rebuild_recording_list_rows.py --id <song-uuid>
+    python rebuild_recording_list_rows.py --all
+    python rebuild_recording_list_rows.py --all --dry-run
+"""
+
+from script_base import ScriptBase, run_script
+from db_utils import get_db_connection
+
+
+def rebuild_song(song_id, dry_run: bool) -> int:
+    """Recompute every list row for one song. Returns the recording count."""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT array_agg(id) as ids FROM recordings WHERE song_id = %s",
+                (song_id,)
+            )
+            ids = cur.fetchone()['ids'] or []
+            if ids and not dry_run:
+                cur.execute("SELECT refresh_recording_list_rows(%s::uuid[])", (ids,))
+                conn.commit()
+            return len(ids)
+
+
+def main():
+    script = ScriptBase(
+        name="rebuild_recording_list_rows",
+        description="Rebuild the recording_list_rows projection for one song or the whole catalog",
+        epilog="""
+Examples:
+  python rebuild_recording_list_rows.py --name "Body and Soul"
+  python rebuild_recording_list_rows.py --all
+  python rebuild_recording_list_rows.py --all --dry-run
+        """
+    )
+
+    group = script.add_song_args(required=False)
+    group.add_argument('--all', action='store_true', help='Rebuild every song')
+    script.add_dry_run_arg()
+    script.add_debug_arg()
+
+    args = script.parse_args()
+
+    if not (args.name or args.id or args.all):
+        script.parser.error("one of --name, --id or --all is required")
+
+    script.print_header({
+        "DRY RUN": args.dry_run,
+    })
+
+    if args.all:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT id, title FROM songs ORDER BY title")
+                songs = cur.fetchall()
+    else:
+        songs = [script.find_song(args)]
+
+    stats = {
+        'songs_processed': 0,
+        'recordings_rebuilt': 0,
+        'errors': 0,
+    }
+
+    for song in songs:
+        try:
+            count = rebuild_song(song['id'], args.dry_run)
+            stats['songs_processed'] += 1
+            stats['recordings_rebuilt'] += count
+            script.logger.debug(f"{song['title']}: {count} recordings")
+        except Exception as e:
+            stats['errors'] += 1
+            script.logger.error(f"Error rebuilding {song['title']}: {e}")
+
+    script.print_summary(stats)
+    return stats['errors'] == 0
+
+
+if __name__ == "__main__":
+    run_script(main)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Reconcile the song_streaming_stats rollup
+
+song_streaming_stats (sql/migrations/020_song_streaming_stats.sql) holds the
+per-song streaming coverage counts for /admin/streaming-availability. A
+trigger keeps it current and the research worker reconciles it periodically;
+run this after a bulk load with triggers disabled, or to check for drift.
+
+The rollup is aggregated from recording_list_rows, so if the per-recording
+flags themselves are suspect, run rebuild_recording_list_rows.py first.
+
+Usage:
+    python reconcile_song_streaming_stats.py --all
+    python reconcile_song_streaming_stats.py --name "Body and Soul"
+    python reconcile_song_streaming_stats.py --id <song-uuid>
+"""
+
+from script_base import ScriptBase, run_script
+from core import streaming_stats
+
+
+def main():
+    script = ScriptBase(
+        name="reconcile_song_streaming_stats",
+        description="Re-aggregate the song_streaming_stats rollup for one song or the whole catalog",
+        epilog="""
+Examples:
+  python reconcile_song_streaming_stats.py --all
+  python reconcile_song_streaming_stats.py --name "Body and Soul"
+        """
+    )
+
+    group = script.add_song_args(required=False)
+    group.add_argument('--all', action='store_true', help='Reconcile every song')
+    script.add_debug_arg()
+
+    args = script.parse_args()
+
+    if not (args.name or args.id or args.all):
+        script.parser.error("one of --name, --id or --all is required")
+
+    script.print_header()
+
+    if args.all:
+        result = streaming_stats.reconcile()
+        stats = {
+            'songs_processed': result['songs'] - result['skipped'],
+            'songs_skipped': result['skipped'],
+            'rows_drifted': result['drifted'],
+        }
+    else:
+        song = script.find_song(args)
+        stats = {
+            'songs_processed': 1,
+            'rows_drifted': streaming_stats.refresh_songs([song['id']]),
+        }
+
+    script.print_summary(stats)
+    return True
+
+
+if __name__ == "__main__":
+    run_script(main)
@@ -12,8 +12,10 @@ no surprises.
 
 Defaults set BEFORE backend imports
 -----------------------------------
-``RATELIMIT_ENABLED`` and ``JWT_SECRET`` are read at module-import time by
-``rate_limit.py`` and ``core.auth_utils`` respectively. They MUST be set
+``RATELIMIT_ENABLED``, ``JWT_SECRET`` and ``RESPONSE_CACHE_ENABLED`` are read
+at module-import time by ``rate_limit.py``, ``core.auth_utils`` and
+``core.response_cache`` respectively. The response cache is off by default
+because fixtures reuse deterministic IDs across tests. They MUST be set
 before the ``app`` fixture imports the Flask app, so we set sane defaults
 at the very top of this file.
 """
@@ -29,6 +31,7 @@ from pathlib import Path
 # ``app``).
 os.environ.setdefault("RATELIMIT_ENABLED", "false")
 os.environ.setdefault("JWT_SECRET", "pytest-test-secret")
+os.environ.setdefault("RESPONSE_CACHE_ENABLED", "false")
 
 # Make ``backend/`` importable so we can ``from app import app`` etc.
 # (Mirrors what ``scripts/script_base.py`` does for CLI scripts.)
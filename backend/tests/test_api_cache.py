@@ -0,0 +1,90 @@
+"""
+Unit tests for core.api_cache.
+
+Each test opens its own SQLite file under tmp_path, so no database server
+or shared cache directory is involved. They pin what the integration
+clients rely on:
+
+  * values round-trip (large ones compressed), and a cached None is
+    distinguishable from a miss via ``default``,
+  * entries older than max_age_days read as misses,
+  * clear() can drop just one key prefix (MusicBrainz "search only"),
+  * keys() lists one key prefix, with LIKE wildcards taken literally,
+  * a bulk load never replaces a fresher entry,
+  * going over the size bound evicts least recently read entries.
+"""
+
+import time
+
+import pytest
+
+from core.api_cache import ApiCache, CacheKey
+
+MISS = object()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ApiCache(tmp_path / 'api_cache.sqlite3')
+
+
+def test_round_trip_and_negative_entries(cache):
+    big = {'tracks': [{'name': f'Track {i}'} for i in range(200)]}
+    cache.set(CacheKey('spotify', 'albums/album_big'), big)
+    cache.set(CacheKey('spotify', 'tracks/track_missing'), None)
+
+    assert cache.get(CacheKey('spotify', 'albums/album_big')) == big
+    assert cache.get(CacheKey('spotify', 'tracks/track_missing'), default=MISS) is None
+    assert cache.get(CacheKey('spotify', 'tracks/track_other'), default=MISS) is MISS
+
+
+def test_expired_entry_is_a_miss(cache):
+    key = CacheKey('wikipedia', 'searches/search_x')
+    cache.set(key, {'results': []}, stored_at=time.time() - 8 * 86400)
+
+    assert cache.get(key) is None                     # namespace TTL: 7 days
+    assert cache.get(key, max_age_days=30) == {'results': []}
+
+
+def test_clear_prefix_only(cache):
+    cache.set(CacheKey('musicbrainz', 'searches/work_a'), {'data': 1})
+    cache.set(CacheKey('musicbrainz', 'recordings/recording_a'), {'data': 2})
+
+    assert cache.clear('musicbrainz', 'searches/') == 1
+    assert cache.get(CacheKey('musicbrainz', 'searches/work_a')) is None
+    assert cache.get(CacheKey('musicbrainz', 'recordings/recording_a')) == {'data': 2}
+
+
+def test_keys_by_prefix(cache):
+    cache.set(CacheKey('musicbrainz', 'releases/release_b'), {'data': 1})
+    cache.set(CacheKey('musicbrainz', 'releases/release_a'), {'data': 2})
+    cache.set(CacheKey('musicbrainz', 'releases/releaseXc'), {'data': 3})
+    cache.set(CacheKey('spotify', 'releases/release_d'), {'data': 4})
+
+    assert [k.key for k in cache.keys('musicbrainz', 'releases/release_')] == [
+        'releases/release_a', 'releases/release_b',
+    ]
+    assert len(list(cache.keys('musicbrainz'))) == 3
+
+
+def test_bulk_load_keeps_fresher_entry(cache):
+    key = CacheKey('coverart', 'releases/release_a')
+    cache.set(key, {'data': 'fresh'})
+
+    cache.set_many([(key, {'data': 'stale file'}, time.time() - 86400)])
+
+    assert cache.get(key) == {'data': 'fresh'}
+
+
+def test_eviction_drops_least_recently_read(cache):
+    for i in range(10):
+        cache.set(CacheKey('spotify', f'tracks/track_{i}'), {'i': i})
+    per_entry = cache.total_bytes() // 10
+    cache.max_bytes = per_entry * 5
+
+    removed = cache.evict()
+
+    assert removed >= 5
+    assert cache.total_bytes() <= cache.max_bytes
+    assert cache.get(CacheKey('spotify', 'tracks/track_0')) is None
+    assert cache.get(CacheKey('spotify', 'tracks/track_9')) == {'i': 9}
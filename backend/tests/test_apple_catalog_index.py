@@ -0,0 +1,169 @@
+"""
+Tests for the Apple Music catalog trigram name index.
+
+Builds a tiny catalog database with DuckDB (no parquet files, no network)
+and pins that
+
+  * the Python and SQL name normalizations/trigrams agree, so query
+    trigrams line up with the posting tables,
+  * ranked search finds substring and misspelled names and puts the closest
+    name first,
+  * artist terms filter through the artist index,
+  * a batch search returns what the same searches return one at a time,
+    with the albums' tracklists attached,
+  * databases built before the index still search with LIKE,
+  * one catalog can be searched from several threads at once.
+"""
+
+import threading
+
+import duckdb
+import pytest
+
+from integrations.apple_music.feed import (
+    AppleMusicCatalog, build_name_search_index, catalog_name_grams,
+    name_grams_sql, name_norm_sql, normalize_catalog_name,
+)
+
+ALBUMS = [
+    ('1', 'Kind of Blue', 'Miles Davis'),
+    ('2', 'Kind of Blue (Legacy Edition)', 'Miles Davis'),
+    ('3', 'Blue Train', 'John Coltrane'),
+    ('4', 'Giant Steps', 'John Coltrane'),
+    ('5', 'Kind of Blue', 'Tribute Band'),
+    ('6', 'Naïma: The Ballads', 'Ångström Trio'),
+]
+
+SONGS = [
+    ('11', 'So What', 'Miles Davis', '1', 1, 1),
+    ('12', 'Freddie Freeloader', 'Miles Davis', '1', 1, 2),
+    ('41', 'Giant Steps', 'John Coltrane', '4', 1, 1),
+]
+
+
+def build_catalog(path, with_index=True):
+    conn = duckdb.connect(str(path))
+    conn.execute("CREATE TABLE raw (id VARCHAR, name VARCHAR, artist_name VARCHAR)")
+    conn.executemany("INSERT INTO raw VALUES (?, ?, ?)", ALBUMS)
+    conn.execute(f"""
+        CREATE TABLE albums AS
+        SELECT id, name, artist_name,
+               NULL AS release_date, 10 AS track_count, NULL AS upc, NULL AS url_template,
+               {name_norm_sql('name')} AS name_norm,
+               {name_norm_sql('artist_name')} AS artist_norm
+        FROM raw
+    """)
+    conn.execute("CREATE TABLE raw_songs (id VARCHAR, name VARCHAR, artist_name VARCHAR, "
+                 "album_id VARCHAR, disc_number INTEGER, track_number INTEGER)")
+    conn.executemany("INSERT INTO raw_songs VALUES (?, ?, ?, ?, ?, ?)", SONGS)
+    conn.execute(f"""
+        CREATE TABLE songs AS
+        SELECT s.id, s.name, s.artist_name, s.album_id, a.name AS album_name,
+               s.disc_number, s.track_number, 180000 AS duration_ms,
+               NULL AS isrc, NULL AS preview_url,
+               {name_norm_sql('s.name')} AS name_norm,
+               {name_norm_sql('s.artist_name')} AS artist_norm
+        FROM raw_songs s JOIN raw a ON a.id = s.album_id
+    """)
+    if with_index:
+        build_name_search_index(conn)
+    conn.close()
+    return AppleMusicCatalog(db_path=str(path))
+
+
+def test_python_and_sql_normalization_agree():
+    conn = duckdb.connect()
+    for text in ['Naïma: The Ballads', "Don't Blame Me", 'Ångström  Trio', 'A_B-C']:
+        norm, grams = conn.execute(
+            f"SELECT {name_norm_sql('$t')}, {name_grams_sql(name_norm_sql('$t'))}",
+            {'t': text}
+        ).fetchone()
+        assert norm == normalize_catalog_name(text)
+        assert sorted(grams) == sorted(catalog_name_grams(text))
+
+
+def test_ranked_title_search(tmp_path):
+    catalog = build_catalog(tmp_path / 'catalog.duckdb')
+
+    results = catalog.search_albums(album_title='kind of blue')
+    assert [album['id'] for album in results[:2]] in (['1', '5'], ['5', '1'])
+    assert {album['id'] for album in results} >= {'1', '2', '5'}
+    assert '4' not in {album['id'] for album in results}
+
+    # Typo and accent tolerant
+    assert catalog.search_albums(album_title='Kind of Bleu')[0]['name'] == 'Kind of Blue'
+    assert catalog.search_albums(album_title='naima')[0]['id'] == '6'
+
+
+def test_artist_filter(tmp_path):
+    catalog = build_catalog(tmp_path / 'catalog.duckdb')
+
+    results = catalog.search_albums(artist_name='miles davis', album_title='kind of blue')
+    assert [album['id'] for album in results] == ['1', '2']
+
+    assert {a['id'] for a in catalog.search_albums(artist_name='Coltrane')} == {'3', '4'}
+    assert catalog.search_albums(artist_name='angstrom')[0]['id'] == '6'
+    assert catalog.search_albums(artist_name='Sonny Rollins') == []
+
+
+@pytest.mark.parametrize('with_index', [True, False])
+def test_like_fallback(tmp_path, with_index):
+    catalog = build_catalog(tmp_path / 'catalog.duckdb', with_index=with_index)
+
+    # Punctuation-only terms have no trigrams and use LIKE either way
+    assert catalog.search_albums(album_title=':')[0]['id'] == '6'
+    results = catalog.search_albums(album_title='Giant')
+    assert [album['id'] for album in results] == ['4']
+
+
+def test_batch_matches_single_searches(tmp_path):
+    catalog = build_catalog(tmp_path / 'catalog.duckdb')
+    queries = [
+        ('Miles Davis', 'Kind of Blue'),
+        (None, 'kind of bleu'),
+        ('Coltrane', 'Giant Steps'),
+        ('Sonny Rollins', 'Kind of Blue'),
+        (None, ':'),
+    ]
+
+    results = catalog.search_albums_batch(queries)
+
+    assert 4 not in results  # no trigrams: left to search_albums()
+    for qid, (artist_name, album_title) in enumerate(queries[:4]):
+        single = catalog.search_albums(artist_name=artist_name, album_title=album_title, limit=50)
+        assert [album['id'] for album in results[qid]] == [album['id'] for album in single]
+
+    kind_of_blue = results[0][0]
+    assert [track['name'] for track in kind_of_blue['tracks']] == ['So What', 'Freddie Freeloader']
+    assert kind_of_blue['tracks'] == catalog.get_songs_for_album('1')
+    assert results[0][1]['tracks'] == []
+
+    songs = catalog.get_songs_for_albums(['1', '4', '9'])
+    assert [len(songs[album_id]) for album_id in ('1', '4', '9')] == [2, 1, 0]
+
+
+def test_concurrent_searches(tmp_path):
+    catalog = build_catalog(tmp_path / 'catalog.duckdb')
+    expected = [album['id'] for album in catalog.search_albums(album_title='kind of blue')]
+
+    results = []
+    errors = []
+
+    def search():
+        try:
+            for _ in range(20):
+                results.append([a['id'] for a in catalog.search_albums(album_title='kind of blue')])
+                catalog.search_albums_batch([('Miles Davis', 'Kind of Blue')])
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=search) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert results == [expected] * 80
+    assert catalog.get_query_count() == 1 + 160
+    assert catalog.get_catalog_stats()['queries']['queries'] >= 160
@@ -0,0 +1,91 @@
+"""
+Tests for the Apple Music stage of pipelined song research.
+
+No database and no catalog file: the matcher gets a fake catalog that
+records its queries, and the per-release DB calls are patched out. They pin
+that a batch of releases handed to the stage costs one batched catalog
+search, and the per-release matching is then served from its results.
+"""
+
+import contextlib
+
+import pytest
+
+from core import song_research
+from integrations.apple_music import matcher as matcher_module
+from integrations.apple_music.matcher import AppleMusicMatcher
+
+RELEASES = [
+    {'id': f'r{i}', 'title': title, 'artist_credit': 'Miles Davis', 'release_year': 1959}
+    for i, title in enumerate(['Kind of Blue', 'Milestones', 'Sketches of Spain: Legacy'])
+]
+
+
+class FakeCatalog:
+    def __init__(self):
+        self.batch_searches = []
+        self.single_searches = []
+
+    def search_albums_batch(self, searches, limit=50):
+        self.batch_searches.append(list(searches))
+        return {qid: [] for qid in range(len(searches))}
+
+    def get_songs_for_albums(self, album_ids):
+        return {}
+
+    def search_albums(self, **kwargs):
+        self.single_searches.append(kwargs)
+        return []
+
+    def _get_conn(self):
+        return None
+
+    def _refresh_conn(self):
+        pass
+
+
+@pytest.fixture
+def matcher(monkeypatch):
+    monkeypatch.setattr(matcher_module, 'get_db_connection', contextlib.nullcontext)
+    monkeypatch.setattr(matcher_module, 'mark_release_searched', lambda *args: None)
+    matcher = AppleMusicMatcher(use_local_catalog=False, local_catalog_only=True)
+    matcher.catalog = FakeCatalog()
+    return matcher
+
+
+def test_research_stage_issues_one_batched_search(matcher):
+    stage = song_research.ReleaseStage(
+        'apple_music', 'apple_music_match',
+        load=lambda items: RELEASES if items is None else items,
+        process=lambda release: matcher.match_release('song', 'So What', release),
+        progress_callback=lambda *args: None,
+        prepare=matcher.prefetch_catalog,
+    )
+    stage.start()
+    stage.submit(RELEASES)
+    stage.finish(sweep=False)
+
+    assert stage.processed == len(RELEASES)
+    assert stage.errors == 0
+    assert len(matcher.catalog.batch_searches) == 1
+    assert ('Miles Davis', 'Kind of Blue') in matcher.catalog.batch_searches[0]
+    assert matcher.catalog.single_searches == []
+    assert matcher.stats['releases_no_match'] == len(RELEASES)
+
+
+def test_sweep_prefetches_only_unprocessed_releases(matcher):
+    stage = song_research.ReleaseStage(
+        'apple_music', 'apple_music_match',
+        load=lambda items: RELEASES if items is None else items,
+        process=lambda release: matcher.match_release('song', 'So What', release),
+        progress_callback=lambda *args: None,
+        prepare=matcher.prefetch_catalog,
+    )
+    stage.start()
+    stage.submit(RELEASES[:1])
+    stage.finish()
+
+    assert stage.processed == len(RELEASES)
+    assert len(matcher.catalog.batch_searches) == 2
+    assert ('Miles Davis', 'Kind of Blue') not in matcher.catalog.batch_searches[1]
+    assert matcher.catalog.single_searches == []
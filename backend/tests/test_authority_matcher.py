@@ -0,0 +1,107 @@
+"""
+Unit tests for core.authority_matcher's per-song index.
+
+No database: SongCandidateIndex is built from rows shaped like load()'s.
+They pin that
+
+  * _SongScorer's matrix scores equal compare_artists() / compare_albums()
+    pair for pair, including the album year-pattern boost, empty values and
+    strings that aren't in the index,
+  * the in-memory candidate filters keep the semantics of the LIKE queries
+    they replaced (accent-insensitive, last name and combined-credit parts,
+    linked release titles),
+  * a whole recommendation still resolves to the expected recording.
+"""
+
+import pytest
+
+from core.authority_matcher import (
+    AuthorityRecommendationMatcher,
+    SongCandidateIndex,
+    _SongScorer,
+)
+
+
+def _recordings():
+    return [
+        {
+            'id': 'rich', 'recording_year': 1947, 'label': None,
+            'album_title': "Buddy Rich '47 '48",
+            'artist_credit': 'Buddy Rich & His Orchestra',
+            'artist_names': 'Buddy Rich / Zoot Sims',
+            'primary_artist': 'Buddy Rich',
+            'performer_names': ['Buddy Rich', 'Zoot Sims'],
+            'releases': [{'title': "The Legendary '47-'48 Orchestra",
+                          'artist_credit': 'Buddy Rich', 'release_year': 1990}],
+        },
+        {
+            'id': 'getz', 'recording_year': 1963, 'label': 'Verve',
+            'album_title': 'Getz/Gilberto',
+            'artist_credit': 'Stan Getz & João Gilberto',
+            'artist_names': 'Antônio Carlos Jobim / João Gilberto / Stan Getz',
+            'primary_artist': 'Stan Getz',
+            'performer_names': ['Stan Getz', 'João Gilberto', 'Antônio Carlos Jobim'],
+            'releases': [{'title': 'Getz / Gilberto',
+                          'artist_credit': 'Stan Getz, João Gilberto', 'release_year': 1964}],
+        },
+        {
+            'id': 'bare', 'recording_year': None, 'label': None,
+            'album_title': None, 'artist_credit': None, 'artist_names': None,
+            'primary_artist': None, 'performer_names': None, 'releases': [],
+        },
+    ]
+
+
+RECOMMENDATIONS = [
+    {'artist_name': 'Buddy Rich', 'album_title': "The Legendary '47-'48 Orchestra"},
+    {'artist_name': 'Stan Getz & Joao Gilberto', 'album_title': 'Getz/Gilberto'},
+    {'artist_name': 'Antonio Carlos Jobim', 'album_title': None},
+]
+
+
+@pytest.fixture
+def index():
+    return SongCandidateIndex('song', _recordings())
+
+
+@pytest.fixture
+def matcher():
+    return AuthorityRecommendationMatcher(dry_run=True)
+
+
+def test_scorer_matches_pairwise_comparisons(index, matcher):
+    scorer = _SongScorer(matcher, index, RECOMMENDATIONS)
+    # Last one was never primed: scored lazily
+    queries = RECOMMENDATIONS + [{'artist_name': 'Someone Else', 'album_title': 'Live 1947'}]
+
+    for rec in queries:
+        for artist in index.artist_strings() | {None, '', 'Not In Index'}:
+            assert scorer.artist(rec['artist_name'], artist) == \
+                matcher.compare_artists(rec['artist_name'], artist)
+        for album in index.album_strings() | {None, '', 'Not In Index'}:
+            assert scorer.album(rec['album_title'], album) == \
+                matcher.compare_albums(rec['album_title'], album)
+
+
+def test_candidate_filters(index):
+    ids = lambda recs: [r['id'] for r in recs]
+
+    # Accent-insensitive, and any part of a combined credit
+    assert ids(index.by_performer('Antonio Carlos Jobim')) == ['getz']
+    assert ids(index.by_performer('Zoot Sims & Al Cohn')) == ['rich']
+    assert ids(index.by_performer('Nobody Here')) == []
+
+    assert ids(index.by_artist_credit('Stan Getz & Joao Gilberto')) == ['getz']
+    # Linked release titles count, not just the default release
+    assert ids(index.by_album_title("legendary '47")) == ['rich']
+    assert [(r['id'], rel['title']) for r, rel in index.by_release_title('getz')] == \
+        [('getz', 'Getz / Gilberto')]
+
+
+def test_recommendation_resolves_to_recording(index, matcher):
+    rec = {'id': 'sar', 'song_title': 'Song', 'artist_name': 'Buddy Rich',
+           'album_title': "Buddy Rich '47 '48", 'recording_year': 1947}
+    scorer = _SongScorer(matcher, index, [rec])
+
+    assert matcher.process_recommendation(rec, index, scorer) == 'rich'
+    assert matcher.stats['high_confidence_matches'] == 1
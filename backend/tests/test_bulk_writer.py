@@ -0,0 +1,206 @@
+"""
+Tests for core.bulk_writer.
+
+The first group renders the merge statement without a database (psycopg's
+Composable.as_string(None)). They pin:
+
+  * DO UPDATE collapses staged duplicates on the conflict key and returns
+    an inserted flag when asked,
+  * skip_existing filters rows already in the target (nullable unique
+    keys, where ON CONFLICT never fires),
+  * rows must match the declared columns, and an empty flush is a no-op.
+
+The rest flush against the test database, through the COPY into the temp
+staging table and the merge, and check the rows that land: inserts,
+updates on conflict, collapsed duplicates, skipped existing rows, and
+several flushes in one transaction. Fixture rows use their own
+``00000000-0000-4000-8000-…`` range and are cleaned before and after.
+"""
+
+import pytest
+from psycopg import sql
+from psycopg.rows import dict_row
+
+from core.bulk_writer import BulkWriter
+
+_NS = "00000000-0000-4000-8000-00000010{:04x}"
+RELEASE_ID = _NS.format(0x0001)
+OTHER_RELEASE_ID = _NS.format(0x0002)
+PERFORMER_ID = _NS.format(0x0010)
+
+
+def render(writer):
+    columns = sql.SQL(', ').join(map(sql.Identifier, writer.columns))
+    query = writer._merge_query(
+        sql.Identifier(f"_bulk_{writer.table}"), sql.Identifier(writer.table), columns
+    )
+    return query.as_string(None)
+
+
+def test_upsert_merge():
+    writer = BulkWriter(
+        'release_imagery', ('release_id', 'source', 'type', 'source_url'),
+        conflict=('release_id', 'source', 'type'),
+        update=('source_url',),
+        touch='updated_at',
+        returning=('type',),
+        report_inserted=True,
+    )
+    query = render(writer)
+
+    assert 'DISTINCT ON ("s"."release_id", "s"."source", "s"."type")' in query
+    assert 'ON CONFLICT ("release_id", "source", "type") DO UPDATE SET' in query
+    assert '"source_url" = EXCLUDED."source_url"' in query
+    assert '"updated_at" = CURRENT_TIMESTAMP' in query
+    assert query.endswith('RETURNING "type", (xmax = 0) AS inserted')
+
+
+def test_skip_existing_merge():
+    writer = BulkWriter(
+        'release_performers', ('release_id', 'performer_id', 'role'),
+        skip_existing=('release_id', 'performer_id'),
+    )
+    query = render(writer)
+
+    assert 'WHERE NOT EXISTS (SELECT 1 FROM "release_performers" t' in query
+    assert 't."performer_id" = s."performer_id"' in query
+    assert 'ON CONFLICT DO NOTHING' in query
+    assert 'RETURNING' not in query
+
+
+def test_row_shape_and_empty_flush():
+    writer = BulkWriter('performer_instruments', ('performer_id', 'instrument_id'))
+
+    with pytest.raises(ValueError):
+        writer.add(('only-one',))
+    with pytest.raises(ValueError):
+        BulkWriter('releases', ('title',), update=('title',))
+
+    assert len(writer) == 0
+    assert writer.flush(conn=None) == []
+
+
+# ---------------------------------------------------------------------------
+# Against the database
+# ---------------------------------------------------------------------------
+
+def _cleanup(conn):
+    with conn.cursor() as cur:
+        cur.execute(
+            "DELETE FROM releases WHERE id IN (%s, %s)", (RELEASE_ID, OTHER_RELEASE_ID)
+        )
+        cur.execute("DELETE FROM performers WHERE id = %s", (PERFORMER_ID,))
+    conn.commit()
+
+
+@pytest.fixture
+def release_fixture(db):
+    _cleanup(db)
+    with db.cursor() as cur:
+        cur.execute(
+            "INSERT INTO releases (id, title) VALUES (%s, %s), (%s, %s)",
+            (RELEASE_ID, "Bulk Test Release", OTHER_RELEASE_ID, "Other Bulk Test Release"),
+        )
+        cur.execute(
+            "INSERT INTO performers (id, name) VALUES (%s, %s)", (PERFORMER_ID, "Bulk Tester")
+        )
+    db.commit()
+    db.row_factory = dict_row
+    yield db
+    db.rollback()
+    _cleanup(db)
+
+
+def _imagery_writer():
+    return BulkWriter(
+        'release_imagery', ('release_id', 'source', 'type', 'source_url'),
+        conflict=('release_id', 'source', 'type'),
+        update=('source_url',),
+        touch='updated_at',
+        returning=('release_id', 'type', 'source_url'),
+        report_inserted=True,
+    )
+
+
+def _imagery(conn):
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT release_id::text AS release_id, type::text AS type, source_url "
+            "FROM release_imagery WHERE release_id IN (%s, %s) ORDER BY release_id, type",
+            (RELEASE_ID, OTHER_RELEASE_ID),
+        )
+        return [tuple(row.values()) for row in cur.fetchall()]
+
+
+def test_flush_inserts_then_updates(release_fixture):
+    conn = release_fixture
+    writer = _imagery_writer()
+    writer.add((RELEASE_ID, 'MusicBrainz', 'Front', 'https://caa/front-1'))
+    writer.add((RELEASE_ID, 'MusicBrainz', 'Back', 'https://caa/back-1'))
+    writer.add((OTHER_RELEASE_ID, 'MusicBrainz', 'Front', 'https://caa/other-front'))
+
+    inserted = writer.flush(conn)
+
+    assert len(writer) == 0
+    assert sorted((str(r['release_id']), r['type'], r['inserted']) for r in inserted) == [
+        (RELEASE_ID, 'Back', True),
+        (RELEASE_ID, 'Front', True),
+        (OTHER_RELEASE_ID, 'Front', True),
+    ]
+
+    # Second flush in the same transaction: the staging table is recreated,
+    # an existing key is updated and a new one inserted
+    writer.add((RELEASE_ID, 'MusicBrainz', 'Front', 'https://caa/front-2'))
+    writer.add((OTHER_RELEASE_ID, 'MusicBrainz', 'Back', 'https://caa/other-back'))
+    merged = writer.flush(conn)
+    conn.commit()
+
+    assert sorted((str(r['release_id']), r['type'], r['inserted']) for r in merged) == [
+        (RELEASE_ID, 'Front', False),
+        (OTHER_RELEASE_ID, 'Back', True),
+    ]
+    assert _imagery(conn) == [
+        (RELEASE_ID, 'Back', 'https://caa/back-1'),
+        (RELEASE_ID, 'Front', 'https://caa/front-2'),
+        (OTHER_RELEASE_ID, 'Back', 'https://caa/other-back'),
+        (OTHER_RELEASE_ID, 'Front', 'https://caa/other-front'),
+    ]
+
+
+def test_flush_collapses_staged_duplicates(release_fixture):
+    conn = release_fixture
+    writer = _imagery_writer()
+    writer.add((RELEASE_ID, 'MusicBrainz', 'Front', 'https://caa/front-a'))
+    writer.add((RELEASE_ID, 'MusicBrainz', 'Front', 'https://caa/front-b'))
+
+    result = writer.flush(conn)
+    conn.commit()
+
+    assert len(result) == 1
+    assert len(_imagery(conn)) == 1
+    assert _imagery(conn)[0][2] in ('https://caa/front-a', 'https://caa/front-b')
+
+
+def test_flush_skips_existing_rows_with_null_keys(release_fixture):
+    conn = release_fixture
+
+    def flush(role):
+        writer = BulkWriter(
+            'release_performers', ('release_id', 'performer_id', 'instrument_id', 'role'),
+            skip_existing=('release_id', 'performer_id'),
+        )
+        writer.add((RELEASE_ID, PERFORMER_ID, None, role))
+        writer.add((RELEASE_ID, PERFORMER_ID, None, role))
+        writer.flush(conn)
+        conn.commit()
+
+    flush('leader')
+    # A NULL instrument_id never conflicts, so without skip_existing this
+    # would add a second row
+    flush('sideman')
+
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT role FROM release_performers WHERE release_id = %s", (RELEASE_ID,)
+        )
+        assert [row['role'] for row in cur.fetchall()] == ['leader']
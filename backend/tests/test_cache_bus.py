@@ -0,0 +1,84 @@
+"""
+Tests for the state web workers share through Postgres: core.cache_bus and
+core.rate_limit_storage.
+
+The unit test needs no database. It pins that the poller skips rows this
+process published (it already applied them) and routes the rest to the
+cache that registered for them.
+
+The integration tests (Postgres) pin that
+  * an invalidation published by another process drops this process's
+    response-cache entries on the next poll,
+  * two storage instances (standing in for two gunicorn workers) count
+    against one rate-limit window.
+"""
+
+import pytest
+
+from core import cache_bus, response_cache
+from core.rate_limit_storage import PostgresRateLimitStorage
+from core.response_cache import CacheEntry
+
+RATE_LIMIT_KEY = "pytest/cache-bus/login"
+
+
+def _entry(tags):
+    return CacheEntry(body=b"{}", mimetype="application/json", headers=(),
+                      etag='"x"', tags=frozenset(tags), expires_at=float("inf"))
+
+
+def test_apply_skips_own_rows_and_routes_by_cache(monkeypatch):
+    seen = []
+    monkeypatch.setattr(cache_bus, "_handlers", {"response": seen.append})
+
+    cache_bus._apply([
+        {"id": 1, "cache": "response", "keys": ["song:a"], "origin": cache_bus._origin()},
+        {"id": 2, "cache": "response", "keys": ["song:b"], "origin": "other-host:1"},
+        {"id": 3, "cache": "unknown", "keys": ["x"], "origin": "other-host:1"},
+    ])
+
+    assert seen == [["song:b"]]
+
+
+def test_remote_invalidation_drops_local_entries(db, monkeypatch):
+    cache = response_cache.get_cache()
+    cache.clear()
+    monkeypatch.setattr(cache_bus, "_last_id", None)
+    cache_bus.poll_once()  # start from the current end of the log
+
+    cache.set(("/songs/a", ()), _entry(["song:a"]), cache.generation)
+    cache.set(("/songs/b", ()), _entry(["song:b"]), cache.generation)
+    with db.cursor() as cur:
+        cur.execute(
+            "INSERT INTO cache_invalidations (cache, keys, origin) VALUES ('response', %s, 'other-host:1')",
+            (["song:a"],),
+        )
+    db.commit()
+
+    assert cache_bus.poll_once() >= 1
+    assert cache.get(("/songs/a", ())) is None
+    assert cache.get(("/songs/b", ())) is not None
+    cache.clear()
+
+
+@pytest.fixture
+def rate_limit_key(db):
+    with db.cursor() as cur:
+        cur.execute("DELETE FROM rate_limit_counters WHERE key = %s", (RATE_LIMIT_KEY,))
+    db.commit()
+    yield RATE_LIMIT_KEY
+    with db.cursor() as cur:
+        cur.execute("DELETE FROM rate_limit_counters WHERE key = %s", (RATE_LIMIT_KEY,))
+    db.commit()
+
+
+def test_rate_limit_window_is_shared(rate_limit_key):
+    worker_a = PostgresRateLimitStorage("app-postgres://")
+    worker_b = PostgresRateLimitStorage("app-postgres://")
+
+    assert worker_a.incr(rate_limit_key, 60) == 1
+    assert worker_b.incr(rate_limit_key, 60) == 2
+    assert worker_a.get(rate_limit_key) == 2
+
+    worker_b.clear(rate_limit_key)
+    assert worker_a.get(rate_limit_key) == 0
@@ -0,0 +1,69 @@
+"""
+Unit tests for integrations.apple_music.catalog_pool.
+
+In-memory DuckDB only. They pin that
+
+  * each thread gets its own cursor and keeps it between queries,
+  * a discarded cursor is replaced, and reopening the database hands
+    every thread a fresh cursor,
+  * the latency histogram buckets, percentiles and snapshot add up.
+"""
+
+import threading
+
+from integrations.apple_music.catalog_pool import CatalogPool, LatencyHistogram, get_pool
+
+
+def test_cursor_per_thread():
+    pool = CatalogPool(':memory:', read_only=False)
+    main = pool.cursor()
+    assert pool.cursor() is main
+
+    seen = []
+    threads = [
+        threading.Thread(target=lambda: seen.append((pool.cursor(), pool.cursor())))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(first is second for first, second in seen)
+    assert len({id(first) for first, _ in seen} | {id(main)}) == 4
+    assert pool.stats()['cursors_opened'] == 4
+
+
+def test_discard_and_reopen():
+    pool = CatalogPool(':memory:', read_only=False)
+    first = pool.cursor()
+
+    pool.discard()
+    second = pool.cursor()
+    assert second is not first
+    assert second.execute("SELECT 42").fetchone() == (42,)
+
+    pool.reopen()
+    third = pool.cursor()
+    assert third is not second
+    assert third.execute("SELECT 1").fetchone() == (1,)
+    assert pool.stats()['databases_opened'] == 2
+
+    assert get_pool('x.duckdb') is get_pool('x.duckdb')
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram(buckets=(1, 10, 100))
+    assert histogram.percentile(50) is None
+
+    for ms in [0.5] * 50 + [5] * 45 + [50] * 4 + [400]:
+        histogram.observe(ms)
+
+    snapshot = histogram.snapshot()
+    assert snapshot['queries'] == 100
+    assert snapshot['buckets'] == {'<=1ms': 50, '<=10ms': 45, '<=100ms': 4, '>100ms': 1}
+    assert snapshot['p50_ms'] == 1
+    assert snapshot['p95_ms'] == 10
+    assert snapshot['p99_ms'] == 100
+    assert histogram.percentile(100) == 400
+    assert snapshot['max_ms'] == 400
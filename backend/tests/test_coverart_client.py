@@ -0,0 +1,100 @@
+"""
+Unit tests for CoverArtArchiveClient's listing lookup.
+
+No network and no shared cache: the api_cache is a fresh SQLite file under
+tmp_path and the HTTP session is replaced by a recorder with canned
+responses. They pin that
+
+  * a release without art is cached as a negative, so a second lookup
+    makes no request,
+  * a release with art costs one CAA request,
+  * a release whose MusicBrainz data reports no artwork costs no request,
+    while one reported with artwork is still looked up,
+  * a failed lookup raises CoverArtArchiveError instead of reading as
+    "no art", so the release is not marked as checked.
+"""
+
+import json
+
+import pytest
+import requests
+
+from core import api_cache
+from integrations.coverart.utils import CoverArtArchiveClient, CoverArtArchiveError
+
+MBID = '0b5e0a9d-0000-4000-8000-000000000001'
+URL = f'{CoverArtArchiveClient.BASE_URL}/release/{MBID}/'
+LISTING = {'images': [{
+    'types': ['Front'], 'front': True, 'id': 1, 'approved': True,
+    'image': 'http://coverartarchive.org/release/x/1.jpg',
+    'thumbnails': {'250': 'http://a/250.jpg', '500': 'http://a/500.jpg',
+                   '1200': 'http://a/1200.jpg'},
+}]}
+
+
+def _response(url, status, body=None):
+    response = requests.Response()
+    response.status_code = status
+    response.url = url
+    if body is not None:
+        response._content = json.dumps(body).encode()
+    return response
+
+
+def _mb_release(artwork):
+    return {'id': MBID, 'cover-art-archive': {'artwork': artwork, 'count': int(artwork)}}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(api_cache, '_cache', api_cache.ApiCache(tmp_path / 'api_cache.sqlite3'))
+    client = CoverArtArchiveClient()
+    client.calls = []
+    client.routes = {}
+
+    def get(url, **kwargs):
+        client.calls.append(url)
+        return _response(url, *client.routes[url])
+
+    monkeypatch.setattr(client.session, 'get', get)
+    monkeypatch.setattr(client, '_rate_limit', lambda: None)
+    monkeypatch.setattr(client, 'base_delay', 0)
+    return client
+
+
+def test_no_art_is_cached(client):
+    client.routes[URL] = (404,)
+
+    assert client.extract_imagery_data(MBID) == []
+    assert client.calls == [URL]
+
+    client.calls.clear()
+    assert client.extract_imagery_data(MBID) == []
+    assert client.calls == []
+
+
+def test_listing_is_one_request(client):
+    client.routes[URL] = (200, LISTING)
+
+    images = client.extract_imagery_data(MBID)
+
+    assert [img['type'] for img in images] == ['Front']
+    assert images[0]['image_url_medium'] == 'https://a/500.jpg'
+    assert client.calls == [URL]
+
+
+def test_musicbrainz_no_artwork_skips_the_request(client):
+    assert client.extract_imagery_data(MBID, _mb_release(False)) == []
+    assert client.calls == []
+    assert client.get_stats()['no_art_from_musicbrainz'] == 1
+
+    client.routes[URL] = (200, LISTING)
+    assert len(client.extract_imagery_data(MBID, _mb_release(True))) == 1
+    assert client.calls == [URL]
+
+
+def test_failed_lookup_raises(client):
+    client.routes[URL] = (500,)
+
+    with pytest.raises(CoverArtArchiveError):
+        client.extract_imagery_data(MBID)
@@ -0,0 +1,121 @@
+"""
+Tests for core.db_profiler.
+
+The unit tests need no database. They pin that
+  * statements differing only in literals aggregate under one normalized key,
+  * a request gets a Server-Timing header with its own query count, and a
+    statement repeated REPEAT_THRESHOLD times in one request is reported as
+    a likely N+1,
+  * only reads whose function calls are all side-effect-free builtins are
+    EXPLAIN ANALYZEd.
+
+The integration tests (Postgres) pin that queries run on a raw
+get_db_connection() cursor -- not just through execute_query -- are counted,
+and that whatever the EXPLAIN ANALYZE re-run writes is rolled back.
+"""
+
+import pytest
+from flask import Flask
+
+from core import db_profiler
+
+
+@pytest.fixture
+def fresh_report():
+    db_profiler.reset()
+    yield
+    db_profiler.reset()
+
+
+def test_normalize_sql_collapses_literals():
+    a = db_profiler.normalize_sql("SELECT *  FROM songs\n WHERE id = 42 AND title = 'Naima'")
+    b = db_profiler.normalize_sql("SELECT * FROM songs WHERE id = 7 AND title = 'It''s You'")
+
+    assert a == b == "SELECT * FROM songs WHERE id = ? AND title = ?"
+    assert db_profiler.normalize_sql("SELECT 1 FROM t2 WHERE x IN (1, 2, 3)") == \
+        "SELECT ? FROM t2 WHERE x IN (?)"
+
+
+def test_only_side_effect_free_reads_are_explained():
+    explainable = db_profiler._is_explainable
+
+    assert explainable(db_profiler.normalize_sql(
+        "SELECT s.id, COUNT(*) FILTER (WHERE r.id IS NOT NULL) FROM songs s "
+        "LEFT JOIN recordings r ON r.song_id = s.id WHERE s.id IN (1, 2) GROUP BY s.id"
+    ))
+    assert explainable("WITH q AS (SELECT search_normalize(?) AS term) "
+                       "SELECT word_similarity(q.term, title_search) FROM songs, q")
+    assert not explainable("SELECT refresh_song_streaming_stats(ARRAY[?]::uuid[])")
+    assert not explainable("SELECT refresh_recording_list_rows(?)")
+    assert not explainable("SELECT nextval(?)")
+    assert not explainable("WITH d AS (DELETE FROM songs RETURNING id) SELECT * FROM d")
+    assert not explainable("UPDATE songs SET title = ?")
+
+
+def test_request_profile_and_repeat_report(fresh_report):
+    app = Flask(__name__)
+    db_profiler.init_db_profiler(app)
+    sql = db_profiler.normalize_sql("SELECT name FROM performers WHERE id = %s")
+
+    @app.route('/n-plus-one')
+    def n_plus_one():
+        profile = db_profiler.current_profile()
+        for _ in range(db_profiler.REPEAT_THRESHOLD):
+            profile.queries += 1
+            profile.exec_ms += 1.0
+            profile.statements[sql] += 1
+        return 'ok'
+
+    resp = app.test_client().get('/n-plus-one')
+
+    timing = resp.headers['Server-Timing']
+    assert f'desc="{db_profiler.REPEAT_THRESHOLD} queries"' in timing
+    assert 'db-exec;dur=10.0' in timing
+    assert db_profiler.current_profile() is None
+
+    [endpoint] = db_profiler.get_report()['endpoints']
+    assert endpoint['endpoint'] == 'n_plus_one'
+    assert endpoint['suspect_n_plus_one']
+    assert endpoint['repeated_sql'] == sql
+
+
+def test_raw_cursor_queries_are_counted(app, fresh_report):
+    from db_utils import get_db_connection
+
+    with app.test_request_context('/'):
+        token = db_profiler._current.set(db_profiler.RequestProfile(endpoint='test'))
+        try:
+            with get_db_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1 AS one")
+                    cur.fetchone()
+                    cur.execute("SELECT 2 AS two")
+                    cur.fetchall()
+            profile = db_profiler.current_profile()
+        finally:
+            db_profiler._current.reset(token)
+
+    assert profile.queries == 2
+    report = db_profiler.get_report()
+    assert {s['sql'] for s in report['statements_by_total']} >= {"SELECT ? AS one", "SELECT ? AS two"}
+
+
+def test_explain_rolls_back_the_rerun(db, fresh_report, monkeypatch):
+    monkeypatch.setattr(db_profiler, 'EXPLAIN_THRESHOLD_MS', 1.0)
+    with db.cursor() as cur:
+        cur.execute("CREATE TEMP TABLE explain_writes (n INTEGER)")
+        cur.execute("""
+            CREATE FUNCTION pg_temp.bump() RETURNS INTEGER LANGUAGE sql
+            AS $$ INSERT INTO explain_writes VALUES (1) RETURNING 1 $$
+        """)
+        cur.execute("SELECT pg_temp.bump()")
+
+        # Keyed as a plain read so the filter lets it through: the savepoint
+        # must still undo the insert the ANALYZE re-run makes
+        db_profiler._maybe_explain(cur, "SELECT ? AS bump", "SELECT pg_temp.bump()", None, 50.0)
+
+        cur.execute("SELECT COUNT(*) FROM explain_writes")
+        assert cur.fetchone()[0] == 1
+    db.rollback()
+
+    assert 'Result' in db_profiler._plans["SELECT ? AS bump"][0]
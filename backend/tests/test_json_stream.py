@@ -0,0 +1,105 @@
+"""
+Unit tests for core.json_stream.
+
+No database: rows are handed to the encoders directly, and the streamed
+path is exercised with a generator response on a throwaway Flask app. They
+pin that
+
+  * rows encode to the same JSON values jsonify() produced through
+    CustomJSONProvider (dates as YYYY-MM-DD, UUIDs as strings),
+  * ?format=columns returns parallel arrays,
+  * a streamed response through cached_response is stored once it has been
+    sent, so the next request is a HIT with the identical body,
+  * compressed_response gzips both the stream and the cache hit, and the
+    hit's ETag still revalidates to a 304.
+"""
+
+import gzip
+import json
+import uuid
+from datetime import date, datetime
+
+import pytest
+from flask import Flask, Response, jsonify
+
+from core import json_stream, response_cache
+from core.json_stream import compressed_response
+from core.response_cache import ResponseCache, cached_response, TAG_INDEX
+from utils.json_provider import CustomJSONProvider
+
+ROWS = [
+    {'id': uuid.UUID(int=1), 'title': 'Naïma', 'composed_year': 1959,
+     'created_at': datetime(2024, 5, 1, 12, 30), 'released': date(1960, 1, 1)},
+    {'id': uuid.UUID(int=2), 'title': 'Giant Steps', 'composed_year': None,
+     'created_at': datetime(2024, 5, 2, 8, 0), 'released': None},
+]
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.json = CustomJSONProvider(app)
+    return app
+
+
+def test_rows_match_jsonify(app):
+    with app.app_context():
+        expected = json.loads(jsonify(ROWS).get_data())
+        body = json_stream.rows_response(ROWS).get_data()
+
+    assert json.loads(body) == expected
+    assert json.loads(body)[0]['created_at'] == '2024-05-01'
+
+
+def test_columnar_output(app):
+    with app.app_context():
+        body = json.loads(json_stream.rows_response(ROWS, columnar=True).get_data())
+
+    assert body['count'] == 2
+    assert body['columns']['title'] == ['Naïma', 'Giant Steps']
+    assert body['columns']['composed_year'] == [1959, None]
+
+
+@pytest.fixture
+def client(app, monkeypatch):
+    monkeypatch.setattr(response_cache, '_cache', ResponseCache(max_entries=8, ttl_seconds=60))
+    monkeypatch.setattr(response_cache, 'CACHE_ENABLED', True)
+    calls = {'index': 0}
+
+    @app.route('/songs/index')
+    @compressed_response
+    @cached_response(lambda: [TAG_INDEX])
+    def index():
+        calls['index'] += 1
+        columns = list(ROWS[0].keys())
+        chunks = [[tuple(r.values())] for r in ROWS * 50]
+        response = Response(json_stream._encode_rows(columns, chunks), mimetype='application/json')
+        response.headers['X-Total-Count'] = str(len(ROWS) * 50)
+        return response
+
+    client = app.test_client()
+    client.calls = calls
+    return client
+
+
+def test_streamed_response_is_cached_and_compressed(client):
+    first = client.get('/songs/index', headers={'Accept-Encoding': 'gzip'})
+    assert first.is_streamed or first.headers['X-Cache'] == 'MISS'
+    assert first.headers['Content-Encoding'] == 'gzip'
+    body = gzip.decompress(first.get_data())
+    assert len(json.loads(body)) == 100
+
+    second = client.get('/songs/index', headers={'Accept-Encoding': 'gzip'})
+    assert second.headers['X-Cache'] == 'HIT'
+    assert second.headers['X-Total-Count'] == '100'
+    assert 'Content-Encoding' in second.headers
+    assert gzip.decompress(second.get_data()) == body
+    assert client.calls['index'] == 1
+
+    plain = client.get('/songs/index')
+    assert 'Content-Encoding' not in plain.headers
+    assert plain.get_data() == body
+
+    etag = second.headers['ETag']
+    revalidated = client.get('/songs/index', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert revalidated.status_code == 304
@@ -0,0 +1,189 @@
+"""
+Tests for GET /api/performers/<id>/recordings (keyset pages) and
+GET /api/performers/<id>/recordings/shell.
+
+They pin that
+
+  * a performer credited twice on one recording (two instruments/roles)
+    still gets a single row, with the leader role winning,
+  * walking ?limit=&after= pages returns exactly the unpaginated list, in
+    the same order (year DESC with undated recordings last),
+  * a cursor from one sort order is rejected by the other, and one with
+    key values of the wrong type is a 400, not a 500,
+  * shell rows carry only the grouping fields; album/art come from
+    /recordings/batch.
+
+The cursor helpers in core.pagination are also checked on their own (no
+database).
+
+Fixture strategy mirrors ``test_song_recordings_shell.py``: deterministic
+UUIDs in their own ``00000000-0000-4000-8000-…`` range, cleaned before and
+after every test.
+"""
+
+from uuid import UUID
+
+import pytest
+
+from core import pagination
+
+EXPECTED_SHELL_FIELDS = frozenset({
+    "recording_id",
+    "song_id",
+    "song_title",
+    "recording_year",
+    "is_canonical",
+    "role",
+})
+
+_NS = "00000000-0000-4000-8000-0000000b{:04x}"
+
+SONG_ID = _NS.format(0x0001)
+PERFORMER_ID = _NS.format(0x0020)
+INSTRUMENT_BASS_ID = _NS.format(0x0030)
+INSTRUMENT_CELLO_ID = _NS.format(0x0031)
+# (id, year): two share a year so the song-title/id tiebreak matters
+RECORDINGS = [
+    (_NS.format(0x0010), 1959),
+    (_NS.format(0x0011), 1964),
+    (_NS.format(0x0012), 1964),
+    (_NS.format(0x0013), None),
+]
+RP_IDS = [_NS.format(0x0050 + i) for i in range(len(RECORDINGS) + 1)]
+
+
+def _cleanup(conn):
+    ids = [rec_id for rec_id, _ in RECORDINGS]
+    with conn.cursor() as cur:
+        cur.execute("DELETE FROM recording_performers WHERE id = ANY(%s::uuid[])", (RP_IDS,))
+        cur.execute("DELETE FROM recordings WHERE id = ANY(%s::uuid[])", (ids,))
+        cur.execute("DELETE FROM performers WHERE id = %s", (PERFORMER_ID,))
+        cur.execute(
+            "DELETE FROM instruments WHERE id IN (%s, %s)",
+            (INSTRUMENT_BASS_ID, INSTRUMENT_CELLO_ID),
+        )
+        cur.execute("DELETE FROM songs WHERE id = %s", (SONG_ID,))
+    conn.commit()
+
+
+@pytest.fixture
+def performer_fixture(db):
+    _cleanup(db)
+
+    with db.cursor() as cur:
+        cur.execute(
+            "INSERT INTO songs (id, title) VALUES (%s, %s)",
+            (SONG_ID, "Performer Pagination Test Song"),
+        )
+        cur.execute(
+            "INSERT INTO performers (id, name) VALUES (%s, %s)",
+            (PERFORMER_ID, "Page Bassist"),
+        )
+        cur.execute(
+            "INSERT INTO instruments (id, name) VALUES (%s, 'bass'), (%s, 'cello')",
+            (INSTRUMENT_BASS_ID, INSTRUMENT_CELLO_ID),
+        )
+        for rec_id, year in RECORDINGS:
+            cur.execute(
+                "INSERT INTO recordings (id, song_id, title, recording_year) VALUES (%s, %s, %s, %s)",
+                (rec_id, SONG_ID, "Performer Pagination Take", year),
+            )
+        for rp_id, (rec_id, _) in zip(RP_IDS, RECORDINGS):
+            cur.execute(
+                """
+                INSERT INTO recording_performers (id, recording_id, performer_id, instrument_id, role)
+                VALUES (%s, %s, %s, %s, 'sideman')
+                """,
+                (rp_id, rec_id, PERFORMER_ID, INSTRUMENT_BASS_ID),
+            )
+        # Second credit on the first recording, as leader on cello
+        cur.execute(
+            """
+            INSERT INTO recording_performers (id, recording_id, performer_id, instrument_id, role)
+            VALUES (%s, %s, %s, %s, 'leader')
+            """,
+            (RP_IDS[-1], RECORDINGS[0][0], PERFORMER_ID, INSTRUMENT_CELLO_ID),
+        )
+    db.commit()
+
+    yield PERFORMER_ID
+
+    _cleanup(db)
+
+
+def test_one_row_per_recording_leader_role_wins(client, performer_fixture):
+    body = client.get(f"/performers/{performer_fixture}/recordings").get_json()
+
+    assert body["recording_count"] == len(RECORDINGS)
+    assert body["next_cursor"] is None
+    roles = {r["recording_id"]: r["role"] for r in body["recordings"]}
+    assert roles[RECORDINGS[0][0]] == "leader"
+    assert [r["recording_year"] for r in body["recordings"]] == [1964, 1964, 1959, None]
+
+
+@pytest.mark.parametrize("sort", ["year", "name"])
+def test_pages_concatenate_to_full_list(client, performer_fixture, sort):
+    url = f"/performers/{performer_fixture}/recordings?sort={sort}"
+    full = client.get(url).get_json()["recordings"]
+
+    walked, after = [], None
+    while True:
+        page_url = f"{url}&limit=1" + (f"&after={after}" if after else "")
+        body = client.get(page_url).get_json()
+        walked.extend(body["recordings"])
+        after = body["next_cursor"]
+        if after is None:
+            break
+
+    assert walked == full
+
+
+def test_cursor_from_other_sort_is_rejected(client, performer_fixture):
+    body = client.get(f"/performers/{performer_fixture}/recordings?sort=year&limit=1").get_json()
+
+    resp = client.get(
+        f"/performers/{performer_fixture}/recordings?sort=name&limit=1&after={body['next_cursor']}"
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.parametrize("key", [
+    [-1964, "Naïma", "not-a-uuid"],
+    ["1964", "Naïma", _NS.format(0x0100)],
+    [-1964, 7, _NS.format(0x0100)],
+    [-1964, "Naïma"],
+])
+def test_cursor_with_bad_key_values_is_rejected(client, performer_fixture, key):
+    token = pagination.encode_cursor("year", key)
+
+    resp = client.get(f"/performers/{performer_fixture}/recordings?limit=1&after={token}")
+    assert resp.status_code == 400
+
+
+def test_shell_fields(client, performer_fixture):
+    body = client.get(f"/performers/{performer_fixture}/recordings/shell").get_json()
+
+    assert body["recording_count"] == len(RECORDINGS)
+    for rec in body["recordings"]:
+        assert set(rec.keys()) == EXPECTED_SHELL_FIELDS
+
+
+def test_cursor_round_trip():
+    token = pagination.encode_cursor("year", [-1964, "Naïma", "abc"])
+
+    assert pagination.decode_cursor(token, "year") == [-1964, "Naïma", "abc"]
+    assert pagination.decode_cursor(None, "year") is None
+
+    uuid_token = pagination.encode_cursor("name", ["Naïma", None, SONG_ID])
+    assert pagination.decode_cursor(uuid_token, "name", (str, int, UUID)) == ["Naïma", None, SONG_ID]
+    with pytest.raises(ValueError):
+        pagination.decode_cursor(token, "year", (int, str, UUID))
+    with pytest.raises(ValueError):
+        pagination.decode_cursor(
+            pagination.encode_cursor("year", [True, "Naïma", SONG_ID]), "year", (int, str, UUID)
+        )
+    with pytest.raises(ValueError):
+        pagination.decode_cursor(token, "name")
+    with pytest.raises(ValueError):
+        pagination.decode_cursor("not-a-cursor", "year")
+    assert pagination.parse_page_limit("1000") == pagination.MAX_PAGE_SIZE
@@ -0,0 +1,82 @@
+"""
+Tests for core.principal_cache.
+
+The unit tests need no database. They pin that
+
+  * a cached principal is handed out as a copy,
+  * entries expire after the TTL, and a fill that raced an invalidation is
+    not stored,
+  * hit/miss counters add up for sizing the TTL.
+
+The integration test runs the real auth flow (Postgres): once a signed-in
+user's principal is cached, locking the account through failed logins
+still takes effect on the very next request.
+"""
+
+import pytest
+
+from core import principal_cache
+from core.principal_cache import PrincipalCache
+
+USER = {'id': 'u1', 'email': 'a@example.com', 'display_name': 'A',
+        'is_active': True, 'account_locked': False, 'is_admin': False}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    class _Clock:
+        now = 1000.0
+
+        def monotonic(self):
+            return self.now
+
+    fake = _Clock()
+    monkeypatch.setattr(principal_cache.time, 'monotonic', fake.monotonic)
+    return fake
+
+
+def test_hits_are_copies_and_expire(clock):
+    cache = PrincipalCache(ttl_seconds=60)
+    cache.set('u1', USER)
+
+    first = cache.get('u1')
+    first['account_locked'] = True
+    assert cache.get('u1') == USER
+
+    clock.now += 61
+    assert cache.get('u1') is None
+
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['hit_rate']) == (2, 1, 0.667)
+
+
+def test_fill_racing_an_invalidation_is_dropped(clock):
+    cache = PrincipalCache(ttl_seconds=60)
+
+    generation = cache.generation
+    cache.invalidate('u1')
+    assert not cache.set('u1', USER, generation)
+    assert cache.get('u1') is None
+
+    assert cache.set('u1', USER, cache.generation)
+    cache.invalidate('u1')
+    assert cache.get('u1') is None
+
+
+def test_zero_ttl_disables(clock):
+    cache = PrincipalCache(ttl_seconds=0)
+    assert not cache.set('u1', USER)
+    assert not cache.get_stats()['enabled']
+
+
+def test_lockout_invalidates_cached_principal(client, register_user):
+    body = register_user(email="erin@example.com", password="password1234")
+    headers = {"Authorization": f"Bearer {body['access_token']}"}
+    assert client.get("/auth/me", headers=headers).status_code == 200
+
+    for _ in range(5):
+        client.post("/auth/login", json={"email": "erin@example.com", "password": "wrong"})
+
+    resp = client.get("/auth/me", headers=headers)
+    assert resp.status_code == 401
+    assert "locked" in resp.get_json()["error"].lower()
@@ -0,0 +1,127 @@
+"""
+Unit tests for integrations.rate_limiter.
+
+The in-process tests (no database, no network) replace time.sleep and
+time.monotonic with a fake clock so the bucket arithmetic is checked
+exactly:
+
+  * an idle bucket allows a burst, then holds callers to the steady rate,
+  * a throttle pause blocks every caller until it expires,
+  * a caller's slower min_interval slows the shared bucket, never speeds it,
+  * Retry-After is read as delta-seconds or as an HTTP date.
+
+The shared-bucket tests run against the test database with two
+SharedTokenBucket instances standing in for two processes, and pin that
+they draw from one budget and see each other's throttle pauses.
+"""
+
+import email.utils
+import time
+
+import pytest
+
+from integrations import rate_limiter
+from integrations.rate_limiter import SharedTokenBucket, TokenBucket
+
+SHARED_HOST = 'shared-bucket-test.invalid'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', fake.monotonic)
+    monkeypatch.setattr(rate_limiter.time, 'sleep', fake.sleep)
+    return fake
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(rate_limiter, '_buckets', {})
+    monkeypatch.setattr(rate_limiter, 'SHARED', False)
+
+
+@pytest.fixture
+def shared_host(db):
+    def cleanup():
+        with db.cursor() as cur:
+            cur.execute("DELETE FROM outbound_rate_buckets WHERE host = %s", (SHARED_HOST,))
+        db.commit()
+
+    cleanup()
+    yield SHARED_HOST
+    cleanup()
+
+
+def test_burst_then_steady_rate(clock):
+    bucket = TokenBucket('example.org', rate=2.0, burst=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.get_stats()['requests'] == 5
+
+
+def test_pause_blocks_until_expiry(clock):
+    bucket = TokenBucket('example.org', rate=10.0, burst=5)
+    bucket.pause(30)
+
+    assert bucket.acquire() == pytest.approx(30.1)
+    assert bucket.get_stats()['throttled'] == 1
+
+
+def test_min_interval_only_slows_bucket(clock, registry):
+    bucket = rate_limiter.get_bucket(rate_limiter.SPOTIFY, min_interval=1.0)
+    assert bucket.rate == pytest.approx(1.0)
+
+    rate_limiter.get_bucket(rate_limiter.SPOTIFY, min_interval=0.1)
+    assert bucket.rate == pytest.approx(1.0)
+
+
+def test_report_throttled_uses_retry_after(clock, registry):
+    class Response:
+        headers = {'Retry-After': '12'}
+
+    assert rate_limiter.report_throttled(rate_limiter.MUSICBRAINZ, Response()) == 12
+    assert rate_limiter.get_stats()[rate_limiter.MUSICBRAINZ]['paused_for'] == 12
+
+
+def test_parse_retry_after_http_date():
+    when = email.utils.formatdate(time.time() + 60, usegmt=True)
+
+    assert rate_limiter.parse_retry_after(when) == pytest.approx(60, abs=2)
+    assert rate_limiter.parse_retry_after('soon') is None
+    assert rate_limiter.parse_retry_after(None) is None
+
+
+def test_shared_buckets_draw_from_one_budget(shared_host):
+    first = SharedTokenBucket(shared_host, rate=0.5, burst=2)
+    second = SharedTokenBucket(shared_host, rate=0.5, burst=2)
+
+    assert first.acquire() == 0.0
+    assert second.acquire() == 0.0
+
+    # The burst is spent across both "processes": the next token is ~2s out
+    assert second._take_shared() == pytest.approx(2.0, abs=0.2)
+    assert first._take_shared() == pytest.approx(2.0, abs=0.2)
+    assert first.get_stats()['requests'] == second.get_stats()['requests'] == 1
+
+
+def test_shared_pause_reaches_other_buckets(shared_host):
+    first = SharedTokenBucket(shared_host, rate=10.0, burst=5)
+    second = SharedTokenBucket(shared_host, rate=10.0, burst=5)
+    assert second.acquire() == 0.0
+
+    first.pause(30)
+
+    assert second._take_shared() == pytest.approx(30, abs=1)
@@ -0,0 +1,178 @@
+"""
+Tests for the Postgres-backed research queue (core.research_queue).
+
+These drive the job table directly rather than starting worker threads, so
+each state transition is deterministic:
+
+* queueing a song twice leaves one queued job (dedup), and a deep refresh
+  upgrades a waiting simple refresh,
+* a claimed job is invisible to a second claimer,
+* a song that is running is not claimed again while it is re-queued, and
+  the table refuses a second running job for a song whatever its kind,
+* a job recovered from its worker and claimed by another can't be
+  completed or failed by the original worker,
+* a failed attempt goes back on the queue with a backoff until
+  max_attempts, then is marked failed (and counted as failed),
+* research jobs are claimed ahead of other kinds, and the queue size and
+  queued songs only count research jobs.
+
+Fixture strategy mirrors the other tests: deterministic UUIDs with a
+distinct prefix range, self-cleaning before and after each test.
+"""
+
+import pytest
+
+from core import research_queue
+
+
+_NS = "00000000-0000-4000-8000-0000000d{:04x}"
+SONG_ID = _NS.format(0x0001)
+OTHER_SONG_ID = _NS.format(0x0002)
+
+
+def _cleanup(conn):
+    with conn.cursor() as cur:
+        cur.execute(
+            "DELETE FROM research_jobs WHERE song_id IN (%s, %s)",
+            (SONG_ID, OTHER_SONG_ID),
+        )
+        cur.execute("DELETE FROM songs WHERE id IN (%s, %s)", (SONG_ID, OTHER_SONG_ID))
+    conn.commit()
+
+
+@pytest.fixture
+def songs(db):
+    _cleanup(db)
+    with db.cursor() as cur:
+        cur.execute(
+            "INSERT INTO songs (id, title) VALUES (%s, %s), (%s, %s)",
+            (SONG_ID, "Queue Test Song", OTHER_SONG_ID, "Other Queue Test Song"),
+        )
+    db.commit()
+    yield
+    _cleanup(db)
+
+
+def _jobs(db, song_id):
+    with db.cursor() as cur:
+        cur.execute(
+            "SELECT status, force_refresh, attempts, run_after > now() AS backing_off "
+            "FROM research_jobs WHERE song_id = %s ORDER BY id",
+            (song_id,),
+        )
+        return cur.fetchall()
+
+
+def test_requeue_is_deduplicated(db, songs):
+    assert research_queue.add_song_to_queue(SONG_ID, "Queue Test Song", force_refresh=False)
+    assert research_queue.add_song_to_queue(SONG_ID, "Queue Test Song", force_refresh=True)
+
+    jobs = _jobs(db, SONG_ID)
+    assert len(jobs) == 1
+    status, force_refresh, _, _ = jobs[0]
+    assert status == "queued"
+    assert force_refresh is True
+
+
+def test_claimed_job_is_not_claimed_twice(songs):
+    research_queue.add_song_to_queue(SONG_ID, "Queue Test Song")
+
+    first = research_queue._claim_job("worker-a")
+    second = research_queue._claim_job("worker-b")
+
+    assert first is not None and first["song_id"] == SONG_ID
+    assert second is None or second["song_id"] != SONG_ID
+
+
+def test_running_song_is_not_started_again(db, songs):
+    research_queue.add_song_to_queue(SONG_ID, "Queue Test Song")
+    job = research_queue._claim_job("worker-a")
+    assert job["song_id"] == SONG_ID
+
+    research_queue.add_song_to_queue(SONG_ID, "Queue Test Song")
+    claimed = research_queue._claim_job("worker-b")
+    assert claimed is None or claimed["song_id"] != SONG_ID
+
+    research_queue._complete_job(job["id"], "worker-a")
+    assert [j[0] for j in _jobs(db, SONG_ID)] == ["done", "queued"]
+
+
+def test_second_running_job_for_a_song_is_refused(db, songs):
+    import psycopg
+
+    research_queue.add_song_to_queue(SONG_ID, "Queue Test Song")
+    research_queue.add_song_to_queue(
+        SONG_ID, "Queue Test Song", kind=research_queue.KIND_AUTHORITY_MATCH
+    )
+    assert research_queue._claim_job("worker-a")["song_id"] == SONG_ID
+
+    # What a concurrent claimer that missed worker-a's claim would do
+    with pytest.raises(psycopg.errors.UniqueViolation):
+        with db.cursor() as cur:
+            cur.execute(
+                "UPDATE research_jobs SET status = 'running' "
+                "WHERE song_id = %s AND status = 'queued'",
+                (SONG_ID,),
+            )
+    db.rollback()
+
+
+def test_recovered_job_is_not_finished_by_its_old_worker(db, songs):
+    research_queue.add_song_to_queue(SONG_ID, "Queue Test Song")
+    job = research_queue._claim_job("worker-a")
+
+    # Stale-job recovery puts it back; worker-b picks it up
+    with db.cursor() as cur:
+        cur.execute(
+            "UPDATE research_jobs SET status = 'queued', run_after = now() WHERE id = %s",
+            (job["id"],),
+        )
+    db.commit()
+    reclaimed = research_queue._claim_job("worker-b")
+    assert reclaimed["id"] == job["id"]
+
+    research_queue._complete_job(job["id"], "worker-a")
+    research_queue._fail_job(job["id"], "worker-a", "late failure")
+    assert [j[0] for j in _jobs(db, SONG_ID)] == ["running"]
+
+    research_queue._complete_job(job["id"], "worker-b")
+    assert [j[0] for j in _jobs(db, SONG_ID)] == ["done"]
+
+
+def test_failed_job_retries_then_fails(db, songs, monkeypatch):
+    monkeypatch.setattr(research_queue, "MAX_ATTEMPTS", 2)
+    failed_before = research_queue.get_failed_count()
+    research_queue.add_song_to_queue(SONG_ID, "Queue Test Song")
+
+    job = research_queue._claim_job("worker-a")
+    research_queue._fail_job(job["id"], "worker-a", "boom")
+    status, _, attempts, backing_off = _jobs(db, SONG_ID)[0]
+    assert (status, attempts, backing_off) == ("queued", 1, True)
+
+    # Skip the backoff and fail the last attempt
+    with db.cursor() as cur:
+        cur.execute("UPDATE research_jobs SET run_after = now() WHERE song_id = %s", (SONG_ID,))
+    db.commit()
+    job = research_queue._claim_job("worker-a")
+    assert job["attempts"] == 2
+    research_queue._fail_job(job["id"], "worker-a", "boom again")
+
+    status, _, attempts, _ = _jobs(db, SONG_ID)[0]
+    assert (status, attempts) == ("failed", 2)
+    assert research_queue.get_failed_count() == failed_before + 1
+
+
+def test_research_is_claimed_before_other_kinds(songs):
+    research_queue.add_song_to_queue(
+        SONG_ID, "Queue Test Song", kind=research_queue.KIND_AUTHORITY_MATCH
+    )
+    research_queue.add_song_to_queue(OTHER_SONG_ID, "Other Queue Test Song")
+
+    queued = [s["song_id"] for s in research_queue.get_queued_songs()]
+    assert OTHER_SONG_ID in queued
+    assert SONG_ID not in queued
+
+    first = research_queue._claim_job("worker-a")
+    second = research_queue._claim_job("worker-b")
+    assert (first["song_id"], first["kind"]) == (OTHER_SONG_ID, research_queue.KIND_RESEARCH)
+    assert (second["song_id"], second["kind"]) == (SONG_ID, research_queue.KIND_AUTHORITY_MATCH)
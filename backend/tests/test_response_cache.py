@@ -0,0 +1,134 @@
+"""
+Unit tests for core.response_cache.
+
+These run against a throwaway Flask app rather than the real blueprints, so
+they need no database. They pin the behaviours the iOS clients rely on:
+
+  * a repeat GET is served from memory with the same body and ETag,
+  * If-None-Match with the current ETag gets a bodyless 304,
+  * route-set headers (X-Total-Count) survive a cache hit,
+  * invalidating a song drops that song's entries and the index entries,
+    but not other songs' entries,
+  * a fill that raced an invalidation is not stored.
+"""
+
+import pytest
+from flask import Flask, jsonify
+
+from core import response_cache
+from core.response_cache import (
+    CacheEntry, ResponseCache, cached_response, invalidate_on_write,
+    song_tag, TAG_INDEX,
+)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fresh = ResponseCache(max_entries=8, ttl_seconds=60)
+    monkeypatch.setattr(response_cache, '_cache', fresh)
+    monkeypatch.setattr(response_cache, 'CACHE_ENABLED', True)
+    return fresh
+
+
+@pytest.fixture
+def client(cache):
+    app = Flask(__name__)
+    app.after_request(invalidate_on_write)
+    calls = {'summary': 0, 'index': 0}
+
+    @app.route('/songs/<song_id>/summary')
+    @cached_response(lambda song_id: [song_tag(song_id)])
+    def summary(song_id):
+        calls['summary'] += 1
+        if song_id == 'missing':
+            return jsonify({'error': 'Song not found'}), 404
+        return jsonify({'id': song_id, 'calls': calls['summary']})
+
+    @app.route('/songs/index')
+    @cached_response(lambda: [TAG_INDEX])
+    def index():
+        calls['index'] += 1
+        response = jsonify({'songs': [], 'calls': calls['index']})
+        response.headers['X-Total-Count'] = '42'
+        return response
+
+    @app.route('/songs/<song_id>', methods=['PATCH'])
+    def update(song_id):
+        return jsonify({'id': song_id})
+
+    client = app.test_client()
+    client.calls = calls
+    return client
+
+
+def test_repeat_get_is_served_from_cache(client):
+    first = client.get('/songs/a/summary')
+    second = client.get('/songs/a/summary')
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers['X-Cache'] == 'MISS'
+    assert second.headers['X-Cache'] == 'HIT'
+    assert first.get_data() == second.get_data()
+    assert first.headers['ETag'] == second.headers['ETag']
+    assert client.calls['summary'] == 1
+
+
+def test_if_none_match_returns_304(client):
+    etag = client.get('/songs/a/summary').headers['ETag']
+
+    response = client.get('/songs/a/summary', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.get_data() == b''
+    assert response.headers['ETag'] == etag
+
+
+def test_route_headers_survive_a_hit(client):
+    client.get('/songs/index')
+    response = client.get('/songs/index')
+
+    assert response.headers['X-Cache'] == 'HIT'
+    assert response.headers['X-Total-Count'] == '42'
+    assert response.mimetype == 'application/json'
+
+
+def test_errors_are_not_cached(client, cache):
+    client.get('/songs/missing/summary')
+    client.get('/songs/missing/summary')
+
+    assert client.calls['summary'] == 2
+    assert cache.get_stats()['entries'] == 0
+
+
+def test_write_invalidates_song_and_index_only(client):
+    client.get('/songs/a/summary')
+    client.get('/songs/b/summary')
+    client.get('/songs/index')
+
+    assert client.patch('/songs/a').status_code == 200
+
+    assert client.get('/songs/a/summary').headers['X-Cache'] == 'MISS'
+    assert client.get('/songs/index').headers['X-Cache'] == 'MISS'
+    assert client.get('/songs/b/summary').headers['X-Cache'] == 'HIT'
+
+
+def test_fill_after_invalidation_is_discarded(cache):
+    entry = CacheEntry(body=b'{}', mimetype='application/json', headers=(),
+                       etag='"x"', tags=frozenset({TAG_INDEX}), expires_at=float('inf'))
+    generation = cache.generation
+    cache.invalidate_tags([TAG_INDEX])
+
+    assert cache.set(('/songs/index', ()), entry, generation) is False
+    assert cache.get(('/songs/index', ())) is None
+
+
+def test_lru_evicts_oldest(cache):
+    for i in range(cache.max_entries + 2):
+        entry = CacheEntry(body=b'{}', mimetype='application/json', headers=(),
+                           etag='"x"', tags=frozenset(), expires_at=float('inf'))
+        cache.set((f'/songs/{i}/summary', ()), entry, cache.generation)
+
+    stats = cache.get_stats()
+    assert stats['entries'] == cache.max_entries
+    assert stats['evictions'] == 2
+    assert cache.get(('/songs/0/summary', ())) is None
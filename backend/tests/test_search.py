@@ -0,0 +1,142 @@
+"""
+Tests for core.search.
+
+The first group needs no database and checks the SQL fragments and
+parameters the endpoints compose, pinning that
+
+  * queries are normalized in SQL by the same search_normalize() that
+    builds the *_search columns (not in Python, where unidecode would
+    transliterate non-Latin text the columns keep),
+  * LIKE wildcards typed by the user are escaped after normalizing,
+  * fuzzy mode filters with the index-backed word-similarity operator and
+    prefix mode only with anchored LIKE patterns,
+  * ?limit= is clamped.
+
+The rest run the clauses against seeded songs and pin the behaviour users
+see: typo-tolerant and accent/case-insensitive matches, alternate titles
+and composers, and the ranking order (exact title, then title prefix, then
+other matches; start-of-title first in prefix mode). Seeded songs use
+their own ``00000000-0000-4000-8000-…`` range and results are restricted
+to them, so other rows in the test database can't reorder anything.
+"""
+
+import pytest
+
+from core import search
+
+_NS = "00000000-0000-4000-8000-0000000f{:04x}"
+SONGS = [
+    # (title, composer, alt_titles)
+    ("Blue Monk", "Thelonious Monk", None),
+    ("Blue Monk Blues", None, None),
+    ("Monk's Mood", "Thelonious Monk", None),
+    ("Águas de Março", "Antônio Carlos Jobim", None),
+    ("Giant Steps", "John Coltrane", None),
+    ("Night in Tunisia", "Dizzy Gillespie", ["Interlude"]),
+]
+SONG_IDS = [_NS.format(i + 1) for i in range(len(SONGS))]
+
+
+def test_query_is_normalized_in_sql():
+    clause = search.song_clause('  Ночь в Тунисе ')
+
+    # Passed through as typed (trimmed); search_normalize() runs in SQL
+    assert clause.params == {'search_q': 'Ночь в Тунисе'}
+    assert 'search_normalize(%(search_q)s) <%% title_search' in clause.where
+    assert 'word_similarity(search_normalize(%(search_q)s), title_search)' in clause.score
+
+
+def test_like_wildcards_are_escaped():
+    clause = search.performer_clause('100%_sure')
+
+    assert clause.params['search_q'] == '100%_sure'
+    escaped = ("replace(replace(replace(search_normalize(%(search_q)s), "
+               "'\\', '\\\\'), '%%', '\\%%'), '_', '\\_')")
+    assert f"name_search LIKE ('%%' || {escaped} || '%%')" in clause.where
+
+
+def test_fuzzy_and_prefix_filters():
+    fuzzy = search.song_clause('colrane')
+    assert 'search_normalize(%(search_q)s) <%% title_search' in fuzzy.where
+    assert 'composer_search' in fuzzy.where
+    assert 'word_similarity' in fuzzy.score
+
+    prefix = search.song_clause('blue', prefix=True)
+    assert '<%%' not in prefix.where
+    assert "title_search LIKE (replace(" in prefix.where
+    assert "title_search LIKE ('%% ' || replace(" in prefix.where
+
+
+def test_parse_limit():
+    assert search.parse_limit(None, 20) == 20
+    assert search.parse_limit('5', 20) == 5
+    assert search.parse_limit('10000', 20) == search.MAX_LIMIT
+    assert search.parse_limit('abc', 20) == 20
+    assert search.is_prefix_mode('Prefix')
+    assert not search.is_prefix_mode(None)
+
+
+# ---------------------------------------------------------------------------
+# Against the database
+# ---------------------------------------------------------------------------
+
+def _cleanup(conn):
+    with conn.cursor() as cur:
+        cur.execute("DELETE FROM songs WHERE id = ANY(%s::uuid[])", (SONG_IDS,))
+    conn.commit()
+
+
+@pytest.fixture
+def seeded_songs(db):
+    _cleanup(db)
+    with db.cursor() as cur:
+        for song_id, (title, composer, alt_titles) in zip(SONG_IDS, SONGS):
+            cur.execute(
+                "INSERT INTO songs (id, title, composer, alt_titles) VALUES (%s, %s, %s, %s)",
+                (song_id, title, composer, alt_titles),
+            )
+    db.commit()
+    yield
+    _cleanup(db)
+
+
+def _search(query, prefix=False):
+    clause = search.song_clause(query, prefix=prefix)
+    rows = search.execute(f"""
+        SELECT s.title
+        FROM songs s
+        WHERE {clause.where} AND s.id = ANY(%(seeded)s::uuid[])
+        ORDER BY {clause.score} DESC, s.title
+    """, {**clause.params, 'seeded': SONG_IDS})
+    return [row['title'] for row in rows]
+
+
+@pytest.mark.parametrize("query", ["giant stpes", "gaint steps"])
+def test_typos_still_match(seeded_songs, query):
+    assert _search(query) == ["Giant Steps"]
+
+
+@pytest.mark.parametrize("query", ["aguas de marco", "AGUAS DE MARÇO", "  águas   de março "])
+def test_accents_case_and_spacing_are_ignored(seeded_songs, query):
+    assert _search(query) == ["Águas de Março"]
+
+
+def test_composer_and_alternate_titles_match(seeded_songs):
+    assert _search("colrane") == ["Giant Steps"]
+    assert _search("interlude") == ["Night in Tunisia"]
+
+
+def test_exact_title_ranks_above_prefix_and_partial_matches(seeded_songs):
+    assert _search("blue monk") == ["Blue Monk", "Blue Monk Blues", "Monk's Mood"]
+
+
+def test_prefix_mode_ranks_start_of_title_first(seeded_songs):
+    assert _search("mo", prefix=True) == ["Monk's Mood", "Blue Monk", "Blue Monk Blues"]
+    assert _search("blue", prefix=True) == ["Blue Monk", "Blue Monk Blues"]
+    assert _search("steps", prefix=True) == ["Giant Steps"]
+    assert _search("tep", prefix=True) == []
+
+
+def test_songs_index_search_endpoint(client, seeded_songs):
+    body = client.get("/songs/index?search=aguas%20de%20marco").get_json()
+    assert [song["title"] for song in body if song["id"] in SONG_IDS] == ["Águas de Março"]
@@ -45,6 +45,7 @@ developer has locally in the ``jazz_test`` DB.
 import uuid
 
 import pytest
+from psycopg.rows import dict_row
 
 
 # ---------------------------------------------------------------------------
@@ -122,6 +123,7 @@ RECORDING_RELEASE_ID = _NS.format(0x0051)
 RELEASE_IMAGERY_FRONT_ID = _NS.format(0x0060)
 RELEASE_IMAGERY_BACK_ID = _NS.format(0x0061)
 STREAMING_LINK_ID = _NS.format(0x0070)
+EMPTY_SONG_ID = _NS.format(0x0002)
 
 
 def _cleanup(conn):
@@ -161,7 +163,7 @@ def _cleanup(conn):
         cur.execute("DELETE FROM releases WHERE id = %s", (RELEASE_ID,))
         cur.execute("DELETE FROM performers WHERE id = %s", (PERFORMER_ID,))
         cur.execute("DELETE FROM instruments WHERE id = %s", (INSTRUMENT_ID,))
-        cur.execute("DELETE FROM songs WHERE id = %s", (SONG_ID,))
+        cur.execute("DELETE FROM songs WHERE id IN (%s, %s)", (SONG_ID, EMPTY_SONG_ID))
     conn.commit()
 
 
@@ -429,9 +431,10 @@ def test_populated_recording_surfaces_joined_data(client, song_fixture):
 
 
 def test_name_sort_branch_returns_contract_shape(client, song_fixture):
-    """The ``?sort=name`` branch swaps in a correlated subquery for
-    ORDER BY (routes/songs.py). It's easy to break when editing the
-    query, so exercise it explicitly with the same contract assertion.
+    """The ``?sort=name`` branch orders by the projection's
+    ``leader_sort_key`` instead of recording_year (routes/songs.py). It's
+    easy to break when editing the query, so exercise it explicitly with
+    the same contract assertion.
     """
     resp = client.get(
         f"/songs/{song_fixture['song_id']}/recordings?sort=name"
@@ -443,6 +446,181 @@ def test_name_sort_branch_returns_contract_shape(client, song_fixture):
         assert set(rec.keys()) == EXPECTED_LIST_FIELDS
 
 
+def test_projection_tracks_out_of_band_writes(client, db, song_fixture):
+    """The endpoint reads the ``recording_list_rows`` projection, which is
+    maintained by triggers rather than recomputed per request. A write made
+    directly against a source table (as the importers and scripts do) must
+    show up on the next read without any explicit refresh call.
+    """
+    with db.cursor() as cur:
+        cur.execute(
+            "UPDATE releases SET title = %s WHERE id = %s",
+            ("Contract Test Album (retitled)", RELEASE_ID),
+        )
+        cur.execute(
+            "DELETE FROM recording_release_streaming_links WHERE id = %s",
+            (STREAMING_LINK_ID,),
+        )
+    db.commit()
+
+    resp = client.get(f"/songs/{song_fixture['song_id']}/recordings")
+    body = resp.get_json()
+    rec = next(
+        r for r in body["recordings"]
+        if r["id"] == song_fixture["populated_recording_id"]
+    )
+
+    assert rec["album_title"] == "Contract Test Album (retitled)"
+    assert rec["has_spotify"] is False
+    assert rec["best_spotify_url"] is None
+    assert rec["streaming_services"] == []
+
+
+def test_song_streaming_stats_follow_link_writes(db, song_fixture):
+    """``song_streaming_stats`` (read by /admin/streaming-availability) is
+    aggregated from the projection by trigger, so removing a streaming link
+    must move the song's counts with no explicit refresh.
+    """
+    def stats():
+        with db.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                "SELECT * FROM song_streaming_stats WHERE song_id = %s",
+                (SONG_ID,),
+            )
+            return cur.fetchone()
+
+    before = stats()
+    assert before["total_recordings"] == 2
+    assert before["spotify_recordings"] == 1
+    assert before["spotify_only_recordings"] == 1
+    assert before["no_streaming_recordings"] == 1
+
+    with db.cursor() as cur:
+        cur.execute(
+            "DELETE FROM recording_release_streaming_links WHERE id = %s",
+            (STREAMING_LINK_ID,),
+        )
+    db.commit()
+
+    after = stats()
+    assert after["spotify_recordings"] == 0
+    assert after["any_playable_recordings"] == 0
+    assert after["no_streaming_recordings"] == 2
+
+
+def test_song_stats_follow_writes(client, db, song_fixture):
+    """``song_streaming_stats`` and ``song_stats`` back the summary's counts
+    and the index's optional stats fields. It is maintained by triggers, so a streaming link write or
+    a re-dated recording must show up on the next read with no refresh.
+    """
+    def summary():
+        return client.get(f"/songs/{SONG_ID}/summary").get_json()
+
+    def index_row():
+        body = client.get("/songs/index?include=stats").get_json()
+        return next(s for s in body if s["id"] == SONG_ID)
+
+    assert summary()["recording_count"] == 2
+    assert summary()["has_any_streaming"] is True
+    row = index_row()
+    assert row["recording_count"] == 2
+    assert row["streaming_recording_count"] == 1
+    assert (row["earliest_recording_year"], row["latest_recording_year"]) == (1957, 1962)
+
+    with db.cursor() as cur:
+        cur.execute(
+            "DELETE FROM recording_release_streaming_links WHERE id = %s",
+            (STREAMING_LINK_ID,),
+        )
+        cur.execute(
+            "UPDATE recordings SET recording_year = %s WHERE id = %s",
+            (1949, RECORDING_BARE_ID),
+        )
+    db.commit()
+
+    assert summary()["has_any_streaming"] is False
+    row = index_row()
+    assert row["has_any_streaming"] is False
+    assert (row["earliest_recording_year"], row["latest_recording_year"]) == (1949, 1957)
+
+    # Stats stay opt-in
+    body = client.get("/songs/index").get_json()
+    plain = next(s for s in body if s["id"] == SONG_ID)
+    assert "recording_count" not in plain
+
+
+def test_song_without_stats_rows_counts_zero(client, db, song_fixture):
+    """A song with no ``song_streaming_stats`` / ``song_stats`` row (added
+    after the backfill, nothing recorded or recommended yet) reports 0 and
+    false in the index's stats fields, the same as on its summary.
+    """
+    with db.cursor() as cur:
+        cur.execute(
+            "INSERT INTO songs (id, title) VALUES (%s, %s)",
+            (EMPTY_SONG_ID, "Contract Test Song Without Stats"),
+        )
+        cur.execute("DELETE FROM song_streaming_stats WHERE song_id = %s", (EMPTY_SONG_ID,))
+        cur.execute("DELETE FROM song_stats WHERE song_id = %s", (EMPTY_SONG_ID,))
+    db.commit()
+
+    body = client.get("/songs/index?include=stats").get_json()
+    row = next(s for s in body if s["id"] == EMPTY_SONG_ID)
+    assert row["recording_count"] == 0
+    assert row["has_any_streaming"] is False
+    assert row["streaming_recording_count"] == 0
+    assert row["authority_recommendation_count"] == 0
+    assert row["earliest_recording_year"] is None
+    assert row["last_researched_at"] is None
+
+    summary = client.get(f"/songs/{EMPTY_SONG_ID}/summary").get_json()
+    for field in ("recording_count", "has_any_streaming", "authority_recommendation_count"):
+        assert summary[field] == row[field]
+
+
+def test_recording_consensus_follows_contributions(
+        client, db, register_user, song_fixture):
+    """Community consensus is read from ``recording_consensus``, kept by
+    triggers on ``recording_contributions``. A contribution must move the
+    consensus returned by the PUT, the list row's ``community_data``, and
+    withdrawing the last one must drop the row again.
+    """
+    rec_id = song_fixture["populated_recording_id"]
+    users = [register_user() for _ in range(3)]
+    votes = [True, True, False]
+
+    for body, vote in zip(users, votes):
+        resp = client.put(
+            f"/recordings/{rec_id}/contribution",
+            json={"is_instrumental": vote, "performance_key": "Eb"},
+            headers={"Authorization": f"Bearer {body['access_token']}"},
+        )
+        assert resp.status_code == 200, resp.get_json()
+
+    put_body = resp.get_json()
+    assert put_body["consensus"]["is_instrumental"] is True
+    assert put_body["consensus"]["performance_key"] == "Eb"
+    assert put_body["counts"] == {"key": 3, "tempo": 0, "instrumental": 3}
+
+    resp = client.get(f"/songs/{song_fixture['song_id']}/recordings")
+    rec = next(r for r in resp.get_json()["recordings"] if r["id"] == rec_id)
+    assert rec["community_data"]["consensus"]["is_instrumental"] is True
+    assert rec["community_data"]["counts"]["instrumental"] == 3
+
+    for body in users:
+        resp = client.delete(
+            f"/recordings/{rec_id}/contribution",
+            headers={"Authorization": f"Bearer {body['access_token']}"},
+        )
+        assert resp.status_code == 200, resp.get_json()
+
+    with db.cursor(row_factory=dict_row) as cur:
+        cur.execute(
+            "SELECT * FROM recording_consensus WHERE recording_id = %s",
+            (rec_id,),
+        )
+        assert cur.fetchone() is None
+
+
 def test_unknown_song_returns_empty_list(client):
     """Sanity: an unknown song ID returns 200 with zero recordings, not a
     500 or a 404. This matches the current handler behaviour and the iOS
@@ -0,0 +1,91 @@
+"""
+Unit tests for integrations.spotify.hydration.
+
+No network and no shared cache: the api_cache is a fresh SQLite file under
+tmp_path and the client's batch endpoint is replaced by a recorder. They
+pin that
+
+  * queued IDs are deduplicated and fetched in chunks of the endpoint's
+    batch limit (50 tracks, 20 albums),
+  * results land in the same cache entries the single-ID lookups use, so
+    a second pass makes no API calls, and unknown IDs are cached as None,
+  * a failed batch leaves its IDs out of get_many() rather than reporting
+    them as "not on Spotify",
+  * prefetch() only queues one window of IDs ahead of the consumer.
+"""
+
+import pytest
+
+from core import api_cache
+from integrations.spotify.client import SpotifyClient
+from integrations.spotify.hydration import TRACKS, SpotifyHydrator
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(api_cache, '_cache', api_cache.ApiCache(tmp_path / 'api_cache.sqlite3'))
+    client = SpotifyClient()
+    client.calls = []
+
+    def get_batch(resource, ids):
+        client.calls.append((resource, list(ids)))
+        if client.fail:
+            return None
+        return {i: {'id': i, 'name': f'{resource} {i}'} for i in ids if not i.startswith('gone')}
+
+    client.fail = False
+    monkeypatch.setattr(client, 'get_batch', get_batch)
+    return client
+
+
+def test_batches_and_dedupes(client):
+    hydrator = SpotifyHydrator(client)
+    track_ids = [f't{i}' for i in range(120)]
+
+    hydrator.request_tracks(track_ids + track_ids[:10])
+    assert hydrator.get_track('t0')['name'] == 'tracks t0'
+    tracks = hydrator.get_tracks(track_ids[1:])
+
+    assert [len(ids) for _, ids in client.calls] == [50, 50, 20]
+    assert len(tracks) == 119
+
+    albums = hydrator.get_albums([f'a{i}' for i in range(45)])
+    assert [len(ids) for resource, ids in client.calls if resource == 'albums'] == [20, 20, 5]
+    assert len(albums) == 45
+
+
+def test_second_pass_is_served_from_cache(client):
+    SpotifyHydrator(client).get_tracks(['t1', 'gone1'])
+    client.calls.clear()
+
+    hydrator = SpotifyHydrator(client)
+    tracks = hydrator.get_tracks(['t1', 'gone1'])
+
+    assert client.calls == []
+    assert tracks == {'t1': {'id': 't1', 'name': 'tracks t1'}, 'gone1': None}
+    assert api_cache.get(client._get_track_cache_key('t1'))['id'] == 't1'
+
+
+def test_failed_batch_is_not_a_negative_result(client):
+    client.fail = True
+    hydrator = SpotifyHydrator(client)
+
+    assert hydrator.get_tracks(['t1', 't2']) == {}
+    assert hydrator.stats['failed'] == 2
+    assert api_cache.get(client._get_track_cache_key('t1'), default='miss') == 'miss'
+
+
+def test_prefetch_queues_one_window_at_a_time(client):
+    hydrator = SpotifyHydrator(client)
+    rows = [{'track_id': f't{i}'} for i in range(120)]
+
+    seen = []
+    for row in hydrator.prefetch(TRACKS, rows, lambda row: row['track_id'], window=60):
+        track = hydrator.get_track(row['track_id'])
+        seen.append(track['id'])
+        # Nothing beyond the current window has been fetched yet
+        assert len(client.calls) == (2 if len(seen) <= 60 else 4)
+
+    assert seen == [row['track_id'] for row in rows]
+    assert [len(ids) for _, ids in client.calls] == [50, 10, 50, 10]
+    assert hydrator._resolved[TRACKS] == {}
@@ -0,0 +1,51 @@
+"""
+Unit tests for the vectorized scorer in integrations.spotify.matching.
+
+Pure string tests (no database, no Spotify). They pin that
+similarity_matrix() is a drop-in for calling calculate_similarity() per
+pair - including the parenthetical fallback and empty inputs - and that a
+score_cutoff only ever hides scores below the cutoff.
+"""
+
+from integrations.spotify.matching import calculate_similarity, similarity_matrix
+
+TITLES = ['Who Cares?', 'Stella By Starlight', '', 'The Man I Love']
+CANDIDATES = [
+    'Who Cares (As Long As You Care For Me)',
+    'Stella by Starlight - Remastered 2001',
+    'Man I Love, The',
+    '',
+    'Giant Steps (Alternate Take)',
+]
+
+
+def test_matrix_matches_pairwise_similarity():
+    scores = similarity_matrix(TITLES, CANDIDATES)
+
+    assert scores.shape == (len(TITLES), len(CANDIDATES))
+    for i, title in enumerate(TITLES):
+        for j, candidate in enumerate(CANDIDATES):
+            assert scores[i, j] == calculate_similarity(title, candidate)
+
+
+def test_cutoff_only_hides_low_scores():
+    # 'Round Midnight (ab)' scores 84.8 against 'Round Midnight': above the
+    # parenthetical retry threshold, so it must not be retried up to 100
+    titles = TITLES + ['Round Midnight']
+    candidates = CANDIDATES + ['Round Midnight (ab)']
+    assert 80 <= calculate_similarity('Round Midnight', 'Round Midnight (ab)') < 85
+
+    scores = similarity_matrix(titles, candidates, score_cutoff=85)
+
+    assert scores[-1, -1] < 85
+    for i, title in enumerate(titles):
+        for j, candidate in enumerate(candidates):
+            expected = calculate_similarity(title, candidate)
+            if expected >= 85:
+                assert scores[i, j] == expected
+            else:
+                assert scores[i, j] < 85
+
+
+def test_empty_candidate_list():
+    assert similarity_matrix(['Naima'], []).shape == (1, 0)
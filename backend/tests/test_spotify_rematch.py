@@ -0,0 +1,140 @@
+"""
+Tests for the Spotify rematch run store in core.spotify_rematch.
+
+They drive save_run() / load_run() and the listing helpers against the
+spotify_rematch_runs table, and pin that
+
+  * a saved run loads back as the same record (through the gzip codec),
+  * saving a run_id again leaves the stored run alone,
+  * listings are newest first and honour limit/offset, and counts are per
+    song or catalog-wide,
+  * import_legacy_runs() copies old JSON run files into the table, skips
+    unreadable ones, writes nothing on a dry run, and is a no-op the
+    second time.
+
+Fixture strategy mirrors the other DB tests: deterministic song UUIDs in
+their own ``00000000-0000-4000-8000-…`` range, cleaned before and after
+every test. The table has no FK to songs, so no songs are inserted.
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from core import spotify_rematch
+
+_NS = "00000000-0000-4000-8000-0000000e{:04x}"
+SONG_ID = _NS.format(0x0001)
+OTHER_SONG_ID = _NS.format(0x0002)
+
+
+def _cleanup(conn):
+    with conn.cursor() as cur:
+        cur.execute(
+            "DELETE FROM spotify_rematch_runs WHERE song_id IN (%s, %s)",
+            (SONG_ID, OTHER_SONG_ID),
+        )
+    conn.commit()
+
+
+@pytest.fixture(autouse=True)
+def clean_runs(db):
+    _cleanup(db)
+    yield
+    _cleanup(db)
+
+
+def _record(run_id, song_id=SONG_ID, ran_at="2026-01-01T12:00:00+00:00", changes=1):
+    return {
+        "run_id": run_id,
+        "ran_at": ran_at,
+        "song": {"id": song_id, "title": "Rematch Test Song", "composer": "Someone"},
+        "stats": {"releases_processed": 3, "tracks_matched": 2},
+        "matcher_success": True,
+        "matcher_error": None,
+        "changes": [{"action": "track_added", "release": {"title": "Ñandú"}}] * changes,
+        "unresolved_releases": [],
+        "unmatched_recording_releases": [],
+        "log_lines": [{"level": "INFO", "message": "matched"}],
+    }
+
+
+def test_save_then_load_round_trips():
+    record = _record("e" * 32, changes=2)
+
+    assert spotify_rematch.save_run(record) == record["run_id"]
+
+    assert spotify_rematch.load_run(record["run_id"]) == record
+    assert spotify_rematch.load_run("f" * 32) is None
+
+
+def test_saving_a_run_id_again_is_a_no_op():
+    record = _record("e" * 32)
+    spotify_rematch.save_run(record)
+
+    spotify_rematch.save_run(dict(record, matcher_error="overwritten?", changes=[]))
+
+    assert spotify_rematch.count_runs(SONG_ID) == 1
+    assert spotify_rematch.load_run(record["run_id"])["matcher_error"] is None
+
+
+def test_listings_are_newest_first_with_limit_and_offset():
+    for n in range(5):
+        spotify_rematch.save_run(
+            _record(f"{n:032x}", ran_at=f"2026-01-0{n + 1}T12:00:00+00:00", changes=n)
+        )
+    spotify_rematch.save_run(
+        _record("a" * 32, song_id=OTHER_SONG_ID, ran_at="2026-01-03T18:00:00+00:00")
+    )
+
+    runs = spotify_rematch.list_runs_for_song(SONG_ID)
+    assert [run["run_id"] for run in runs] == [f"{n:032x}" for n in (4, 3, 2, 1, 0)]
+    assert runs[0]["change_count"] == 4
+    assert runs[0]["stats"] == {"releases_processed": 3, "tracks_matched": 2}
+
+    page = spotify_rematch.list_runs_for_song(SONG_ID, limit=2, offset=2)
+    assert [run["run_id"] for run in page] == [f"{n:032x}" for n in (2, 1)]
+
+    ours = [
+        run["run_id"] for run in spotify_rematch.list_all_runs(limit=1000)
+        if run["song"]["id"] in (SONG_ID, OTHER_SONG_ID)
+    ]
+    assert ours == [f"{4:032x}", f"{3:032x}", "a" * 32, f"{2:032x}", f"{1:032x}", f"{0:032x}"]
+
+
+def test_counts_are_per_song():
+    all_before = spotify_rematch.count_runs()
+    for n in range(3):
+        spotify_rematch.save_run(_record(f"{n:032x}"))
+    spotify_rematch.save_run(_record("a" * 32, song_id=OTHER_SONG_ID))
+
+    assert spotify_rematch.count_runs(SONG_ID) == 3
+    assert spotify_rematch.count_runs(OTHER_SONG_ID) == 1
+    assert spotify_rematch.count_runs() == all_before + 4
+
+
+def test_import_legacy_runs(tmp_path):
+    record = _record("b" * 32)
+    (tmp_path / f"{SONG_ID}_{record['run_id']}.json").write_text(json.dumps(record, indent=2))
+    (tmp_path / "truncated.json").write_text('{"run_id": ')
+    (tmp_path / "no_song.json").write_text(json.dumps({"run_id": "c" * 32, "ran_at": "x"}))
+
+    dry = spotify_rematch.import_legacy_runs(tmp_path, dry_run=True)
+    assert dry == {"files_found": 3, "imported": 1, "unreadable": 2}
+    assert spotify_rematch.count_runs(SONG_ID) == 0
+
+    stats = spotify_rematch.import_legacy_runs(tmp_path)
+    assert stats == {"files_found": 3, "imported": 1, "unreadable": 2}
+    assert spotify_rematch.load_run(record["run_id"]) == record
+    ran_at = spotify_rematch.list_runs_for_song(SONG_ID)[0]["ran_at"]
+    assert datetime.fromisoformat(ran_at) == datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+    # Re-running is a no-op
+    spotify_rematch.import_legacy_runs(tmp_path)
+    assert spotify_rematch.count_runs(SONG_ID) == 1
+
+
+def test_import_legacy_runs_without_a_directory(tmp_path):
+    stats = spotify_rematch.import_legacy_runs(tmp_path / "missing")
+    assert stats == {"files_found": 0, "imported": 0, "unreadable": 0}
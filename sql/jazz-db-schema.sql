@@ -210,6 +210,38 @@ CREATE TABLE release_performers (
     UNIQUE (release_id, performer_id, instrument_id)
 );
 
+-- ============================================================================
+-- USERS
+-- ============================================================================
+
+-- Created ahead of the streaming-link tables, whose added_by_user_id
+-- columns reference it.
+CREATE TABLE users (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    email VARCHAR(255) NOT NULL UNIQUE,
+    email_verified BOOLEAN DEFAULT false,
+    password_hash VARCHAR(255),
+    display_name VARCHAR(255),
+    profile_image_url VARCHAR(500),
+    google_id VARCHAR(255) UNIQUE,
+    apple_id VARCHAR(255) UNIQUE,
+    is_active BOOLEAN DEFAULT true,
+    account_locked BOOLEAN DEFAULT false,
+    failed_login_attempts INTEGER DEFAULT 0,
+    last_failed_login_at TIMESTAMP WITH TIME ZONE,
+    last_login_at TIMESTAMP WITH TIME ZONE,
+    is_admin BOOLEAN NOT NULL DEFAULT false,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON COLUMN users.is_admin IS
+    'True if user may access /admin web pages. Granted via backend/scripts/grant_admin.py.';
+
+CREATE INDEX IF NOT EXISTS idx_users_is_admin
+    ON users(is_admin)
+    WHERE is_admin = true;
+
 -- ============================================================================
 -- STREAMING LINKS
 -- ============================================================================
@@ -330,32 +362,6 @@ CREATE TABLE artist_images (
 -- USER & AUTH TABLES
 -- ============================================================================
 
-CREATE TABLE users (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    email VARCHAR(255) NOT NULL UNIQUE,
-    email_verified BOOLEAN DEFAULT false,
-    password_hash VARCHAR(255),
-    display_name VARCHAR(255),
-    profile_image_url VARCHAR(500),
-    google_id VARCHAR(255) UNIQUE,
-    apple_id VARCHAR(255) UNIQUE,
-    is_active BOOLEAN DEFAULT true,
-    account_locked BOOLEAN DEFAULT false,
-    failed_login_attempts INTEGER DEFAULT 0,
-    last_failed_login_at TIMESTAMP WITH TIME ZONE,
-    last_login_at TIMESTAMP WITH TIME ZONE,
-    is_admin BOOLEAN NOT NULL DEFAULT false,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-);
-
-COMMENT ON COLUMN users.is_admin IS
-    'True if user may access /admin web pages. Granted via backend/scripts/grant_admin.py.';
-
-CREATE INDEX IF NOT EXISTS idx_users_is_admin
-    ON users(is_admin)
-    WHERE is_admin = true;
-
 CREATE TABLE admin_users (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     email VARCHAR(255) NOT NULL UNIQUE,
@@ -0,0 +1,509 @@
+-- sql/migrations/015_recording_list_rows.sql
+--
+-- Denormalized "list row" projection for the song recordings list.
+--
+-- GET /songs/<id>/recordings and GET /recordings/batch used to rebuild the
+-- same five CTEs (front_art, back_art, streaming, spotify_urls, community)
+-- plus a json_agg over performers on every call. For standards with 500+
+-- recordings that was our slowest endpoint. This table holds exactly the
+-- list-row contract pinned by backend/tests/test_song_recordings.py, one row
+-- per recording, so both endpoints become a single indexed read.
+--
+-- Freshness: statement-level triggers on every table that feeds a list row
+-- call refresh_recording_list_rows() with the affected recording IDs. This
+-- covers the importers, the admin routes, the contributions API and the
+-- one-off scripts alike, without each write path having to remember to
+-- refresh. Statement-level (with transition tables) rather than row-level
+-- so a multi-row INSERT recomputes each recording once, not once per row.
+--
+-- Reconcile: backend/scripts/rebuild_recording_list_rows.py rebuilds the
+-- projection for one song or the whole catalog if it is ever suspected to
+-- have drifted.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS recording_list_rows (
+    recording_id UUID PRIMARY KEY REFERENCES recordings(id) ON DELETE CASCADE,
+    song_id UUID NOT NULL,
+    title VARCHAR(500),
+    album_title VARCHAR(500),
+    artist_credit VARCHAR(500),
+    recording_year INTEGER,
+    is_canonical BOOLEAN,
+    best_cover_art_small VARCHAR(1000),
+    best_cover_art_medium VARCHAR(1000),
+    best_cover_art_large VARCHAR(1000),
+    best_cover_art_source TEXT,
+    best_cover_art_source_url VARCHAR(1000),
+    back_cover_art_small VARCHAR(1000),
+    back_cover_art_medium VARCHAR(1000),
+    back_cover_art_large VARCHAR(1000),
+    has_back_cover BOOLEAN NOT NULL DEFAULT false,
+    back_cover_source TEXT,
+    back_cover_source_url VARCHAR(1000),
+    best_spotify_url VARCHAR(500),
+    has_streaming BOOLEAN NOT NULL DEFAULT false,
+    has_spotify BOOLEAN NOT NULL DEFAULT false,
+    has_apple_music BOOLEAN NOT NULL DEFAULT false,
+    has_youtube BOOLEAN NOT NULL DEFAULT false,
+    streaming_services VARCHAR[] NOT NULL DEFAULT ARRAY[]::varchar[],
+    performers JSONB NOT NULL DEFAULT '[]'::jsonb,
+    authority_count INTEGER NOT NULL DEFAULT 0,
+    authority_sources TEXT[] NOT NULL DEFAULT ARRAY[]::text[],
+    community_data JSONB,
+    -- Not part of the payload: backs the ?sort=name ordering (first leader
+    -- by COALESCE(sort_name, name), NULL when the recording has no leader).
+    leader_sort_key VARCHAR(255),
+    refreshed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_recording_list_rows_song_year
+    ON recording_list_rows (song_id, recording_year);
+
+CREATE INDEX IF NOT EXISTS idx_recording_list_rows_song_leader
+    ON recording_list_rows (song_id, leader_sort_key, recording_year);
+
+COMMENT ON TABLE recording_list_rows IS
+    'Trigger-maintained projection of the song recordings list-row contract. '
+    'Read by GET /songs/<id>/recordings and GET /recordings/batch.';
+
+
+-- ----------------------------------------------------------------------------
+-- Recompute the projection for a set of recordings
+-- ----------------------------------------------------------------------------
+-- Same CTE structure the endpoints used to run per request, scoped by
+-- recording id. Recordings that no longer exist simply produce no row (the
+-- FK cascade has already removed their projection).
+
+CREATE OR REPLACE FUNCTION refresh_recording_list_rows(p_recording_ids UUID[])
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF p_recording_ids IS NULL OR cardinality(p_recording_ids) = 0 THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO recording_list_rows (
+        recording_id, song_id, title, album_title, artist_credit,
+        recording_year, is_canonical,
+        best_cover_art_small, best_cover_art_medium, best_cover_art_large,
+        best_cover_art_source, best_cover_art_source_url,
+        back_cover_art_small, back_cover_art_medium, back_cover_art_large,
+        has_back_cover, back_cover_source, back_cover_source_url,
+        best_spotify_url,
+        has_streaming, has_spotify, has_apple_music, has_youtube,
+        streaming_services, performers, authority_count, authority_sources,
+        community_data, leader_sort_key, refreshed_at
+    )
+    WITH
+    front_art AS (
+        SELECT DISTINCT ON (sub.recording_id)
+            sub.recording_id,
+            sub.image_url_small, sub.image_url_medium, sub.image_url_large,
+            sub.source, sub.source_url
+        FROM (
+            SELECT r.id as recording_id,
+                   ri.image_url_small, ri.image_url_medium, ri.image_url_large,
+                   ri.source::text as source, ri.source_url,
+                   1 as priority,
+                   CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END as source_order
+            FROM recordings r
+            JOIN release_imagery ri ON ri.release_id = r.default_release_id AND ri.type = 'Front'
+            WHERE r.id = ANY(p_recording_ids)
+            UNION ALL
+            SELECT r.id, ri.image_url_small, ri.image_url_medium, ri.image_url_large,
+                   ri.source::text, ri.source_url,
+                   2 as priority,
+                   CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END
+            FROM recordings r
+            JOIN recording_releases rr ON rr.recording_id = r.id
+            JOIN release_imagery ri ON ri.release_id = rr.release_id AND ri.type = 'Front'
+            WHERE r.id = ANY(p_recording_ids)
+        ) sub
+        ORDER BY sub.recording_id, sub.priority, sub.source_order
+    ),
+    back_art AS (
+        SELECT DISTINCT ON (r.id)
+            r.id as recording_id,
+            ri.image_url_small, ri.image_url_medium, ri.image_url_large,
+            ri.source::text as source, ri.source_url,
+            TRUE as has_back_cover
+        FROM recordings r
+        JOIN release_imagery ri ON ri.release_id = r.default_release_id AND ri.type = 'Back'
+        WHERE r.id = ANY(p_recording_ids)
+    ),
+    streaming AS (
+        SELECT
+            rr.recording_id,
+            bool_or(TRUE) as has_streaming,
+            bool_or(rrsl.service = 'spotify') as has_spotify,
+            bool_or(rrsl.service = 'apple_music') as has_apple_music,
+            bool_or(rrsl.service = 'youtube') as has_youtube,
+            array_agg(DISTINCT rrsl.service) as streaming_services
+        FROM recording_releases rr
+        JOIN recording_release_streaming_links rrsl ON rrsl.recording_release_id = rr.id
+        WHERE rr.recording_id = ANY(p_recording_ids)
+        GROUP BY rr.recording_id
+    ),
+    spotify_urls AS (
+        SELECT DISTINCT ON (rr.recording_id)
+            rr.recording_id,
+            rrsl.service_url as best_spotify_url
+        FROM recording_releases rr
+        JOIN recording_release_streaming_links rrsl
+            ON rrsl.recording_release_id = rr.id AND rrsl.service = 'spotify'
+        WHERE rr.recording_id = ANY(p_recording_ids)
+        ORDER BY rr.recording_id,
+            CASE WHEN rr.release_id = (
+                SELECT default_release_id FROM recordings WHERE id = rr.recording_id
+            ) THEN 0 ELSE 1 END
+    ),
+    community AS (
+        SELECT
+            rc.recording_id,
+            jsonb_build_object(
+                'consensus', jsonb_build_object(
+                    'is_instrumental', (
+                        SELECT is_instrumental FROM recording_contributions rc2
+                        WHERE rc2.recording_id = rc.recording_id AND rc2.is_instrumental IS NOT NULL
+                        GROUP BY is_instrumental ORDER BY COUNT(*) DESC, MAX(updated_at) DESC LIMIT 1
+                    )
+                ),
+                'counts', jsonb_build_object(
+                    'instrumental', COUNT(*) FILTER (WHERE rc.is_instrumental IS NOT NULL)
+                )
+            ) as community_data
+        FROM recording_contributions rc
+        WHERE rc.recording_id = ANY(p_recording_ids)
+        GROUP BY rc.recording_id
+    ),
+    leader_sort AS (
+        SELECT
+            rp.recording_id,
+            MIN(COALESCE(p.sort_name, p.name)) as leader_sort_key
+        FROM recording_performers rp
+        JOIN performers p ON rp.performer_id = p.id
+        WHERE rp.recording_id = ANY(p_recording_ids) AND rp.role = 'leader'
+        GROUP BY rp.recording_id
+    )
+    SELECT
+        r.id,
+        r.song_id,
+        r.title,
+        def_rel.title,
+        def_rel.artist_credit,
+        r.recording_year,
+        r.is_canonical,
+        fa.image_url_small,
+        fa.image_url_medium,
+        fa.image_url_large,
+        fa.source,
+        fa.source_url,
+        ba.image_url_small,
+        ba.image_url_medium,
+        ba.image_url_large,
+        COALESCE(ba.has_back_cover, FALSE),
+        ba.source,
+        ba.source_url,
+        su.best_spotify_url,
+        COALESCE(st.has_streaming, FALSE),
+        COALESCE(st.has_spotify, FALSE),
+        COALESCE(st.has_apple_music, FALSE),
+        COALESCE(st.has_youtube, FALSE),
+        COALESCE(st.streaming_services, ARRAY[]::varchar[]),
+        COALESCE(
+            jsonb_agg(
+                jsonb_build_object(
+                    'id', p.id,
+                    'name', p.name,
+                    'sort_name', p.sort_name,
+                    'instrument', i.name,
+                    'role', rp.role
+                ) ORDER BY
+                    CASE rp.role
+                        WHEN 'leader' THEN 1
+                        WHEN 'sideman' THEN 2
+                        ELSE 3
+                    END,
+                    COALESCE(p.sort_name, p.name)
+            ) FILTER (WHERE p.id IS NOT NULL),
+            '[]'::jsonb
+        ),
+        COUNT(DISTINCT sar.id),
+        COALESCE(
+            array_agg(DISTINCT sar.source) FILTER (WHERE sar.source IS NOT NULL),
+            ARRAY[]::text[]
+        ),
+        cm.community_data,
+        ls.leader_sort_key,
+        CURRENT_TIMESTAMP
+    FROM recordings r
+    LEFT JOIN releases def_rel ON r.default_release_id = def_rel.id
+    LEFT JOIN recording_performers rp ON r.id = rp.recording_id
+    LEFT JOIN performers p ON rp.performer_id = p.id
+    LEFT JOIN instruments i ON rp.instrument_id = i.id
+    LEFT JOIN song_authority_recommendations sar ON r.id = sar.recording_id
+    LEFT JOIN front_art fa ON fa.recording_id = r.id
+    LEFT JOIN back_art ba ON ba.recording_id = r.id
+    LEFT JOIN streaming st ON st.recording_id = r.id
+    LEFT JOIN spotify_urls su ON su.recording_id = r.id
+    LEFT JOIN community cm ON cm.recording_id = r.id
+    LEFT JOIN leader_sort ls ON ls.recording_id = r.id
+    WHERE r.id = ANY(p_recording_ids)
+    GROUP BY r.id, def_rel.title, def_rel.artist_credit, r.recording_year,
+             r.is_canonical,
+             su.best_spotify_url,
+             fa.image_url_small, fa.image_url_medium, fa.image_url_large, fa.source, fa.source_url,
+             ba.image_url_small, ba.image_url_medium, ba.image_url_large, ba.has_back_cover, ba.source, ba.source_url,
+             st.has_streaming, st.has_spotify, st.has_apple_music, st.has_youtube, st.streaming_services,
+             cm.community_data, ls.leader_sort_key
+    ON CONFLICT (recording_id) DO UPDATE SET
+        song_id = EXCLUDED.song_id,
+        title = EXCLUDED.title,
+        album_title = EXCLUDED.album_title,
+        artist_credit = EXCLUDED.artist_credit,
+        recording_year = EXCLUDED.recording_year,
+        is_canonical = EXCLUDED.is_canonical,
+        best_cover_art_small = EXCLUDED.best_cover_art_small,
+        best_cover_art_medium = EXCLUDED.best_cover_art_medium,
+        best_cover_art_large = EXCLUDED.best_cover_art_large,
+        best_cover_art_source = EXCLUDED.best_cover_art_source,
+        best_cover_art_source_url = EXCLUDED.best_cover_art_source_url,
+        back_cover_art_small = EXCLUDED.back_cover_art_small,
+        back_cover_art_medium = EXCLUDED.back_cover_art_medium,
+        back_cover_art_large = EXCLUDED.back_cover_art_large,
+        has_back_cover = EXCLUDED.has_back_cover,
+        back_cover_source = EXCLUDED.back_cover_source,
+        back_cover_source_url = EXCLUDED.back_cover_source_url,
+        best_spotify_url = EXCLUDED.best_spotify_url,
+        has_streaming = EXCLUDED.has_streaming,
+        has_spotify = EXCLUDED.has_spotify,
+        has_apple_music = EXCLUDED.has_apple_music,
+        has_youtube = EXCLUDED.has_youtube,
+        streaming_services = EXCLUDED.streaming_services,
+        performers = EXCLUDED.performers,
+        authority_count = EXCLUDED.authority_count,
+        authority_sources = EXCLUDED.authority_sources,
+        community_data = EXCLUDED.community_data,
+        leader_sort_key = EXCLUDED.leader_sort_key,
+        refreshed_at = EXCLUDED.refreshed_at;
+END;
+$$;
+
+
+-- ----------------------------------------------------------------------------
+-- Trigger functions: map changed rows to affected recording IDs
+-- ----------------------------------------------------------------------------
+-- Transition tables are only visible for the event that declared them, so
+-- each function branches on TG_OP before touching new_rows / old_rows.
+
+-- recordings: title, year, is_canonical, default_release_id, song_id
+CREATE OR REPLACE FUNCTION rlr_on_recordings() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_recording_list_rows(ARRAY(SELECT id FROM new_rows));
+    ELSE
+        PERFORM refresh_recording_list_rows(ARRAY(
+            SELECT n.id
+            FROM new_rows n
+            JOIN old_rows o ON o.id = n.id
+            WHERE n.title IS DISTINCT FROM o.title
+               OR n.recording_year IS DISTINCT FROM o.recording_year
+               OR n.is_canonical IS DISTINCT FROM o.is_canonical
+               OR n.default_release_id IS DISTINCT FROM o.default_release_id
+               OR n.song_id IS DISTINCT FROM o.song_id
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- releases: album_title / artist_credit of recordings using it as default
+CREATE OR REPLACE FUNCTION rlr_on_releases() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_recording_list_rows(ARRAY(
+        SELECT r.id
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        JOIN recordings r ON r.default_release_id = n.id
+        WHERE n.title IS DISTINCT FROM o.title
+           OR n.artist_credit IS DISTINCT FROM o.artist_credit
+    ));
+    RETURN NULL;
+END;
+$$;
+
+-- Tables that carry recording_id directly
+CREATE OR REPLACE FUNCTION rlr_on_recording_id_rows() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_recording_list_rows(ARRAY(
+            SELECT DISTINCT recording_id FROM new_rows WHERE recording_id IS NOT NULL));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM refresh_recording_list_rows(ARRAY(
+            SELECT DISTINCT recording_id FROM old_rows WHERE recording_id IS NOT NULL));
+    ELSE
+        PERFORM refresh_recording_list_rows(ARRAY(
+            SELECT recording_id FROM new_rows WHERE recording_id IS NOT NULL
+            UNION
+            SELECT recording_id FROM old_rows WHERE recording_id IS NOT NULL));
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- release_imagery: recordings whose default or any linked release changed art
+CREATE OR REPLACE FUNCTION rlr_on_release_imagery() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_release_ids UUID[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        v_release_ids := ARRAY(SELECT DISTINCT release_id FROM new_rows);
+    ELSIF TG_OP = 'DELETE' THEN
+        v_release_ids := ARRAY(SELECT DISTINCT release_id FROM old_rows);
+    ELSE
+        v_release_ids := ARRAY(SELECT release_id FROM new_rows
+                               UNION SELECT release_id FROM old_rows);
+    END IF;
+
+    PERFORM refresh_recording_list_rows(ARRAY(
+        SELECT rr.recording_id FROM recording_releases rr
+        WHERE rr.release_id = ANY(v_release_ids)
+        UNION
+        SELECT r.id FROM recordings r
+        WHERE r.default_release_id = ANY(v_release_ids)
+    ));
+    RETURN NULL;
+END;
+$$;
+
+-- recording_release_streaming_links: keyed by recording_release_id
+CREATE OR REPLACE FUNCTION rlr_on_streaming_links() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_rr_ids UUID[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        v_rr_ids := ARRAY(SELECT DISTINCT recording_release_id FROM new_rows);
+    ELSIF TG_OP = 'DELETE' THEN
+        v_rr_ids := ARRAY(SELECT DISTINCT recording_release_id FROM old_rows);
+    ELSE
+        v_rr_ids := ARRAY(SELECT recording_release_id FROM new_rows
+                          UNION SELECT recording_release_id FROM old_rows);
+    END IF;
+
+    PERFORM refresh_recording_list_rows(ARRAY(
+        SELECT DISTINCT rr.recording_id FROM recording_releases rr
+        WHERE rr.id = ANY(v_rr_ids)
+    ));
+    RETURN NULL;
+END;
+$$;
+
+-- performers: name / sort_name feed the performers[] payload and name sort
+CREATE OR REPLACE FUNCTION rlr_on_performers() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_recording_list_rows(ARRAY(
+        SELECT DISTINCT rp.recording_id
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        JOIN recording_performers rp ON rp.performer_id = n.id
+        WHERE n.name IS DISTINCT FROM o.name
+           OR n.sort_name IS DISTINCT FROM o.sort_name
+    ));
+    RETURN NULL;
+END;
+$$;
+
+-- instruments: name feeds performers[].instrument
+CREATE OR REPLACE FUNCTION rlr_on_instruments() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_recording_list_rows(ARRAY(
+        SELECT DISTINCT rp.recording_id
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        JOIN recording_performers rp ON rp.instrument_id = n.id
+        WHERE n.name IS DISTINCT FROM o.name
+    ));
+    RETURN NULL;
+END;
+$$;
+
+
+-- ----------------------------------------------------------------------------
+-- Triggers
+-- ----------------------------------------------------------------------------
+-- One trigger per event: Postgres does not allow transition tables on a
+-- trigger that fires for more than one event type.
+
+DROP TRIGGER IF EXISTS rlr_recordings_ins ON recordings;
+DROP TRIGGER IF EXISTS rlr_recordings_upd ON recordings;
+CREATE TRIGGER rlr_recordings_ins AFTER INSERT ON recordings
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rlr_on_recordings();
+CREATE TRIGGER rlr_recordings_upd AFTER UPDATE ON recordings
+    REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rlr_on_recordings();
+
+DROP TRIGGER IF EXISTS rlr_releases_upd ON releases;
+CREATE TRIGGER rlr_releases_upd AFTER UPDATE ON releases
+    REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rlr_on_releases();
+
+DROP TRIGGER IF EXISTS rlr_performers_upd ON performers;
+CREATE TRIGGER rlr_performers_upd AFTER UPDATE ON performers
+    REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rlr_on_performers();
+
+DROP TRIGGER IF EXISTS rlr_instruments_upd ON instruments;
+CREATE TRIGGER rlr_instruments_upd AFTER UPDATE ON instruments
+    REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rlr_on_instruments();
+
+DO $$
+DECLARE
+    t RECORD;
+BEGIN
+    FOR t IN
+        SELECT * FROM (VALUES
+            ('recording_releases', 'rlr_on_recording_id_rows'),
+            ('recording_performers', 'rlr_on_recording_id_rows'),
+            ('recording_contributions', 'rlr_on_recording_id_rows'),
+            ('song_authority_recommendations', 'rlr_on_recording_id_rows'),
+            ('release_imagery', 'rlr_on_release_imagery'),
+            ('recording_release_streaming_links', 'rlr_on_streaming_links')
+        ) AS v(tbl, fn)
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS rlr_%s_ins ON %I', t.tbl, t.tbl);
+        EXECUTE format('DROP TRIGGER IF EXISTS rlr_%s_upd ON %I', t.tbl, t.tbl);
+        EXECUTE format('DROP TRIGGER IF EXISTS rlr_%s_del ON %I', t.tbl, t.tbl);
+        EXECUTE format(
+            'CREATE TRIGGER rlr_%s_ins AFTER INSERT ON %I '
+            'REFERENCING NEW TABLE AS new_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION %I()', t.tbl, t.tbl, t.fn);
+        EXECUTE format(
+            'CREATE TRIGGER rlr_%s_upd AFTER UPDATE ON %I '
+            'REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION %I()', t.tbl, t.tbl, t.fn);
+        EXECUTE format(
+            'CREATE TRIGGER rlr_%s_del AFTER DELETE ON %I '
+            'REFERENCING OLD TABLE AS old_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION %I()', t.tbl, t.tbl, t.fn);
+    END LOOP;
+END $$;
+
+
+-- ----------------------------------------------------------------------------
+-- Backfill
+-- ----------------------------------------------------------------------------
+
+SELECT refresh_recording_list_rows(ARRAY(SELECT id FROM recordings));
+
+COMMIT;
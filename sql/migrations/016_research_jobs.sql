@@ -0,0 +1,55 @@
+-- sql/migrations/016_research_jobs.sql
+--
+-- Durable research job table.
+--
+-- Replaces the in-memory queue.Queue in core/research_queue.py. Jobs survive
+-- deploys, any number of worker threads/processes can drain the table
+-- concurrently (claimed with FOR UPDATE SKIP LOCKED), and failed jobs are
+-- retried with exponential backoff.
+--
+-- Lifecycle: queued -> running -> done
+--                             \-> queued (retry, run_after pushed out)
+--                             \-> failed (attempts exhausted)
+--
+-- At most one *queued* job exists per song (partial unique index), so
+-- re-queueing a song that is already waiting is a no-op. A song may be
+-- re-queued while it is running; the claim query will not start it again
+-- until the running job finishes.
+
+CREATE TABLE IF NOT EXISTS research_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    song_id UUID NOT NULL REFERENCES songs(id) ON DELETE CASCADE,
+    song_name TEXT NOT NULL,
+    force_refresh BOOLEAN NOT NULL DEFAULT TRUE,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued'
+        CHECK (status IN ('queued', 'running', 'done', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    run_after TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    worker_id TEXT,
+    progress JSONB,
+    last_error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP WITH TIME ZONE,
+    heartbeat_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+
+-- Per-song dedup of waiting jobs
+CREATE UNIQUE INDEX IF NOT EXISTS idx_research_jobs_song_queued
+    ON research_jobs(song_id) WHERE status = 'queued';
+
+-- Claim scan: oldest eligible queued job first
+CREATE INDEX IF NOT EXISTS idx_research_jobs_claim
+    ON research_jobs(run_after, id) WHERE status = 'queued';
+
+-- Progress reporting and stale-job recovery
+CREATE INDEX IF NOT EXISTS idx_research_jobs_running
+    ON research_jobs(song_id) WHERE status = 'running';
+
+-- Retention sweep
+CREATE INDEX IF NOT EXISTS idx_research_jobs_finished
+    ON research_jobs(finished_at) WHERE status IN ('done', 'failed');
+
+COMMENT ON TABLE research_jobs IS
+    'Durable song research queue drained by core.research_queue workers';
@@ -0,0 +1,76 @@
+-- sql/migrations/017_search_trigram_index.sql
+--
+-- Trigram search index for songs and performers.
+--
+-- Song and performer search used ILIKE '%q%' (plus unnest(alt_titles) for
+-- songs), which can only be answered with a sequential scan and ranks
+-- nothing. This adds accent/case-folded search columns with pg_trgm GIN
+-- indexes so core/search.py can:
+--   * filter with word-similarity (typo tolerant) and LIKE, both index-backed
+--   * rank by trigram similarity
+--   * serve typeahead prefix lookups from a text_pattern_ops btree
+--
+-- search_normalize() folds apostrophe variants, removes accents (unaccent,
+-- migration 004), lowercases and collapses whitespace. core/search.py runs
+-- the query through the same search_normalize() in SQL, so both sides of
+-- every comparison are normalized identically.
+--
+-- The columns are GENERATED, so every existing INSERT/UPDATE path keeps
+-- them current without code changes.
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- unaccent() is only STABLE (its dictionary could be swapped); pinning the
+-- dictionary makes the wrapper safe to declare IMMUTABLE for generated
+-- columns and indexes.
+CREATE OR REPLACE FUNCTION search_normalize(value TEXT)
+RETURNS TEXT
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE
+AS $$
+    SELECT btrim(regexp_replace(
+        lower(public.unaccent('public.unaccent'::regdictionary,
+              regexp_replace(value, '[‘’‛`´]', '''', 'g'))),
+        '\s+', ' ', 'g'))
+$$;
+
+-- Alternate titles are searched as one string, separated so that a prefix
+-- match can anchor on the start of any of them.
+CREATE OR REPLACE FUNCTION search_normalize_array(items TEXT[])
+RETURNS TEXT
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE
+AS $$
+    SELECT search_normalize(array_to_string(items, ' | '))
+$$;
+
+ALTER TABLE songs
+    ADD COLUMN IF NOT EXISTS title_search TEXT
+        GENERATED ALWAYS AS (search_normalize(title)) STORED,
+    ADD COLUMN IF NOT EXISTS composer_search TEXT
+        GENERATED ALWAYS AS (search_normalize(composer)) STORED,
+    ADD COLUMN IF NOT EXISTS alt_titles_search TEXT
+        GENERATED ALWAYS AS (search_normalize_array(alt_titles)) STORED;
+
+ALTER TABLE performers
+    ADD COLUMN IF NOT EXISTS name_search TEXT
+        GENERATED ALWAYS AS (search_normalize(name)) STORED;
+
+-- Fuzzy / substring matching (%, <%, LIKE '%q%')
+CREATE INDEX IF NOT EXISTS idx_songs_title_search_trgm
+    ON songs USING gin (title_search gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_songs_composer_search_trgm
+    ON songs USING gin (composer_search gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_songs_alt_titles_search_trgm
+    ON songs USING gin (alt_titles_search gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_performers_name_search_trgm
+    ON performers USING gin (name_search gin_trgm_ops);
+
+-- Typeahead prefix matching (LIKE 'q%'), which trigrams handle poorly for
+-- one- and two-character queries
+CREATE INDEX IF NOT EXISTS idx_songs_title_search_prefix
+    ON songs (title_search text_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_performers_name_search_prefix
+    ON performers (name_search text_pattern_ops);
+
+COMMENT ON FUNCTION search_normalize(TEXT) IS
+    'SQL mirror of db_utils.normalize_for_search() (lowercased); backs the *_search columns.';
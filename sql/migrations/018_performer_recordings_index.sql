@@ -0,0 +1,11 @@
+-- sql/migrations/018_performer_recordings_index.sql
+--
+-- Covering index for the performer recordings endpoints.
+--
+-- GET /performers/<id>/recordings (and /recordings/shell) start from the
+-- performer's recording_performers rows and collapse them to one
+-- (recording_id, role) per recording. With role included the whole step is
+-- an index-only scan, even for sidemen with thousands of credits.
+
+CREATE INDEX IF NOT EXISTS idx_recording_performers_performer_recording
+    ON recording_performers (performer_id, recording_id) INCLUDE (role);
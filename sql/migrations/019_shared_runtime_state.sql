@@ -0,0 +1,60 @@
+-- sql/migrations/019_shared_runtime_state.sql
+--
+-- Runtime state shared between web workers and the research worker process.
+--
+-- The backend used to be one gunicorn sync worker with the research worker
+-- thread inside it, so rate-limit counters, cache invalidations and "is the
+-- worker alive" all lived in that process's memory. Research now runs in its
+-- own process (backend/research_worker.py) and the web tier runs several
+-- workers, so that state moves here:
+--
+--   rate_limit_counters  Fixed-window counters behind Flask-Limiter
+--                        (core/rate_limit_storage.py).
+--   cache_invalidations  Append-only log of response/principal cache
+--                        invalidations; every process tails it and drops
+--                        its own copies (core/cache_bus.py).
+--   research_workers     One row per research worker process, refreshed as a
+--                        heartbeat so /research/queue can report whether
+--                        anything is draining the queue.
+--
+-- All three are UNLOGGED: losing them in a crash only resets rate-limit
+-- windows, drops invalidations that cache TTLs cover anyway, and forgets
+-- heartbeats that are rewritten within seconds.
+
+CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_counters (
+    key TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+-- Expired-window sweep
+CREATE INDEX IF NOT EXISTS idx_rate_limit_counters_expires
+    ON rate_limit_counters(expires_at);
+
+CREATE UNLOGGED TABLE IF NOT EXISTS cache_invalidations (
+    id BIGSERIAL PRIMARY KEY,
+    cache VARCHAR(20) NOT NULL,
+    keys TEXT[] NOT NULL,
+    origin TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Retention sweep
+CREATE INDEX IF NOT EXISTS idx_cache_invalidations_created
+    ON cache_invalidations(created_at);
+
+CREATE UNLOGGED TABLE IF NOT EXISTS research_workers (
+    worker_id TEXT PRIMARY KEY,
+    hostname TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    threads INTEGER NOT NULL,
+    started_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    heartbeat_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE rate_limit_counters IS
+    'Flask-Limiter fixed-window counters shared by all web workers';
+COMMENT ON TABLE cache_invalidations IS
+    'Cross-process cache invalidation log tailed by core.cache_bus';
+COMMENT ON TABLE research_workers IS
+    'Heartbeats of running research worker processes';
@@ -0,0 +1,165 @@
+-- sql/migrations/020_song_streaming_stats.sql
+--
+-- Per-song streaming coverage rollup for /admin/streaming-availability.
+--
+-- The page used to join recordings -> recording_releases -> two passes over
+-- recording_release_streaming_links for the whole catalog and aggregate per
+-- song on every view. This table holds those per-song counts, so the page
+-- (and its filters and sorts) is a plain read of one row per song.
+--
+-- Freshness: the per-recording has_spotify / has_apple_music flags already
+-- live in recording_list_rows (015), whose triggers fire on every streaming
+-- link write -- the Spotify and Apple Music importers
+-- (integrations/*/db.py) as well as the manual link edits in the admin and
+-- recordings routes. A statement-level trigger on recording_list_rows
+-- re-aggregates the affected songs whenever a recording's flags or song
+-- change, which is a short index scan over that song's list rows.
+--
+-- Reconcile: core/streaming_stats.py re-aggregates the whole catalog from
+-- the research worker's maintenance loop (SONG_STREAMING_STATS_RECONCILE_SECONDS)
+-- and backend/scripts/reconcile_song_streaming_stats.py does the same on
+-- demand.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS song_streaming_stats (
+    song_id UUID PRIMARY KEY REFERENCES songs(id) ON DELETE CASCADE,
+    total_recordings INTEGER NOT NULL DEFAULT 0,
+    spotify_recordings INTEGER NOT NULL DEFAULT 0,
+    apple_recordings INTEGER NOT NULL DEFAULT 0,
+    both_recordings INTEGER NOT NULL DEFAULT 0,
+    any_playable_recordings INTEGER NOT NULL DEFAULT 0,
+    no_streaming_recordings INTEGER NOT NULL DEFAULT 0,
+    spotify_only_recordings INTEGER NOT NULL DEFAULT 0,
+    apple_only_recordings INTEGER NOT NULL DEFAULT 0,
+    refreshed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE song_streaming_stats IS
+    'Trigger-maintained per-song streaming coverage counts, aggregated from '
+    'recording_list_rows. Read by /admin/streaming-availability.';
+
+
+-- ----------------------------------------------------------------------------
+-- Recompute the rollup for a set of songs
+-- ----------------------------------------------------------------------------
+-- Returns the number of rows whose counts actually changed, so the
+-- reconcile job can report drift. Songs that no longer exist produce no row
+-- (the FK cascade has already removed theirs).
+
+CREATE OR REPLACE FUNCTION refresh_song_streaming_stats(p_song_ids UUID[])
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_changed integer;
+BEGIN
+    IF p_song_ids IS NULL OR cardinality(p_song_ids) = 0 THEN
+        RETURN 0;
+    END IF;
+
+    WITH counts AS (
+        SELECT
+            s.id as song_id,
+            COUNT(rlr.recording_id) as total_recordings,
+            COUNT(*) FILTER (WHERE rlr.has_spotify) as spotify_recordings,
+            COUNT(*) FILTER (WHERE rlr.has_apple_music) as apple_recordings,
+            COUNT(*) FILTER (WHERE rlr.has_spotify AND rlr.has_apple_music) as both_recordings,
+            COUNT(*) FILTER (WHERE rlr.has_spotify OR rlr.has_apple_music) as any_playable_recordings,
+            COUNT(*) FILTER (WHERE NOT rlr.has_spotify AND NOT rlr.has_apple_music) as no_streaming_recordings,
+            COUNT(*) FILTER (WHERE rlr.has_spotify AND NOT rlr.has_apple_music) as spotify_only_recordings,
+            COUNT(*) FILTER (WHERE NOT rlr.has_spotify AND rlr.has_apple_music) as apple_only_recordings
+        FROM songs s
+        LEFT JOIN recording_list_rows rlr ON rlr.song_id = s.id
+        WHERE s.id = ANY(p_song_ids)
+        GROUP BY s.id
+    )
+    INSERT INTO song_streaming_stats AS sss (
+        song_id, total_recordings, spotify_recordings, apple_recordings,
+        both_recordings, any_playable_recordings, no_streaming_recordings,
+        spotify_only_recordings, apple_only_recordings, refreshed_at
+    )
+    SELECT
+        song_id, total_recordings, spotify_recordings, apple_recordings,
+        both_recordings, any_playable_recordings, no_streaming_recordings,
+        spotify_only_recordings, apple_only_recordings, CURRENT_TIMESTAMP
+    FROM counts
+    ON CONFLICT (song_id) DO UPDATE SET
+        total_recordings = EXCLUDED.total_recordings,
+        spotify_recordings = EXCLUDED.spotify_recordings,
+        apple_recordings = EXCLUDED.apple_recordings,
+        both_recordings = EXCLUDED.both_recordings,
+        any_playable_recordings = EXCLUDED.any_playable_recordings,
+        no_streaming_recordings = EXCLUDED.no_streaming_recordings,
+        spotify_only_recordings = EXCLUDED.spotify_only_recordings,
+        apple_only_recordings = EXCLUDED.apple_only_recordings,
+        refreshed_at = EXCLUDED.refreshed_at
+    -- Unchanged rows are left alone (no dead tuple, not counted as drift)
+    WHERE (sss.total_recordings, sss.spotify_recordings, sss.apple_recordings,
+           sss.both_recordings)
+          IS DISTINCT FROM
+          (EXCLUDED.total_recordings, EXCLUDED.spotify_recordings,
+           EXCLUDED.apple_recordings, EXCLUDED.both_recordings);
+
+    GET DIAGNOSTICS v_changed = ROW_COUNT;
+    RETURN v_changed;
+END;
+$$;
+
+
+-- ----------------------------------------------------------------------------
+-- Trigger function: map changed list rows to affected songs
+-- ----------------------------------------------------------------------------
+-- recording_list_rows is rewritten for many reasons (art, performers,
+-- community data); updates only matter here when a streaming flag or the
+-- song changed.
+
+CREATE OR REPLACE FUNCTION sss_on_recording_list_rows() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_song_streaming_stats(ARRAY(
+            SELECT DISTINCT song_id FROM new_rows));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM refresh_song_streaming_stats(ARRAY(
+            SELECT DISTINCT song_id FROM old_rows));
+    ELSE
+        PERFORM refresh_song_streaming_stats(ARRAY(
+            SELECT n.song_id
+            FROM new_rows n
+            JOIN old_rows o ON o.recording_id = n.recording_id
+            WHERE n.has_spotify IS DISTINCT FROM o.has_spotify
+               OR n.has_apple_music IS DISTINCT FROM o.has_apple_music
+               OR n.song_id IS DISTINCT FROM o.song_id
+            UNION
+            SELECT o.song_id
+            FROM new_rows n
+            JOIN old_rows o ON o.recording_id = n.recording_id
+            WHERE n.song_id IS DISTINCT FROM o.song_id
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS sss_recording_list_rows_ins ON recording_list_rows;
+DROP TRIGGER IF EXISTS sss_recording_list_rows_upd ON recording_list_rows;
+DROP TRIGGER IF EXISTS sss_recording_list_rows_del ON recording_list_rows;
+CREATE TRIGGER sss_recording_list_rows_ins AFTER INSERT ON recording_list_rows
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sss_on_recording_list_rows();
+CREATE TRIGGER sss_recording_list_rows_upd AFTER UPDATE ON recording_list_rows
+    REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sss_on_recording_list_rows();
+CREATE TRIGGER sss_recording_list_rows_del AFTER DELETE ON recording_list_rows
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sss_on_recording_list_rows();
+
+
+-- ----------------------------------------------------------------------------
+-- Backfill
+-- ----------------------------------------------------------------------------
+
+SELECT refresh_song_streaming_stats(ARRAY(SELECT id FROM songs));
+
+COMMIT;
@@ -0,0 +1,37 @@
+-- sql/migrations/021_research_job_kinds.sql
+--
+-- Job kinds on the research queue.
+--
+-- research_jobs only ever held "research this song" jobs. The authority
+-- recommendation matcher (scripts/jazzs_match_authorityrecs.py) is also
+-- per-song background work, and /admin/recommendations/run-matcher-all used
+-- to run it for the whole catalog inside the HTTP request. It now queues one
+-- 'authority_match' job per song and the research worker process runs them.
+--
+-- Dedup becomes per (song, kind): a song may wait for research and for
+-- matching at the same time. The claim query still runs at most one job per
+-- song at a time, whatever the kind.
+--
+-- Research jobs are claimed before background kinds (the claim orders by
+-- kind <> 'research' first), so the claim index leads with the same
+-- expression: otherwise every claim sorts all eligible queued rows, and
+-- queue_all puts the whole catalog in the queue.
+
+BEGIN;
+
+ALTER TABLE research_jobs
+    ADD COLUMN IF NOT EXISTS kind VARCHAR(30) NOT NULL DEFAULT 'research';
+
+ALTER TABLE research_jobs DROP CONSTRAINT IF EXISTS research_jobs_kind_check;
+ALTER TABLE research_jobs ADD CONSTRAINT research_jobs_kind_check
+    CHECK (kind IN ('research', 'authority_match'));
+
+DROP INDEX IF EXISTS idx_research_jobs_song_queued;
+CREATE UNIQUE INDEX idx_research_jobs_song_queued
+    ON research_jobs(song_id, kind) WHERE status = 'queued';
+
+DROP INDEX IF EXISTS idx_research_jobs_claim;
+CREATE INDEX idx_research_jobs_claim
+    ON research_jobs((kind <> 'research'), run_after, id) WHERE status = 'queued';
+
+COMMIT;
@@ -0,0 +1,38 @@
+-- sql/migrations/022_spotify_rematch_runs.sql
+--
+-- Spotify rematch run history in the database.
+--
+-- core/spotify_rematch.py used to write each run to an indented JSON file
+-- under backend/data/spotify_rematch_runs/, and the /admin/spotify-rematch
+-- pages listed and parsed the whole directory on every view (load_run
+-- scanned it for a filename suffix). This table keeps the columns those
+-- lists show, indexed by song and by time, and the full run record (diff,
+-- diagnostic buckets, captured log lines) as gzip-compressed JSON that is
+-- only read for the single run being viewed.
+--
+-- Existing JSON files are imported with
+-- backend/scripts/import_spotify_rematch_runs.py.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS spotify_rematch_runs (
+    run_id VARCHAR(32) PRIMARY KEY,
+    -- No FK: run history outlives a deleted or merged song
+    song_id UUID NOT NULL,
+    song_title TEXT,
+    ran_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    matcher_success BOOLEAN NOT NULL DEFAULT false,
+    matcher_error TEXT,
+    change_count INTEGER NOT NULL DEFAULT 0,
+    stats JSONB NOT NULL DEFAULT '{}'::jsonb,
+    -- gzip(JSON) of the complete run record
+    record BYTEA NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_spotify_rematch_runs_song
+    ON spotify_rematch_runs(song_id, ran_at DESC, run_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_spotify_rematch_runs_ran_at
+    ON spotify_rematch_runs(ran_at DESC, run_id DESC);
+
+COMMIT;
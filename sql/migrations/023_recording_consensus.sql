@@ -0,0 +1,432 @@
+-- sql/migrations/023_recording_consensus.sql
+--
+-- Per-recording community consensus.
+--
+-- Consensus (the most common contributed value per field, ties broken by
+-- the most recent update) used to be recomputed from recording_contributions
+-- on every read: six subqueries per call in routes/contributions.py
+-- get_consensus_data(), the same in the recording detail query, and a
+-- nested GROUP BY per recording in the list-row projection and the
+-- /songs/<id>/recordings shell. This table holds, per recording that has
+-- any contribution, each field's mode, the tie-break timestamp of that
+-- mode (its latest updated_at) and the per-field contribution counts, so
+-- every consensus lookup is one primary-key read.
+--
+-- Freshness: statement-level triggers on recording_contributions recompute
+-- the affected recordings in the same transaction as the write -- the
+-- contributions API (PUT, DELETE, per-field DELETE), the release importer's
+-- JazzBot vote (_create_vocal_instrumental_contribution) and the scripts
+-- alike. A recording's row is removed once its last contribution is.
+--
+-- recording_list_rows (015) now takes its community_data from this table,
+-- so its recording_contributions triggers move here: contributions ->
+-- recording_consensus -> recording_list_rows.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS recording_consensus (
+    recording_id UUID PRIMARY KEY REFERENCES recordings(id) ON DELETE CASCADE,
+    contribution_count INTEGER NOT NULL DEFAULT 0,
+    performance_key VARCHAR(3),
+    performance_key_updated_at TIMESTAMP WITH TIME ZONE,
+    key_count INTEGER NOT NULL DEFAULT 0,
+    tempo_marking VARCHAR(20),
+    tempo_marking_updated_at TIMESTAMP WITH TIME ZONE,
+    tempo_count INTEGER NOT NULL DEFAULT 0,
+    is_instrumental BOOLEAN,
+    is_instrumental_updated_at TIMESTAMP WITH TIME ZONE,
+    instrumental_count INTEGER NOT NULL DEFAULT 0,
+    refreshed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE recording_consensus IS
+    'Trigger-maintained per-recording consensus (mode, tie-break timestamp, '
+    'count per field) over recording_contributions.';
+
+
+-- ----------------------------------------------------------------------------
+-- Recompute consensus for a set of recordings
+-- ----------------------------------------------------------------------------
+-- Returns the number of rows inserted, changed or removed. Unchanged rows
+-- are left alone, so they don't churn the list-row projection.
+
+CREATE OR REPLACE FUNCTION refresh_recording_consensus(p_recording_ids UUID[])
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_removed integer;
+    v_changed integer;
+BEGIN
+    IF p_recording_ids IS NULL OR cardinality(p_recording_ids) = 0 THEN
+        RETURN 0;
+    END IF;
+
+    DELETE FROM recording_consensus rcon
+    WHERE rcon.recording_id = ANY(p_recording_ids)
+      AND NOT EXISTS (
+          SELECT 1 FROM recording_contributions rc
+          WHERE rc.recording_id = rcon.recording_id
+      );
+    GET DIAGNOSTICS v_removed = ROW_COUNT;
+
+    INSERT INTO recording_consensus AS rcon (
+        recording_id, contribution_count,
+        performance_key, performance_key_updated_at, key_count,
+        tempo_marking, tempo_marking_updated_at, tempo_count,
+        is_instrumental, is_instrumental_updated_at, instrumental_count,
+        refreshed_at
+    )
+    SELECT
+        ids.recording_id, cnt.contribution_count,
+        k.performance_key, k.updated_at, cnt.key_count,
+        t.tempo_marking, t.updated_at, cnt.tempo_count,
+        i.is_instrumental, i.updated_at, cnt.instrumental_count,
+        CURRENT_TIMESTAMP
+    FROM (
+        SELECT DISTINCT recording_id
+        FROM recording_contributions
+        WHERE recording_id = ANY(p_recording_ids)
+    ) ids
+    CROSS JOIN LATERAL (
+        SELECT
+            COUNT(*) as contribution_count,
+            COUNT(performance_key) as key_count,
+            COUNT(tempo_marking) as tempo_count,
+            COUNT(is_instrumental) as instrumental_count
+        FROM recording_contributions
+        WHERE recording_id = ids.recording_id
+    ) cnt
+    -- Mode per field: most common value, ties broken by most recent update
+    LEFT JOIN LATERAL (
+        SELECT performance_key, MAX(updated_at) as updated_at
+        FROM recording_contributions
+        WHERE recording_id = ids.recording_id AND performance_key IS NOT NULL
+        GROUP BY performance_key
+        ORDER BY COUNT(*) DESC, MAX(updated_at) DESC
+        LIMIT 1
+    ) k ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT tempo_marking, MAX(updated_at) as updated_at
+        FROM recording_contributions
+        WHERE recording_id = ids.recording_id AND tempo_marking IS NOT NULL
+        GROUP BY tempo_marking
+        ORDER BY COUNT(*) DESC, MAX(updated_at) DESC
+        LIMIT 1
+    ) t ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT is_instrumental, MAX(updated_at) as updated_at
+        FROM recording_contributions
+        WHERE recording_id = ids.recording_id AND is_instrumental IS NOT NULL
+        GROUP BY is_instrumental
+        ORDER BY COUNT(*) DESC, MAX(updated_at) DESC
+        LIMIT 1
+    ) i ON TRUE
+    ON CONFLICT (recording_id) DO UPDATE SET
+        contribution_count = EXCLUDED.contribution_count,
+        performance_key = EXCLUDED.performance_key,
+        performance_key_updated_at = EXCLUDED.performance_key_updated_at,
+        key_count = EXCLUDED.key_count,
+        tempo_marking = EXCLUDED.tempo_marking,
+        tempo_marking_updated_at = EXCLUDED.tempo_marking_updated_at,
+        tempo_count = EXCLUDED.tempo_count,
+        is_instrumental = EXCLUDED.is_instrumental,
+        is_instrumental_updated_at = EXCLUDED.is_instrumental_updated_at,
+        instrumental_count = EXCLUDED.instrumental_count,
+        refreshed_at = EXCLUDED.refreshed_at
+    WHERE (rcon.contribution_count,
+           rcon.performance_key, rcon.performance_key_updated_at, rcon.key_count,
+           rcon.tempo_marking, rcon.tempo_marking_updated_at, rcon.tempo_count,
+           rcon.is_instrumental, rcon.is_instrumental_updated_at, rcon.instrumental_count)
+          IS DISTINCT FROM
+          (EXCLUDED.contribution_count,
+           EXCLUDED.performance_key, EXCLUDED.performance_key_updated_at, EXCLUDED.key_count,
+           EXCLUDED.tempo_marking, EXCLUDED.tempo_marking_updated_at, EXCLUDED.tempo_count,
+           EXCLUDED.is_instrumental, EXCLUDED.is_instrumental_updated_at, EXCLUDED.instrumental_count);
+    GET DIAGNOSTICS v_changed = ROW_COUNT;
+
+    RETURN v_removed + v_changed;
+END;
+$$;
+
+
+-- ----------------------------------------------------------------------------
+-- Trigger: recording_contributions -> recording_consensus
+-- ----------------------------------------------------------------------------
+-- UPDATE covers both the old and new recording_id, for contributions moved
+-- between recordings (scripts/deduplicate_recordings.py).
+
+CREATE OR REPLACE FUNCTION rcon_on_recording_contributions() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_recording_consensus(ARRAY(
+            SELECT DISTINCT recording_id FROM new_rows));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM refresh_recording_consensus(ARRAY(
+            SELECT DISTINCT recording_id FROM old_rows));
+    ELSE
+        PERFORM refresh_recording_consensus(ARRAY(
+            SELECT recording_id FROM new_rows
+            UNION
+            SELECT recording_id FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS rcon_recording_contributions_ins ON recording_contributions;
+DROP TRIGGER IF EXISTS rcon_recording_contributions_upd ON recording_contributions;
+DROP TRIGGER IF EXISTS rcon_recording_contributions_del ON recording_contributions;
+CREATE TRIGGER rcon_recording_contributions_ins AFTER INSERT ON recording_contributions
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rcon_on_recording_contributions();
+CREATE TRIGGER rcon_recording_contributions_upd AFTER UPDATE ON recording_contributions
+    REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rcon_on_recording_contributions();
+CREATE TRIGGER rcon_recording_contributions_del AFTER DELETE ON recording_contributions
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rcon_on_recording_contributions();
+
+
+-- ----------------------------------------------------------------------------
+-- Backfill (before the projection switches over to reading it)
+-- ----------------------------------------------------------------------------
+
+SELECT refresh_recording_consensus(ARRAY(
+    SELECT DISTINCT recording_id FROM recording_contributions));
+
+
+-- ----------------------------------------------------------------------------
+-- recording_list_rows: community_data from recording_consensus
+-- ----------------------------------------------------------------------------
+-- Same function as 015 except the community CTE.
+
+CREATE OR REPLACE FUNCTION refresh_recording_list_rows(p_recording_ids UUID[])
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF p_recording_ids IS NULL OR cardinality(p_recording_ids) = 0 THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO recording_list_rows (
+        recording_id, song_id, title, album_title, artist_credit,
+        recording_year, is_canonical,
+        best_cover_art_small, best_cover_art_medium, best_cover_art_large,
+        best_cover_art_source, best_cover_art_source_url,
+        back_cover_art_small, back_cover_art_medium, back_cover_art_large,
+        has_back_cover, back_cover_source, back_cover_source_url,
+        best_spotify_url,
+        has_streaming, has_spotify, has_apple_music, has_youtube,
+        streaming_services, performers, authority_count, authority_sources,
+        community_data, leader_sort_key, refreshed_at
+    )
+    WITH
+    front_art AS (
+        SELECT DISTINCT ON (sub.recording_id)
+            sub.recording_id,
+            sub.image_url_small, sub.image_url_medium, sub.image_url_large,
+            sub.source, sub.source_url
+        FROM (
+            SELECT r.id as recording_id,
+                   ri.image_url_small, ri.image_url_medium, ri.image_url_large,
+                   ri.source::text as source, ri.source_url,
+                   1 as priority,
+                   CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END as source_order
+            FROM recordings r
+            JOIN release_imagery ri ON ri.release_id = r.default_release_id AND ri.type = 'Front'
+            WHERE r.id = ANY(p_recording_ids)
+            UNION ALL
+            SELECT r.id, ri.image_url_small, ri.image_url_medium, ri.image_url_large,
+                   ri.source::text, ri.source_url,
+                   2 as priority,
+                   CASE WHEN ri.source = 'MusicBrainz' THEN 0 ELSE 1 END
+            FROM recordings r
+            JOIN recording_releases rr ON rr.recording_id = r.id
+            JOIN release_imagery ri ON ri.release_id = rr.release_id AND ri.type = 'Front'
+            WHERE r.id = ANY(p_recording_ids)
+        ) sub
+        ORDER BY sub.recording_id, sub.priority, sub.source_order
+    ),
+    back_art AS (
+        SELECT DISTINCT ON (r.id)
+            r.id as recording_id,
+            ri.image_url_small, ri.image_url_medium, ri.image_url_large,
+            ri.source::text as source, ri.source_url,
+            TRUE as has_back_cover
+        FROM recordings r
+        JOIN release_imagery ri ON ri.release_id = r.default_release_id AND ri.type = 'Back'
+        WHERE r.id = ANY(p_recording_ids)
+    ),
+    streaming AS (
+        SELECT
+            rr.recording_id,
+            bool_or(TRUE) as has_streaming,
+            bool_or(rrsl.service = 'spotify') as has_spotify,
+            bool_or(rrsl.service = 'apple_music') as has_apple_music,
+            bool_or(rrsl.service = 'youtube') as has_youtube,
+            array_agg(DISTINCT rrsl.service) as streaming_services
+        FROM recording_releases rr
+        JOIN recording_release_streaming_links rrsl ON rrsl.recording_release_id = rr.id
+        WHERE rr.recording_id = ANY(p_recording_ids)
+        GROUP BY rr.recording_id
+    ),
+    spotify_urls AS (
+        SELECT DISTINCT ON (rr.recording_id)
+            rr.recording_id,
+            rrsl.service_url as best_spotify_url
+        FROM recording_releases rr
+        JOIN recording_release_streaming_links rrsl
+            ON rrsl.recording_release_id = rr.id AND rrsl.service = 'spotify'
+        WHERE rr.recording_id = ANY(p_recording_ids)
+        ORDER BY rr.recording_id,
+            CASE WHEN rr.release_id = (
+                SELECT default_release_id FROM recordings WHERE id = rr.recording_id
+            ) THEN 0 ELSE 1 END
+    ),
+    community AS (
+        SELECT
+            rcon.recording_id,
+            jsonb_build_object(
+                'consensus', jsonb_build_object('is_instrumental', rcon.is_instrumental),
+                'counts', jsonb_build_object('instrumental', rcon.instrumental_count)
+            ) as community_data
+        FROM recording_consensus rcon
+        WHERE rcon.recording_id = ANY(p_recording_ids)
+    ),
+    leader_sort AS (
+        SELECT
+            rp.recording_id,
+            MIN(COALESCE(p.sort_name, p.name)) as leader_sort_key
+        FROM recording_performers rp
+        JOIN performers p ON rp.performer_id = p.id
+        WHERE rp.recording_id = ANY(p_recording_ids) AND rp.role = 'leader'
+        GROUP BY rp.recording_id
+    )
+    SELECT
+        r.id,
+        r.song_id,
+        r.title,
+        def_rel.title,
+        def_rel.artist_credit,
+        r.recording_year,
+        r.is_canonical,
+        fa.image_url_small,
+        fa.image_url_medium,
+        fa.image_url_large,
+        fa.source,
+        fa.source_url,
+        ba.image_url_small,
+        ba.image_url_medium,
+        ba.image_url_large,
+        COALESCE(ba.has_back_cover, FALSE),
+        ba.source,
+        ba.source_url,
+        su.best_spotify_url,
+        COALESCE(st.has_streaming, FALSE),
+        COALESCE(st.has_spotify, FALSE),
+        COALESCE(st.has_apple_music, FALSE),
+        COALESCE(st.has_youtube, FALSE),
+        COALESCE(st.streaming_services, ARRAY[]::varchar[]),
+        COALESCE(
+            jsonb_agg(
+                jsonb_build_object(
+                    'id', p.id,
+                    'name', p.name,
+                    'sort_name', p.sort_name,
+                    'instrument', i.name,
+                    'role', rp.role
+                ) ORDER BY
+                    CASE rp.role
+                        WHEN 'leader' THEN 1
+                        WHEN 'sideman' THEN 2
+                        ELSE 3
+                    END,
+                    COALESCE(p.sort_name, p.name)
+            ) FILTER (WHERE p.id IS NOT NULL),
+            '[]'::jsonb
+        ),
+        COUNT(DISTINCT sar.id),
+        COALESCE(
+            array_agg(DISTINCT sar.source) FILTER (WHERE sar.source IS NOT NULL),
+            ARRAY[]::text[]
+        ),
+        cm.community_data,
+        ls.leader_sort_key,
+        CURRENT_TIMESTAMP
+    FROM recordings r
+    LEFT JOIN releases def_rel ON r.default_release_id = def_rel.id
+    LEFT JOIN recording_performers rp ON r.id = rp.recording_id
+    LEFT JOIN performers p ON rp.performer_id = p.id
+    LEFT JOIN instruments i ON rp.instrument_id = i.id
+    LEFT JOIN song_authority_recommendations sar ON r.id = sar.recording_id
+    LEFT JOIN front_art fa ON fa.recording_id = r.id
+    LEFT JOIN back_art ba ON ba.recording_id = r.id
+    LEFT JOIN streaming st ON st.recording_id = r.id
+    LEFT JOIN spotify_urls su ON su.recording_id = r.id
+    LEFT JOIN community cm ON cm.recording_id = r.id
+    LEFT JOIN leader_sort ls ON ls.recording_id = r.id
+    WHERE r.id = ANY(p_recording_ids)
+    GROUP BY r.id, def_rel.title, def_rel.artist_credit, r.recording_year,
+             r.is_canonical,
+             su.best_spotify_url,
+             fa.image_url_small, fa.image_url_medium, fa.image_url_large, fa.source, fa.source_url,
+             ba.image_url_small, ba.image_url_medium, ba.image_url_large, ba.has_back_cover, ba.source, ba.source_url,
+             st.has_streaming, st.has_spotify, st.has_apple_music, st.has_youtube, st.streaming_services,
+             cm.community_data, ls.leader_sort_key
+    ON CONFLICT (recording_id) DO UPDATE SET
+        song_id = EXCLUDED.song_id,
+        title = EXCLUDED.title,
+        album_title = EXCLUDED.album_title,
+        artist_credit = EXCLUDED.artist_credit,
+        recording_year = EXCLUDED.recording_year,
+        is_canonical = EXCLUDED.is_canonical,
+        best_cover_art_small = EXCLUDED.best_cover_art_small,
+        best_cover_art_medium = EXCLUDED.best_cover_art_medium,
+        best_cover_art_large = EXCLUDED.best_cover_art_large,
+        best_cover_art_source = EXCLUDED.best_cover_art_source,
+        best_cover_art_source_url = EXCLUDED.best_cover_art_source_url,
+        back_cover_art_small = EXCLUDED.back_cover_art_small,
+        back_cover_art_medium = EXCLUDED.back_cover_art_medium,
+        back_cover_art_large = EXCLUDED.back_cover_art_large,
+        has_back_cover = EXCLUDED.has_back_cover,
+        back_cover_source = EXCLUDED.back_cover_source,
+        back_cover_source_url = EXCLUDED.back_cover_source_url,
+        best_spotify_url = EXCLUDED.best_spotify_url,
+        has_streaming = EXCLUDED.has_streaming,
+        has_spotify = EXCLUDED.has_spotify,
+        has_apple_music = EXCLUDED.has_apple_music,
+        has_youtube = EXCLUDED.has_youtube,
+        streaming_services = EXCLUDED.streaming_services,
+        performers = EXCLUDED.performers,
+        authority_count = EXCLUDED.authority_count,
+        authority_sources = EXCLUDED.authority_sources,
+        community_data = EXCLUDED.community_data,
+        leader_sort_key = EXCLUDED.leader_sort_key,
+        refreshed_at = EXCLUDED.refreshed_at;
+END;
+$$;
+
+
+-- The projection now follows recording_consensus rather than the raw
+-- contributions (whose triggers fire first and feed it).
+DROP TRIGGER IF EXISTS rlr_recording_contributions_ins ON recording_contributions;
+DROP TRIGGER IF EXISTS rlr_recording_contributions_upd ON recording_contributions;
+DROP TRIGGER IF EXISTS rlr_recording_contributions_del ON recording_contributions;
+
+DROP TRIGGER IF EXISTS rlr_recording_consensus_ins ON recording_consensus;
+DROP TRIGGER IF EXISTS rlr_recording_consensus_upd ON recording_consensus;
+DROP TRIGGER IF EXISTS rlr_recording_consensus_del ON recording_consensus;
+CREATE TRIGGER rlr_recording_consensus_ins AFTER INSERT ON recording_consensus
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rlr_on_recording_id_rows();
+CREATE TRIGGER rlr_recording_consensus_upd AFTER UPDATE ON recording_consensus
+    REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rlr_on_recording_id_rows();
+CREATE TRIGGER rlr_recording_consensus_del AFTER DELETE ON recording_consensus
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rlr_on_recording_id_rows();
+
+COMMIT;
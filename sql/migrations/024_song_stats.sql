@@ -0,0 +1,332 @@
+-- sql/migrations/024_song_stats.sql
+--
+-- Per-song aggregate columns.
+--
+-- GET /songs/<id>/summary computed authority_recommendation_count,
+-- recording_count and has_any_streaming on every request, the last as two
+-- EXISTS scans through recordings, recording_releases, the streaming links
+-- and releases. The songs index couldn't show any of them without a query
+-- per song.
+--
+-- Everything derived from a song's recordings lives in the existing
+-- song_streaming_stats rollup (020), which already re-aggregates a song from
+-- recording_list_rows and is reconciled by core/streaming_stats.py. This
+-- migration extends it with
+--   * playable_recordings -- recordings with a track streaming link or a
+--     release matched to a Spotify album (what the summary's play button
+--     means by "has any streaming"),
+--   * earliest_recording_year / latest_recording_year,
+-- and re-aggregates it on the two writes that only affect the album-level
+-- Spotify matches: recording_releases and releases.spotify_album_id.
+--
+-- The new song_stats table holds only what is not recording-derived: the
+-- authority recommendation count (kept by a trigger on
+-- song_authority_recommendations) and last_researched_at, stamped by
+-- research_song (core/song_stats.py) when a research run completes; the
+-- backfill takes it from research_jobs.
+
+BEGIN;
+
+-- ----------------------------------------------------------------------------
+-- song_streaming_stats: recording year range and album-level playability
+-- ----------------------------------------------------------------------------
+
+ALTER TABLE song_streaming_stats
+    ADD COLUMN IF NOT EXISTS playable_recordings INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS earliest_recording_year INTEGER,
+    ADD COLUMN IF NOT EXISTS latest_recording_year INTEGER;
+
+COMMENT ON COLUMN song_streaming_stats.playable_recordings IS
+    'Recordings with a track streaming link or a release matched to a '
+    'Spotify album (any_playable_recordings counts track links only)';
+
+CREATE OR REPLACE FUNCTION refresh_song_streaming_stats(p_song_ids UUID[])
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_changed integer;
+BEGIN
+    IF p_song_ids IS NULL OR cardinality(p_song_ids) = 0 THEN
+        RETURN 0;
+    END IF;
+
+    WITH recording_rows AS (
+        SELECT
+            rlr.song_id,
+            rlr.recording_id,
+            rlr.recording_year,
+            rlr.has_spotify,
+            rlr.has_apple_music,
+            (rlr.has_streaming OR EXISTS (
+                SELECT 1 FROM recording_releases rr
+                JOIN releases rel ON rel.id = rr.release_id
+                WHERE rr.recording_id = rlr.recording_id
+                  AND rel.spotify_album_id IS NOT NULL
+            )) as playable
+        FROM recording_list_rows rlr
+        WHERE rlr.song_id = ANY(p_song_ids)
+    ),
+    counts AS (
+        SELECT
+            s.id as song_id,
+            COUNT(rw.recording_id) as total_recordings,
+            COUNT(*) FILTER (WHERE rw.has_spotify) as spotify_recordings,
+            COUNT(*) FILTER (WHERE rw.has_apple_music) as apple_recordings,
+            COUNT(*) FILTER (WHERE rw.has_spotify AND rw.has_apple_music) as both_recordings,
+            COUNT(*) FILTER (WHERE rw.has_spotify OR rw.has_apple_music) as any_playable_recordings,
+            COUNT(*) FILTER (WHERE NOT rw.has_spotify AND NOT rw.has_apple_music) as no_streaming_recordings,
+            COUNT(*) FILTER (WHERE rw.has_spotify AND NOT rw.has_apple_music) as spotify_only_recordings,
+            COUNT(*) FILTER (WHERE NOT rw.has_spotify AND rw.has_apple_music) as apple_only_recordings,
+            COUNT(*) FILTER (WHERE rw.playable) as playable_recordings,
+            MIN(rw.recording_year) as earliest_recording_year,
+            MAX(rw.recording_year) as latest_recording_year
+        FROM songs s
+        LEFT JOIN recording_rows rw ON rw.song_id = s.id
+        WHERE s.id = ANY(p_song_ids)
+        GROUP BY s.id
+    )
+    INSERT INTO song_streaming_stats AS sss (
+        song_id, total_recordings, spotify_recordings, apple_recordings,
+        both_recordings, any_playable_recordings, no_streaming_recordings,
+        spotify_only_recordings, apple_only_recordings,
+        playable_recordings, earliest_recording_year, latest_recording_year,
+        refreshed_at
+    )
+    SELECT
+        song_id, total_recordings, spotify_recordings, apple_recordings,
+        both_recordings, any_playable_recordings, no_streaming_recordings,
+        spotify_only_recordings, apple_only_recordings,
+        playable_recordings, earliest_recording_year, latest_recording_year,
+        CURRENT_TIMESTAMP
+    FROM counts
+    ON CONFLICT (song_id) DO UPDATE SET
+        total_recordings = EXCLUDED.total_recordings,
+        spotify_recordings = EXCLUDED.spotify_recordings,
+        apple_recordings = EXCLUDED.apple_recordings,
+        both_recordings = EXCLUDED.both_recordings,
+        any_playable_recordings = EXCLUDED.any_playable_recordings,
+        no_streaming_recordings = EXCLUDED.no_streaming_recordings,
+        spotify_only_recordings = EXCLUDED.spotify_only_recordings,
+        apple_only_recordings = EXCLUDED.apple_only_recordings,
+        playable_recordings = EXCLUDED.playable_recordings,
+        earliest_recording_year = EXCLUDED.earliest_recording_year,
+        latest_recording_year = EXCLUDED.latest_recording_year,
+        refreshed_at = EXCLUDED.refreshed_at
+    -- Unchanged rows are left alone (no dead tuple, not counted as drift)
+    WHERE (sss.total_recordings, sss.spotify_recordings, sss.apple_recordings,
+           sss.both_recordings, sss.playable_recordings,
+           sss.earliest_recording_year, sss.latest_recording_year)
+          IS DISTINCT FROM
+          (EXCLUDED.total_recordings, EXCLUDED.spotify_recordings,
+           EXCLUDED.apple_recordings, EXCLUDED.both_recordings,
+           EXCLUDED.playable_recordings,
+           EXCLUDED.earliest_recording_year, EXCLUDED.latest_recording_year);
+
+    GET DIAGNOSTICS v_changed = ROW_COUNT;
+    RETURN v_changed;
+END;
+$$;
+
+-- recording_list_rows: the year and any-service streaming flag now matter
+-- too (the triggers from 020 keep calling this function)
+CREATE OR REPLACE FUNCTION sss_on_recording_list_rows() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_song_streaming_stats(ARRAY(
+            SELECT DISTINCT song_id FROM new_rows));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM refresh_song_streaming_stats(ARRAY(
+            SELECT DISTINCT song_id FROM old_rows));
+    ELSE
+        PERFORM refresh_song_streaming_stats(ARRAY(
+            SELECT n.song_id
+            FROM new_rows n
+            JOIN old_rows o ON o.recording_id = n.recording_id
+            WHERE n.has_spotify IS DISTINCT FROM o.has_spotify
+               OR n.has_apple_music IS DISTINCT FROM o.has_apple_music
+               OR n.has_streaming IS DISTINCT FROM o.has_streaming
+               OR n.recording_year IS DISTINCT FROM o.recording_year
+               OR n.song_id IS DISTINCT FROM o.song_id
+            UNION
+            SELECT o.song_id
+            FROM new_rows n
+            JOIN old_rows o ON o.recording_id = n.recording_id
+            WHERE n.song_id IS DISTINCT FROM o.song_id
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- recording_releases: links a recording to a release that may carry a
+-- Spotify album match
+CREATE OR REPLACE FUNCTION sss_on_recording_releases() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_recording_ids UUID[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        v_recording_ids := ARRAY(SELECT DISTINCT recording_id FROM new_rows);
+    ELSIF TG_OP = 'DELETE' THEN
+        v_recording_ids := ARRAY(SELECT DISTINCT recording_id FROM old_rows);
+    ELSE
+        v_recording_ids := ARRAY(SELECT recording_id FROM new_rows
+                                 UNION SELECT recording_id FROM old_rows);
+    END IF;
+
+    PERFORM refresh_song_streaming_stats(ARRAY(
+        SELECT DISTINCT r.song_id FROM recordings r
+        WHERE r.id = ANY(v_recording_ids)
+    ));
+    RETURN NULL;
+END;
+$$;
+
+-- releases: only gaining or losing a Spotify album match matters
+CREATE OR REPLACE FUNCTION sss_on_releases() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_song_streaming_stats(ARRAY(
+        SELECT DISTINCT r.song_id
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        JOIN recording_releases rr ON rr.release_id = n.id
+        JOIN recordings r ON r.id = rr.recording_id
+        WHERE (n.spotify_album_id IS NULL) <> (o.spotify_album_id IS NULL)
+    ));
+    RETURN NULL;
+END;
+$$;
+
+-- One trigger per event: Postgres does not allow transition tables on a
+-- trigger that fires for more than one event type.
+
+DROP TRIGGER IF EXISTS sss_releases_upd ON releases;
+CREATE TRIGGER sss_releases_upd AFTER UPDATE ON releases
+    REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sss_on_releases();
+
+DROP TRIGGER IF EXISTS sss_recording_releases_ins ON recording_releases;
+DROP TRIGGER IF EXISTS sss_recording_releases_upd ON recording_releases;
+DROP TRIGGER IF EXISTS sss_recording_releases_del ON recording_releases;
+CREATE TRIGGER sss_recording_releases_ins AFTER INSERT ON recording_releases
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sss_on_recording_releases();
+CREATE TRIGGER sss_recording_releases_upd AFTER UPDATE ON recording_releases
+    REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sss_on_recording_releases();
+CREATE TRIGGER sss_recording_releases_del AFTER DELETE ON recording_releases
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sss_on_recording_releases();
+
+
+-- ----------------------------------------------------------------------------
+-- song_stats: authority count and research time
+-- ----------------------------------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS song_stats (
+    song_id UUID PRIMARY KEY REFERENCES songs(id) ON DELETE CASCADE,
+    authority_recommendation_count INTEGER NOT NULL DEFAULT 0,
+    last_researched_at TIMESTAMP WITH TIME ZONE,
+    refreshed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE song_stats IS
+    'Per-song authority recommendation count (trigger-maintained) and last '
+    'research time. Recording-derived counts live in song_streaming_stats. '
+    'Read by /songs/<id>/summary and /songs/index?include=stats.';
+
+-- Returns the number of rows inserted or changed. last_researched_at is not
+-- derived and is never touched here.
+CREATE OR REPLACE FUNCTION refresh_song_stats(p_song_ids UUID[])
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_changed integer;
+BEGIN
+    IF p_song_ids IS NULL OR cardinality(p_song_ids) = 0 THEN
+        RETURN 0;
+    END IF;
+
+    INSERT INTO song_stats AS ss (song_id, authority_recommendation_count, refreshed_at)
+    SELECT
+        s.id,
+        (SELECT COUNT(*) FROM song_authority_recommendations sar
+         WHERE sar.song_id = s.id),
+        CURRENT_TIMESTAMP
+    FROM songs s
+    WHERE s.id = ANY(p_song_ids)
+    ON CONFLICT (song_id) DO UPDATE SET
+        authority_recommendation_count = EXCLUDED.authority_recommendation_count,
+        refreshed_at = EXCLUDED.refreshed_at
+    -- Unchanged rows are left alone (no dead tuple, not counted as changed)
+    WHERE ss.authority_recommendation_count
+          IS DISTINCT FROM EXCLUDED.authority_recommendation_count;
+
+    GET DIAGNOSTICS v_changed = ROW_COUNT;
+    RETURN v_changed;
+END;
+$$;
+
+-- song_authority_recommendations: keyed by song_id
+CREATE OR REPLACE FUNCTION sst_on_song_authority_recommendations() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_song_stats(ARRAY(
+            SELECT DISTINCT song_id FROM new_rows));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM refresh_song_stats(ARRAY(
+            SELECT DISTINCT song_id FROM old_rows));
+    ELSE
+        PERFORM refresh_song_stats(ARRAY(
+            SELECT n.song_id
+            FROM new_rows n
+            JOIN old_rows o ON o.id = n.id
+            WHERE n.song_id IS DISTINCT FROM o.song_id
+            UNION
+            SELECT o.song_id
+            FROM new_rows n
+            JOIN old_rows o ON o.id = n.id
+            WHERE n.song_id IS DISTINCT FROM o.song_id
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS sst_song_authority_recommendations_ins ON song_authority_recommendations;
+DROP TRIGGER IF EXISTS sst_song_authority_recommendations_upd ON song_authority_recommendations;
+DROP TRIGGER IF EXISTS sst_song_authority_recommendations_del ON song_authority_recommendations;
+CREATE TRIGGER sst_song_authority_recommendations_ins AFTER INSERT ON song_authority_recommendations
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sst_on_song_authority_recommendations();
+CREATE TRIGGER sst_song_authority_recommendations_upd AFTER UPDATE ON song_authority_recommendations
+    REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sst_on_song_authority_recommendations();
+CREATE TRIGGER sst_song_authority_recommendations_del AFTER DELETE ON song_authority_recommendations
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION sst_on_song_authority_recommendations();
+
+
+-- ----------------------------------------------------------------------------
+-- Backfill
+-- ----------------------------------------------------------------------------
+
+SELECT refresh_song_streaming_stats(ARRAY(SELECT id FROM songs));
+SELECT refresh_song_stats(ARRAY(SELECT id FROM songs));
+
+UPDATE song_stats ss
+SET last_researched_at = rj.finished_at
+FROM (
+    SELECT song_id, MAX(finished_at) as finished_at
+    FROM research_jobs
+    WHERE kind = 'research' AND status = 'done'
+    GROUP BY song_id
+) rj
+WHERE rj.song_id = ss.song_id;
+
+COMMIT;
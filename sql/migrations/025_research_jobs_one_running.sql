@@ -0,0 +1,34 @@
+-- sql/migrations/025_research_jobs_one_running.sql
+--
+-- At most one running research job per song.
+--
+-- The claim query skips songs that already have a running job, but under
+-- READ COMMITTED two workers claiming at the same moment can each miss the
+-- other's uncommitted claim and start the same song (for the same or a
+-- different kind). Making the running index unique closes that race: the
+-- second claim fails on the index once the first commits, and the worker
+-- tries again (core/research_queue.py _claim_job).
+--
+-- Any duplicates already running are marked failed, keeping the one that
+-- started first. Their workers' completion updates are guarded on status
+-- and worker_id, so they leave the failed row alone.
+
+BEGIN;
+
+UPDATE research_jobs j
+SET status = 'failed',
+    finished_at = CURRENT_TIMESTAMP,
+    last_error = 'Duplicate running job for song'
+WHERE j.status = 'running'
+  AND EXISTS (
+      SELECT 1 FROM research_jobs r
+      WHERE r.song_id = j.song_id
+        AND r.status = 'running'
+        AND (r.started_at, r.id) < (j.started_at, j.id)
+  );
+
+DROP INDEX IF EXISTS idx_research_jobs_running;
+CREATE UNIQUE INDEX idx_research_jobs_running
+    ON research_jobs(song_id) WHERE status = 'running';
+
+COMMIT;
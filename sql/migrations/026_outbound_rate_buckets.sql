@@ -0,0 +1,90 @@
+-- sql/migrations/026_outbound_rate_buckets.sql
+--
+-- Outbound per-host token buckets shared by every backend process.
+--
+-- integrations/rate_limiter.py used to keep one token bucket per host in
+-- process memory. MusicBrainz and Spotify are called both from the research
+-- worker process and directly from web workers (admin tools, the MusicBrainz
+-- search route, recording refreshes), so each of those processes spent the
+-- host's whole budget on its own: two gthread workers plus the research
+-- worker could send MusicBrainz three times its 1 request/second limit and
+-- bring back the 503s the limiter exists to prevent.
+--
+-- The bucket state now lives here, next to the inbound Flask-Limiter
+-- counters (019). A request takes its token through
+-- acquire_outbound_token(), which locks the host's row, refills it and
+-- either takes a token or says how long to wait, all in one round trip.
+-- Throttle pauses (Retry-After) are written to the same row so every
+-- process backs off, not just the one that got the 429.
+--
+-- UNLOGGED like the other shared runtime state: losing it in a crash only
+-- refills the buckets.
+
+BEGIN;
+
+CREATE UNLOGGED TABLE IF NOT EXISTS outbound_rate_buckets (
+    host TEXT PRIMARY KEY,
+    tokens DOUBLE PRECISION NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    paused_until TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT '-infinity'
+);
+
+COMMENT ON TABLE outbound_rate_buckets IS
+    'Outbound API token buckets shared by all processes (integrations/rate_limiter.py)';
+
+
+-- ----------------------------------------------------------------------------
+-- Take one token for a host
+-- ----------------------------------------------------------------------------
+-- Rate (tokens per second) and burst come from the caller, so a process
+-- that has slowed its bucket (a script's --rate-delay) refills at its own
+-- slower rate. Returns 0 when a token was taken, otherwise the seconds to
+-- wait before asking again. A refused call writes nothing: tokens keep
+-- accruing from updated_at.
+
+CREATE OR REPLACE FUNCTION acquire_outbound_token(
+    p_host TEXT, p_rate DOUBLE PRECISION, p_burst DOUBLE PRECISION
+)
+RETURNS DOUBLE PRECISION
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_bucket outbound_rate_buckets%ROWTYPE;
+    v_now TIMESTAMP WITH TIME ZONE;
+    v_tokens DOUBLE PRECISION;
+BEGIN
+    INSERT INTO outbound_rate_buckets (host, tokens, updated_at)
+    VALUES (p_host, p_burst, clock_timestamp())
+    ON CONFLICT (host) DO NOTHING;
+
+    SELECT * INTO v_bucket
+    FROM outbound_rate_buckets
+    WHERE host = p_host
+    FOR UPDATE;
+
+    -- Read the clock after the lock, so time spent waiting for it counts
+    v_now := clock_timestamp();
+
+    IF v_bucket.paused_until > v_now THEN
+        RETURN EXTRACT(EPOCH FROM v_bucket.paused_until - v_now);
+    END IF;
+
+    v_tokens := LEAST(
+        p_burst,
+        v_bucket.tokens
+            + GREATEST(0, EXTRACT(EPOCH FROM v_now - v_bucket.updated_at)) * p_rate
+    );
+
+    -- Tolerate float rounding, as TokenBucket.acquire() does
+    IF v_tokens >= 1 - 1e-9 THEN
+        UPDATE outbound_rate_buckets
+        SET tokens = GREATEST(0, v_tokens - 1),
+            updated_at = v_now
+        WHERE host = p_host;
+        RETURN 0;
+    END IF;
+
+    RETURN (1 - v_tokens) / p_rate;
+END;
+$$;
+
+COMMIT;